@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+"""
+실시간 STT 서버 부하 테스트 — 녹음된 WebM 청크를 N개 클라이언트가 동시에 재전송
+
+STT_RECORD_DIR로 저장한 청크 디렉토리(00001.webm, 00002.webm, ...)를
+/ws/audio에 레코더와 같은 간격으로 전송하고, transcript 메시지의 "chunk"
+(STT 윈도우에 포함된 마지막 청크 번호)로 해당 청크 전송 시각 → 전사 수신까지의
+종단 간 지연을 측정합니다. 서버 backpressure(status: busy) 발생 횟수도 집계합니다.
+
+Usage:
+  python load_test_stt.py results/recordings/20260101_120000_1 --clients 4
+  python load_test_stt.py a.webm b.webm --clients 8 --url wss://192.168.0.10:8765/ws/audio --insecure
+"""
+
+import argparse
+import asyncio
+import ssl
+import time
+from pathlib import Path
+
+try:
+    import aiohttp
+except ImportError:
+    print("[오류] aiohttp 패키지가 필요합니다: pip install aiohttp")
+    raise SystemExit(1)
+
+
+def collect_chunks(sources: list[str]) -> list[Path]:
+    """WebM 파일/디렉토리 목록 → 전송 순서대로 정렬된 청크 파일 목록"""
+    chunks: list[Path] = []
+    for source in sources:
+        path = Path(source)
+        if path.is_dir():
+            chunks.extend(sorted(path.glob("*.webm")))
+        else:
+            chunks.append(path)
+    return chunks
+
+
+def percentile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(int(len(ordered) * q), len(ordered) - 1)]
+
+
+async def run_client(
+    index: int,
+    url: str,
+    chunks: list[bytes],
+    interval: float,
+    ssl_context: ssl.SSLContext | bool,
+    drain_timeout: float,
+) -> dict:
+    """클라이언트 1개: 청크 전송 + transcript 수신 → 지연 측정"""
+    sent_at: dict[int, float] = {}
+    latencies: list[float] = []
+    busy_count = 0
+    transcripts = 0
+
+    async with aiohttp.ClientSession() as http:
+        async with http.ws_connect(url, ssl=ssl_context, max_msg_size=0) as ws:
+
+            async def receive():
+                nonlocal busy_count, transcripts
+                async for msg in ws:
+                    if msg.type != aiohttp.WSMsgType.TEXT:
+                        continue
+                    data = msg.json()
+                    if data.get("type") == "status" and data.get("state") == "busy":
+                        busy_count += 1
+                    elif data.get("type") == "transcript":
+                        transcripts += 1
+                        chunk = data.get("chunk")
+                        if chunk in sent_at:
+                            latencies.append(time.monotonic() - sent_at[chunk])
+
+            receiver = asyncio.create_task(receive())
+            for seq, payload in enumerate(chunks, start=1):
+                sent_at[seq] = time.monotonic()
+                await ws.send_bytes(payload)
+                await asyncio.sleep(interval)
+
+            # 마지막 사이클 결과 대기 후 종료 (종료 시 서버가 잔여 PCM을 최종 STT)
+            await asyncio.sleep(drain_timeout)
+            await ws.close()
+            await receiver
+
+    result = {
+        "client": index,
+        "chunks": len(chunks),
+        "transcripts": transcripts,
+        "busy": busy_count,
+        "latencies": latencies,
+    }
+    print(f"[클라이언트 {index}] 완료: 전사 {transcripts}개, busy {busy_count}회"
+          + (f", p50 {percentile(latencies, 0.5):.2f}초" if latencies else ""))
+    return result
+
+
+def print_report(results: list[dict], elapsed: float):
+    print()
+    print(f"{'client':>6s} {'chunks':>6s} {'text':>5s} {'busy':>5s} {'p50':>7s} {'p95':>7s} {'max':>7s}")
+
+    def row(label: str, chunks: int, texts: int, busy: int, latencies: list[float]):
+        if latencies:
+            stats = " ".join(f"{v:6.2f}s" for v in (
+                percentile(latencies, 0.5), percentile(latencies, 0.95), max(latencies)))
+        else:
+            stats = " ".join(f"{'-':>7s}" for _ in range(3))
+        print(f"{label:>6s} {chunks:6d} {texts:5d} {busy:5d} {stats}")
+
+    for r in results:
+        row(str(r["client"]), r["chunks"], r["transcripts"], r["busy"], r["latencies"])
+    row("all",
+        sum(r["chunks"] for r in results),
+        sum(r["transcripts"] for r in results),
+        sum(r["busy"] for r in results),
+        [v for r in results for v in r["latencies"]])
+    print(f"\n총 소요 {elapsed:.1f}초 (클라이언트 {len(results)}개)")
+
+
+async def main_async(args):
+    paths = collect_chunks(args.sources)
+    if not paths:
+        print("[오류] 전송할 WebM 청크가 없습니다")
+        raise SystemExit(1)
+    chunks = [p.read_bytes() for p in paths]
+    print(f"청크 {len(chunks)}개 × 클라이언트 {args.clients}개 → {args.url} "
+          f"(간격 {args.interval}초)")
+
+    ssl_context: ssl.SSLContext | bool = True
+    if args.insecure:
+        ssl_context = ssl.create_default_context()
+        ssl_context.check_hostname = False
+        ssl_context.verify_mode = ssl.CERT_NONE
+
+    start = time.monotonic()
+    results = await asyncio.gather(*(
+        run_client(i + 1, args.url, chunks, args.interval, ssl_context, args.drain)
+        for i in range(args.clients)
+    ))
+    print_report(list(results), time.monotonic() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="실시간 STT 서버 부하 테스트")
+    parser.add_argument("sources", nargs="+", help="WebM 청크 파일 또는 청크 디렉토리")
+    parser.add_argument("--url", default="wss://localhost:8765/ws/audio", help="오디오 WebSocket URL")
+    parser.add_argument("--clients", type=int, default=4, help="동시 클라이언트 수")
+    parser.add_argument("--interval", type=float, default=3.0, help="청크 전송 간격 (초, 레코더 전송 주기)")
+    parser.add_argument("--drain", type=float, default=30.0, help="전송 완료 후 결과 대기 시간 (초)")
+    parser.add_argument("--insecure", action="store_true", help="자체 서명 인증서 검증 생략")
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
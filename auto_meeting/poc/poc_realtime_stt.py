@@ -22,6 +22,7 @@ import ssl
 import socket
 import time
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
@@ -50,6 +51,17 @@ WHISPER_DEVICE = os.environ.get("WHISPER_DEVICE", "cpu")
 BUFFER_CHAR_THRESHOLD = int(os.environ.get("BUFFER_CHAR_THRESHOLD", "500"))
 CHUNK_SECONDS = int(os.environ.get("CHUNK_SECONDS", "15"))
 MAX_RETRY = int(os.environ.get("MAX_RETRY", "3"))
+SAMPLE_RATE = 16000
+STT_WORKERS = int(os.environ.get("STT_WORKERS", "1"))            # Whisper 모델 인스턴스 수
+STT_QUEUE_SIZE = int(os.environ.get("STT_QUEUE_SIZE", str(2 * STT_WORKERS)))
+# 세션별 미처리 오디오 한도: 넘으면 클라이언트에 busy 통지 후 수신 중단 (backpressure)
+MAX_BACKLOG_SECONDS = int(os.environ.get("MAX_BACKLOG_SECONDS", str(2 * CHUNK_SECONDS)))
+# 수신 WebM 청크 저장 디렉토리 (부하 테스트 리플레이용, 비우면 저장 안 함)
+STT_RECORD_DIR = os.environ.get("STT_RECORD_DIR", "")
+# PCM 링 버퍼 용량: NG 재시도 최대 누적(MAX_RETRY+1 윈도우) + 백로그 한도 + 여유 1 윈도우
+RING_SECONDS = int(os.environ.get(
+    "RING_SECONDS", str((MAX_RETRY + 2) * CHUNK_SECONDS + MAX_BACKLOG_SECONDS)
+))
 RESULTS_DIR = Path(os.environ.get("RESULTS_DIR", str(Path(__file__).parent / "results")))
 CERT_DIR = Path(os.environ.get("CERT_DIR", str(Path(__file__).parent / "certs")))
 
@@ -141,40 +153,160 @@ class STTService:
 # ---------------------------------------------------------------------------
 # 오디오 디코딩
 # ---------------------------------------------------------------------------
-def decode_webm_opus(data: bytes) -> np.ndarray | None:
-    """WebM/Opus 바이너리 → 16kHz mono float32 numpy 배열"""
-    try:
-        container = av.open(io.BytesIO(data))
-        resampler = av.AudioResampler(
-            format="s16",
-            layout="mono",
-            rate=16000,
-        )
+EBML_MAGIC = b"\x1a\x45\xdf\xa3"     # WebM 파일 시작 (EBML 헤더)
+CLUSTER_ID = b"\x1f\x43\xb6\x75"     # 첫 Cluster 이전까지가 초기화 세그먼트
+
+
+class StreamingOpusDecoder:
+    """오디오 연결당 1개 유지하는 WebM/Opus → 16kHz mono float32 증분 디코더
+
+    청크마다 컨테이너 포맷 탐색·Opus 디코더·리샘플러를 새로 만들던 방식 대신
+    디코더/리샘플러를 연결 동안 유지한다 (청크 경계에서 리샘플러 상태가 이어짐).
+    - 레코더처럼 청크마다 MediaRecorder를 재시작하면 각 청크가 완전한 WebM 파일
+    - timeslice 방식의 이어지는 청크(EBML 헤더 없음)는 저장해 둔 초기화 세그먼트를
+      앞에 붙여 역다중화
+    """
+
+    def __init__(self):
+        self._codec = None    # Opus 디코더 (첫 청크의 트랙 정보로 생성)
+        self._resampler = av.AudioResampler(format="flt", layout="mono", rate=SAMPLE_RATE)
+        self._header = b""    # 초기화 세그먼트 (EBML + Segment + Tracks)
+
+    def _decoder_for(self, stream):
+        if self._codec is None:
+            codec = av.CodecContext.create(stream.codec_context.name, "r")
+            codec.extradata = stream.codec_context.extradata
+            self._codec = codec
+        return self._codec
+
+    def _resample(self, frame) -> list[np.ndarray]:
+        resampled = self._resampler.resample(frame)
+        # PyAV 버전별 반환 타입 호환 (리스트 또는 단일 AudioFrame)
+        if not isinstance(resampled, (list, tuple)):
+            resampled = [resampled] if resampled is not None else []
+        return [rf.to_ndarray().reshape(-1) for rf in resampled]
+
+    def decode(self, data: bytes) -> np.ndarray | None:
+        """청크 1개 디코딩 → float32 [-1.0, 1.0] 배열 (디코딩할 샘플이 없으면 None)"""
+        if data.startswith(EBML_MAGIC):
+            cluster = data.find(CLUSTER_ID)
+            self._header = data[:cluster] if cluster > 0 else b""
+        elif self._header:
+            data = self._header + data
+        else:
+            print("[디코딩] 초기화 세그먼트 없이 이어지는 청크, 스킵")
+            return None
 
-        frames = []
+        frames: list[np.ndarray] = []
         try:
-            for frame in container.decode(audio=0):
-                resampled = resampler.resample(frame)
-                # PyAV 버전별 반환 타입 호환 (리스트 또는 단일 AudioFrame)
-                if not isinstance(resampled, (list, tuple)):
-                    resampled = [resampled] if resampled is not None else []
-                for rf in resampled:
-                    arr = rf.to_ndarray().flatten()
-                    frames.append(arr)
-        finally:
-            container.close()
+            # 포맷 지정으로 청크마다의 포맷 탐색 생략
+            container = av.open(io.BytesIO(data), format="webm")
+            try:
+                stream = container.streams.audio[0]
+                codec = self._decoder_for(stream)
+                try:
+                    for packet in container.demux(stream):
+                        # demux 끝의 빈 flush 패킷을 보내면 연결 단위 디코더가 EOF 상태가 됨
+                        if packet.size == 0 or packet.dts is None:
+                            continue
+                        for frame in codec.decode(packet):
+                            frames.extend(self._resample(frame))
+                except av.error.InvalidDataError as e:
+                    # 청크 끝에서 잘린 블록은 버리고 그 앞까지만 사용
+                    print(f"[디코딩] 청크 끝 손상, 앞부분만 사용: {e}")
+            finally:
+                container.close()
+        except Exception as e:
+            print(f"[디코딩] 오류: {e}")
+            return None
 
         if not frames:
             return None
+        return np.concatenate(frames) if len(frames) > 1 else frames[0]
+
+    def flush(self) -> np.ndarray | None:
+        """연결 종료 시 리샘플러에 남은 샘플 반환"""
+        try:
+            frames = self._resample(None)
+        except Exception:
+            return None
+        return np.concatenate(frames) if frames else None
 
-        pcm = np.concatenate(frames)
-        # s16 → float32 [-1.0, 1.0]
-        audio_float = pcm.astype(np.float32) / 32768.0
-        return audio_float
 
-    except Exception as e:
-        print(f"[디코딩] 오류: {e}")
-        return None
+def decode_webm_opus(data: bytes) -> np.ndarray | None:
+    """WebM/Opus 바이너리 1개 → 16kHz mono float32 numpy 배열 (단발 디코딩)"""
+    decoder = StreamingOpusDecoder()
+    audio = decoder.decode(data)
+    tail = decoder.flush()
+    if audio is None or tail is None:
+        return audio
+    return np.concatenate([audio, tail])
+
+
+# ---------------------------------------------------------------------------
+# PCM 링 버퍼
+# ---------------------------------------------------------------------------
+class PCMRingBuffer:
+    """미리 할당한 float32 링 버퍼 (용량 이하 구간을 항상 복사 없는 연속 뷰로 제공)
+
+    샘플을 [i]와 [i + capacity] 두 곳에 기록하므로 길이 capacity 이하 구간은
+    2×capacity 배열의 연속 슬라이스가 된다. 위치는 누적 샘플 수(절대 위치)로 다룬다.
+    용량을 넘으면 가장 오래된 샘플부터 버린다 (dropped에 누적).
+    뷰는 링 버퍼를 가리키므로 구간 시작 + capacity까지 기록되면 덮어써진다 (snapshot 참고).
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._data = np.zeros(capacity * 2, dtype=np.float32)
+        self.start = 0      # 보존 중인 가장 오래된 샘플의 절대 위치
+        self.end = 0        # 다음 샘플을 쓸 절대 위치
+        self.dropped = 0    # 용량 초과로 버린 샘플 수
+
+    def __len__(self) -> int:
+        return self.end - self.start
+
+    def append(self, samples: np.ndarray) -> None:
+        if len(samples) > self.capacity:
+            skipped = len(samples) - self.capacity
+            samples = samples[skipped:]
+            self.end += skipped     # 건너뛴 샘플은 아래 overflow로 dropped에 포함
+        n = len(samples)
+        pos = self.end % self.capacity
+        first = min(n, self.capacity - pos)
+        for offset in (pos, pos + self.capacity):
+            self._data[offset:offset + first] = samples[:first]
+        if first < n:
+            rest = n - first
+            self._data[:rest] = samples[first:]
+            self._data[self.capacity:self.capacity + rest] = samples[first:]
+        self.end += n
+
+        overflow = len(self) - self.capacity
+        if overflow > 0:
+            self.start += overflow
+            self.dropped += overflow
+
+    def view(self, start: int, end: int) -> np.ndarray:
+        """[start, end) 구간의 읽기 전용 뷰 (버려진 앞부분은 제외)"""
+        start = max(start, self.start)
+        end = max(min(end, self.end), start)
+        pos = start % self.capacity
+        window = self._data[pos:pos + (end - start)]
+        window.flags.writeable = False
+        return window
+
+    def snapshot(self, start: int, end: int, headroom: int) -> np.ndarray:
+        """[start, end) 구간을 다른 스레드에 넘길 때 사용
+
+        이후 headroom 샘플을 더 기록해도 구간이 덮어써지지 않으면 뷰, 아니면 복사본을 반환한다.
+        """
+        window = self.view(start, end)
+        free = max(start, self.start) + self.capacity - self.end
+        return window.copy() if free < headroom else window
+
+    def discard_until(self, position: int) -> None:
+        """position 이전 샘플 해제"""
+        self.start = max(self.start, min(position, self.end))
 
 
 # ---------------------------------------------------------------------------
@@ -303,6 +435,11 @@ RECORDER_HTML = """<!DOCTYPE html>
       if (data.type === 'summary') {
         summaryEl.textContent = data.text;
       }
+      if (data.type === 'status') {
+        statusText.textContent = data.state === 'busy'
+          ? `서버 처리 지연 — 전송 대기 중 (미처리 ${data.backlog_sec}초)`
+          : '녹음 중...';
+      }
     };
 
     ws.onclose = () => {
@@ -520,27 +657,132 @@ MONITOR_HTML = """<!DOCTYPE html>
 
 
 # ---------------------------------------------------------------------------
-# 서버 구현 (aiohttp 기반)
+# STT 추론 워커 풀
 # ---------------------------------------------------------------------------
-class MeetingServer:
-    """실시간 STT aiohttp 서버"""
+class InferencePool:
+    """STTService 워커 풀 + 크기 제한 추론 큐
+
+    모든 오디오 세션의 STT 요청이 하나의 큐를 거쳐 워커(모델 인스턴스)마다 1개씩
+    처리된다. 큐가 가득 차면 transcribe()가 자리가 날 때까지 대기하므로,
+    요청한 세션의 STT 사이클이 멈추고 백로그가 쌓여 클라이언트 backpressure로 이어진다.
+    """
+
+    def __init__(self, services: list[STTService], queue_size: int = STT_QUEUE_SIZE):
+        self.services = services
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max(queue_size, 1))
+        self._executor = ThreadPoolExecutor(max_workers=len(services), thread_name_prefix="stt")
+        self._workers: list[asyncio.Task] = []
+
+    def start(self):
+        """워커 태스크 시작 (이벤트 루프 안에서 호출)"""
+        self._workers = [asyncio.create_task(self._worker(stt)) for stt in self.services]
+
+    async def stop(self):
+        for task in self._workers:
+            task.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._executor.shutdown(wait=False)
+
+    @property
+    def busy(self) -> bool:
+        return self.queue.full()
+
+    async def _worker(self, stt: STTService):
+        loop = asyncio.get_running_loop()
+        while True:
+            audio, future = await self.queue.get()
+            try:
+                if not future.done():
+                    text = await loop.run_in_executor(self._executor, stt.transcribe, audio)
+                    if not future.done():
+                        future.set_result(text)
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+            finally:
+                self.queue.task_done()
 
-    def __init__(self, stt: STTService):
-        self.stt = stt
-        self.monitor_clients: set[web.WebSocketResponse] = set()
-        self.audio_clients: set[web.WebSocketResponse] = set()
+    async def transcribe(self, audio: np.ndarray) -> str:
+        """큐에 넣고 결과 대기 (큐가 가득 차면 자리가 날 때까지 대기)"""
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((audio, future))
+        return await future
+
+
+# ---------------------------------------------------------------------------
+# 오디오 세션
+# ---------------------------------------------------------------------------
+class AudioSession:
+    """오디오 연결 1개의 STT 상태 (디코더, PCM 링 버퍼, 텍스트 버퍼)
+
+    링 버퍼의 [start, pending_start) = NG 시 유지할 이전 PCM(history),
+    [pending_start, end) = 아직 STT에 넘기지 않은 누적 PCM.
+    """
+
+    def __init__(self, session_id: str, ws: web.WebSocketResponse):
+        self.id = session_id
+        self.ws = ws
+        self.decoder = StreamingOpusDecoder()
+        self.pcm = PCMRingBuffer(RING_SECONDS * SAMPLE_RATE)
+        self.pending_start: int = 0         # 현재 누적 구간 시작 (절대 샘플 위치)
+        self.retry_count: int = 0           # 현재 NG 재시도 횟수
         self.text_buffer: list[str] = []
         self.buffer_char_count: int = 0
         self.transcript_log: list[str] = []
         self.summaries: list[str] = []
+        self.latencies: list[float] = []    # 마지막 청크 수신 → transcript 전송 (초)
+        self.chunk_count: int = 0
+        self.last_chunk_at: float = 0.0     # 마지막 청크 수신 시각 (monotonic)
+        self.start_time = time.time()
+        self.closed = False
+        self.ready = asyncio.Event()        # STT 윈도우 누적 완료 또는 연결 종료
+        self.drained = asyncio.Event()      # 백로그가 한도 아래 (수신 재개 가능)
+        self.drained.set()
+
+    @property
+    def pending_sec(self) -> float:
+        return (self.pcm.end - max(self.pending_start, self.pcm.start)) / SAMPLE_RATE
+
+    def take_window(self) -> tuple[np.ndarray, int]:
+        """history + 누적 구간 → (오디오, 구간 끝 위치), 누적 구간 시작 이동
+
+        drained를 바로 set하므로 STT 중에도 백로그 한도 + 청크 1개까지 수신이 계속된다.
+        그만큼 기록할 여유가 없으면 처리 중 덮어써지지 않도록 복사본을 넘긴다.
+        """
+        snapshot_end = self.pcm.end
+        headroom = (MAX_BACKLOG_SECONDS + CHUNK_SECONDS) * SAMPLE_RATE
+        audio = self.pcm.snapshot(self.pcm.start, snapshot_end, headroom)
+        self.pending_start = snapshot_end
+        self.drained.set()
+        return audio, snapshot_end
+
+    def add_text(self, text: str):
+        self.text_buffer.append(text)
+        self.buffer_char_count += len(text)
+        self.transcript_log.append(text)
+
+
+# ---------------------------------------------------------------------------
+# 서버 구현 (aiohttp 기반)
+# ---------------------------------------------------------------------------
+class MeetingServer:
+    """실시간 STT aiohttp 서버 (오디오 연결마다 독립 세션, STT는 공유 워커 풀)"""
+
+    def __init__(self, pool: InferencePool):
+        self.pool = pool
+        self.monitor_clients: set[web.WebSocketResponse] = set()
+        self.sessions: dict[str, AudioSession] = {}
+        self.transcript_log: list[str] = []     # 모니터 리플레이용 (전 세션)
+        self.summaries: list[str] = []
         self.msg_count: int = 0
         self.start_time: float = 0  # main()에서 모델 로딩 후 설정
-        self.chunk_count: int = 0
-        # STT 누적 버퍼 (점진적 누적 + Qwen 품질 판정)
-        self.pcm_buffer = bytearray()       # 현재 누적 PCM (float32)
-        self.pcm_history = bytearray()      # NG 시 유지할 이전 PCM
-        self.retry_count: int = 0           # 현재 NG 재시도 횟수
-        self._processing: bool = False       # STT 재진입 방지 플래그
+        self._session_seq: int = 0
+
+    async def on_startup(self, app: web.Application):
+        self.pool.start()
+
+    async def on_cleanup(self, app: web.Application):
+        await self.pool.stop()
 
     # --- HTTP 라우트 ---
 
@@ -592,142 +834,195 @@ class MeetingServer:
         ws = web.WebSocketResponse(max_msg_size=10 * 1024 * 1024, heartbeat=30)
         await ws.prepare(request)
 
-        self.audio_clients.add(ws)
-        print("[오디오] 클라이언트 연결")
+        self._session_seq += 1
+        session = AudioSession(f"{datetime.now():%Y%m%d_%H%M%S}_{self._session_seq}", ws)
+        self.sessions[session.id] = session
+        print(f"[오디오] 세션 {session.id} 연결 (총 {len(self.sessions)}개)")
+        await ws.send_json({"type": "session", "id": session.id})
+        worker = asyncio.create_task(self._session_loop(session))
 
         try:
             async for msg in ws:
                 if msg.type == web.WSMsgType.BINARY:
-                    await self._process_audio_chunk(msg.data)
+                    await self._process_audio_chunk(session, msg.data)
+                    if not session.drained.is_set():
+                        # 백로그 한도 초과 → 클라이언트에 알리고 STT가 따라올 때까지 수신 중단
+                        await self._send(ws, {"type": "status", "state": "busy",
+                                              "backlog_sec": round(session.pending_sec, 1)})
+                        await session.drained.wait()
+                        await self._send(ws, {"type": "status", "state": "ok"})
                 elif msg.type == web.WSMsgType.ERROR:
                     print(f"[오디오] WebSocket 에러: {ws.exception()}")
         finally:
-            self.audio_clients.discard(ws)
-            print("[오디오] 클라이언트 해제")
-
-            loop = asyncio.get_running_loop()
-
-            # 연결 종료 시 잔여 PCM 강제 STT
-            remaining_pcm = bytes(self.pcm_history) + bytes(self.pcm_buffer)
-            if len(remaining_pcm) > 4 * 16000:  # 최소 1초 이상
-                print(f"[종료] 잔여 PCM {len(remaining_pcm)//4/16000:.1f}초 → 최종 STT")
-                final_audio = np.frombuffer(remaining_pcm, dtype=np.float32)
-                text = await loop.run_in_executor(None, self.stt.transcribe, final_audio)
-                if text.strip():
-                    await self.broadcast({"type": "transcript", "text": text})
-                    self._add_to_buffer(text)
-                self.pcm_buffer.clear()
-                self.pcm_history.clear()
-                self.retry_count = 0
-
-            # 연결 종료 시 잔여 텍스트 버퍼 요약
-            if self.text_buffer:
-                print(f"[요약] 잔여 버퍼 {self.buffer_char_count}자 → 최종 요약")
-                summary = await loop.run_in_executor(None, self._summarize_sync)
-                self.summaries.append(summary)
-                await self.broadcast({"type": "summary", "text": summary})
-                self.text_buffer.clear()
-                self.buffer_char_count = 0
-
-            self._save_results()
+            session.closed = True
+            session.ready.set()
+            try:
+                await worker
+            finally:
+                del self.sessions[session.id]
+                self._save_results(session)
+                print(f"[오디오] 세션 {session.id} 해제 (총 {len(self.sessions)}개)")
 
         return ws
 
-    async def _process_audio_chunk(self, data: bytes):
-        """오디오 청크 처리: 디코딩 → PCM 누적 → 15초 단위 STT → Qwen 품질 판정"""
-        self.chunk_count += 1
-        print(f"[오디오] 청크 #{self.chunk_count} 수신: {len(data)} bytes")
-
-        # WebM/Opus 디코딩
-        audio_array = decode_webm_opus(data)
+    async def _process_audio_chunk(self, session: AudioSession, data: bytes):
+        """오디오 청크 처리: 디코딩 → PCM 누적 → 15초 누적 시 세션 STT 사이클에 알림"""
+        session.chunk_count += 1
+        print(f"[오디오:{session.id}] 청크 #{session.chunk_count} 수신: {len(data)} bytes")
+        if STT_RECORD_DIR:
+            record_dir = Path(STT_RECORD_DIR) / session.id
+            record_dir.mkdir(parents=True, exist_ok=True)
+            (record_dir / f"{session.chunk_count:05d}.webm").write_bytes(data)
+
+        # WebM/Opus 디코딩 (세션별 디코더 유지)
+        audio_array = session.decoder.decode(data)
         if audio_array is None:
-            print(f"[오디오] 청크 #{self.chunk_count} 디코딩 실패, 스킵")
+            print(f"[오디오:{session.id}] 청크 #{session.chunk_count} 디코딩 실패, 스킵")
             return
 
-        # PCM 누적 (float32 바이트)
-        self.pcm_buffer.extend(audio_array.tobytes())
-        samples = len(self.pcm_buffer) // 4  # float32 = 4 bytes
-        accumulated_sec = samples / 16000
-        print(f"[누적] {accumulated_sec:.1f}초 / {CHUNK_SECONDS}초 목표")
-
-        if accumulated_sec < CHUNK_SECONDS:
-            return  # 아직 충분히 누적되지 않음
+        # PCM 누적 (링 버퍼, 용량 초과 시 가장 오래된 history부터 해제)
+        dropped = session.pcm.dropped
+        session.pcm.append(audio_array)
+        session.last_chunk_at = time.monotonic()
+        if session.pcm.dropped > dropped:
+            print(f"[누적:{session.id}] 링 버퍼 용량 초과, "
+                  f"{(session.pcm.dropped - dropped) / SAMPLE_RATE:.1f}초 해제")
+        accumulated_sec = session.pending_sec
+        print(f"[누적:{session.id}] {accumulated_sec:.1f}초 / {CHUNK_SECONDS}초 목표")
+
+        if accumulated_sec >= CHUNK_SECONDS:
+            session.ready.set()
+        if accumulated_sec >= MAX_BACKLOG_SECONDS:
+            session.drained.clear()
+
+    async def _session_loop(self, session: AudioSession):
+        """세션 STT 사이클 (세션당 1개 태스크, 사이클은 순서대로 1개씩)
+
+        사이클 처리 중 도착한 오디오는 누적 구간에 계속 쌓이고 다음 사이클에서 함께 처리된다.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            await session.ready.wait()
+            session.ready.clear()
+            if session.closed:
+                break
+            if session.pending_sec >= CHUNK_SECONDS:
+                await self._run_cycle(session)
+
+        # 연결 종료: 리샘플러 잔여분 포함 잔여 PCM 강제 STT
+        tail = session.decoder.flush()
+        if tail is not None:
+            session.pcm.append(tail)
+        if len(session.pcm) > SAMPLE_RATE:  # 최소 1초 이상
+            final_audio, snapshot_end = session.take_window()
+            print(f"[종료:{session.id}] 잔여 PCM {len(final_audio)/SAMPLE_RATE:.1f}초 → 최종 STT")
+            try:
+                text = await self.pool.transcribe(final_audio)
+            except Exception as e:
+                print(f"[STT:{session.id}] 최종 STT 오류: {e}")
+                text = ""
+            if text.strip():
+                await self._publish_transcript(session, text)
+            session.pcm.discard_until(snapshot_end)
+            session.retry_count = 0
+
+        # 연결 종료 시 잔여 텍스트 버퍼 요약
+        if session.text_buffer:
+            print(f"[요약:{session.id}] 잔여 버퍼 {session.buffer_char_count}자 → 최종 요약")
+            summary = await loop.run_in_executor(None, self._summarize_sync, session.text_buffer)
+            await self._publish_summary(session, summary)
+
+    async def _run_cycle(self, session: AudioSession):
+        """STT 1사이클: history + 누적 구간 STT → Qwen 품질 판정 → broadcast / NG 보존"""
+        # 누적 구간 시작을 끝으로 이동 (이후 도착 청크는 새 누적 구간에 적재,
+        # 용량에 가까우면 take_window가 복사본을 넘기므로 처리 중인 오디오는 덮어쓰지 않음)
+        full_audio, snapshot_end = session.take_window()
+        last_chunk_at = session.last_chunk_at
+        last_chunk = session.chunk_count
+        total_sec = len(full_audio) / SAMPLE_RATE
+        if self.pool.busy:
+            print(f"[STT:{session.id}] 추론 큐 가득 참, 자리 대기")
+        print(f"[STT:{session.id}] 누적 {total_sec:.1f}초 오디오 추론 중... "
+              f"(재시도 #{session.retry_count})")
+
+        loop = asyncio.get_running_loop()
+        try:
+            text = await self.pool.transcribe(full_audio)
+        except Exception as e:
+            # 오디오는 history로 남겨 다음 사이클에서 다시 시도
+            print(f"[STT:{session.id}] 추론 오류: {e}")
+            return
 
-        # 재진입 방지: STT/Qwen 처리 중에는 초과분만 유지
-        if self._processing:
-            print(f"[오디오] STT 처리 중, 다음 사이클 대기")
+        if not text.strip():
+            print(f"[STT:{session.id}] 텍스트 없음 (침묵), 버퍼 클리어")
+            session.pcm.discard_until(snapshot_end)
+            session.retry_count = 0
             return
-        self._processing = True
 
-        try:
-            # 누적 완료 → history + buffer 스냅샷 후 buffer 즉시 클리어
-            # (STT 처리 중 도착하는 청크는 빈 buffer에 적재 → 15초 윈도우 유지)
-            combined = bytes(self.pcm_history) + bytes(self.pcm_buffer)
-            self.pcm_buffer.clear()
-            full_audio = np.frombuffer(combined, dtype=np.float32)
-            total_sec = len(full_audio) / 16000
-            print(f"[STT] 누적 {total_sec:.1f}초 오디오 추론 중... "
-                  f"(재시도 #{self.retry_count})")
-
-            loop = asyncio.get_running_loop()
-            text = await loop.run_in_executor(None, self.stt.transcribe, full_audio)
-
-            if not text.strip():
-                print(f"[STT] 텍스트 없음 (침묵), 버퍼 클리어")
-                self.pcm_history.clear()
-                self.retry_count = 0
-                return
-
-            # Qwen 품질 판정
-            verdict = await loop.run_in_executor(None, self._judge_quality, text)
-            print(f"[품질] Qwen 판정: {verdict} | 텍스트: {text[:60]}...")
-
-            if verdict == "OK" or self.retry_count >= MAX_RETRY:
-                if self.retry_count >= MAX_RETRY and verdict != "OK":
-                    print(f"[품질] 최대 재시도 도달 ({MAX_RETRY}회), 강제 broadcast")
-                # OK 또는 최대 재시도 → broadcast + history 클리어
-                await self.broadcast({"type": "transcript", "text": text})
-                self._add_to_buffer(text)
-                self.pcm_history.clear()
-                self.retry_count = 0
-            else:
-                # NG → combined를 history로 보존, 다음 15초 추가 대기
-                print(f"[품질] NG → history에 {len(combined)}bytes 보존, "
-                      f"다음 {CHUNK_SECONDS}초 대기")
-                self.pcm_history = bytearray(combined)
-                self.retry_count += 1
-
-            # 500자 초과 시 요약
-            if self.buffer_char_count >= BUFFER_CHAR_THRESHOLD:
-                print(f"[요약] 버퍼 {self.buffer_char_count}자 → 요약 트리거")
-                summary = await loop.run_in_executor(None, self._summarize_sync)
-                self.summaries.append(summary)
-                await self.broadcast({"type": "summary", "text": summary})
-                self.text_buffer.clear()
-                self.buffer_char_count = 0
-        finally:
-            self._processing = False
+        # Qwen 품질 판정
+        verdict = await loop.run_in_executor(None, self._judge_quality, text)
+        print(f"[품질:{session.id}] Qwen 판정: {verdict} | 텍스트: {text[:60]}...")
+
+        if verdict == "OK" or session.retry_count >= MAX_RETRY:
+            if session.retry_count >= MAX_RETRY and verdict != "OK":
+                print(f"[품질:{session.id}] 최대 재시도 도달 ({MAX_RETRY}회), 강제 broadcast")
+            # OK 또는 최대 재시도 → broadcast + history 해제
+            latency = time.monotonic() - last_chunk_at
+            session.latencies.append(latency)
+            await self._publish_transcript(session, text, chunk=last_chunk, latency=latency)
+            session.pcm.discard_until(snapshot_end)
+            session.retry_count = 0
+        else:
+            # NG → 스냅샷 구간을 history로 보존 (해제하지 않음), 다음 15초 추가 대기
+            print(f"[품질:{session.id}] NG → history에 {total_sec:.1f}초 보존, "
+                  f"다음 {CHUNK_SECONDS}초 대기")
+            session.retry_count += 1
+
+        # 500자 초과 시 요약
+        if session.buffer_char_count >= BUFFER_CHAR_THRESHOLD:
+            print(f"[요약:{session.id}] 버퍼 {session.buffer_char_count}자 → 요약 트리거")
+            summary = await loop.run_in_executor(None, self._summarize_sync, session.text_buffer)
+            await self._publish_summary(session, summary)
+
+    async def _publish_transcript(self, session: AudioSession, text: str,
+                                  chunk: int | None = None, latency: float | None = None):
+        message = {"type": "transcript", "text": text, "session": session.id}
+        if chunk is not None:
+            message["chunk"] = chunk
+        if latency is not None:
+            message["latency"] = round(latency, 3)
+        session.add_text(text)
+        self.transcript_log.append(text)
+        await self.broadcast(message, session)
+
+    async def _publish_summary(self, session: AudioSession, summary: str):
+        session.summaries.append(summary)
+        self.summaries.append(summary)
+        await self.broadcast({"type": "summary", "text": summary, "session": session.id}, session)
+        session.text_buffer.clear()
+        session.buffer_char_count = 0
 
     # --- 브로드캐스트 ---
 
-    async def broadcast(self, data: dict):
-        """모든 클라이언트 (모니터 + 오디오)에 메시지 push"""
-        all_clients = self.monitor_clients | self.audio_clients
-        if not all_clients:
-            return
-        disconnected = set()
-        for client in all_clients:
-            try:
-                if client.closed:
-                    disconnected.add(client)
-                    continue
-                await client.send_json(data)
-                self.msg_count += 1
-            except Exception as e:
-                print(f"[broadcast] 전송 실패 ({type(e).__name__}): {e}")
-                disconnected.add(client)
-        self.monitor_clients -= disconnected
-        self.audio_clients -= disconnected
+    async def _send(self, client: web.WebSocketResponse, data: dict) -> bool:
+        try:
+            if client.closed:
+                return False
+            await client.send_json(data)
+            self.msg_count += 1
+            return True
+        except Exception as e:
+            print(f"[broadcast] 전송 실패 ({type(e).__name__}): {e}")
+            return False
+
+    async def broadcast(self, data: dict, session: AudioSession | None = None):
+        """모니터 전체 + 해당 세션 오디오 클라이언트에 메시지 push (session 없으면 전 세션)"""
+        audio_clients = [session.ws] if session else [s.ws for s in self.sessions.values()]
+        for client in list(self.monitor_clients):
+            if not await self._send(client, data):
+                self.monitor_clients.discard(client)
+        for client in audio_clients:
+            await self._send(client, data)
 
     # --- Qwen 품질 판정 ---
 
@@ -761,18 +1056,12 @@ class MeetingServer:
             print(f"[품질] Qwen 판정 오류 (OK 기본값): {e}")
             return "OK"  # Qwen 실패 시 통과 (STT 결과를 보여주는 게 안 보여주는 것보다 나음)
 
-    # --- 버퍼 + 요약 ---
-
-    def _add_to_buffer(self, text: str):
-        """텍스트를 버퍼에 추가"""
-        self.text_buffer.append(text)
-        self.buffer_char_count += len(text)
-        self.transcript_log.append(text)
+    # --- 요약 ---
 
-    def _summarize_sync(self) -> str:
+    def _summarize_sync(self, texts: list[str]) -> str:
         """Qwen 요약 호출 (동기 — executor에서 실행)"""
-        full_text = "\n".join(self.text_buffer)
-        print(f"[요약] Qwen 호출 ({self.buffer_char_count}자)...")
+        full_text = "\n".join(texts)
+        print(f"[요약] Qwen 호출 ({len(full_text)}자)...")
         t0 = time.time()
 
         try:
@@ -811,22 +1100,26 @@ class MeetingServer:
 
     # --- 결과 저장 ---
 
-    def _save_results(self):
+    def _save_results(self, session: AudioSession):
         """세션 결과 JSON 저장"""
-        if not self.transcript_log:
-            print("[저장] 전사 기록 없음, 스킵")
+        if not session.transcript_log:
+            print(f"[저장:{session.id}] 전사 기록 없음, 스킵")
             return
 
         RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+        latencies = sorted(session.latencies)
         result = {
             "run_at": datetime.now().isoformat(),
-            "elapsed_sec": round(time.time() - self.start_time, 1),
-            "chunk_count": self.chunk_count,
-            "transcript": self.transcript_log,
-            "summaries": self.summaries,
-            "segments_count": len(self.transcript_log),
+            "session": session.id,
+            "elapsed_sec": round(time.time() - session.start_time, 1),
+            "chunk_count": session.chunk_count,
+            "transcript": session.transcript_log,
+            "summaries": session.summaries,
+            "segments_count": len(session.transcript_log),
+            "latency_p50_sec": round(latencies[len(latencies) // 2], 3) if latencies else None,
+            "latency_max_sec": round(latencies[-1], 3) if latencies else None,
         }
-        out_path = RESULTS_DIR / "realtime_session_result.json"
+        out_path = RESULTS_DIR / f"realtime_session_{session.id}_result.json"
         out_path.write_text(
             json.dumps(result, ensure_ascii=False, indent=2), encoding="utf-8"
         )
@@ -859,16 +1152,18 @@ def main():
     ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
     ssl_context.load_cert_chain(str(cert_path), str(key_path))
 
-    # Whisper 모델 로드
-    print("Whisper Large-v3 모델 로드 중...")
-    stt = STTService()
+    # Whisper 모델 로드 (워커 수만큼)
+    print(f"Whisper {WHISPER_MODEL} 모델 로드 중... (워커 {STT_WORKERS}개)")
+    services = [STTService() for _ in range(max(STT_WORKERS, 1))]
     print("Whisper 모델 로드 완료")
 
     # aiohttp 앱 구성
-    server = MeetingServer(stt)
+    server = MeetingServer(InferencePool(services, STT_QUEUE_SIZE))
     server.start_time = time.time()  # 모델 로딩 후 실제 서버 시작 시간
 
     app = web.Application()
+    app.on_startup.append(server.on_startup)
+    app.on_cleanup.append(server.on_cleanup)
     app.router.add_get("/", server.handle_index)
     app.router.add_get("/monitor", server.handle_index)
     app.router.add_get("/recorder", server.handle_recorder)
@@ -882,6 +1177,7 @@ def main():
     print(f"  모니터:    https://{local_ip}:{PORT}/")
     print(f"  레코더:    https://{local_ip}:{PORT}/recorder")
     print(f"  Ollama:    {OLLAMA_URL} ({MODEL})")
+    print(f"  STT 워커:  {STT_WORKERS}개 (큐 {STT_QUEUE_SIZE}, 백로그 한도 {MAX_BACKLOG_SECONDS}초)")
     print(f"  종료:      Ctrl+C")
     print(f"{'='*55}\n")
 
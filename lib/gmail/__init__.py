@@ -18,6 +18,9 @@ Usage:
     # Read inbox
     emails = client.list_emails(query="is:unread", max_results=10)
 
+    # Headers only, fetched in one batch request per 100 emails
+    emails = client.list_emails(query="in:inbox", max_results=100, format="metadata")
+
     # Get email detail
     email = client.get_email(email_id)
 
@@ -0,0 +1 @@
+"""Gmail library benchmarks (not collected by pytest)"""
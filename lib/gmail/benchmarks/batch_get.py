@@ -0,0 +1,118 @@
+"""
+Latency of fetching listed messages: one call each vs get_emails
+
+Times 100 (by default) messages.get calls made the old way, one
+get_email() per listed ID, against one get_emails() call. The Gmail
+service and the gws CLI are replaced by fakes that sleep for a fixed
+round-trip time per HTTP request or gws process, so the numbers show the
+round-trip count, not Gmail's server time. Pass --rtt/--gws-ms measured on
+your own network for realistic figures.
+
+Usage:
+    python -m lib.gmail.benchmarks.batch_get
+    python -m lib.gmail.benchmarks.batch_get --count 500 --rtt 80 --gws-ms 400
+"""
+
+import argparse
+import time
+from unittest import mock
+
+from lib.gmail import client as gmail_client
+from lib.gmail.client import GmailClient
+
+
+def _message(email_id: str) -> dict:
+    return {"id": email_id, "threadId": email_id, "payload": {"headers": [{"name": "Subject", "value": email_id}]}}
+
+
+class _Request:
+    def __init__(self, service: "_Service", email_id: str):
+        self.service, self.email_id = service, email_id
+
+    def execute(self):
+        time.sleep(self.service.rtt)
+        return _message(self.email_id)
+
+
+class _Batch:
+    def __init__(self, service: "_Service", callback):
+        self.service, self.callback, self.parts = service, callback, []
+
+    def add(self, request: _Request, request_id: str) -> None:
+        self.parts.append((request_id, request))
+
+    def execute(self):
+        time.sleep(self.service.rtt)
+        for request_id, request in self.parts:
+            self.callback(request_id, _message(request.email_id), None)
+
+
+class _Service:
+    """Gmail service whose every HTTP request (single or batch) costs one round-trip"""
+
+    def __init__(self, rtt: float):
+        self.rtt = rtt
+
+    def users(self):
+        return self
+
+    def messages(self):
+        return self
+
+    def get(self, id, **params):
+        return _Request(self, id)
+
+    def new_batch_http_request(self, callback):
+        return _Batch(self, callback)
+
+
+def _timed(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def run(count: int = 100, rtt_ms: float = 50.0, gws_ms: float = 250.0) -> dict[str, float]:
+    """Run the benchmark
+
+    Returns:
+        {path: seconds for count messages}
+    """
+    ids = [f"m{i:04d}" for i in range(count)]
+
+    api = GmailClient(credentials=object(), prefer_gws=False)
+    api._service = _Service(rtt_ms / 1000)
+
+    def gws_call(resource, method, params):
+        time.sleep(gws_ms / 1000)
+        return _message(params["id"])
+
+    with mock.patch.object(gmail_client, "get_credentials", return_value=None), \
+            mock.patch.object(gmail_client.shutil, "which", return_value="gws"):
+        gws = GmailClient()
+    gws._gws_call = gws_call
+
+    results = {
+        "api one-by-one": _timed(lambda: [api.get_email(i) for i in ids]),
+        "api get_emails": _timed(lambda: api.get_emails(ids)),
+        "gws one-by-one": _timed(lambda: [gws.get_email(i) for i in ids]),
+        "gws get_emails": _timed(lambda: gws.get_emails(ids)),
+    }
+
+    print(f"{count} messages, HTTP round-trip {rtt_ms:g} ms, gws process {gws_ms:g} ms")
+    for name, seconds in results.items():
+        print(f"  {name:15s} {seconds:8.3f} s")
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Gmail message fetch latency benchmark")
+    parser.add_argument("--count", type=int, default=100, help="Number of messages")
+    parser.add_argument("--rtt", type=float, default=50.0, help="Simulated HTTP round-trip (ms)")
+    parser.add_argument("--gws-ms", type=float, default=250.0, help="Simulated gws process time (ms)")
+    args = parser.parse_args()
+    run(args.count, args.rtt, args.gws_ms)
+
+
+if __name__ == "__main__":
+    main()
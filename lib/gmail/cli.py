@@ -113,7 +113,7 @@ def inbox(
 
     try:
         client = GmailClient()
-        emails = client.list_emails(query="in:inbox", max_results=limit)
+        emails = client.list_emails(query="in:inbox", max_results=limit, format="metadata")
 
         if json_output:
             output = [{
@@ -148,7 +148,7 @@ def unread(
 
     try:
         client = GmailClient()
-        emails = client.list_emails(query="is:unread", max_results=limit)
+        emails = client.list_emails(query="is:unread", max_results=limit, format="metadata")
 
         if json_output:
             output = [{
@@ -190,7 +190,7 @@ def search(
 
     try:
         client = GmailClient()
-        emails = client.list_emails(query=query, max_results=limit)
+        emails = client.list_emails(query=query, max_results=limit, format="metadata")
 
         if json_output:
             output = [{
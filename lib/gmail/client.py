@@ -9,12 +9,18 @@ Usage:
 
     client = GmailClient()
     emails = client.list_emails(query="is:unread", max_results=10)
+
+    # Headers/snippet only (no body), fetched in one batch request
+    emails = client.list_emails(query="in:inbox", max_results=100, format="metadata")
 """
 
 import base64
 import json
+import re
 import shutil
 import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from typing import Optional, List
@@ -28,6 +34,19 @@ from .errors import (
     GmailRateLimitError, GmailGwsNotFoundError,
 )
 
+# HTTP batch endpoint accepts at most 100 calls per request
+MAX_BATCH_SIZE = 100
+# Rate-limited parts of a batch are retried in a follow-up batch
+BATCH_RETRIES = 3
+# gws has no batch command: messages.get calls run as parallel processes
+GWS_CONCURRENCY = 8
+
+MESSAGE_FORMATS = ("full", "metadata")
+METADATA_HEADERS = ["From", "To", "Cc", "Subject", "Date"]
+
+# gws exits non-zero and prints the API error JSON; a 404 means the message is gone
+_GWS_NOT_FOUND = re.compile(r'"code"\s*:\s*404\b|\bnotFound\b|Requested entity was not found')
+
 
 class GmailClient:
     """Gmail API client with gws CLI + Python API fallback."""
@@ -111,6 +130,89 @@ class GmailClient:
         except subprocess.TimeoutExpired:
             raise GmailAPIError("gws command timed out (30s)")
 
+    def _gws_call_many(
+        self, resource: str, method: str, params_list: List[dict], skip_not_found: bool = False
+    ) -> List[Optional[dict]]:
+        """
+        Run several gws calls in parallel (at most GWS_CONCURRENCY processes at once).
+
+        Args:
+            skip_not_found: Return None for calls that fail with a 404 instead of raising
+
+        Returns:
+            Parsed JSON responses in the order of params_list
+        """
+        if not params_list:
+            return []
+
+        def call(params):
+            try:
+                return self._gws_call(resource, method, params)
+            except GmailAPIError as e:
+                if skip_not_found and _GWS_NOT_FOUND.search(e.error):
+                    return None
+                raise
+
+        with ThreadPoolExecutor(max_workers=min(GWS_CONCURRENCY, len(params_list))) as pool:
+            return list(pool.map(call, params_list))
+
+    # ── HTTP batch helpers ────────────────────────────────────
+
+    def _batch_get_messages(self, email_ids: List[str], format: str) -> dict:
+        """
+        Fetch messages with the Gmail HTTP batch endpoint.
+
+        Args:
+            email_ids: Message IDs (any number; split into MAX_BATCH_SIZE chunks)
+            format: "full" or "metadata"
+
+        Returns:
+            Dict of message ID → raw message
+        """
+        messages = self.service.users().messages()
+        params = {"userId": "me", "format": format}
+        if format == "metadata":
+            params["metadataHeaders"] = METADATA_HEADERS
+
+        results = {}
+        pending = list(dict.fromkeys(email_ids))
+        for attempt in range(BATCH_RETRIES + 1):
+            rate_limited = []
+            for start in range(0, len(pending), MAX_BATCH_SIZE):
+                errors = {}
+
+                def callback(request_id, response, exception):
+                    if exception is not None:
+                        errors[request_id] = exception
+                    else:
+                        results[request_id] = response
+
+                batch = self.service.new_batch_http_request(callback=callback)
+                for email_id in pending[start:start + MAX_BATCH_SIZE]:
+                    batch.add(messages.get(id=email_id, **params), request_id=email_id)
+                try:
+                    batch.execute()
+                except HttpError as e:
+                    self._handle_error(e)
+
+                for email_id, error in errors.items():
+                    if isinstance(error, HttpError) and error.resp.status == 429:
+                        rate_limited.append(email_id)
+                    elif isinstance(error, HttpError) and error.resp.status == 404:
+                        continue  # Deleted since it was listed
+                    elif isinstance(error, HttpError):
+                        self._handle_error(error)
+                    else:
+                        raise GmailAPIError(str(error))
+
+            if not rate_limited:
+                return results
+            if attempt < BATCH_RETRIES:
+                time.sleep(2 ** attempt)
+            pending = rate_limited
+
+        raise GmailRateLimitError()
+
     # ── Public API ────────────────────────────────────────────
 
     def get_profile(self) -> dict:
@@ -223,6 +325,7 @@ class GmailClient:
         max_results: int = 10,
         label_ids: List[str] = None,
         include_spam_trash: bool = False,
+        format: str = "full",
     ) -> List[GmailMessage]:
         """
         List emails matching query.
@@ -232,6 +335,7 @@ class GmailClient:
             max_results: Maximum number of emails to return
             label_ids: Filter by label IDs (e.g., ["INBOX", "UNREAD"])
             include_spam_trash: Include spam and trash
+            format: "full" (with body) or "metadata" (headers and snippet only)
 
         Returns:
             List of GmailMessage objects
@@ -250,18 +354,59 @@ class GmailClient:
             try:
                 data = self._gws_call("gmail.users.messages", "list", params)
                 messages = data.get("messages", [])
-                return [self.get_email(msg["id"]) for msg in messages]
+                return self.get_emails([msg["id"] for msg in messages], format=format)
             except GmailGwsNotFoundError:
                 pass
 
         try:
             results = self.service.users().messages().list(**params).execute()
             messages = results.get("messages", [])
-
-            return [self.get_email(msg["id"]) for msg in messages]
         except HttpError as e:
             self._handle_error(e)
 
+        return self.get_emails([msg["id"] for msg in messages], format=format)
+
+    def get_emails(self, email_ids: List[str], format: str = "full") -> List[GmailMessage]:
+        """
+        Get many emails with as few round-trips as possible.
+
+        With Python API credentials, messages are fetched through the HTTP batch
+        endpoint (one request per MAX_BATCH_SIZE messages). gws-only setups run
+        the gws calls in parallel instead.
+
+        Args:
+            email_ids: Email IDs
+            format: "full" (with body) or "metadata" (headers and snippet only)
+
+        Returns:
+            GmailMessage objects in the order of email_ids
+        """
+        if format not in MESSAGE_FORMATS:
+            raise ValueError(f"format must be one of {MESSAGE_FORMATS}: {format!r}")
+        if not email_ids:
+            return []
+
+        if self.credentials is None and self._gws_available:
+            try:
+                params = {"userId": "me", "format": format}
+                if format == "metadata":
+                    params["metadataHeaders"] = METADATA_HEADERS
+                raw = self._gws_call_many(
+                    "gmail.users.messages", "get",
+                    [{**params, "id": email_id} for email_id in email_ids],
+                    skip_not_found=True,
+                )
+                # Messages deleted between list and get are skipped
+                return [self._parse_message(msg) for msg in raw if msg is not None]
+            except GmailGwsNotFoundError:
+                raise GmailAuthError(
+                    "gws CLI not found and not authenticated. Run 'python -m lib.gmail login' first."
+                )
+
+        raw = self._batch_get_messages(email_ids, format)
+        # Messages deleted between list and get are skipped
+        return [self._parse_message(raw[email_id]) for email_id in email_ids if email_id in raw]
+
     def get_email(self, email_id: str) -> GmailMessage:
         """
         Get full email details.
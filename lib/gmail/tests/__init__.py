@@ -0,0 +1 @@
+"""Gmail library tests"""
@@ -0,0 +1,217 @@
+"""
+Tests for batched message fetching in GmailClient
+"""
+
+import threading
+from typing import Optional
+from unittest import mock
+
+import httplib2
+import pytest
+from googleapiclient.errors import HttpError
+
+from lib.gmail import client as gmail_client
+from lib.gmail.client import BATCH_RETRIES, METADATA_HEADERS, GmailClient
+from lib.gmail.errors import GmailAPIError, GmailRateLimitError
+
+
+def _message(email_id: str) -> dict:
+    return {
+        "id": email_id,
+        "threadId": f"t-{email_id}",
+        "snippet": f"snippet {email_id}",
+        "labelIds": ["INBOX"],
+        "payload": {"headers": [{"name": "Subject", "value": f"subject {email_id}"}]},
+    }
+
+
+def _http_error(status: int) -> HttpError:
+    return HttpError(httplib2.Response({"status": status}), b"{}")
+
+
+class FakeGet:
+    """messages.get request; execute() is one HTTP round-trip"""
+
+    def __init__(self, gmail: "FakeGmail", params: dict):
+        self.gmail, self.params = gmail, params
+
+    def execute(self):
+        self.gmail.http += 1
+        return self.gmail.run(self.params)
+
+
+class FakeBatch:
+    """BatchHttpRequest stand-in: runs parts in order, calls back per part"""
+
+    def __init__(self, gmail: "FakeGmail", callback):
+        self.gmail, self.callback, self.parts = gmail, callback, []
+
+    def add(self, request: FakeGet, request_id: str) -> None:
+        assert len(self.parts) < 100
+        self.parts.append((request_id, request))
+
+    def execute(self):
+        self.gmail.http += 1
+        self.gmail.batches.append(len(self.parts))
+        for request_id, request in self.parts:
+            try:
+                self.callback(request_id, self.gmail.run(request.params), None)
+            except HttpError as e:
+                self.callback(request_id, None, e)
+
+
+class FakeGmail:
+    """Gmail v1 service stand-in for users().messages().get and batches
+
+    Records HTTP round-trips (http), batch sizes (batches) and the params of
+    every messages.get part (gets).
+    """
+
+    def __init__(self, ids, rate_limited: int = 0, errors: Optional[dict] = None):
+        self.stored = {email_id: _message(email_id) for email_id in ids}
+        self.rate_limited = rate_limited  # First N parts answer 429
+        self.errors = errors or {}  # Message ID → HTTP status
+        self.http = 0
+        self.batches: list[int] = []
+        self.gets: list[dict] = []
+
+    def users(self):
+        return self
+
+    def messages(self):
+        return self
+
+    def get(self, **params):
+        return FakeGet(self, params)
+
+    def new_batch_http_request(self, callback):
+        return FakeBatch(self, callback)
+
+    def run(self, params: dict) -> dict:
+        self.gets.append(params)
+        if self.rate_limited:
+            self.rate_limited -= 1
+            raise _http_error(429)
+        if params["id"] in self.errors:
+            raise _http_error(self.errors[params["id"]])
+        if params["id"] not in self.stored:
+            raise _http_error(404)
+        return self.stored[params["id"]]
+
+
+@pytest.fixture
+def sleeps():
+    calls = []
+    with mock.patch.object(gmail_client.time, "sleep", calls.append):
+        yield calls
+
+
+def _client(service: FakeGmail) -> GmailClient:
+    client = GmailClient(credentials=object(), prefer_gws=False)
+    client._service = service
+    return client
+
+
+class TestBatchGet:
+    def test_one_http_request_per_100_messages(self):
+        ids = [f"m{i:03d}" for i in range(250)]
+        gmail = FakeGmail(ids)
+
+        emails = _client(gmail).get_emails(list(reversed(ids)))
+
+        assert gmail.batches == [100, 100, 50]
+        assert gmail.http == 3
+        assert [e.id for e in emails] == list(reversed(ids))
+        assert emails[0].subject == "subject m249"
+
+    def test_metadata_format(self):
+        gmail = FakeGmail(["a", "b"])
+
+        _client(gmail).get_emails(["a", "b"], format="metadata")
+
+        assert all(p["format"] == "metadata" and p["metadataHeaders"] == METADATA_HEADERS for p in gmail.gets)
+
+    def test_invalid_format_rejected(self):
+        with pytest.raises(ValueError):
+            _client(FakeGmail([])).get_emails(["a"], format="raw")
+
+    def test_duplicate_ids_fetched_once(self):
+        gmail = FakeGmail(["a", "b"])
+
+        emails = _client(gmail).get_emails(["a", "b", "a"])
+
+        assert [e.id for e in emails] == ["a", "b", "a"]
+        assert gmail.batches == [2]
+
+    def test_deleted_message_skipped(self):
+        gmail = FakeGmail(["a", "c"])
+
+        emails = _client(gmail).get_emails(["a", "b", "c"])
+
+        assert [e.id for e in emails] == ["a", "c"]
+
+    def test_rate_limited_parts_retried_with_backoff(self, sleeps):
+        ids = [f"m{i}" for i in range(120)]
+        gmail = FakeGmail(ids, rate_limited=30)
+
+        emails = _client(gmail).get_emails(ids)
+
+        assert [e.id for e in emails] == ids
+        assert gmail.batches == [100, 20, 30]
+        assert sleeps == [1]
+
+    def test_rate_limit_exhausted(self, sleeps):
+        gmail = FakeGmail(["a"], rate_limited=BATCH_RETRIES + 1)
+
+        with pytest.raises(GmailRateLimitError):
+            _client(gmail).get_emails(["a"])
+        assert sleeps == [2 ** attempt for attempt in range(BATCH_RETRIES)]
+
+    def test_other_part_error_raised(self):
+        gmail = FakeGmail(["a", "b"], errors={"b": 500})
+
+        with pytest.raises(GmailAPIError) as exc:
+            _client(gmail).get_emails(["a", "b"])
+        assert exc.value.status_code == 500
+
+
+class TestGwsGet:
+    @pytest.fixture
+    def gws_client(self):
+        with mock.patch.object(gmail_client, "get_credentials", return_value=None), \
+                mock.patch.object(gmail_client.shutil, "which", return_value="/usr/bin/gws"):
+            client = GmailClient()
+        assert client.credentials is None
+        return client
+
+    def _fake_gws(self, messages: dict, failures: dict):
+        calls, lock = [], threading.Lock()
+
+        def gws_call(resource, method, params):
+            assert (resource, method) == ("gmail.users.messages", "get")
+            with lock:
+                calls.append(params["id"])
+            if params["id"] in failures:
+                raise GmailAPIError(f"gws command failed: {failures[params['id']]}", status_code=1)
+            return messages[params["id"]]
+
+        return gws_call, calls
+
+    def test_parallel_calls_keep_order_and_skip_deleted(self, gws_client):
+        ids = [f"m{i}" for i in range(20)]
+        gone = '{"error": {"code": 404, "message": "Requested entity was not found.", "status": "NOT_FOUND"}}'
+        gws_call, calls = self._fake_gws({i: _message(i) for i in ids}, {"m3": gone, "m7": gone})
+
+        with mock.patch.object(gws_client, "_gws_call", side_effect=gws_call):
+            emails = gws_client.get_emails(ids, format="metadata")
+
+        assert sorted(calls) == sorted(ids)
+        assert [e.id for e in emails] == [i for i in ids if i not in ("m3", "m7")]
+
+    def test_other_failure_raised(self, gws_client):
+        denied = '{"error": {"code": 403, "message": "Insufficient Permission"}}'
+        gws_call, _ = self._fake_gws({"a": _message("a")}, {"b": denied})
+
+        with mock.patch.object(gws_client, "_gws_call", side_effect=gws_call), \
+                pytest.raises(GmailAPIError, match="Insufficient Permission"):
+            gws_client.get_emails(["a", "b"])
@@ -18,6 +18,10 @@ from .models import TextSegment, TableData, TableCell, ConversionResult
 from .auth import get_credentials, get_sheets_credentials
 from .converter import MarkdownToDocsConverter, create_google_doc
 from .table_renderer import NativeTableRenderer
+from .doc_model import DocModel
+from .planner import DocumentPlan, build_document_plan, execute_document_plan
+from .incremental import IncrementalPlan, build_incremental_plan, execute_incremental_plan
+from .rate_governor import RateGovernor, execute_request, get_governor, track_calls
 from .notion_style import (
     NOTION_COLORS,
     NOTION_FONTS,
@@ -31,10 +35,14 @@ from .notion_style import (
 )
 from .diagram_generator import DiagramGenerator, create_generator
 from .image_inserter import ImageInserter, create_inserter
+from .image_cache import ImageUploadCache, upload_local_images
+from .sync_state import SyncStateStore, get_sync_store
 from .batch_processor import BatchConverter, ConvertResult as BatchConvertResult
 from .auto_trigger import AutoTriggerHandler
 from .project_registry import ProjectRegistry, get_project_folder_id, get_default_folder_id
 from .drive_guardian import DriveGuardian, AuditReport, FixPlan
+from .drive_crawler import DriveCrawler
+from .drive_executor import DriveFixExecutor, MoveOp
 from .sheets import SheetsClient, parse_sheet_url
 
 __version__ = "1.4.0"
@@ -51,6 +59,20 @@ __all__ = [
     "MarkdownToDocsConverter",
     "create_google_doc",
     "NativeTableRenderer",
+    # Plan 모드 (오프라인 요청 계획)
+    "DocModel",
+    "DocumentPlan",
+    "build_document_plan",
+    "execute_document_plan",
+    # Incremental Update (섹션 단위 증분 업데이트)
+    "IncrementalPlan",
+    "build_incremental_plan",
+    "execute_incremental_plan",
+    # Rate Governor (전역 API 속도 조절)
+    "RateGovernor",
+    "execute_request",
+    "get_governor",
+    "track_calls",
     # Notion Style
     "NOTION_COLORS",
     "NOTION_FONTS",
@@ -67,6 +89,11 @@ __all__ = [
     # Image Inserter
     "ImageInserter",
     "create_inserter",
+    "ImageUploadCache",
+    "upload_local_images",
+    # Sync State (문서/이미지 동기화 상태 저장소)
+    "SyncStateStore",
+    "get_sync_store",
     # Batch Processor (Phase 1)
     "BatchConverter",
     "BatchConvertResult",
@@ -80,6 +107,11 @@ __all__ = [
     "DriveGuardian",
     "AuditReport",
     "FixPlan",
+    # Drive Crawler (폴더 목록 너비 우선 조회)
+    "DriveCrawler",
+    # Drive Executor (일괄 이동/폴더 생성)
+    "DriveFixExecutor",
+    "MoveOp",
     # Sheets
     "SheetsClient",
     "parse_sheet_url",
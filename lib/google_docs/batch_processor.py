@@ -12,6 +12,7 @@ from typing import Optional
 from .converter import create_google_doc
 from .auth import DEFAULT_FOLDER_ID
 from .project_registry import get_project_folder_id
+from .rate_governor import get_governor
 
 
 @dataclass
@@ -65,6 +66,7 @@ class BatchConverter:
         fail_count = len(results) - success_count
 
         print(f"[BatchConverter] 완료: 성공 {success_count}, 실패 {fail_count}")
+        print(f"[BatchConverter] API: {get_governor().summary()}")
 
         return results
 
@@ -0,0 +1,209 @@
+"""
+문서당 Docs API 호출 수 벤치마크
+
+테이블/코드 블록 수를 늘려 가며 create_google_doc()이 실행하는
+documents().batchUpdate / documents().get 호출 수를 셉니다.
+실제 API 대신 인메모리 문서 모델(DocModel)에 요청을 적용하는
+가짜 서비스를 사용하므로 네트워크/인증이 필요 없고, 모든 요청의
+인덱스 유효성도 함께 검증됩니다.
+
+참고: 테이블마다 단계별로 삽입하던 이전 방식은
+    표 1개당 get 3회 + batchUpdate 3회,
+    코드 블록 1개당 get 5회 + batchUpdate 4회가 추가로 필요했습니다.
+
+Usage:
+    python -m lib.google_docs.benchmarks.api_calls
+    python -m lib.google_docs.benchmarks.api_calls --sections 10 40 100
+"""
+
+import argparse
+import contextlib
+import io
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Iterator
+from unittest import mock
+
+
+def build_doc(sections: int) -> str:
+    """섹션마다 표 1개 + 코드 블록 1개가 있는 합성 PRD (이미지 1개 포함)"""
+    out = ["# API 호출 벤치마크", "", "![구성도](https://example.com/arch.png)", ""]
+    for i in range(sections):
+        out += [
+            f"## {i}. 섹션 {i}",
+            "",
+            f"본문 **굵게** 와 `code` 텍스트 {i}.",
+            "",
+            "| 항목 | 설명 | 비고 |",
+            "|------|------|------|",
+            f"| **{i}** | 설명 🙂 | `x` |",
+            "| 둘째 | 행 | - |",
+            "",
+            "```python",
+            f"def f{i}():",
+            "    return 1",
+            "```",
+            "",
+            f"- 항목 {i}",
+            "",
+        ]
+    return "\n".join(out)
+
+
+_DOCS_URI = "https://docs.googleapis.com/v1/documents"
+_DRIVE_URI = "https://www.googleapis.com/drive/v3/files"
+
+
+class _Call:
+    """HttpRequest 대체 (uri/method로 RateGovernor 버킷 분류)"""
+
+    def __init__(self, result: Any, uri: str = _DOCS_URI, method: str = "POST"):
+        self._result = result
+        self.uri = uri
+        self.method = method
+
+    def execute(self) -> Any:
+        return self._result() if callable(self._result) else self._result
+
+
+class _FakeDocuments:
+    """documents() 리소스: 요청을 DocModel에 적용하고 호출 수 기록"""
+
+    def __init__(self, counts: dict[str, int]):
+        from lib.google_docs.doc_model import DocModel
+
+        self._model = DocModel()
+        self._counts = counts
+
+    def create(self, body: dict) -> _Call:
+        self._counts["create"] += 1
+        return _Call({"documentId": "benchmark-doc"})
+
+    def get(self, documentId: str) -> _Call:
+        self._counts["get"] += 1
+        return _Call(self._model.to_document, f"{_DOCS_URI}/{documentId}", "GET")
+
+    def batchUpdate(self, documentId: str, body: dict) -> _Call:
+        self._counts["batchUpdate"] += 1
+        return _Call(lambda: self._apply(body["requests"]), f"{_DOCS_URI}/{documentId}:batchUpdate")
+
+    def _apply(self, requests: list[dict]) -> dict:
+        self._counts["requests"] += len(requests)
+        self._model.apply(requests)
+        return {"replies": [{} for _ in requests]}
+
+
+class _FakeFiles:
+    def get(self, **kwargs) -> _Call:
+        return _Call({"parents": ["root"]}, _DRIVE_URI, "GET")
+
+    def update(self, **kwargs) -> _Call:
+        return _Call({}, _DRIVE_URI, "PATCH")
+
+
+class _FakeService:
+    def __init__(self, counts: dict[str, int]):
+        self._documents = _FakeDocuments(counts)
+        self._files = _FakeFiles()
+
+    def documents(self) -> _FakeDocuments:
+        return self._documents
+
+    def files(self) -> _FakeFiles:
+        return self._files
+
+
+@contextlib.contextmanager
+def fake_google_services() -> Iterator[tuple[dict[str, int], _FakeService]]:
+    """converter의 Google API를 DocModel 기반 가짜 서비스로 교체
+
+    속도 조절 없는 RateGovernor를 사용하고, 동기화 상태는 임시 DB에 기록합니다.
+
+    Yields:
+        (호출 수 {create, get, batchUpdate, requests}, docs 서비스)
+    """
+    from lib.google_docs import converter, image_cache
+    from lib.google_docs.rate_governor import DEFAULT_RATES, RateGovernor, set_governor
+    from lib.google_docs.sync_state import SyncStateStore
+
+    counts = {"create": 0, "get": 0, "batchUpdate": 0, "requests": 0}
+    docs = _FakeService(counts)
+    drive = _FakeService(counts)
+
+    def fake_build(name: str, version: str, credentials: Any = None) -> _FakeService:
+        return docs if name == "docs" else drive
+
+    # 호출 수만 세므로 속도 조절 없이 실행
+    previous = set_governor(RateGovernor(rates={api: 1e9 for api in DEFAULT_RATES}))
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            store = SyncStateStore(Path(tmp) / ".gdocs_sync_state.db")
+            try:
+                with mock.patch.object(converter, "get_credentials", return_value=None), \
+                        mock.patch.object(converter, "build", side_effect=fake_build), \
+                        mock.patch.object(converter, "get_sync_store", return_value=store), \
+                        mock.patch.object(image_cache, "get_sync_store", return_value=store), \
+                        contextlib.redirect_stdout(io.StringIO()):
+                    yield counts, docs
+            finally:
+                store.close()
+    finally:
+        set_governor(previous)
+
+
+def count_calls(content: str, plan: bool = False) -> dict[str, Any]:
+    """create_google_doc() 1회 실행 시 Docs API 호출 수
+
+    Returns:
+        {batchUpdate, get, tables, seconds}
+    """
+    from lib.google_docs import converter
+
+    with fake_google_services() as (counts, docs):
+        start = time.perf_counter()
+        converter.create_google_doc("benchmark", content, folder_id="folder", plan=plan)
+        elapsed = time.perf_counter() - start
+
+    return {
+        "batchUpdate": counts["batchUpdate"],
+        "get": counts["get"],
+        "tables": docs.documents()._model.table_count,
+        "seconds": elapsed,
+    }
+
+
+def run(sections: list[int]) -> list[dict[str, Any]]:
+    """벤치마크 실행
+
+    Returns:
+        섹션 수별 {sections, mode, batchUpdate, get, tables, seconds}
+    """
+    results = []
+    print(f"{'섹션':>6} {'테이블':>6} {'모드':>8} {'batchUpdate':>12} {'get':>5} {'이전 방식 추정':>14}")
+    for n in sections:
+        content = build_doc(n)
+        # 이전 방식: 표당 get 3 + write 3, 코드 블록당 get 5 + write 4 (추가분)
+        legacy = n * (3 + 3) + n * (5 + 4)
+        for mode, plan in (("default", False), ("plan", True)):
+            row = {"sections": n, "mode": mode, **count_calls(content, plan=plan)}
+            results.append(row)
+            print(
+                f"{n:>6} {row['tables']:>6} {mode:>8} {row['batchUpdate']:>12} "
+                f"{row['get']:>5} {'+' + format(legacy, ','):>14}  ({row['seconds'] * 1000:.0f} ms)"
+            )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="문서당 Docs API 호출 수 벤치마크")
+    parser.add_argument(
+        "--sections", type=int, nargs="+", default=[10, 40, 100],
+        help="섹션 수 (섹션마다 표 1개 + 코드 블록 1개)",
+    )
+    args = parser.parse_args()
+    run(args.sections)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+증분 업데이트 Docs API 호출 수 벤치마크
+
+섹션마다 표 + 코드 블록이 있는 합성 PRD를 만든 뒤, 한 줄 수정 / 섹션 추가 /
+섹션 이동 후 update_google_doc()의 documents().batchUpdate / get 호출 수와
+요청 수를 전체 재작성(incremental=False)과 비교합니다.
+인메모리 문서 모델(DocModel) 기반 가짜 서비스를 사용하며, 증분 업데이트 결과가
+새 내용으로 처음부터 만든 문서와 같은지도 함께 확인합니다.
+
+Usage:
+    python -m lib.google_docs.benchmarks.incremental_update
+    python -m lib.google_docs.benchmarks.incremental_update --sections 50 200
+"""
+
+import argparse
+import time
+from typing import Any, Callable
+
+from .api_calls import build_doc, fake_google_services
+
+DOC_ID = "benchmark-doc"
+
+
+def edit_one_line(content: str, section: int) -> str:
+    """섹션 본문 한 줄 수정"""
+    return content.replace(f"텍스트 {section}.", f"텍스트 {section} (수정됨).", 1)
+
+
+def insert_section(content: str, section: int) -> str:
+    """섹션 앞에 표가 있는 새 섹션 삽입"""
+    new = "## 새 섹션\n\n| 키 | 값 |\n|----|----|\n| a | b |\n\n![새 그림](https://example.com/new.png)\n\n"
+    marker = f"## {section}. "
+    return content.replace(marker, new + marker, 1)
+
+
+def move_section(content: str, section: int) -> str:
+    """섹션을 문서 끝으로 이동"""
+    start = content.index(f"## {section}. ")
+    end = content.index(f"## {section + 1}. ")
+    return content[:start] + content[end:] + "\n" + content[start:end]
+
+
+def _final_document(content: str) -> dict[str, Any]:
+    from lib.google_docs import converter
+
+    with fake_google_services() as (_, docs):
+        converter.create_google_doc("benchmark", content, folder_id="folder")
+    return docs.documents()._model.to_document()
+
+
+def update_calls(original: str, edited: str, incremental: bool = True) -> dict[str, Any]:
+    """create_google_doc(original) 후 update_google_doc(edited) 1회의 호출 수
+
+    Returns:
+        {batchUpdate, get, requests, matches, seconds}
+        matches: 결과 문서 == edited로 새로 만든 문서
+    """
+    from lib.google_docs import converter
+
+    with fake_google_services() as (counts, docs):
+        converter.create_google_doc("benchmark", original, folder_id="folder")
+        for key in counts:
+            counts[key] = 0
+
+        start = time.perf_counter()
+        converter.update_google_doc(DOC_ID, edited, incremental=incremental)
+        elapsed = time.perf_counter() - start
+        document = docs.documents()._model.to_document()
+
+    return {
+        "batchUpdate": counts["batchUpdate"],
+        "get": counts["get"],
+        "requests": counts["requests"],
+        "matches": document == _final_document(edited),
+        "seconds": elapsed,
+    }
+
+
+SCENARIOS: dict[str, Callable[[str, int], str]] = {
+    "한 줄 수정": edit_one_line,
+    "섹션 추가": insert_section,
+    "섹션 이동": move_section,
+}
+
+
+def run(sections: list[int]) -> list[dict[str, Any]]:
+    """벤치마크 실행
+
+    Returns:
+        섹션 수 × 시나리오 × 모드별 {sections, scenario, mode, batchUpdate, get, requests, matches}
+    """
+    results = []
+    print(f"{'섹션':>6} {'시나리오':>8} {'모드':>12} {'batchUpdate':>12} {'get':>5} {'요청':>7} {'일치':>4}")
+    for n in sections:
+        original = build_doc(n)
+        for scenario, edit in SCENARIOS.items():
+            edited = edit(original, n // 2)
+            for mode, incremental in (("incremental", True), ("full", False)):
+                row = {
+                    "sections": n,
+                    "scenario": scenario,
+                    "mode": mode,
+                    **update_calls(original, edited, incremental=incremental),
+                }
+                results.append(row)
+                print(
+                    f"{n:>6} {scenario:>8} {mode:>12} {row['batchUpdate']:>12} {row['get']:>5} "
+                    f"{row['requests']:>7} {'O' if row['matches'] else 'X':>4}  "
+                    f"({row['seconds'] * 1000:.0f} ms)"
+                )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="증분 업데이트 Docs API 호출 수 벤치마크")
+    parser.add_argument(
+        "--sections", type=int, nargs="+", default=[200],
+        help="섹션 수 (섹션마다 표 1개 + 코드 블록 1개)",
+    )
+    args = parser.parse_args()
+    run(args.sections)
+
+
+if __name__ == "__main__":
+    main()
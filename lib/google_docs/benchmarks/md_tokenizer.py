@@ -0,0 +1,105 @@
+"""
+마크다운 블록 토큰화 처리량 벤치마크
+
+50,000줄 합성 PRD에 대해 공유 블록 토크나이저와 그 소비자
+(MarkdownToDocsConverter.parse, _parse_md_sections, MDParser.parse)의
+초당 처리 줄 수(lines/sec)를 측정합니다.
+
+Usage:
+    python -m lib.google_docs.benchmarks.md_tokenizer
+    python -m lib.google_docs.benchmarks.md_tokenizer --lines 100000 --repeat 5
+"""
+
+import argparse
+import time
+from typing import Callable
+
+
+def build_prd(target_lines: int = 50_000) -> str:
+    """제목/단락/리스트/테이블/코드 블록이 섞인 합성 PRD 생성"""
+    out = ["---", "title: Benchmark PRD", "---", "# Benchmark PRD", ""]
+    i = 0
+    while len(out) < target_lines:
+        out += [
+            f"## {i}. 섹션 {i}",
+            "",
+            f"본문 **굵게** 와 *기울임*, `code` 그리고 [링크](https://example.com/{i}) 텍스트 {i}.",
+            "일반 단락 텍스트입니다. 추가 설명이 이어집니다.",
+            "",
+            f"- 항목 **{i}**",
+            "- 항목 두번째",
+            "* 별표 항목",
+            f"1. 번호 {i}",
+            "2. 번호 다음",
+            "- [ ] 할 일",
+            "- [x] 완료",
+            "> 인용 *문장*",
+            "",
+            "| 컬럼A | 컬럼B | 컬럼C |",
+            "|---|:---:|---:|",
+            f"| a{i} | **b** | c |",
+            "| d | e | `f` |",
+            "",
+            "```python",
+            "def f():",
+            "    # 제목 아님",
+            "    return 1",
+            "```",
+            "",
+            f"### 하위 {i}",
+            "텍스트 줄",
+            "---",
+            "",
+        ]
+        i += 1
+    return "\n".join(out[:target_lines])
+
+
+def _best_of(fn: Callable[[], object], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(lines: int = 50_000, repeat: int = 3) -> dict[str, float]:
+    """벤치마크 실행
+
+    Returns:
+        {대상 이름: lines/sec}
+    """
+    from lib.md_blocks import tokenize
+    from lib.pdf_utils.md_chunker import MDParser
+    from lib.google_docs.converter import MarkdownToDocsConverter, _parse_md_sections
+
+    md = build_prd(lines)
+    line_count = md.count("\n") + 1
+
+    targets: list[tuple[str, Callable[[], object]]] = [
+        ("md_blocks.tokenize", lambda: tokenize(md)),
+        ("converter.parse", lambda: MarkdownToDocsConverter(md).parse()),
+        ("_parse_md_sections", lambda: _parse_md_sections(md)),
+        ("MDParser.parse", lambda: MDParser().parse(md)),
+    ]
+
+    results = {}
+    print(f"합성 PRD: {line_count:,}줄 (best of {repeat})")
+    for name, fn in targets:
+        elapsed = _best_of(fn, repeat)
+        results[name] = line_count / elapsed
+        print(f"  {name:22s} {results[name]:>12,.0f} lines/s  ({elapsed * 1000:8.1f} ms)")
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="마크다운 토큰화 처리량 벤치마크")
+    parser.add_argument("--lines", type=int, default=50_000, help="합성 PRD 줄 수")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수 (최솟값 사용)")
+    args = parser.parse_args()
+    run(args.lines, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+네이티브 테이블 컬럼 너비 계산 마이크로벤치마크
+
+한글/영문/인라인 서식이 섞인 비교 테이블(기본 500행 × 6열)에 대해
+NativeTableRenderer.calculate_dynamic_column_widths와 render_table_at
+(너비 + 텍스트 + 스타일 요청 생성)의 소요 시간을 측정합니다.
+매 반복마다 새 TableData를 사용하므로 측정 캐시 재사용은 포함되지 않습니다.
+
+Usage:
+    python -m lib.google_docs.benchmarks.table_widths
+    python -m lib.google_docs.benchmarks.table_widths --rows 2000 --repeat 5
+"""
+
+import argparse
+import time
+from typing import Callable
+
+
+def build_table(rows: int = 500) -> list[str]:
+    """비교 테이블 마크다운 라인 생성"""
+    lines = [
+        "| 기능 | Feature | **상태** | 설명 | `code` | 비고 |",
+        "|---|---|:---:|---|---|---:|",
+    ]
+    for i in range(rows):
+        lines.append(
+            f"| 기능 {i} 비교 항목 | Feature comparison {i} | **완료** "
+            f"| 긴 설명 텍스트가 이어집니다 *강조* 포함 {i} | `api_{i}()` | {i * 17 % 1000} |"
+        )
+    return lines
+
+
+def _best_of(fn: Callable[[int], object], repeat: int) -> float:
+    best = float("inf")
+    for i in range(repeat):
+        start = time.perf_counter()
+        fn(i)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(rows: int = 500, repeat: int = 5) -> dict[str, float]:
+    """벤치마크 실행
+
+    Returns:
+        {대상 이름: ms}
+    """
+    from lib.google_docs.table_renderer import NativeTableRenderer
+
+    renderer = NativeTableRenderer()
+    lines = build_table(rows)
+    tables = [renderer.parse_markdown_table(lines) for _ in range(repeat * 2)]
+
+    targets: list[tuple[str, Callable[[int], object]]] = [
+        ("column_widths", lambda i: renderer.calculate_dynamic_column_widths(tables[i])),
+        ("render_table_at", lambda i: renderer.render_table_at(tables[repeat + i], 1)),
+    ]
+
+    results = {}
+    cells = (rows + 1) * tables[0].column_count
+    print(f"비교 테이블: {rows + 1:,}행 × {tables[0].column_count}열 = {cells:,}셀 (best of {repeat})")
+    for name, fn in targets:
+        results[name] = _best_of(fn, repeat) * 1000
+        print(f"  {name:16s} {results[name]:8.2f} ms")
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="테이블 컬럼 너비 계산 벤치마크")
+    parser.add_argument("--rows", type=int, default=500, help="테이블 본문 행 수")
+    parser.add_argument("--repeat", type=int, default=5, help="반복 횟수 (최솟값 사용)")
+    args = parser.parse_args()
+    run(args.rows, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -19,6 +19,7 @@ from typing import Optional
 from .auth import DEFAULT_FOLDER_ID
 from .project_registry import get_project_folder_id
 from .converter import create_google_doc
+from .rate_governor import execute_request
 
 
 def _resolve_folder_id(args_folder: Optional[str] = None, project: Optional[str] = None) -> str:
@@ -37,6 +38,7 @@ def process_file(
     include_toc: bool = False,
     use_native_tables: bool = True,
     custom_title: Optional[str] = None,
+    plan: bool = False,
 ) -> Optional[str]:
     """
     단일 파일 처리
@@ -47,6 +49,7 @@ def process_file(
         include_toc: 목차 포함 여부
         use_native_tables: 네이티브 테이블 사용 여부
         custom_title: 커스텀 문서 제목
+        plan: 오프라인 요청 계획 모드 사용 여부
 
     Returns:
         str | None: 생성된 문서 URL 또는 실패 시 None
@@ -75,6 +78,7 @@ def process_file(
             include_toc=include_toc,
             use_native_tables=use_native_tables,
             base_path=str(file_path),  # 이미지 상대 경로 해석용
+            plan=plan,
         )
         print(f"[OK] {doc_url}")
         return doc_url
@@ -109,6 +113,12 @@ Examples:
   # 네이티브 테이블 비활성화 (기본값: 네이티브 테이블 사용)
   python -m lib.google_docs convert file.md --no-native-tables
 
+  # 요청 계획 모드 (전체 요청을 미리 계산 후 최소 batchUpdate로 실행)
+  python -m lib.google_docs convert file.md --plan
+
+  # 요청 계획만 계산 (Docs API 호출 없음)
+  python -m lib.google_docs convert file.md --dry-run
+
   # 배치 변환
   python -m lib.google_docs batch tasks/prds/*.md
 
@@ -153,6 +163,16 @@ Examples:
     convert_parser.add_argument(
         "--no-folder", action="store_true", help="폴더 이동 없이 내 드라이브에 생성"
     )
+    convert_parser.add_argument(
+        "--plan",
+        action="store_true",
+        help="요청 계획 모드 (인메모리 모델로 인덱스 계산, 중간 조회 없이 최소 batchUpdate)",
+    )
+    convert_parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="요청 계획만 계산하고 요약 출력 (Docs API 호출 없음)",
+    )
 
     # batch 명령
     batch_parser = subparsers.add_parser("batch", help="여러 파일 배치 변환")
@@ -173,6 +193,9 @@ Examples:
         help="네이티브 테이블 비활성화 (기본: 네이티브 테이블 사용)",
     )
     batch_parser.set_defaults(native_tables=True)
+    batch_parser.add_argument(
+        "--plan", action="store_true", help="요청 계획 모드 (중간 조회 없이 최소 batchUpdate)"
+    )
 
     # update 명령 (기존 문서 내용 교체)
     update_parser = subparsers.add_parser(
@@ -230,6 +253,9 @@ Examples:
     drive_status_parser.add_argument(
         "--json", action="store_true", help="JSON 형식 출력"
     )
+    drive_status_parser.add_argument(
+        "--refresh", action="store_true", help="폴더 목록 스냅샷 무시 (전체 다시 조회)"
+    )
 
     # drive duplicates
     drive_dup_parser = drive_subparsers.add_parser("duplicates", help="중복 파일 분석")
@@ -239,6 +265,10 @@ Examples:
     drive_dup_parser.add_argument(
         "--delete", action="store_true", help="중복 파일 삭제 (기본: dry-run)"
     )
+    drive_dup_parser.add_argument(
+        "--include-similar", action="store_true",
+        help="체크섬 없는 Google 파일의 이름 유사 그룹도 삭제 (--delete와 함께 사용)",
+    )
     drive_dup_parser.add_argument(
         "--json", action="store_true", help="JSON 형식 출력"
     )
@@ -260,6 +290,12 @@ Examples:
     drive_audit_parser.add_argument(
         "--json", action="store_true", help="JSON 형식 출력"
     )
+    drive_audit_parser.add_argument(
+        "--refresh", action="store_true", help="폴더 목록 스냅샷 무시 (전체 다시 조회)"
+    )
+    drive_audit_parser.add_argument(
+        "--resume", action="store_true", help="중단된 --apply 재개 (이미 옮긴 파일 건너뜀)"
+    )
 
     # drive organize
     drive_org_parser = drive_subparsers.add_parser("organize", help="파일 자동 정리")
@@ -272,6 +308,9 @@ Examples:
     drive_org_parser.add_argument(
         "--execute", action="store_true", help="실제 실행"
     )
+    drive_org_parser.add_argument(
+        "--resume", action="store_true", help="중단된 --execute 재개 (이미 옮긴 파일 건너뜀)"
+    )
     drive_org_parser.add_argument(
         "--json", action="store_true", help="JSON 형식 출력"
     )
@@ -286,7 +325,25 @@ Examples:
     print("Google Docs PRD Converter")
     print("=" * 60)
 
-    if args.command == "convert":
+    if args.command == "convert" and args.dry_run:
+        from .planner import build_document_plan
+
+        file_path = Path(args.file)
+        if not file_path.exists():
+            print(f"[FAIL] 파일을 찾을 수 없습니다: {file_path}")
+            sys.exit(1)
+
+        plan = build_document_plan(
+            file_path.read_text(encoding="utf-8"),
+            include_toc=args.toc,
+            use_native_tables=args.native_tables,
+            base_path=str(file_path.resolve()),
+        )
+        print(f"\n[PLAN] {file_path.name}")
+        for key, value in plan.summary().items():
+            print(f"       {key}: {value}")
+
+    elif args.command == "convert":
         folder_id = None if args.no_folder else _resolve_folder_id(args.folder, getattr(args, 'project', None))
         use_native = args.native_tables
 
@@ -330,6 +387,7 @@ Examples:
                 include_toc=args.toc,
                 use_native_tables=use_native,
                 custom_title=args.title,
+                plan=args.plan,
             )
 
             print("\n" + "=" * 60)
@@ -370,6 +428,7 @@ Examples:
                 folder_id=batch_folder,
                 include_toc=args.toc,
                 use_native_tables=use_native,
+                plan=args.plan,
             )
             results.append((file_path, result))
 
@@ -429,14 +488,12 @@ Examples:
 
         query = f"'{args.folder}' in parents and mimeType='application/vnd.google-apps.document' and trashed=false"
 
-        results = (
-            drive_service.files()
-            .list(
+        results = execute_request(
+            drive_service.files().list(
                 q=query,
                 pageSize=50,
                 fields="files(id, name, modifiedTime, webViewLink)",
             )
-            .execute()
         )
 
         files = results.get("files", [])
@@ -497,7 +554,7 @@ Examples:
         if args.drive_command == "audit":
             from .drive_guardian import DriveGuardian, print_audit_report, print_fix_plan
 
-            guardian = DriveGuardian()
+            guardian = DriveGuardian(refresh=args.refresh)
             report = guardian.audit()
 
             if args.json:
@@ -532,19 +589,21 @@ Examples:
 
                     if args.apply:
                         print("\nApplying fixes...")
-                        result = guardian.apply_fixes(plan, dry_run=False)
+                        result = guardian.apply_fixes(plan, dry_run=False, resume=args.resume)
                         print(f"Applied: {len(result['applied'])}")
                         if result['errors']:
                             print(f"Errors: {len(result['errors'])}")
                             for err in result['errors'][:5]:
                                 print(f"  - {err['file']}: {err['error']}")
+                            print("\nTo retry failed moves, run:")
+                            print("  python -m lib.google_docs drive audit --fix --apply --resume")
                     else:
                         print("\nTo apply fixes, run:")
                         print("  python -m lib.google_docs drive audit --fix --apply")
 
         else:
             # status, duplicates, init, organize는 DriveOrganizer 사용
-            organizer = DriveOrganizer(args.folder)
+            organizer = DriveOrganizer(args.folder, refresh=getattr(args, "refresh", False))
 
             if args.drive_command == "status":
                 status = organizer.get_status()
@@ -555,7 +614,9 @@ Examples:
 
             elif args.drive_command == "duplicates":
                 if args.delete:
-                    result = organizer.delete_duplicates(dry_run=False)
+                    result = organizer.delete_duplicates(
+                        dry_run=False, include_similar=args.include_similar
+                    )
                     if args.json:
                         print(json_module.dumps(result, indent=2, ensure_ascii=False))
                     else:
@@ -570,6 +631,7 @@ Examples:
                         output = [
                             {
                                 "name": d.name,
+                                "reason": d.reason,
                                 "count": d.count,
                                 "keep": d.keep.id if d.keep else None,
                                 "to_delete": [f.id for f in d.to_delete]
@@ -592,7 +654,7 @@ Examples:
 
             elif args.drive_command == "organize":
                 dry_run = not args.execute
-                result = organizer.organize_files(dry_run=dry_run)
+                result = organizer.organize_files(dry_run=dry_run, resume=args.resume)
 
                 if args.json:
                     print(json_module.dumps(result, indent=2, ensure_ascii=False))
@@ -616,6 +678,9 @@ Examples:
                         print(f"\nErrors: {len(result['errors'])}")
                         for err in result['errors'][:5]:
                             print(f"  - {err['name']}: {err['error']}")
+                        if not dry_run:
+                            print("\nTo retry failed moves, run:")
+                            print("  python -m lib.google_docs drive organize --execute --resume")
 
                     if dry_run:
                         print("\nTo execute, run:")
@@ -18,6 +18,10 @@ from .project_registry import get_project_folder_id
 from .models import TextSegment, InlineParseResult
 from .table_renderer import NativeTableRenderer
 from .notion_style import NotionStyle
+from .doc_model import DocModel, table_element
+from .rate_governor import execute_request
+from .sync_state import get_sync_store
+from ..md_blocks import MdBlockKind, iter_blocks, split_lines
 
 
 def utf16_len(text: str) -> int:
@@ -30,6 +34,34 @@ def utf16_len(text: str) -> int:
     return len(text.encode("utf-16-le")) // 2
 
 
+# 참조 링크 [text][ref] 또는 [text][]
+_REF_LINK_RE = re.compile(r"\[([^\]]+)\]\[([^\]]*)\]")
+
+# 인라인 포맷 패턴 (순서 중요 - 긴 패턴 먼저)
+# (컴파일된 패턴, 스타일, 매치에 반드시 필요한 문자열)
+_INLINE_PATTERNS = [
+    # [![alt](img)](link) - 링크된 이미지 (image/link 패턴보다 먼저!)
+    (re.compile(r"\[!\[([^\]]*)\]\(([^)]+)\)\]\([^)]*\)"), "linked_image", "!["),
+    # ![alt](url) - 이미지 (링크보다 먼저!)
+    (re.compile(r"!\[([^\]]*)\]\(([^)]+)\)"), "image", "!["),
+    (re.compile(r"\[([^\]]+)\]\(([^)]+)\)"), "link", "]("),  # [text](url)
+    # 중첩 포맷 (bold + italic)
+    (re.compile(r"\*\*\*(.+?)\*\*\*"), "bold_italic", "***"),  # ***bold italic***
+    (re.compile(r"___(.+?)___"), "bold_italic", "___"),  # ___bold italic___
+    (re.compile(r"\*\*_(.+?)_\*\*"), "bold_italic", "**_"),  # **_bold italic_**
+    (re.compile(r"__\*(.+?)\*__"), "bold_italic", "__*"),  # __*bold italic*__
+    (re.compile(r"\*__(.+?)__\*"), "bold_italic", "*__"),  # *__bold italic__*
+    (re.compile(r"_\*\*(.+?)\*\*_"), "bold_italic", "_**"),  # _**bold italic**_
+    # 단일 포맷
+    (re.compile(r"\*\*(.+?)\*\*"), "bold", "**"),  # **bold** (non-greedy, 내부 * 허용)
+    (re.compile(r"__(.+?)__"), "bold", "__"),  # __bold__ (non-greedy, 내부 _ 허용)
+    (re.compile(r"(?<!\*)\*(?!\*)(.+?)(?<!\*)\*(?!\*)"), "italic", "*"),  # *italic* (** 제외)
+    (re.compile(r"(?<!_)_(?!_)(.+?)(?<!_)_(?!_)"), "italic", "_"),  # _italic_ (__ 제외)
+    (re.compile(r"`([^`]+)`"), "code", "`"),  # `code`
+    (re.compile(r"~~(.+?)~~"), "strikethrough", "~~"),  # ~~strike~~ (non-greedy)
+]
+
+
 class MarkdownToDocsConverter:
     """마크다운을 Google Docs API 요청으로 변환"""
 
@@ -44,6 +76,7 @@ class MarkdownToDocsConverter:
         docs_service: Any = None,
         doc_id: str | None = None,
         base_path: str | None = None,
+        plan: bool = False,
     ):
         """
         Args:
@@ -53,9 +86,11 @@ class MarkdownToDocsConverter:
             code_font: 코드 블록 폰트
             code_bg_color: 코드 블록 배경색 (RGB 0-1), None이면 스타일에서 가져옴
             use_premium_style: 파랑 계열 전문 문서 스타일 사용 여부
-            docs_service: Google Docs API 서비스 (2단계 테이블 처리용)
-            doc_id: 문서 ID (2단계 테이블 처리용)
+            docs_service: Google Docs API 서비스 (지정 시 코드 블록을 테이블 박스로 변환)
+            doc_id: 문서 ID (지정 시 코드 블록을 테이블 박스로 변환)
             base_path: 마크다운 파일의 기준 경로 (상대 이미지 경로 해석용)
+            plan: 오프라인 계획 모드 (인메모리 문서 모델로 테이블 인덱스를 계산,
+                docs_service 없이 전체 요청 시퀀스 생성)
         """
         self.content = content
         self.base_path = base_path
@@ -85,6 +120,14 @@ class MarkdownToDocsConverter:
 
         self._table_renderer = NativeTableRenderer()
 
+        # 네이티브 테이블 지연 삽입: (삽입 위치, 요청, 추가되는 길이)
+        # parse() 마지막에 뒤쪽 테이블부터 한꺼번에 요청 목록에 추가
+        self._deferred_tables: list[tuple[int, list[dict[str, Any]], int]] = []
+
+        # plan 모드: 요청을 인메모리 문서 모델에 적용하며 인덱스 추적
+        self.doc_model = DocModel() if plan else None
+        self._model_synced = 0  # 모델에 반영된 요청 수
+
         # 참조 링크 저장소
         self._reference_links: dict[str, str] = {}
 
@@ -98,6 +141,9 @@ class MarkdownToDocsConverter:
         # Mermaid 다이어그램 고유 번호 (placeholder alt text 충돌 방지)
         self._mermaid_counter: int = 0
 
+        # 사전 렌더링에 실패한 Mermaid 코드 (파싱 중 재시도하지 않음)
+        self._mermaid_failed: set[str] = set()
+
         # YAML frontmatter 제거 및 참조 링크 파싱
         self._preprocess_content()
 
@@ -265,116 +311,43 @@ class MarkdownToDocsConverter:
         Returns:
             list: batchUpdate에 전달할 요청 리스트
         """
-        lines = self.content.replace('\r\n', '\n').replace('\r', '\n').split("\n")
-        i = 0
-
-        while i < len(lines):
-            line = lines[i]
-
-            # 코드 블록 처리
-            if line.startswith("```"):
-                code_lines = []
-                lang = line[3:].strip()
-                i += 1
-                while i < len(lines) and not lines[i].startswith("```"):
-                    code_lines.append(lines[i])
-                    i += 1
-                self._add_code_block("\n".join(code_lines), lang)
-                i += 1
-                continue
-
-            # 제목 처리
-            if line.startswith("#"):
-                level = len(line) - len(line.lstrip("#"))
-                text = line.lstrip("#").strip()
-                if text:
-                    self._add_heading(text, level)
-                i += 1
-                continue
-
-            # 테이블 처리
-            if (
-                "|" in line
-                and i + 1 < len(lines)
-                and ("---" in lines[i + 1] or ":-" in lines[i + 1])
-            ):
-                table_lines = []
-                while i < len(lines) and "|" in lines[i]:
-                    table_lines.append(lines[i])
-                    i += 1
-                self._add_table(table_lines)
-                continue
-
-            # 체크리스트 처리
-            if (
-                line.strip().startswith("- [ ]")
-                or line.strip().startswith("- [x]")
-                or line.strip().startswith("- [X]")
-            ):
-                checked = "x" in line.strip()[3:5].lower()
-                text = line.strip()[5:].strip()
-                self._add_checklist_item(text, checked)
-                i += 1
-                continue
+        blocks = list(iter_blocks(split_lines(self.content)))
+        self._prerender_mermaid(blocks)
 
-            # 일반 리스트 처리
-            if line.strip().startswith("- ") or line.strip().startswith("* "):
-                text = line.strip()[2:]
-                self._add_bullet_item(text)
-                i += 1
-                continue
+        for block in blocks:
+            kind = block.kind
 
-            # 번호 리스트 처리
-            numbered_match = re.match(r"^(\d+)\.\s+(.+)$", line.strip())
-            if numbered_match:
-                text = numbered_match.group(2)
-                self._add_paragraph_with_inline_styles(
-                    f"{numbered_match.group(1)}. {text}"
-                )
-                i += 1
-                continue
-
-            # 인용문 처리
-            if line.strip().startswith(">"):
-                text = line.strip()[1:].strip()
-                self._add_quote(text)
-                i += 1
-                continue
-
-            # 수평선 처리
-            if line.strip() in ["---", "***", "___"]:
+            if kind is MdBlockKind.TEXT:
+                # 일반 텍스트 (인라인 스타일 적용)
+                self._add_paragraph_with_inline_styles(block.text)
+            elif kind is MdBlockKind.BLANK:
+                self._add_text("\n")
+            elif kind is MdBlockKind.HEADING:
+                if block.text:
+                    self._add_heading(block.text, block.level)
+            elif kind is MdBlockKind.BULLET:
+                self._add_bullet_item(block.text)
+            elif kind is MdBlockKind.NUMBERED:
+                self._add_paragraph_with_inline_styles(f"{block.number}. {block.text}")
+            elif kind is MdBlockKind.FENCE:
+                self._add_code_block(block.text, block.lang)
+            elif kind is MdBlockKind.TABLE:
+                self._add_table(block.lines)
+            elif kind is MdBlockKind.CHECKLIST:
+                self._add_checklist_item(block.text, block.checked)
+            elif kind is MdBlockKind.QUOTE:
+                self._add_quote(block.text)
+            elif kind is MdBlockKind.HR:
                 self._add_horizontal_rule()
-                i += 1
-                continue
-
-            # 독립 이미지 라인 처리: 줄 전체가 이미지인 경우
-            image_match = re.match(r"^\s*!\[([^\]]*)\]\(([^)]+)\)\s*$", line)
-            if image_match:
-                alt_text = image_match.group(1)
-                image_url = image_match.group(2)
-                self._add_image_block(image_url, alt_text)
-                i += 1
-                continue
+            elif kind is MdBlockKind.IMAGE:
+                # 독립 이미지 / 링크된 이미지 라인 ([![alt](img)](link))
+                # _apply_segment_style에 image_url 처리 없으므로 블록 레벨에서 잡아야 함
+                self._add_image_block(block.url, block.text)
 
-            # 링크된 이미지 라인 처리: [![alt](img)](link) 형태 (줄 전체)
-            # _apply_segment_style에 image_url 처리 없으므로 블록 레벨에서 잡아야 함
-            linked_img_match = re.match(
-                r"^\s*\[!\[([^\]]*)\]\(([^)]+)\)\]\([^)]*\)\s*$", line
-            )
-            if linked_img_match:
-                alt_text = linked_img_match.group(1)
-                image_url = linked_img_match.group(2)
-                self._add_image_block(image_url, alt_text)
-                i += 1
-                continue
-
-            # 일반 텍스트 (인라인 스타일 적용)
-            if line.strip():
-                self._add_paragraph_with_inline_styles(line)
-            else:
-                self._add_text("\n")
+        self._flush_deferred_tables()
 
-            i += 1
+        if self.doc_model is not None:
+            self._sync_doc_model()
 
         return self.requests
 
@@ -428,62 +401,18 @@ class MarkdownToDocsConverter:
             return match.group(0)  # 참조 못 찾으면 원본 유지
 
         # 참조 링크 패턴: [text][ref] 또는 [text][]
-        text = re.sub(r"\[([^\]]+)\]\[([^\]]*)\]", replace_ref_link, text)
-
-        # 정규식 패턴들 (순서 중요 - 긴 패턴 먼저)
-        patterns = [
-            (
-                r"\[!\[([^\]]*)\]\(([^)]+)\)\]\([^)]*\)",
-                "linked_image",
-            ),  # [![alt](img)](link) - 링크된 이미지 (image/link 패턴보다 먼저!)
-            (
-                r"!\[([^\]]*)\]\(([^)]+)\)",
-                "image",
-            ),  # ![alt](url) - 이미지 (링크보다 먼저!)
-            (r"\[([^\]]+)\]\(([^)]+)\)", "link"),  # [text](url)
-            # 중첩 포맷 (bold + italic)
-            (r"\*\*\*(.+?)\*\*\*", "bold_italic"),  # ***bold italic***
-            (r"___(.+?)___", "bold_italic"),  # ___bold italic___
-            (r"\*\*_(.+?)_\*\*", "bold_italic"),  # **_bold italic_**
-            (r"__\*(.+?)\*__", "bold_italic"),  # __*bold italic*__
-            (r"\*__(.+?)__\*", "bold_italic"),  # *__bold italic__*
-            (r"_\*\*(.+?)\*\*_", "bold_italic"),  # _**bold italic**_
-            # 단일 포맷
-            (r"\*\*(.+?)\*\*", "bold"),  # **bold** (non-greedy, 내부 * 허용)
-            (r"__(.+?)__", "bold"),  # __bold__ (non-greedy, 내부 _ 허용)
-            (r"(?<!\*)\*(?!\*)(.+?)(?<!\*)\*(?!\*)", "italic"),  # *italic* (** 제외)
-            (r"(?<!_)_(?!_)(.+?)(?<!_)_(?!_)", "italic"),  # _italic_ (__ 제외)
-            (r"`([^`]+)`", "code"),  # `code`
-            (r"~~(.+?)~~", "strikethrough"),  # ~~strike~~ (non-greedy)
-        ]
+        if "][" in text:
+            text = _REF_LINK_RE.sub(replace_ref_link, text)
 
-        # 모든 매치 찾기
+        # 모든 매치 찾기 (필수 문자열이 없는 패턴은 건너뜀)
         all_matches = []
-        for pattern, style in patterns:
-            for match in re.finditer(pattern, text):
-                if style == "linked_image":
-                    # 링크된 이미지: group(1)=alt텍스트, group(2)=이미지URL, group(3)=외부링크URL
-                    all_matches.append(
-                        (
-                            match.start(),
-                            match.end(),
-                            match.group(1),
-                            style,
-                            match.group(2),  # 이미지 URL (외부 링크 URL 아님)
-                        )
-                    )
-                elif style == "link":
-                    all_matches.append(
-                        (
-                            match.start(),
-                            match.end(),
-                            match.group(1),
-                            style,
-                            match.group(2),
-                        )
-                    )
-                elif style == "image":
-                    # 이미지: group(1)=alt텍스트, group(2)=URL
+        for pattern, style, required in _INLINE_PATTERNS:
+            if required not in text:
+                continue
+            for match in pattern.finditer(text):
+                if style in ("linked_image", "link", "image"):
+                    # group(1)=alt/링크 텍스트, group(2)=이미지/링크 URL
+                    # (링크된 이미지는 외부 링크 URL이 아닌 이미지 URL 사용)
                     all_matches.append(
                         (
                             match.start(),
@@ -775,122 +704,92 @@ class MarkdownToDocsConverter:
             self._add_text_table(table_lines)
 
     def _add_native_table(self, table_lines: list[str]):
-        """네이티브 Google Docs 테이블 추가 (2단계 방식)"""
+        """네이티브 Google Docs 테이블 추가"""
         table_data = self._table_renderer.parse_markdown_table(table_lines)
 
         if table_data.column_count == 0:
             return
 
-        # 2단계 처리 (docs_service가 있는 경우)
-        if self.docs_service and self.doc_id:
-            self._add_native_table_two_phase(table_data)
+        # plan 모드 (인메모리 모델로 셀 인덱스 계산)
+        if self.doc_model is not None:
+            self._add_native_table_planned(table_data)
         else:
-            # 레거시 단일 batchUpdate 방식 (실패 가능)
-            requests, new_index = self._table_renderer.render(
-                table_data, self.current_index
+            # 셀 인덱스는 계산값 사용, 삽입은 parse() 마지막에 일괄 처리
+            self._defer_table(
+                self._table_renderer.render_table_at(table_data, self.current_index)
             )
-            self.requests.extend(requests)
-            self.current_index = new_index
 
-    def _add_native_table_two_phase(self, table_data):
+    def _defer_table(self, requests: list[dict[str, Any]]) -> None:
+        """
+        테이블 요청을 지연 삽입 목록에 등록 (current_index는 그대로 유지)
+
+        requests는 insertTable로 시작하며 삽입 위치 기준으로 계산된 요청입니다.
+        이후 콘텐츠는 테이블이 없는 것처럼 같은 위치부터 이어서 생성됩니다.
         """
-        최적화된 2단계 네이티브 테이블 처리 (v2.4.1 - Rate Limit 처리 추가)
+        if not requests:
+            return
 
-        API 호출 최적화:
-        - 쓰기: 3회 (기존 요청 + 테이블 구조 + 콘텐츠/스타일)
-        - 읽기: 2회 (인덱스 확인 + 테이블 구조 조회)
+        insert = requests[0]["insertTable"]
+        # 줄바꿈 1 + 빈 테이블 구조 + 셀 텍스트
+        added = 1 + 2 + insert["rows"] * (1 + 2 * insert["columns"])
+        added += sum(
+            utf16_len(req["insertText"]["text"]) for req in requests if "insertText" in req
+        )
+        self._deferred_tables.append((self.current_index, requests, added))
 
-        Rate Limit (429) 처리를 위한 지수 백오프 재시도 로직 포함.
+    def _flush_deferred_tables(self) -> None:
         """
-        import time
-        from googleapiclient.errors import HttpError
+        지연된 테이블을 뒤에서부터 요청 목록에 추가
 
-        def _retry(request_fn, max_retries=5, initial_delay=30):
-            """Rate Limit 처리를 위한 재시도 래퍼"""
-            for attempt in range(max_retries):
-                try:
-                    return request_fn()
-                except HttpError as e:
-                    if e.resp.status == 429 and attempt < max_retries - 1:
-                        wait_time = initial_delay * (1.5 ** attempt)
-                        print(f"     [429] Rate limit, {wait_time:.0f}초 대기 후 재시도...")
-                        time.sleep(wait_time)
-                    else:
-                        raise
+        뒤쪽 테이블을 먼저 삽입하면 앞쪽 테이블의 삽입 위치는 변하지 않으므로,
+        테이블 수와 무관하게 documents().get 없이 한 번의 요청 시퀀스로 실행됩니다.
+        같은 위치의 연속 테이블도 역순 삽입으로 원래 순서가 유지됩니다.
+        """
+        if not self._deferred_tables:
+            return
 
-        # 1단계: 문서 현재 상태 조회하여 인덱스 동기화
-        doc = _retry(
-            lambda: self.docs_service.documents().get(documentId=self.doc_id).execute()
-        )
-        body = doc.get("body", {})
-        content = body.get("content", [])
-        doc_end_index = content[-1].get("endIndex", 1) if content else 1
-
-        # 2단계: 기존 요청 먼저 실행 (테이블 전까지의 콘텐츠)
-        # 요청들의 인덱스를 실제 문서 상태에 맞게 재계산
-        if self.requests:
-            # 실제 문서 끝 위치로 인덱스 오프셋 계산
-            actual_insert_index = doc_end_index - 1
+        for _, requests, _ in reversed(self._deferred_tables):
+            self.requests.extend(requests)
 
-            # 요청들의 인덱스 재계산
-            adjusted_requests = self._adjust_request_indices(
-                self.requests, actual_insert_index
+        # 이미지 placeholder 위치 보정 (앞쪽에 삽입된 테이블만큼 밀림)
+        for img_info in self._pending_images:
+            img_info["index"] += sum(
+                added for location, _, added in self._deferred_tables
+                if location <= img_info["index"]
             )
 
-            _retry(
-                lambda: self.docs_service.documents().batchUpdate(
-                    documentId=self.doc_id, body={"requests": adjusted_requests}
-                ).execute()
-            )
-            self.requests = []
+        self.current_index += sum(added for _, _, added in self._deferred_tables)
+        self._deferred_tables = []
 
-        # 3단계: 문서 재조회 + 테이블 구조 삽입
-        doc = _retry(
-            lambda: self.docs_service.documents().get(documentId=self.doc_id).execute()
-        )
-        body = doc.get("body", {})
-        content = body.get("content", [])
-        doc_end_index = content[-1].get("endIndex", 1) if content else 1
-        table_start_index = doc_end_index - 1
+    def _sync_doc_model(self) -> None:
+        """plan 모드: 아직 모델에 반영되지 않은 요청 적용 (검증 포함)"""
+        self.doc_model.apply(self.requests[self._model_synced:], offset=self._model_synced)
+        self._model_synced = len(self.requests)
+
+    def _add_native_table_planned(self, table_data):
+        """
+        plan 모드 네이티브 테이블 처리 (API 호출 없음)
 
+        insertTable을 모델에 적용한 뒤 모델이 만든 테이블 요소로
+        render_table_content_and_styles()를 호출하므로, 실제 documents().get
+        응답과 동일한 셀 인덱스를 사용합니다.
+        """
         structure_request = self._table_renderer.render_table_structure(
-            table_data, table_start_index
+            table_data, self.current_index
         )
+        if not structure_request:
+            return
 
-        if structure_request:
-            _retry(
-                lambda: self.docs_service.documents().batchUpdate(
-                    documentId=self.doc_id, body={"requests": [structure_request]}
-                ).execute()
-            )
+        self.requests.append(structure_request)
+        self._sync_doc_model()
 
-        # 3단계: 테이블 구조 조회 + 콘텐츠/스타일 적용 (읽기 1회 + 쓰기 1회)
-        # 최적화: 마지막 documents.get을 여기서 수행하고 current_index도 동시에 업데이트
-        doc = _retry(
-            lambda: self.docs_service.documents().get(documentId=self.doc_id).execute()
+        # 삽입 위치 앞에 줄바꿈이 추가되므로 테이블은 current_index + 1에서 시작
+        table_element = self.doc_model.table_at(self.current_index + 1)
+        self.requests.extend(
+            self._table_renderer.render_table_content_and_styles(table_data, table_element)
         )
-        table_element = self._find_last_table(doc)
-
-        if table_element:
-            unified_requests = self._table_renderer.render_table_content_and_styles(
-                table_data, table_element
-            )
-            if unified_requests:
-                _retry(
-                    lambda: self.docs_service.documents().batchUpdate(
-                        documentId=self.doc_id, body={"requests": unified_requests}
-                    ).execute()
-                )
-
-        # current_index 업데이트
-        # 문서 끝 인덱스 - 1로 설정 (다음 콘텐츠 삽입 위치)
-        body = doc.get("body", {})
-        content = body.get("content", [])
-        if content:
-            # 문서 끝 인덱스는 마지막 요소의 endIndex - 1
-            self.current_index = content[-1].get("endIndex", 1) - 1
-        else:
-            self.current_index = 1
+        self._sync_doc_model()
+        self.current_index = self.doc_model.end_index - 1
 
     def _adjust_request_indices(
         self, requests: list[dict], target_start_index: int
@@ -917,6 +816,9 @@ class MarkdownToDocsConverter:
             elif "insertInlineImage" in req:
                 idx = req["insertInlineImage"]["location"]["index"]
                 min_index = min(min_index, idx)
+            elif "insertTable" in req:
+                idx = req["insertTable"]["location"]["index"]
+                min_index = min(min_index, idx)
 
         if min_index == float("inf"):
             return requests
@@ -957,24 +859,42 @@ class MarkdownToDocsConverter:
                     new_value["range"]["startIndex"] += offset
                     new_value["range"]["endIndex"] += offset
                     new_req[key] = new_value
+                elif key == "deleteContentRange":
+                    new_value = dict(value)
+                    new_value["range"] = dict(value["range"])
+                    new_value["range"]["startIndex"] += offset
+                    new_value["range"]["endIndex"] += offset
+                    new_req[key] = new_value
+                elif key == "insertTable":
+                    new_value = dict(value)
+                    new_value["location"] = dict(value["location"])
+                    new_value["location"]["index"] += offset
+                    new_req[key] = new_value
+                elif key == "updateTableColumnProperties":
+                    new_value = dict(value)
+                    new_value["tableStartLocation"] = dict(value["tableStartLocation"])
+                    new_value["tableStartLocation"]["index"] += offset
+                    new_req[key] = new_value
+                elif key == "updateTableCellStyle":
+                    new_value = dict(value)
+                    if "tableRange" in value:
+                        cell_location = dict(value["tableRange"]["tableCellLocation"])
+                        cell_location["tableStartLocation"] = dict(
+                            cell_location["tableStartLocation"]
+                        )
+                        cell_location["tableStartLocation"]["index"] += offset
+                        new_value["tableRange"] = dict(value["tableRange"])
+                        new_value["tableRange"]["tableCellLocation"] = cell_location
+                    else:
+                        new_value["tableStartLocation"] = dict(value["tableStartLocation"])
+                        new_value["tableStartLocation"]["index"] += offset
+                    new_req[key] = new_value
                 else:
                     new_req[key] = value
             adjusted.append(new_req)
 
         return adjusted
 
-    def _find_last_table(self, doc: dict) -> dict | None:
-        """문서에서 마지막 테이블 요소 찾기"""
-        body = doc.get("body", {})
-        content = body.get("content", [])
-
-        # 뒤에서부터 검색하여 첫 번째 테이블 반환
-        for element in reversed(content):
-            if "table" in element:
-                return element
-
-        return None
-
     def _estimate_table_size(self, table_data) -> int:
         """테이블 크기 추정 (폴백용)"""
         size = 1  # 테이블 요소
@@ -1033,6 +953,31 @@ class MarkdownToDocsConverter:
             else:
                 self._add_text(line_text)
 
+    @staticmethod
+    def _normalize_mermaid(code: str) -> str:
+        # \n 리터럴(백슬래시+n) → 실제 줄바꿈으로 변환 (mermaid.ink 호환)
+        return code.strip().replace('\\n', '\n')
+
+    def _prerender_mermaid(self, blocks: list) -> None:
+        """
+        문서의 Mermaid 다이어그램을 파싱 전에 병렬 렌더링 (캐시에 저장)
+
+        파싱 중 _render_mermaid_to_png()는 캐시 사본만 가져오므로
+        다이어그램 수만큼 렌더링이 직렬로 쌓이지 않습니다.
+        """
+        codes = [
+            self._normalize_mermaid(block.text)
+            for block in blocks
+            if block.kind is MdBlockKind.FENCE and block.lang.lower() == "mermaid"
+        ]
+        if not codes:
+            return
+
+        from .mermaid_renderer import prerender_mermaid
+
+        results = prerender_mermaid(codes)
+        self._mermaid_failed = {code for code, ok in results.items() if not ok}
+
     def _render_mermaid_to_png(self, code: str) -> str | None:
         """
         Mermaid 다이어그램을 PNG 파일로 렌더링 (하이브리드 3단계 폴백)
@@ -1043,6 +988,9 @@ class MarkdownToDocsConverter:
         Returns:
             str | None: 생성된 PNG 파일 절대 경로, 실패 시 None
         """
+        if code in self._mermaid_failed:
+            return None
+
         from .mermaid_renderer import render_mermaid
 
         result = render_mermaid(code)
@@ -1062,9 +1010,7 @@ class MarkdownToDocsConverter:
         """
         # Mermaid 다이어그램 → PNG 이미지로 렌더링
         if lang.lower() == "mermaid":
-            code = code.strip()
-            # \n 리터럴(백슬래시+n) → 실제 줄바꿈으로 변환 (mermaid.ink 호환)
-            code = code.replace('\\n', '\n')
+            code = self._normalize_mermaid(code)
             png_path = self._render_mermaid_to_png(code)
             if png_path:
                 self._mermaid_counter += 1
@@ -1072,16 +1018,21 @@ class MarkdownToDocsConverter:
                 return
             # 렌더링 실패 시 코드 블록으로 폴백
 
-        # 2단계 테이블 처리 (docs_service가 있는 경우)
-        if self.docs_service and self.doc_id:
-            self._add_code_block_as_table(code, lang)
+        # plan 모드 (네이티브 테이블 사용 시 테이블 박스)
+        if self.doc_model is not None and self.use_native_tables:
+            self._add_code_block_as_table_planned(code, lang)
+        # 테이블 박스 (docs_service가 있는 경우, parse() 마지막에 일괄 삽입)
+        elif self.docs_service and self.doc_id:
+            self._defer_table(self._code_table_requests(self.current_index, code, lang))
         else:
             # 레거시 방식 (단순 텍스트 + 배경색)
             self._add_code_block_legacy(code, lang)
 
-    def _add_code_block_as_table(self, code: str, lang: str = ""):
+    def _code_table_requests(
+        self, location: int, code: str, lang: str = ""
+    ) -> list[dict[str, Any]]:
         """
-        코드 블록을 1x1 테이블로 추가 (시각적 박스 효과)
+        코드 블록을 1x1 테이블로 추가하는 요청 (시각적 박스 효과, API 조회 없음)
 
         테이블 구조:
         ┌─────────────────────────────┐
@@ -1090,80 +1041,64 @@ class MarkdownToDocsConverter:
         │ def hello():                │
         │     print("Hello World")    │  ← 코드 내용
         └─────────────────────────────┘
-        """
-        import time
-        from googleapiclient.errors import HttpError
 
-        def _retry(request_fn, max_retries=5, initial_delay=30):
-            for attempt in range(max_retries):
-                try:
-                    return request_fn()
-                except HttpError as e:
-                    if e.resp.status == 429 and attempt < max_retries - 1:
-                        wait_time = initial_delay * (1.5 ** attempt)
-                        time.sleep(wait_time)
-                    else:
-                        raise
+        텍스트 삽입 전/후의 테이블 구조를 계산하여 삽입/스타일 요청을 만듭니다.
 
-        # 1단계: 기존 요청 먼저 실행
-        doc = _retry(
-            lambda: self.docs_service.documents().get(documentId=self.doc_id).execute()
-        )
-        body = doc.get("body", {})
-        content = body.get("content", [])
-        doc_end_index = content[-1].get("endIndex", 1) if content else 1
+        Args:
+            location: insertTable 삽입 위치 (테이블은 location + 1에서 시작)
+        """
+        table_start = location + 1
+        row_count = 2 if lang else 1
 
-        if self.requests:
-            actual_insert_index = doc_end_index - 1
-            adjusted_requests = self._adjust_request_indices(
-                self.requests, actual_insert_index
-            )
-            _retry(
-                lambda: self.docs_service.documents().batchUpdate(
-                    documentId=self.doc_id, body={"requests": adjusted_requests}
-                ).execute()
-            )
-            self.requests = []
+        empty = table_element(table_start, [[""] for _ in range(row_count)])
+        filled_texts = [[f"📄 {lang.upper()}"], [code]] if lang else [[code]]
+        filled = table_element(table_start, filled_texts)
 
-        # 2단계: 문서 재조회 + 테이블 삽입
-        doc = _retry(
-            lambda: self.docs_service.documents().get(documentId=self.doc_id).execute()
-        )
-        body = doc.get("body", {})
-        content = body.get("content", [])
-        doc_end_index = content[-1].get("endIndex", 1) if content else 1
-        table_start_index = doc_end_index - 1
+        return [
+            {
+                "insertTable": {
+                    "rows": row_count,
+                    "columns": 1,
+                    "location": {"index": location},
+                }
+            },
+            *self._build_code_table_text_requests(empty, code, lang),
+            *self._build_code_table_format_requests(filled, lang),
+        ]
 
-        # 1x1 테이블 삽입 (또는 언어 헤더 포함 시 2x1)
-        row_count = 2 if lang else 1
-        _retry(
-            lambda: self.docs_service.documents().batchUpdate(
-                documentId=self.doc_id,
-                body={
-                    "requests": [
-                        {
-                            "insertTable": {
-                                "rows": row_count,
-                                "columns": 1,
-                                "location": {"index": table_start_index},
-                            }
-                        }
-                    ]
-                },
-            ).execute()
+    def _add_code_block_as_table_planned(self, code: str, lang: str = ""):
+        """코드 블록 테이블 박스 (plan 모드 - API 호출 없음)"""
+        table_start = self.current_index + 1
+        self.requests.append(
+            {
+                "insertTable": {
+                    "rows": 2 if lang else 1,
+                    "columns": 1,
+                    "location": {"index": self.current_index},
+                }
+            }
         )
+        self._sync_doc_model()
 
-        # 3단계: 테이블 구조 조회 및 내용 채우기
-        doc = _retry(
-            lambda: self.docs_service.documents().get(documentId=self.doc_id).execute()
+        self.requests.extend(
+            self._build_code_table_text_requests(
+                self.doc_model.table_at(table_start), code, lang
+            )
         )
-        table_element = self._find_last_table(doc)
+        self._sync_doc_model()
 
-        if not table_element:
-            # 테이블 생성 실패 시 레거시 방식으로 폴백
-            self._add_code_block_legacy(code, lang)
-            return
+        self.requests.extend(
+            self._build_code_table_format_requests(
+                self.doc_model.table_at(table_start), lang
+            )
+        )
+        self._sync_doc_model()
+        self.current_index = self.doc_model.end_index - 1
 
+    def _build_code_table_text_requests(
+        self, table_element: dict, code: str, lang: str = ""
+    ) -> list[dict[str, Any]]:
+        """코드 블록 테이블의 텍스트 삽입 요청 (언어 레이블 + 코드, 인덱스 역순)"""
         table = table_element.get("table", {})
         table_rows = table.get("tableRows", [])
 
@@ -1205,7 +1140,7 @@ class MarkdownToDocsConverter:
                 if code_content:
                     para = code_content[0].get("paragraph", {})
                     para_elements = para.get("elements", [])
-                    if para_elements:
+                    if para_elements and code:
                         text_start = para_elements[0].get("startIndex", 1)
                         # 코드 내용 삽입
                         style_requests.append({
@@ -1215,195 +1150,170 @@ class MarkdownToDocsConverter:
                             }
                         })
 
-        # 내용 삽입 실행
-        if style_requests:
-            # 역순 정렬 (인덱스 시프트 방지)
-            style_requests.sort(
-                key=lambda x: x.get("insertText", {}).get("location", {}).get("index", 0),
-                reverse=True
-            )
-            _retry(
-                lambda: self.docs_service.documents().batchUpdate(
-                    documentId=self.doc_id, body={"requests": style_requests}
-                ).execute()
-            )
-
-        # 4단계: 스타일 적용
-        doc = _retry(
-            lambda: self.docs_service.documents().get(documentId=self.doc_id).execute()
+        # 역순 정렬 (인덱스 시프트 방지)
+        style_requests.sort(
+            key=lambda x: x.get("insertText", {}).get("location", {}).get("index", 0),
+            reverse=True
         )
-        table_element = self._find_last_table(doc)
-
-        if table_element:
-            table = table_element.get("table", {})
-            table_rows = table.get("tableRows", [])
-
-            format_requests = []
-
-            for row_idx, row in enumerate(table_rows):
-                cells = row.get("tableCells", [])
-                for cell in cells:
-                    cell_content = cell.get("content", [])
-                    for content_el in cell_content:
-                        if "paragraph" in content_el:
-                            para = content_el["paragraph"]
-                            para_elements = para.get("elements", [])
-                            for el in para_elements:
-                                if "textRun" in el:
-                                    start_idx = el.get("startIndex", 0)
-                                    end_idx = el.get("endIndex", start_idx + 1)
-
-                                    if lang and row_idx == 0:
-                                        # 언어 헤더 스타일 (언어별 색상 배지)
-                                        lang_lower = lang.lower()
-                                        # 언어별 텍스트 색상 (어두운 톤)
-                                        lang_text_colors = {
-                                            "python": {"red": 0.2, "green": 0.35, "blue": 0.55},
-                                            "javascript": {"red": 0.6, "green": 0.5, "blue": 0.1},
-                                            "typescript": {"red": 0.18, "green": 0.45, "blue": 0.7},
-                                            "bash": {"red": 0.25, "green": 0.25, "blue": 0.25},
-                                            "shell": {"red": 0.25, "green": 0.25, "blue": 0.25},
-                                            "json": {"red": 0.5, "green": 0.35, "blue": 0.15},
-                                            "yaml": {"red": 0.45, "green": 0.25, "blue": 0.45},
-                                            "sql": {"red": 0.7, "green": 0.35, "blue": 0.15},
-                                            "html": {"red": 0.8, "green": 0.25, "blue": 0.15},
-                                            "css": {"red": 0.15, "green": 0.45, "blue": 0.8},
-                                            "go": {"red": 0.0, "green": 0.55, "blue": 0.65},
-                                            "rust": {"red": 0.7, "green": 0.3, "blue": 0.2},
-                                            "java": {"red": 0.7, "green": 0.4, "blue": 0.2},
+        return style_requests
+
+    def _build_code_table_format_requests(
+        self, table_element: dict, lang: str = ""
+    ) -> list[dict[str, Any]]:
+        """코드 블록 테이블의 텍스트/셀 스타일 요청"""
+        table = table_element.get("table", {})
+        table_rows = table.get("tableRows", [])
+
+        format_requests = []
+
+        for row_idx, row in enumerate(table_rows):
+            cells = row.get("tableCells", [])
+            for cell in cells:
+                cell_content = cell.get("content", [])
+                for content_el in cell_content:
+                    if "paragraph" in content_el:
+                        para = content_el["paragraph"]
+                        para_elements = para.get("elements", [])
+                        for el in para_elements:
+                            if "textRun" in el:
+                                start_idx = el.get("startIndex", 0)
+                                end_idx = el.get("endIndex", start_idx + 1)
+
+                                if lang and row_idx == 0:
+                                    # 언어 헤더 스타일 (언어별 색상 배지)
+                                    lang_lower = lang.lower()
+                                    # 언어별 텍스트 색상 (어두운 톤)
+                                    lang_text_colors = {
+                                        "python": {"red": 0.2, "green": 0.35, "blue": 0.55},
+                                        "javascript": {"red": 0.6, "green": 0.5, "blue": 0.1},
+                                        "typescript": {"red": 0.18, "green": 0.45, "blue": 0.7},
+                                        "bash": {"red": 0.25, "green": 0.25, "blue": 0.25},
+                                        "shell": {"red": 0.25, "green": 0.25, "blue": 0.25},
+                                        "json": {"red": 0.5, "green": 0.35, "blue": 0.15},
+                                        "yaml": {"red": 0.45, "green": 0.25, "blue": 0.45},
+                                        "sql": {"red": 0.7, "green": 0.35, "blue": 0.15},
+                                        "html": {"red": 0.8, "green": 0.25, "blue": 0.15},
+                                        "css": {"red": 0.15, "green": 0.45, "blue": 0.8},
+                                        "go": {"red": 0.0, "green": 0.55, "blue": 0.65},
+                                        "rust": {"red": 0.7, "green": 0.3, "blue": 0.2},
+                                        "java": {"red": 0.7, "green": 0.4, "blue": 0.2},
+                                    }
+                                    text_color = lang_text_colors.get(
+                                        lang_lower, {"red": 0.35, "green": 0.35, "blue": 0.35}
+                                    )
+                                    format_requests.append({
+                                        "updateTextStyle": {
+                                            "range": {"startIndex": start_idx, "endIndex": end_idx},
+                                            "textStyle": {
+                                                "fontSize": {"magnitude": 9, "unit": "PT"},
+                                                "bold": True,
+                                                "foregroundColor": {
+                                                    "color": {"rgbColor": text_color}
+                                                },
+                                                "weightedFontFamily": {
+                                                    "fontFamily": "Arial",
+                                                    "weight": 700,
+                                                },
+                                            },
+                                            "fields": "fontSize,bold,foregroundColor,weightedFontFamily",
                                         }
-                                        text_color = lang_text_colors.get(
-                                            lang_lower, {"red": 0.35, "green": 0.35, "blue": 0.35}
-                                        )
-                                        format_requests.append({
-                                            "updateTextStyle": {
-                                                "range": {"startIndex": start_idx, "endIndex": end_idx},
-                                                "textStyle": {
-                                                    "fontSize": {"magnitude": 9, "unit": "PT"},
-                                                    "bold": True,
-                                                    "foregroundColor": {
-                                                        "color": {"rgbColor": text_color}
-                                                    },
-                                                    "weightedFontFamily": {
-                                                        "fontFamily": "Arial",
-                                                        "weight": 700,
-                                                    },
+                                    })
+                                else:
+                                    # 코드 스타일
+                                    format_requests.append({
+                                        "updateTextStyle": {
+                                            "range": {"startIndex": start_idx, "endIndex": end_idx},
+                                            "textStyle": {
+                                                "weightedFontFamily": {
+                                                    "fontFamily": self.code_font,
+                                                    "weight": 400,
                                                 },
-                                                "fields": "fontSize,bold,foregroundColor,weightedFontFamily",
-                                            }
-                                        })
-                                    else:
-                                        # 코드 스타일
-                                        format_requests.append({
-                                            "updateTextStyle": {
-                                                "range": {"startIndex": start_idx, "endIndex": end_idx},
-                                                "textStyle": {
-                                                    "weightedFontFamily": {
-                                                        "fontFamily": self.code_font,
-                                                        "weight": 400,
-                                                    },
-                                                    "fontSize": {"magnitude": 10, "unit": "PT"},
-                                                    "foregroundColor": {
-                                                        "color": {"rgbColor": {"red": 0.15, "green": 0.15, "blue": 0.15}}
-                                                    },
+                                                "fontSize": {"magnitude": 10, "unit": "PT"},
+                                                "foregroundColor": {
+                                                    "color": {"rgbColor": {"red": 0.15, "green": 0.15, "blue": 0.15}}
                                                 },
-                                                "fields": "weightedFontFamily,fontSize,foregroundColor",
-                                            }
-                                        })
-
-                    # 셀 배경색 설정
-                    if lang and row_idx == 0:
-                        # 헤더 셀: 언어별 연한 배경색
-                        lang_lower = lang.lower()
-                        lang_header_bg = {
-                            "python": {"red": 0.9, "green": 0.92, "blue": 0.96},    # 연한 파랑
-                            "javascript": {"red": 0.98, "green": 0.96, "blue": 0.88},  # 연한 노랑
-                            "typescript": {"red": 0.88, "green": 0.93, "blue": 0.98},  # 연한 청색
-                            "bash": {"red": 0.92, "green": 0.92, "blue": 0.92},      # 연한 회색
-                            "shell": {"red": 0.92, "green": 0.92, "blue": 0.92},     # 연한 회색
-                            "json": {"red": 0.96, "green": 0.94, "blue": 0.9},       # 연한 갈색
-                            "yaml": {"red": 0.95, "green": 0.92, "blue": 0.95},      # 연한 보라
-                            "sql": {"red": 0.98, "green": 0.93, "blue": 0.88},       # 연한 주황
-                            "html": {"red": 0.98, "green": 0.9, "blue": 0.88},       # 연한 빨강
-                            "css": {"red": 0.88, "green": 0.93, "blue": 0.98},       # 연한 파랑
-                            "go": {"red": 0.88, "green": 0.96, "blue": 0.97},        # 연한 청록
-                            "rust": {"red": 0.97, "green": 0.92, "blue": 0.9},       # 연한 적갈
-                            "java": {"red": 0.97, "green": 0.93, "blue": 0.9},       # 연한 주황
-                        }
-                        bg_color = lang_header_bg.get(
-                            lang_lower, {"red": 0.92, "green": 0.92, "blue": 0.92}
-                        )
-                    else:
-                        # 코드 셀: 연한 회색 배경
-                        bg_color = {
-                            "red": self.code_bg_color[0],
-                            "green": self.code_bg_color[1],
-                            "blue": self.code_bg_color[2],
-                        }
-
-                    format_requests.append({
-                        "updateTableCellStyle": {
-                            "tableStartLocation": {"index": table_element.get("startIndex", 1)},
-                            "tableCellStyle": {
-                                "backgroundColor": {"color": {"rgbColor": bg_color}},
-                                "paddingLeft": {"magnitude": 10, "unit": "PT"},
-                                "paddingRight": {"magnitude": 10, "unit": "PT"},
-                                "paddingTop": {"magnitude": 6, "unit": "PT"},
-                                "paddingBottom": {"magnitude": 6, "unit": "PT"},
-                            },
-                            "fields": "backgroundColor,paddingLeft,paddingRight,paddingTop,paddingBottom",
-                        }
-                    })
+                                            },
+                                            "fields": "weightedFontFamily,fontSize,foregroundColor",
+                                        }
+                                    })
+
+                # 셀 배경색 설정
+                if lang and row_idx == 0:
+                    # 헤더 셀: 언어별 연한 배경색
+                    lang_lower = lang.lower()
+                    lang_header_bg = {
+                        "python": {"red": 0.9, "green": 0.92, "blue": 0.96},    # 연한 파랑
+                        "javascript": {"red": 0.98, "green": 0.96, "blue": 0.88},  # 연한 노랑
+                        "typescript": {"red": 0.88, "green": 0.93, "blue": 0.98},  # 연한 청색
+                        "bash": {"red": 0.92, "green": 0.92, "blue": 0.92},      # 연한 회색
+                        "shell": {"red": 0.92, "green": 0.92, "blue": 0.92},     # 연한 회색
+                        "json": {"red": 0.96, "green": 0.94, "blue": 0.9},       # 연한 갈색
+                        "yaml": {"red": 0.95, "green": 0.92, "blue": 0.95},      # 연한 보라
+                        "sql": {"red": 0.98, "green": 0.93, "blue": 0.88},       # 연한 주황
+                        "html": {"red": 0.98, "green": 0.9, "blue": 0.88},       # 연한 빨강
+                        "css": {"red": 0.88, "green": 0.93, "blue": 0.98},       # 연한 파랑
+                        "go": {"red": 0.88, "green": 0.96, "blue": 0.97},        # 연한 청록
+                        "rust": {"red": 0.97, "green": 0.92, "blue": 0.9},       # 연한 적갈
+                        "java": {"red": 0.97, "green": 0.93, "blue": 0.9},       # 연한 주황
+                    }
+                    bg_color = lang_header_bg.get(
+                        lang_lower, {"red": 0.92, "green": 0.92, "blue": 0.92}
+                    )
+                else:
+                    # 코드 셀: 연한 회색 배경
+                    bg_color = {
+                        "red": self.code_bg_color[0],
+                        "green": self.code_bg_color[1],
+                        "blue": self.code_bg_color[2],
+                    }
 
-            # 테이블 테두리 스타일 (Google Docs 네이티브 코드 블록 스타일)
-            # 연한 회색 테두리로 코드 박스 효과
-            border_color = {"red": 0.8, "green": 0.8, "blue": 0.8}
-            format_requests.append({
-                "updateTableCellStyle": {
-                    "tableStartLocation": {"index": table_element.get("startIndex", 1)},
-                    "tableCellStyle": {
-                        "borderLeft": {
-                            "width": {"magnitude": 1, "unit": "PT"},
-                            "dashStyle": "SOLID",
-                            "color": {"color": {"rgbColor": border_color}},
-                        },
-                        "borderRight": {
-                            "width": {"magnitude": 1, "unit": "PT"},
-                            "dashStyle": "SOLID",
-                            "color": {"color": {"rgbColor": border_color}},
+                format_requests.append({
+                    "updateTableCellStyle": {
+                        "tableStartLocation": {"index": table_element.get("startIndex", 1)},
+                        "tableCellStyle": {
+                            "backgroundColor": {"color": {"rgbColor": bg_color}},
+                            "paddingLeft": {"magnitude": 10, "unit": "PT"},
+                            "paddingRight": {"magnitude": 10, "unit": "PT"},
+                            "paddingTop": {"magnitude": 6, "unit": "PT"},
+                            "paddingBottom": {"magnitude": 6, "unit": "PT"},
                         },
-                        "borderTop": {
-                            "width": {"magnitude": 1, "unit": "PT"},
-                            "dashStyle": "SOLID",
-                            "color": {"color": {"rgbColor": border_color}},
-                        },
-                        "borderBottom": {
-                            "width": {"magnitude": 1, "unit": "PT"},
-                            "dashStyle": "SOLID",
-                            "color": {"color": {"rgbColor": border_color}},
-                        },
-                    },
-                    "fields": "borderLeft,borderRight,borderTop,borderBottom",
-                }
-            })
+                        "fields": "backgroundColor,paddingLeft,paddingRight,paddingTop,paddingBottom",
+                    }
+                })
 
-            if format_requests:
-                _retry(
-                    lambda: self.docs_service.documents().batchUpdate(
-                        documentId=self.doc_id, body={"requests": format_requests}
-                    ).execute()
-                )
+        # 테이블 테두리 스타일 (Google Docs 네이티브 코드 블록 스타일)
+        # 연한 회색 테두리로 코드 박스 효과
+        border_color = {"red": 0.8, "green": 0.8, "blue": 0.8}
+        format_requests.append({
+            "updateTableCellStyle": {
+                "tableStartLocation": {"index": table_element.get("startIndex", 1)},
+                "tableCellStyle": {
+                    "borderLeft": {
+                        "width": {"magnitude": 1, "unit": "PT"},
+                        "dashStyle": "SOLID",
+                        "color": {"color": {"rgbColor": border_color}},
+                    },
+                    "borderRight": {
+                        "width": {"magnitude": 1, "unit": "PT"},
+                        "dashStyle": "SOLID",
+                        "color": {"color": {"rgbColor": border_color}},
+                    },
+                    "borderTop": {
+                        "width": {"magnitude": 1, "unit": "PT"},
+                        "dashStyle": "SOLID",
+                        "color": {"color": {"rgbColor": border_color}},
+                    },
+                    "borderBottom": {
+                        "width": {"magnitude": 1, "unit": "PT"},
+                        "dashStyle": "SOLID",
+                        "color": {"color": {"rgbColor": border_color}},
+                    },
+                },
+                "fields": "borderLeft,borderRight,borderTop,borderBottom",
+            }
+        })
 
-        # current_index 업데이트
-        doc = _retry(
-            lambda: self.docs_service.documents().get(documentId=self.doc_id).execute()
-        )
-        body = doc.get("body", {})
-        content = body.get("content", [])
-        if content:
-            self.current_index = content[-1].get("endIndex", 1) - 1
-        else:
-            self.current_index = 1
+        return format_requests
 
     def _add_code_block_legacy(self, code: str, lang: str = ""):
         """코드 블록 추가 (레거시 방식 - 텍스트 + paragraph border)
@@ -1898,34 +1808,109 @@ class MarkdownToDocsConverter:
             )
 
 
-def _execute_with_retry(request_fn, max_retries=5, initial_delay=30):
+def _image_replace_requests(op: dict) -> list[dict[str, Any]]:
+    """placeholder 삭제 + 같은 위치에 이미지 삽입 요청"""
+    return [
+        # 먼저 삭제
+        {
+            "deleteContentRange": {
+                "range": {
+                    "startIndex": op["index"],
+                    "endIndex": op["index"] + op["delete_length"],
+                }
+            }
+        },
+        # 같은 위치에 이미지 삽입
+        {
+            "insertInlineImage": {
+                "location": {"index": op["index"]},
+                "uri": op["url"],
+                "objectSize": {
+                    "width": {"magnitude": 510, "unit": "PT"},
+                },
+            }
+        },
+    ]
+
+
+def _upload_local_images(creds: Any, docs_service: Any, images: list[dict], folder_id: str) -> int:
     """
-    Rate Limit (429) 처리를 위한 지수 백오프 재시도 래퍼
+    로컬 이미지를 Drive에 업로드하고 url을 공개 URL로 교체
+
+    내용 해시 캐시에 있는 이미지는 Drive 호출 없이 재사용하고,
+    나머지는 동시에 업로드합니다 (image_cache.upload_local_images).
 
     Args:
-        request_fn: 실행할 API 요청 함수 (람다 또는 callable)
-        max_retries: 최대 재시도 횟수 (기본 5회)
-        initial_delay: 초기 대기 시간 (초, 기본 30초 - 분당 60회 쿼터 고려)
+        creds: Google OAuth 인증 정보
+        docs_service: Google Docs API 서비스
+        images: {url, is_local, original_url} 이미지 정보 리스트 (제자리 갱신)
+        folder_id: 업로드 대상 폴더 ID
 
     Returns:
-        API 응답
+        새로 업로드한 이미지 수
+    """
+    from .image_cache import upload_local_images
+    from .image_inserter import ImageInserter
+
+    return upload_local_images(
+        lambda: ImageInserter(creds, docs_service), images, folder_id
+    )
 
-    Raises:
-        HttpError: 재시도 후에도 실패한 경우
+
+# 이미지 교체 batchUpdate 1회당 최대 이미지 수 (삭제+삽입 = 이미지당 2 요청)
+IMAGE_BATCH_SIZE = 50
+
+
+def _replace_image_placeholders(
+    docs_service: Any, doc_id: str, image_operations: list[dict]
+) -> tuple[int, int]:
+    """
+    placeholder 텍스트를 실제 이미지로 교체
+
+    작업이 index 역순이므로 뒤쪽 교체가 앞쪽 인덱스에 영향을 주지 않아
+    여러 이미지를 하나의 batchUpdate로 보낼 수 있습니다. batchUpdate는
+    원자적이므로 배치가 실패하면 절반씩 나눠 재시도하여, 실패한 이미지만
+    이미지당 1회 호출로 남습니다.
+
+    Args:
+        docs_service: Google Docs API 서비스
+        doc_id: 문서 ID
+        image_operations: {index, delete_length, url, alt} 리스트 (index 역순 정렬)
+
+    Returns:
+        (삽입 성공 수, 실패 수)
     """
-    import time
-    from googleapiclient.errors import HttpError
+    # Rate Limit (429)는 전역 RateGovernor가 속도 조절 + 재시도
+    inserted_count = 0
+    failed_count = 0
 
-    for attempt in range(max_retries):
+    def _apply(ops: list[dict]) -> None:
+        nonlocal inserted_count, failed_count
         try:
-            return request_fn()
-        except HttpError as e:
-            if e.resp.status == 429 and attempt < max_retries - 1:
-                wait_time = initial_delay * (1.5 ** attempt)  # 30, 45, 67.5, 101...초
-                print(f"     [429] Rate limit, {wait_time:.0f}초 대기 후 재시도 ({attempt + 1}/{max_retries})...")
-                time.sleep(wait_time)
-            else:
-                raise
+            execute_request(docs_service.documents().batchUpdate(
+                documentId=doc_id,
+                body={"requests": [req for op in ops for req in _image_replace_requests(op)]},
+            ))
+            inserted_count += len(ops)
+        except Exception as img_err:
+            if len(ops) == 1:
+                print(f"     이미지 삽입 경고 ({ops[0].get('alt', '')}): {img_err}")
+                failed_count += 1
+                return
+            mid = len(ops) // 2
+            _apply(ops[:mid])
+            _apply(ops[mid:])
+
+    for i in range(0, len(image_operations), IMAGE_BATCH_SIZE):
+        _apply(image_operations[i:i + IMAGE_BATCH_SIZE])
+
+    if inserted_count > 0:
+        msg = f"     이미지 {inserted_count}개 삽입됨"
+        if failed_count > 0:
+            msg += f" ({failed_count}개 실패)"
+        print(msg)
+
+    return inserted_count, failed_count
 
 
 def create_google_doc(
@@ -1936,6 +1921,7 @@ def create_google_doc(
     use_native_tables: bool = True,
     apply_page_style: bool = True,
     base_path: Optional[str] = None,
+    plan: bool = False,
 ) -> str:
     """
     Google Docs 문서 생성 (v2.4.1 - Rate Limit 처리 추가)
@@ -1945,13 +1931,28 @@ def create_google_doc(
         content: 마크다운 콘텐츠
         folder_id: Google Drive 폴더 ID (None이면 기본 폴더)
         include_toc: 목차 포함 여부
-        use_native_tables: 네이티브 테이블 사용 여부 (2단계 처리로 안정적)
+        use_native_tables: 네이티브 테이블 사용 여부 (계산된 셀 인덱스로 일괄 삽입)
         apply_page_style: 페이지 스타일 적용 여부 (A4, 72pt 여백, 115% 줄간격)
         base_path: 마크다운 파일의 기준 경로 (상대 이미지 경로 해석용)
+        plan: 오프라인 계획 모드 (전체 요청을 미리 계산·검증 후
+            중간 documents().get 없이 최소 batchUpdate로 실행)
 
     Returns:
         str: 생성된 문서의 URL
     """
+    # plan 모드: 문서 생성 전에 요청 계산·검증 (실패 시 빈 문서를 만들지 않음)
+    doc_plan = None
+    if plan:
+        from .planner import build_document_plan
+
+        doc_plan = build_document_plan(
+            content,
+            include_toc=include_toc,
+            use_native_tables=use_native_tables,
+            apply_page_style=apply_page_style,
+            base_path=base_path,
+        )
+
     creds = get_credentials()
 
     # API 서비스 생성
@@ -1959,7 +1960,7 @@ def create_google_doc(
     drive_service = build("drive", "v3", credentials=creds)
 
     # 1. 빈 문서 생성
-    doc = docs_service.documents().create(body={"title": title}).execute()
+    doc = execute_request(docs_service.documents().create(body={"title": title}))
     doc_id = doc.get("documentId")
     print(f"[OK] 문서 생성됨: {title}")
     print(f"     ID: {doc_id}")
@@ -1970,34 +1971,53 @@ def create_google_doc(
     except Exception:
         target_folder = folder_id or DEFAULT_FOLDER_ID
     try:
-        file = drive_service.files().get(fileId=doc_id, fields="parents").execute()
+        file = execute_request(drive_service.files().get(fileId=doc_id, fields="parents"))
         previous_parents = ",".join(file.get("parents", []))
 
-        drive_service.files().update(
+        execute_request(drive_service.files().update(
             fileId=doc_id,
             addParents=target_folder,
             removeParents=previous_parents,
             fields="id, parents",
-        ).execute()
+        ))
         print("     폴더로 이동됨")
     except Exception as e:
         print(f"     폴더 이동 실패: {e}")
 
+    # 3~6. plan 모드: 미리 계산된 요청 실행 (페이지 스타일·줄간격 포함)
+    if doc_plan is not None:
+        from .planner import execute_document_plan
+
+        summary = doc_plan.summary()
+        print(
+            f"     요청 계획: {summary['requests']} 요청, 테이블 {summary['tables']}개, "
+            f"이미지 {summary['images']}개 → batchUpdate {summary['api_calls']}회"
+        )
+        if any(op.get("is_local") for op in doc_plan.images):
+            _upload_local_images(creds, docs_service, doc_plan.images, target_folder)
+        execute_document_plan(docs_service, doc_id, doc_plan)
+
+        for tmp_file in doc_plan.mermaid_temp_files:
+            try:
+                _Path(tmp_file).unlink(missing_ok=True)
+            except Exception:
+                pass
+        _store_section_cache(doc_id, content)
+        return f"https://docs.google.com/document/d/{doc_id}/edit"
+
     # 3. 페이지 스타일 적용 (A4, 72pt 여백) - SKILL.md 전역 표준
     if apply_page_style:
         try:
             style = NotionStyle.default()
             page_style_request = style.get_page_style_request()
-            _execute_with_retry(
-                lambda: docs_service.documents().batchUpdate(
-                    documentId=doc_id, body={"requests": [page_style_request]}
-                ).execute()
-            )
+            execute_request(docs_service.documents().batchUpdate(
+                documentId=doc_id, body={"requests": [page_style_request]}
+            ))
             print("     페이지 스타일 적용됨 (A4, 72pt 여백)")
         except Exception as e:
             print(f"     페이지 스타일 적용 실패: {e}")
 
-    # 4. 콘텐츠 변환 및 추가 (2단계 테이블 처리 지원)
+    # 4. 콘텐츠 변환 및 추가 (테이블은 요청 끝에 역순으로 포함)
     converter = MarkdownToDocsConverter(
         content,
         include_toc=include_toc,
@@ -2008,74 +2028,30 @@ def create_google_doc(
     )
     requests = converter.parse()
 
-    # 남은 요청들 실행 (테이블 처리 중 일부 요청이 이미 실행되었을 수 있음)
+    # 새 문서는 비어 있으므로 (index 1부터) 인덱스 보정 없이 순서대로 실행
     if requests:
         try:
-            # 테이블 처리 후 문서 상태가 변경되었을 수 있으므로 인덱스 재계산
-            doc = _execute_with_retry(
-                lambda: docs_service.documents().get(documentId=doc_id).execute()
-            )
-            body = doc.get("body", {})
-            content = body.get("content", [])
-            doc_end_index = content[-1].get("endIndex", 1) if content else 1
-            actual_insert_index = doc_end_index - 1
-
-            # 요청들의 인덱스를 실제 문서 상태에 맞게 재계산
-            adjusted_requests = converter._adjust_request_indices(
-                requests, actual_insert_index
-            )
-
             MAX_BATCH_SIZE = 300
-            total_batches = -(-len(adjusted_requests) // MAX_BATCH_SIZE)
-            for i in range(0, len(adjusted_requests), MAX_BATCH_SIZE):
-                batch = adjusted_requests[i:i + MAX_BATCH_SIZE]
-                _execute_with_retry(
-                    lambda b=batch: docs_service.documents().batchUpdate(
-                        documentId=doc_id, body={"requests": b}
-                    ).execute()
-                )
+            total_batches = -(-len(requests) // MAX_BATCH_SIZE)
+            for i in range(0, len(requests), MAX_BATCH_SIZE):
+                batch = requests[i:i + MAX_BATCH_SIZE]
+                execute_request(docs_service.documents().batchUpdate(
+                    documentId=doc_id, body={"requests": batch}
+                ))
                 print(f"     배치 {i//MAX_BATCH_SIZE + 1}/{total_batches} 완료 ({len(batch)} 요청)")
             print(f"     콘텐츠 추가됨: {len(requests)} 요청")
         except Exception as e:
             print(f"     콘텐츠 추가 실패: {e}")
             raise
-    else:
-        print("     콘텐츠 추가됨 (테이블 포함)")
 
     # 5. 2단계 이미지 삽입 (placeholder → 실제 이미지) - API 최적화 버전
     if converter._pending_images:
-        from pathlib import Path
-        from .image_inserter import ImageInserter
-
         try:
-            # ImageInserter 생성 (로컬 이미지 업로드용)
-            image_inserter = ImageInserter(creds, docs_service, drive_service)
-
-            # 로컬 이미지 업로드 및 URL 변환 (Drive API 호출)
-            uploaded_count = 0
-            for img_info in converter._pending_images:
-                if img_info.get("is_local", False):
-                    try:
-                        local_path = Path(img_info["url"])
-                        if local_path.exists():
-                            file_id, public_url = image_inserter.upload_to_drive(
-                                local_path,
-                                folder_id=target_folder,
-                                make_public=True,
-                            )
-                            img_info["url"] = public_url
-                            img_info["is_local"] = False
-                            uploaded_count += 1
-                    except Exception as upload_err:
-                        print(f"     이미지 업로드 실패 ({img_info.get('original_url', '')}): {upload_err}")
-
-            if uploaded_count > 0:
-                print(f"     로컬 이미지 {uploaded_count}개 업로드됨")
+            # 로컬 이미지 업로드 및 URL 변환 (캐시에 없는 이미지만 Drive API 호출)
+            _upload_local_images(creds, docs_service, converter._pending_images, target_folder)
 
             # 최적화: 단 1회의 documents.get으로 모든 placeholder 위치 수집
-            doc = _execute_with_retry(
-                lambda: docs_service.documents().get(documentId=doc_id).execute()
-            )
+            doc = execute_request(docs_service.documents().get(documentId=doc_id))
             body_content = doc.get("body", {}).get("content", [])
 
             # 유효한 이미지만 필터링 및 위치 정보 수집
@@ -2100,78 +2076,7 @@ def create_google_doc(
             # 역순 정렬 (뒤에서부터 처리하여 인덱스 시프트 방지)
             image_operations.sort(key=lambda x: x["index"], reverse=True)
 
-            # 최적화: 이미지별로 삭제+삽입을 단일 batchUpdate로 처리
-            # (삭제와 삽입은 인덱스 의존성이 있어 완전 일괄 처리는 불가)
-            # Rate Limit (429) 처리를 위한 지수 백오프 재시도 로직 추가
-            import time
-            from googleapiclient.errors import HttpError
-
-            inserted_count = 0
-            failed_count = 0
-
-            for i, op in enumerate(image_operations):
-                max_retries = 3
-                retry_delay = 2  # 초기 딜레이 2초
-
-                for attempt in range(max_retries):
-                    try:
-                        # 삭제 + 삽입을 단일 batchUpdate로 결합
-                        docs_service.documents().batchUpdate(
-                            documentId=doc_id,
-                            body={
-                                "requests": [
-                                    # 먼저 삭제
-                                    {
-                                        "deleteContentRange": {
-                                            "range": {
-                                                "startIndex": op["index"],
-                                                "endIndex": op["index"] + op["delete_length"],
-                                            }
-                                        }
-                                    },
-                                    # 같은 위치에 이미지 삽입
-                                    {
-                                        "insertInlineImage": {
-                                            "location": {"index": op["index"]},
-                                            "uri": op["url"],
-                                            "objectSize": {
-                                                "width": {"magnitude": 510, "unit": "PT"},
-                                            },
-                                        }
-                                    },
-                                ]
-                            },
-                        ).execute()
-                        inserted_count += 1
-                        break  # 성공 시 루프 탈출
-                    except HttpError as e:
-                        if e.resp.status == 429:
-                            # Rate Limit - 재시도
-                            if attempt < max_retries - 1:
-                                wait_time = retry_delay * (2 ** attempt)  # 지수 백오프
-                                print(f"     [429] Rate limit, {wait_time}초 대기 후 재시도... ({op.get('alt', '')})")
-                                time.sleep(wait_time)
-                            else:
-                                print(f"     이미지 삽입 실패 (max retries) ({op.get('alt', '')})")
-                                failed_count += 1
-                        else:
-                            print(f"     이미지 삽입 경고 ({op.get('alt', '')}): {e}")
-                            failed_count += 1
-                            break
-                    except Exception as img_err:
-                        print(f"     이미지 삽입 경고 ({op.get('alt', '')}): {img_err}")
-                        failed_count += 1
-                        break
-
-                # Rate Limit 방지: 매 10개 이미지마다 1초 대기
-                if (i + 1) % 10 == 0 and i + 1 < len(image_operations):
-                    time.sleep(1)
-
-            if inserted_count > 0:
-                msg = f"     이미지 {inserted_count}개 삽입됨"
-                if failed_count > 0:
-                    msg += f" ({failed_count}개 실패)"
-                print(msg)
+            _replace_image_placeholders(docs_service, doc_id, image_operations)
         except Exception as e:
             print(f"     이미지 삽입 실패: {e}")
 
@@ -2180,33 +2085,29 @@ def create_google_doc(
     if apply_page_style:
         try:
             # 최종 문서 상태 조회 (이미지 삽입으로 인덱스 변경됐을 수 있음)
-            doc = _execute_with_retry(
-                lambda: docs_service.documents().get(documentId=doc_id).execute()
-            )
+            doc = execute_request(docs_service.documents().get(documentId=doc_id))
             end_index = max(el.get("endIndex", 1) for el in doc["body"]["content"])
 
             if end_index > 2:
-                _execute_with_retry(
-                    lambda: docs_service.documents().batchUpdate(
-                        documentId=doc_id,
-                        body={
-                            "requests": [
-                                {
-                                    "updateParagraphStyle": {
-                                        "range": {
-                                            "startIndex": 1,
-                                            "endIndex": end_index - 1,
-                                        },
-                                        "paragraphStyle": {
-                                            "lineSpacing": 115,
-                                        },
-                                        "fields": "lineSpacing",
-                                    }
+                execute_request(docs_service.documents().batchUpdate(
+                    documentId=doc_id,
+                    body={
+                        "requests": [
+                            {
+                                "updateParagraphStyle": {
+                                    "range": {
+                                        "startIndex": 1,
+                                        "endIndex": end_index - 1,
+                                    },
+                                    "paragraphStyle": {
+                                        "lineSpacing": 115,
+                                    },
+                                    "fields": "lineSpacing",
                                 }
-                            ]
-                        },
-                    ).execute()
-                )
+                            }
+                        ]
+                    },
+                ))
                 print("     줄간격 적용됨 (115%)")
         except Exception as e:
             print(f"     줄간격 적용 실패: {e}")
@@ -2218,7 +2119,10 @@ def create_google_doc(
         except Exception:
             pass
 
-    # 9. 문서 URL 반환
+    # 9. 증분 업데이트 기준 상태 기록 (이후 update_google_doc은 바뀐 섹션만 작성)
+    _store_section_cache(doc_id, content)
+
+    # 10. 문서 URL 반환
     doc_url = f"https://docs.google.com/document/d/{doc_id}/edit"
     return doc_url
 
@@ -2260,36 +2164,14 @@ def _compute_content_hash(content: str) -> str:
     return hashlib.md5(content.encode("utf-8")).hexdigest()
 
 
-def _gdocs_hash_cache_path() -> _Path:
-    """해시 캐시 파일 경로"""
-    _base = _Path(__file__).resolve().parent.parent.parent  # → C:/claude/
-    return _base / "json" / ".gdocs_hash_cache.json"
-
-
-def _load_gdocs_hash_cache() -> dict:
-    """해시 캐시 로드"""
-    p = _gdocs_hash_cache_path()
-    if p.exists():
-        try:
-            return _json.loads(p.read_text(encoding="utf-8"))
-        except Exception:
-            return {}
-    return {}
-
-
-def _save_gdocs_hash_cache(cache: dict) -> None:
-    """해시 캐시 저장"""
-    p = _gdocs_hash_cache_path()
-    try:
-        p.parent.mkdir(parents=True, exist_ok=True)
-        p.write_text(_json.dumps(cache, ensure_ascii=False, indent=2), encoding="utf-8")
-    except Exception as e:
-        print(f"       캐시 저장 실패 (무시됨): {e}")
-
-
 def _parse_md_sections(content: str) -> list[dict]:
     """마크다운을 H1/H2 기준으로 섹션 분할
 
+    공유 블록 토크나이저를 사용하므로 코드 블록 내부의 '# 주석' 줄은
+    섹션 경계로 취급하지 않습니다. has_table은 변환기가 실제 표로 렌더링하는
+    TABLE 블록 기준이며, 코드 블록 안의 '|' 줄이나 구분선 없는 '|' 줄은 표로
+    보지 않습니다.
+
     Returns:
         list of {heading, level, content, has_table, has_image, content_hash}
         heading "__preamble__" 은 첫 제목 이전 내용
@@ -2298,36 +2180,46 @@ def _parse_md_sections(content: str) -> list[dict]:
     lines = content.split("\n")
     cur_heading = "__preamble__"
     cur_level = 0
-    cur_lines: list[str] = []
+    cur_start = 0
+    cur_has_table = False
 
-    def flush(heading: str, level: int, lines_: list[str]) -> None:
-        text = "\n".join(lines_)
+    def flush(heading: str, level: int, start: int, end: int, has_table: bool) -> None:
+        text = "\n".join(lines[start:end])
         sections.append({
             "heading": heading,
             "level": level,
             "content": text,
-            "has_table": bool(re.search(r"^\|.+\|", text, re.MULTILINE)),
+            "has_table": has_table,
             "has_image": "![" in text,
             "content_hash": _compute_content_hash(text),
         })
 
-    for line in lines:
-        m = re.match(r"^(#{1,2}) (.+)", line)
-        if m:
-            flush(cur_heading, cur_level, cur_lines)
-            cur_heading = m.group(2).strip()
-            cur_level = len(m.group(1))
-            cur_lines = [line]
-        else:
-            cur_lines.append(line)
-
-    flush(cur_heading, cur_level, cur_lines)
+    for block in iter_blocks(lines):
+        kind = block.kind
+        if kind is MdBlockKind.TABLE:
+            cur_has_table = True
+            continue
+        if kind is not MdBlockKind.HEADING or block.level > 2:
+            continue
+        # "# 제목" / "## 제목" 형식만 섹션 경계 (# 뒤 공백 1칸 필수)
+        line = block.line
+        if line[block.level:block.level + 1] != " " or len(line) <= block.level + 1:
+            continue
+        flush(cur_heading, cur_level, cur_start, block.start, cur_has_table)
+        cur_heading = line[block.level + 1:].strip()
+        cur_level = block.level
+        cur_start = block.start
+        cur_has_table = False
+
+    flush(cur_heading, cur_level, cur_start, len(lines), cur_has_table)
     return sections
 
 
 def _extract_doc_section_map(body_content: list[dict]) -> list[dict]:
     """Google Docs 본문에서 섹션 맵 추출
 
+    첫 H1은 TITLE 스타일로 렌더링되므로 TITLE도 1단계 섹션 경계로 취급합니다.
+
     Returns:
         list of {heading, level, para_start, para_end, section_end, has_table}
         - para_start: 헤딩 paragraph startIndex
@@ -2346,11 +2238,11 @@ def _extract_doc_section_map(body_content: list[dict]) -> list[dict]:
                 el.get("textRun", {}).get("content", "")
                 for el in para.get("elements", [])
             )
-            if named_style in ("HEADING_1", "HEADING_2"):
+            if named_style in ("TITLE", "HEADING_1", "HEADING_2"):
                 if cur is not None:
                     cur["section_end"] = elem.get("startIndex", 0)
                     secs.append(cur)
-                level = 1 if named_style == "HEADING_1" else 2
+                level = 2 if named_style == "HEADING_2" else 1
                 cur = {
                     "heading": text.strip(),
                     "level": level,
@@ -2370,59 +2262,34 @@ def _extract_doc_section_map(body_content: list[dict]) -> list[dict]:
     return secs
 
 
-def _replace_doc_section(
-    doc_id: str,
-    docs_service: Any,
-    para_end: int,
-    section_end: int,
-    new_section_md: str,
-) -> None:
-    """섹션 본문만 교체 (헤딩 paragraph는 보존)
+def _reference_links_hash(content: str) -> tuple[str, dict[str, str]]:
+    """참조 링크 정의 ([id]: url) 해시 + 링크 맵"""
+    links = MarkdownToDocsConverter(content, use_premium_style=False)._reference_links
+    return _compute_content_hash(_json.dumps(sorted(links.items()))), links
 
-    Args:
-        para_end: 헤딩 paragraph의 endIndex (본문이 시작되는 위치)
-        section_end: 이 섹션의 끝 인덱스 (다음 헤딩 직전)
-        new_section_md: 전체 섹션 마크다운 (헤딩 줄 포함)
+
+def _section_cache_entry(content: str) -> dict:
+    """동기화 상태의 문서 항목 (증분 업데이트 기준 상태)
+
+    section_list는 문서 순서의 [heading, level, hash] 목록으로,
+    incremental.build_incremental_plan()이 섹션 추가·삭제·이동을 비교합니다.
+    sections는 이전 형식과의 호환용입니다.
     """
-    # 1. 헤딩 이후 기존 본문 삭제
-    delete_end = section_end - 1
-    if delete_end > para_end:
-        _execute_with_retry(
-            lambda: docs_service.documents().batchUpdate(
-                documentId=doc_id,
-                body={"requests": [{"deleteContentRange": {"range": {
-                    "startIndex": para_end,
-                    "endIndex": delete_end,
-                }}}]},
-            ).execute()
-        )
+    sections = _parse_md_sections(content)
+    return {
+        "full_hash": _compute_content_hash(content),
+        "sections": {s["heading"]: s["content_hash"] for s in sections},
+        "section_list": [[s["heading"], s["level"], s["content_hash"]] for s in sections],
+        "refs_hash": _reference_links_hash(content)[0],
+    }
 
-    # 2. 새 본문 (헤딩 줄 제외)을 Docs 요청으로 변환 후 삽입
-    body_lines = new_section_md.split("\n")[1:]  # 첫 줄(헤딩) 제외
-    body_md = "\n".join(body_lines).strip()
-    if not body_md:
-        return
 
-    converter = MarkdownToDocsConverter(
-        body_md + "\n\n",
-        include_toc=False,
-        use_native_tables=False,  # 테이블 포함 섹션은 전체 재작성으로 처리
-    )
-    requests = converter.parse()
-    if not requests:
-        return
-
-    # para_end 위치에 삽입 (삭제 후 인덱스가 para_end로 당겨짐)
-    adjusted = converter._adjust_request_indices(requests, para_end)
-
-    MAX_BATCH = 200
-    for i in range(0, len(adjusted), MAX_BATCH):
-        batch = adjusted[i : i + MAX_BATCH]
-        _execute_with_retry(
-            lambda b=batch: docs_service.documents().batchUpdate(
-                documentId=doc_id, body={"requests": b}
-            ).execute()
-        )
+def _store_section_cache(doc_id: str, content: str) -> None:
+    """문서 작성 직후 상태를 동기화 상태 저장소에 기록 (실패해도 무시)"""
+    try:
+        get_sync_store().put_doc(doc_id, _section_cache_entry(content))
+    except Exception as e:
+        print(f"       동기화 상태 저장 실패 (무시됨): {e}")
 
 
 def update_google_doc(
@@ -2456,94 +2323,63 @@ def update_google_doc(
     # ── 증분 업데이트: 해시 체크 및 섹션별 비교 ───────────────────────
     if incremental:
         new_hash = _compute_content_hash(content)
-        cache = _load_gdocs_hash_cache()
+        store = get_sync_store()
+        cached = store.get_doc(doc_id) or {}
 
         # 내용 동일 → 업데이트 완전 스킵
-        if cache.get(doc_id, {}).get("full_hash") == new_hash:
+        if cached.get("full_hash") == new_hash:
             print("[SKIP] 내용 변경 없음, Google Docs 업데이트 스킵")
             return doc_url
 
-        # 섹션 분석으로 증분 업데이트 시도
+        # 섹션 비교로 증분 업데이트 시도 (테이블·이미지 포함 섹션도 구간 단위로 재작성)
         try:
+            from .incremental import build_incremental_plan, execute_incremental_plan
+
             creds = get_credentials()
             docs_service_inc = build("docs", "v1", credentials=creds)
 
             print("[0/5] 문서 구조 분석 중 (증분 업데이트)...")
-            doc = _execute_with_retry(
-                lambda: docs_service_inc.documents().get(documentId=doc_id).execute()
-            )
+            doc = execute_request(docs_service_inc.documents().get(documentId=doc_id))
             body_content = doc.get("body", {}).get("content", [])
+            revision_id = doc.get("revisionId")
+
+            inc_plan = build_incremental_plan(
+                content,
+                cached,
+                body_content,
+                use_native_tables=use_native_tables,
+                apply_page_style=apply_page_style,
+                base_path=base_path,
+            )
 
-            old_secs = _extract_doc_section_map(body_content)
-            new_secs = _parse_md_sections(content)
-
-            old_headings = [s["heading"] for s in old_secs]
-            new_headings = [s["heading"] for s in new_secs if s["heading"] != "__preamble__"]
-
-            # 섹션 구조(추가·삭제·순서) 변경 시 전체 재작성으로 폴백
-            if old_headings != new_headings:
-                added = set(new_headings) - set(old_headings)
-                removed = set(old_headings) - set(new_headings)
-                reason_parts = []
-                if added:
-                    reason_parts.append(f"새 섹션: {', '.join(added)}")
-                if removed:
-                    reason_parts.append(f"삭제 섹션: {', '.join(removed)}")
-                if not reason_parts:
-                    reason_parts.append("섹션 순서 변경")
-                print(f"       구조 변경 감지 ({'; '.join(reason_parts)}) → 전체 재작성")
+            if inc_plan is None:
+                print("       문서 구조가 캐시 기록과 다름 (또는 참조 링크 변경) → 전체 재작성")
             else:
-                # 캐시된 섹션 해시와 비교
-                new_secs_map = {s["heading"]: s for s in new_secs}
-                cached_section_hashes = cache.get(doc_id, {}).get("sections", {})
-                changed: list[dict] = []
-                force_full = False
-
-                for old_sec in old_secs:
-                    heading = old_sec["heading"]
-                    new_sec = new_secs_map.get(heading)
-                    if not new_sec:
-                        continue
-                    # 테이블·이미지 포함 섹션은 전체 재작성
-                    if old_sec["has_table"] or new_sec["has_table"] or new_sec["has_image"]:
-                        force_full = True
-                        print(f"       섹션 '{heading}': 테이블/이미지 포함 → 전체 재작성")
-                        break
-                    # 캐시된 해시와 새 해시 비교
-                    old_hash_sec = cached_section_hashes.get(heading, "")
-                    new_hash_sec = new_sec["content_hash"]
-                    if old_hash_sec != new_hash_sec:
-                        changed.append({
-                            "heading": heading,
-                            "old": old_sec,
-                            "new": new_sec,
-                        })
-
-                if not force_full:
-                    if not changed:
-                        print("       모든 섹션 동일 → 업데이트 스킵")
-                        section_hashes = {s["heading"]: s["content_hash"] for s in new_secs}
-                        cache[doc_id] = {"full_hash": new_hash, "sections": section_hashes}
-                        _save_gdocs_hash_cache(cache)
-                        return doc_url
-
-                    print(f"       변경 섹션 {len(changed)}개 → 증분 업데이트 시작")
-                    # 역순 처리 (인덱스 안정성 보장: 뒤에서 앞으로)
-                    for sec_info in reversed(changed):
-                        _replace_doc_section(
-                            doc_id=doc_id,
-                            docs_service=docs_service_inc,
-                            para_end=sec_info["old"]["para_end"],
-                            section_end=sec_info["old"]["section_end"],
-                            new_section_md=sec_info["new"]["content"],
-                        )
-                        print(f"       '{sec_info['heading']}' 섹션 업데이트 완료")
-
-                    section_hashes = {s["heading"]: s["content_hash"] for s in new_secs}
-                    cache[doc_id] = {"full_hash": new_hash, "sections": section_hashes}
-                    _save_gdocs_hash_cache(cache)
+                summary = inc_plan.summary()
+                if not summary["regions"]:
+                    print("       모든 섹션 동일 → 업데이트 스킵")
+                else:
+                    print(
+                        f"       변경 구간 {summary['regions']}개 "
+                        f"(섹션 {summary['sections_written']}개 작성, {summary['sections_removed']}개 제거) "
+                        f"→ 증분 업데이트 시작"
+                    )
+                    if any(op.get("is_local") for op in inc_plan.images):
+                        try:
+                            image_folder = get_project_folder_id(subfolder="images")
+                        except Exception:
+                            image_folder = folder_id or DEFAULT_FOLDER_ID
+                        _upload_local_images(creds, docs_service_inc, inc_plan.images, image_folder)
+                    try:
+                        result = execute_incremental_plan(docs_service_inc, doc_id, inc_plan)
+                    finally:
+                        for tmp_file in inc_plan.mermaid_temp_files:
+                            _Path(tmp_file).unlink(missing_ok=True)
+                    revision_id = result["revision_id"] or revision_id
                     print(f"[완료] 증분 업데이트 완료: {doc_url}")
-                    return doc_url
+
+                store.put_doc(doc_id, {**_section_cache_entry(content), "revision_id": revision_id})
+                return doc_url
 
         except Exception as e:
             print(f"       증분 업데이트 실패 ({e}), 전체 재작성으로 폴백...")
@@ -2554,37 +2390,32 @@ def update_google_doc(
 
     # API 서비스 생성
     docs_service = build("docs", "v1", credentials=creds)
-    drive_service = build("drive", "v3", credentials=creds)
 
     # 1. 기존 문서 내용 전체 삭제
     print("[1/5] 기존 내용 삭제 중...")
     try:
-        doc = _execute_with_retry(
-            lambda: docs_service.documents().get(documentId=doc_id).execute()
-        )
+        doc = execute_request(docs_service.documents().get(documentId=doc_id))
         body_content = doc.get("body", {}).get("content", [])
 
         # 문서 끝 인덱스 찾기 (첫 번째 요소는 보통 sectionBreak, 마지막 요소의 endIndex - 1까지 삭제)
         if len(body_content) > 1:
             end_index = max(el.get("endIndex", 1) for el in body_content)
             if end_index > 2:
-                _execute_with_retry(
-                    lambda: docs_service.documents().batchUpdate(
-                        documentId=doc_id,
-                        body={
-                            "requests": [
-                                {
-                                    "deleteContentRange": {
-                                        "range": {
-                                            "startIndex": 1,
-                                            "endIndex": end_index - 1,
-                                        }
+                execute_request(docs_service.documents().batchUpdate(
+                    documentId=doc_id,
+                    body={
+                        "requests": [
+                            {
+                                "deleteContentRange": {
+                                    "range": {
+                                        "startIndex": 1,
+                                        "endIndex": end_index - 1,
                                     }
                                 }
-                            ]
-                        },
-                    ).execute()
-                )
+                            }
+                        ]
+                    },
+                ))
                 print("       기존 내용 삭제됨")
         else:
             print("       문서가 비어있음")
@@ -2598,11 +2429,9 @@ def update_google_doc(
         try:
             style = NotionStyle.default()
             page_style_request = style.get_page_style_request()
-            _execute_with_retry(
-                lambda: docs_service.documents().batchUpdate(
-                    documentId=doc_id, body={"requests": [page_style_request]}
-                ).execute()
-            )
+            execute_request(docs_service.documents().batchUpdate(
+                documentId=doc_id, body={"requests": [page_style_request]}
+            ))
             print("       페이지 스타일 적용됨 (A4, 72pt 여백)")
         except Exception as e:
             print(f"       페이지 스타일 적용 실패: {e}")
@@ -2621,9 +2450,7 @@ def update_google_doc(
 
     if requests:
         try:
-            doc = _execute_with_retry(
-                lambda: docs_service.documents().get(documentId=doc_id).execute()
-            )
+            doc = execute_request(docs_service.documents().get(documentId=doc_id))
             body = doc.get("body", {})
             doc_content = body.get("content", [])
             doc_end_index = doc_content[-1].get("endIndex", 1) if doc_content else 1
@@ -2637,11 +2464,9 @@ def update_google_doc(
             total_batches = -(-len(adjusted_requests) // MAX_BATCH_SIZE)
             for i in range(0, len(adjusted_requests), MAX_BATCH_SIZE):
                 batch = adjusted_requests[i:i + MAX_BATCH_SIZE]
-                _execute_with_retry(
-                    lambda b=batch: docs_service.documents().batchUpdate(
-                        documentId=doc_id, body={"requests": b}
-                    ).execute()
-                )
+                execute_request(docs_service.documents().batchUpdate(
+                    documentId=doc_id, body={"requests": batch}
+                ))
                 print(f"       배치 {i//MAX_BATCH_SIZE + 1}/{total_batches} 완료 ({len(batch)} 요청)")
             print(f"       콘텐츠 추가됨: {len(requests)} 요청")
         except Exception as e:
@@ -2653,41 +2478,17 @@ def update_google_doc(
     # 4. 이미지 삽입
     print("[4/5] 이미지 삽입 중...")
     if converter._pending_images:
-        from pathlib import Path
-        from .image_inserter import ImageInserter
-
         try:
-            image_inserter = ImageInserter(creds, docs_service, drive_service)
-
-            # 로컬 이미지 업로드
-            uploaded_count = 0
-            for img_info in converter._pending_images:
-                if img_info.get("is_local", False):
-                    try:
-                        local_path = Path(img_info["url"])
-                        if local_path.exists():
-                            try:
-                                image_folder = get_project_folder_id(subfolder="images")
-                            except Exception:
-                                image_folder = folder_id or DEFAULT_FOLDER_ID
-                            file_id, public_url = image_inserter.upload_to_drive(
-                                local_path,
-                                folder_id=image_folder,
-                                make_public=True,
-                            )
-                            img_info["url"] = public_url
-                            img_info["is_local"] = False
-                            uploaded_count += 1
-                    except Exception as upload_err:
-                        print(f"       이미지 업로드 실패: {upload_err}")
-
-            if uploaded_count > 0:
-                print(f"       로컬 이미지 {uploaded_count}개 업로드됨")
+            # 로컬 이미지 업로드 (캐시에 없는 이미지만)
+            if any(img.get("is_local") for img in converter._pending_images):
+                try:
+                    image_folder = get_project_folder_id(subfolder="images")
+                except Exception:
+                    image_folder = folder_id or DEFAULT_FOLDER_ID
+                _upload_local_images(creds, docs_service, converter._pending_images, image_folder)
 
             # placeholder 위치 찾기 및 이미지 삽입
-            doc = _execute_with_retry(
-                lambda: docs_service.documents().get(documentId=doc_id).execute()
-            )
+            doc = execute_request(docs_service.documents().get(documentId=doc_id))
             body_content = doc.get("body", {}).get("content", [])
 
             image_operations = []
@@ -2710,58 +2511,7 @@ def update_google_doc(
 
             image_operations.sort(key=lambda x: x["index"], reverse=True)
 
-            import time
-            from googleapiclient.errors import HttpError
-
-            inserted_count = 0
-            for i, op in enumerate(image_operations):
-                max_retries = 3
-                retry_delay = 2
-
-                for attempt in range(max_retries):
-                    try:
-                        docs_service.documents().batchUpdate(
-                            documentId=doc_id,
-                            body={
-                                "requests": [
-                                    {
-                                        "deleteContentRange": {
-                                            "range": {
-                                                "startIndex": op["index"],
-                                                "endIndex": op["index"] + op["delete_length"],
-                                            }
-                                        }
-                                    },
-                                    {
-                                        "insertInlineImage": {
-                                            "location": {"index": op["index"]},
-                                            "uri": op["url"],
-                                            "objectSize": {
-                                                "width": {"magnitude": 510, "unit": "PT"},
-                                            },
-                                        }
-                                    },
-                                ]
-                            },
-                        ).execute()
-                        inserted_count += 1
-                        break
-                    except HttpError as e:
-                        if e.resp.status == 429:
-                            if attempt < max_retries - 1:
-                                wait_time = retry_delay * (2 ** attempt)
-                                print(f"       [429] Rate limit, {wait_time}초 대기...")
-                                time.sleep(wait_time)
-                        else:
-                            break
-                    except Exception:
-                        break
-
-                if (i + 1) % 10 == 0 and i + 1 < len(image_operations):
-                    time.sleep(1)
-
-            if inserted_count > 0:
-                print(f"       이미지 {inserted_count}개 삽입됨")
+            _replace_image_placeholders(docs_service, doc_id, image_operations)
         except Exception as e:
             print(f"       이미지 삽입 실패: {e}")
     else:
@@ -2771,49 +2521,35 @@ def update_google_doc(
     print("[5/5] 줄간격 적용 중...")
     if apply_page_style:
         try:
-            doc = _execute_with_retry(
-                lambda: docs_service.documents().get(documentId=doc_id).execute()
-            )
+            doc = execute_request(docs_service.documents().get(documentId=doc_id))
             end_index = max(el.get("endIndex", 1) for el in doc["body"]["content"])
 
             if end_index > 2:
-                _execute_with_retry(
-                    lambda: docs_service.documents().batchUpdate(
-                        documentId=doc_id,
-                        body={
-                            "requests": [
-                                {
-                                    "updateParagraphStyle": {
-                                        "range": {
-                                            "startIndex": 1,
-                                            "endIndex": end_index - 1,
-                                        },
-                                        "paragraphStyle": {
-                                            "lineSpacing": 115,
-                                        },
-                                        "fields": "lineSpacing",
-                                    }
+                execute_request(docs_service.documents().batchUpdate(
+                    documentId=doc_id,
+                    body={
+                        "requests": [
+                            {
+                                "updateParagraphStyle": {
+                                    "range": {
+                                        "startIndex": 1,
+                                        "endIndex": end_index - 1,
+                                    },
+                                    "paragraphStyle": {
+                                        "lineSpacing": 115,
+                                    },
+                                    "fields": "lineSpacing",
                                 }
-                            ]
-                        },
-                    ).execute()
-                )
+                            }
+                        ]
+                    },
+                ))
                 print("       줄간격 적용됨 (115%)")
         except Exception as e:
             print(f"       줄간격 적용 실패: {e}")
 
-    # 전체 재작성 완료 후 해시 캐시 갱신
+    # 전체 재작성 완료 후 동기화 상태 갱신
     if incremental:
-        try:
-            _inc_cache = _load_gdocs_hash_cache()
-            _new_secs = _parse_md_sections(content)
-            _section_hashes = {s["heading"]: s["content_hash"] for s in _new_secs}
-            _inc_cache[doc_id] = {
-                "full_hash": _compute_content_hash(content),
-                "sections": _section_hashes,
-            }
-            _save_gdocs_hash_cache(_inc_cache)
-        except Exception:
-            pass
+        _store_section_cache(doc_id, content)
 
     return doc_url
@@ -0,0 +1,476 @@
+"""
+Google Docs 본문 인메모리 모델
+
+batchUpdate 요청을 네트워크 없이 적용하여 UTF-16 인덱스, 테이블,
+인라인 객체(이미지)를 추적합니다. plan 모드에서 전체 요청 시퀀스를
+미리 계산하고 검증하는 데 사용됩니다.
+
+인덱스 규칙 (Docs API 기준):
+    - 본문은 sectionBreak [0, 1)로 시작하고, 빈 문서는 단락 "\\n" [1, 2)만 가짐
+    - 텍스트는 UTF-16 코드 유닛 단위, 모든 단락은 "\\n"으로 끝남
+    - 인라인 이미지는 1 유닛
+    - insertTable은 삽입 위치에 줄바꿈을 먼저 넣고 그 뒤에 테이블 생성
+      (빈 단락 L에 삽입 시 테이블 시작 = L + 1)
+    - 테이블 크기 = 시작 1 + 행마다 (1 + 셀마다 (1 + 셀 내용)) + 끝 1
+      → 빈 셀 (r, c)의 단락 시작 = 테이블 시작 + 3 + r * (1 + 2 * 열수) + 2 * c
+
+Usage:
+    model = DocModel()
+    model.apply(requests)            # 잘못된 인덱스면 PlanValidationError
+    table = model.table_at(index)    # documents().get 형식의 테이블 요소
+    doc = model.to_document()        # documents().get 형식의 전체 문서
+"""
+
+from bisect import bisect_left, bisect_right
+from typing import Any
+
+from .errors import PlanValidationError
+from .table_renderer import utf16_len
+
+# 인라인 객체(이미지) 자리 표시 문자 (1 UTF-16 유닛)
+OBJECT_CHAR = "\ufffc"
+
+# 인덱스 범위만 검증하는 스타일 요청
+_RANGE_REQUESTS = frozenset(
+    (
+        "updateTextStyle",
+        "updateParagraphStyle",
+        "createParagraphBullets",
+        "deleteParagraphBullets",
+    )
+)
+
+
+class _Paragraph:
+    """단락 (text는 항상 "\\n"으로 끝남)"""
+
+    __slots__ = ("text", "length", "style")
+
+    def __init__(self, text: str, style: str = "NORMAL_TEXT", length: int | None = None):
+        self.text = text
+        self.length = utf16_len(text) if length is None else length
+        self.style = style
+
+
+class _Table:
+    """테이블 (cells[row][col] = 셀 내 단락 리스트)"""
+
+    __slots__ = ("cells", "columns", "length")
+
+    def __init__(self, rows: int, columns: int):
+        self.cells = [[[_Paragraph("\n")] for _ in range(columns)] for _ in range(rows)]
+        self.columns = columns
+        self.length = 2 + rows * (1 + 2 * columns)
+
+
+def _py_offset(paragraph: _Paragraph, offset: int) -> int:
+    """단락 내 UTF-16 오프셋 → 파이썬 문자열 오프셋"""
+    text = paragraph.text
+    if paragraph.length == len(text):
+        return offset  # 서로게이트 쌍 없음
+
+    units = 0
+    for i, ch in enumerate(text):
+        if units >= offset:
+            break
+        units += 2 if ord(ch) > 0xFFFF else 1
+    else:
+        i = len(text)
+    if units != offset:
+        raise PlanValidationError(f"인덱스가 서로게이트 쌍 중간을 가리킴 (offset={offset})")
+    return i
+
+
+def _paragraph_json(paragraph: _Paragraph, start: int) -> dict[str, Any]:
+    """단락 → documents().get 형식의 구조 요소"""
+    elements: list[dict[str, Any]] = []
+    if OBJECT_CHAR not in paragraph.text:
+        elements.append(
+            {
+                "startIndex": start,
+                "endIndex": start + paragraph.length,
+                "textRun": {"content": paragraph.text},
+            }
+        )
+    else:
+        pos = start
+        for i, chunk in enumerate(paragraph.text.split(OBJECT_CHAR)):
+            if i:
+                elements.append(
+                    {"startIndex": pos, "endIndex": pos + 1, "inlineObjectElement": {}}
+                )
+                pos += 1
+            if chunk:
+                end = pos + utf16_len(chunk)
+                elements.append(
+                    {"startIndex": pos, "endIndex": end, "textRun": {"content": chunk}}
+                )
+                pos = end
+
+    return {
+        "startIndex": start,
+        "endIndex": start + paragraph.length,
+        "paragraph": {
+            "elements": elements,
+            "paragraphStyle": {"namedStyleType": paragraph.style},
+        },
+    }
+
+
+def _table_json(table: _Table, start: int) -> dict[str, Any]:
+    """테이블 → documents().get 형식의 구조 요소"""
+    pos = start + 1
+    table_rows = []
+    for row in table.cells:
+        row_start = pos
+        pos += 1
+        table_cells = []
+        for cell in row:
+            cell_start = pos
+            pos += 1
+            content = []
+            for paragraph in cell:
+                content.append(_paragraph_json(paragraph, pos))
+                pos += paragraph.length
+            table_cells.append(
+                {"startIndex": cell_start, "endIndex": pos, "content": content}
+            )
+        table_rows.append(
+            {"startIndex": row_start, "endIndex": pos, "tableCells": table_cells}
+        )
+
+    return {
+        "startIndex": start,
+        "endIndex": pos + 1,
+        "table": {
+            "rows": len(table.cells),
+            "columns": table.columns,
+            "tableRows": table_rows,
+        },
+    }
+
+
+def table_element(table_start: int, cell_texts: list[list[str]]) -> dict[str, Any]:
+    """
+    셀 텍스트를 채운 테이블 요소 (documents().get 형식, 계산값)
+
+    Args:
+        table_start: 테이블 시작 인덱스
+        cell_texts: cell_texts[row][col] = 셀에 삽입한 텍스트 ("\\n"으로 단락 구분)
+
+    Returns:
+        dict: 스타일 없이 텍스트만 채운 테이블 요소
+    """
+    table = _Table(len(cell_texts), len(cell_texts[0]))
+    for r, row in enumerate(cell_texts):
+        for c, text in enumerate(row):
+            if text:
+                table.cells[r][c] = [_Paragraph(line + "\n") for line in text.split("\n")]
+    return _table_json(table, table_start)
+
+
+def _delete_in(elements: list, starts: list[int], start: int, end: int) -> None:
+    """단락/테이블 리스트에서 [start, end) 삭제 (경계 단락은 병합)"""
+    k1 = bisect_right(starts, start) - 1
+    k2 = bisect_right(starts, end - 1) - 1
+    first, last = elements[k1], elements[k2]
+
+    if isinstance(first, _Table):
+        if start != starts[k1]:
+            raise PlanValidationError("테이블 일부만 삭제할 수 없음")
+        head = ""
+    else:
+        head = first.text[:_py_offset(first, start - starts[k1])]
+
+    if isinstance(last, _Table):
+        if end != starts[k2] + last.length:
+            raise PlanValidationError("테이블 일부만 삭제할 수 없음")
+        tail, style = "", "NORMAL_TEXT"
+    else:
+        tail = last.text[_py_offset(last, end - starts[k2]):]
+        style = last.style
+
+    stop = k2 + 1
+    replacement = []
+    if tail:
+        replacement.append(_Paragraph(head + tail, style))
+    elif stop >= len(elements):
+        raise PlanValidationError("세그먼트의 마지막 줄바꿈은 삭제할 수 없음")
+    elif head:
+        # 첫 단락의 줄바꿈이 삭제됨 → 다음 단락과 병합
+        following = elements[stop]
+        if not isinstance(following, _Paragraph):
+            raise PlanValidationError("테이블 직전 줄바꿈은 삭제할 수 없음")
+        replacement.append(_Paragraph(head + following.text, following.style))
+        stop += 1
+
+    elements[k1:stop] = replacement
+
+
+class DocModel:
+    """Google Docs 문서 본문 시뮬레이터
+
+    본문 요소(단락/테이블)와 각 요소의 시작 인덱스를 보관합니다.
+    문서 끝에 이어 붙이는 변환 흐름에서는 변경 지점 이후만 재색인하므로
+    대용량 문서에서도 요청당 비용이 일정합니다.
+    """
+
+    def __init__(self):
+        self._content: list[_Paragraph | _Table] = [_Paragraph("\n")]
+        self._starts: list[int] = [1]
+        self.inline_object_count = 0
+
+    # =========================================================================
+    # 조회
+    # =========================================================================
+
+    @property
+    def end_index(self) -> int:
+        """본문 endIndex (마지막 단락 "\\n" 다음 위치)"""
+        return self._starts[-1] + self._content[-1].length
+
+    @property
+    def table_count(self) -> int:
+        return sum(1 for el in self._content if isinstance(el, _Table))
+
+    def table_at(self, index: int) -> dict[str, Any]:
+        """index에서 시작하는 테이블 요소 (documents().get 형식)"""
+        return _table_json(self._table_starting_at(index), index)
+
+    def text_range(self, start: int, end: int) -> str:
+        """본문 단락의 [start, end) 텍스트 (테이블 내용은 제외)"""
+        parts = []
+        k = max(bisect_right(self._starts, start) - 1, 0)
+        while k < len(self._content) and self._starts[k] < end:
+            element = self._content[k]
+            if isinstance(element, _Paragraph):
+                p_start = self._starts[k]
+                lo = _py_offset(element, max(start, p_start) - p_start)
+                hi = _py_offset(element, min(end, p_start + element.length) - p_start)
+                parts.append(element.text[lo:hi])
+            k += 1
+        return "".join(parts)
+
+    def to_document(self) -> dict[str, Any]:
+        """documents().get 형식의 문서 (body.content만 포함)"""
+        content: list[dict[str, Any]] = [
+            {"startIndex": 0, "endIndex": 1, "sectionBreak": {}}
+        ]
+        for element, start in zip(self._content, self._starts):
+            if isinstance(element, _Table):
+                content.append(_table_json(element, start))
+            else:
+                content.append(_paragraph_json(element, start))
+        return {"body": {"content": content}}
+
+    # =========================================================================
+    # 요청 적용
+    # =========================================================================
+
+    def apply(self, requests: list[dict[str, Any]], offset: int = 0) -> "DocModel":
+        """
+        batchUpdate 요청을 순서대로 적용
+
+        Args:
+            requests: batchUpdate 요청 리스트
+            offset: 오류 메시지에 표시할 요청 번호 시작값
+
+        Raises:
+            PlanValidationError: 현재 문서 상태에 적용할 수 없는 요청
+        """
+        for i, request in enumerate(requests):
+            (kind, body), = request.items()
+            try:
+                self._apply_one(kind, body)
+            except PlanValidationError as e:
+                raise PlanValidationError(e.reason, offset + i, kind) from None
+            except (KeyError, TypeError) as e:
+                raise PlanValidationError(f"필수 필드 누락: {e}", offset + i, kind) from None
+        return self
+
+    def _apply_one(self, kind: str, body: dict[str, Any]) -> None:
+        if kind == "insertText":
+            self._insert_text(self._location(body), body["text"])
+        elif kind in _RANGE_REQUESTS:
+            start, end = self._check_range(body["range"])
+            if kind == "updateParagraphStyle":
+                named = body.get("paragraphStyle", {}).get("namedStyleType")
+                if named and "namedStyleType" in body.get("fields", ""):
+                    self._set_named_style(start, end, named)
+        elif kind == "insertTable":
+            self._insert_table(self._location(body), body["rows"], body["columns"])
+        elif kind == "insertInlineImage":
+            if not body.get("uri"):
+                raise PlanValidationError("이미지 uri 누락")
+            self._insert_text(self._location(body), OBJECT_CHAR)
+            self.inline_object_count += 1
+        elif kind == "deleteContentRange":
+            rng = body["range"]
+            self._delete(rng["startIndex"], rng["endIndex"])
+        elif kind == "updateTableCellStyle":
+            if "tableRange" in body:
+                rng = body["tableRange"]
+                location = rng["tableCellLocation"]
+                table = self._table_starting_at(location["tableStartLocation"]["index"])
+                row_end = location.get("rowIndex", 0) + rng.get("rowSpan", 1)
+                col_end = location.get("columnIndex", 0) + rng.get("columnSpan", 1)
+                if row_end > len(table.cells) or col_end > table.columns:
+                    raise PlanValidationError(
+                        f"셀 범위 초과 (행 {row_end}/{len(table.cells)}, 열 {col_end}/{table.columns})"
+                    )
+            else:
+                self._table_starting_at(body["tableStartLocation"]["index"])
+        elif kind == "updateTableColumnProperties":
+            table = self._table_starting_at(body["tableStartLocation"]["index"])
+            for col in body.get("columnIndices", []):
+                if not 0 <= col < table.columns:
+                    raise PlanValidationError(f"열 인덱스 초과 ({col}/{table.columns})")
+        elif kind == "updateDocumentStyle":
+            pass
+        else:
+            raise PlanValidationError("지원하지 않는 요청 유형")
+
+    def _location(self, body: dict[str, Any]) -> int:
+        if "endOfSegmentLocation" in body:
+            return self.end_index - 1
+        return body["location"]["index"]
+
+    def _check_range(self, rng: dict[str, Any]) -> tuple[int, int]:
+        start, end = rng["startIndex"], rng["endIndex"]
+        if not 1 <= start <= end <= self.end_index:
+            raise PlanValidationError(
+                f"범위 [{start}, {end}) 가 문서 범위 [1, {self.end_index}) 를 벗어남"
+            )
+        return start, end
+
+    def _reindex(self, k: int) -> None:
+        """k번째 요소부터 시작 인덱스 재계산"""
+        starts, content = self._starts, self._content
+        pos = (starts[k - 1] + content[k - 1].length) if k > 0 else 1
+        del starts[k:]
+        for element in content[k:]:
+            starts.append(pos)
+            pos += element.length
+
+    def _locate_cell(self, table: _Table, table_start: int, index: int):
+        """테이블 내부 index를 포함하는 셀 (단락 리스트, 단락 시작 인덱스 리스트)"""
+        pos = table_start + 1
+        for row in table.cells:
+            pos += 1  # 행 시작
+            for cell in row:
+                pos += 1  # 셀 시작
+                if index < pos:
+                    break
+                starts = []
+                for paragraph in cell:
+                    starts.append(pos)
+                    pos += paragraph.length
+                if index < pos:
+                    return cell, starts
+            if index < pos:
+                break
+        raise PlanValidationError(f"인덱스 {index}는 테이블 구조 위치 (셀 내용 아님)")
+
+    def _locate(self, index: int):
+        """index를 포함하는 단락 (컨테이너, 시작 인덱스 리스트, 요소 번호, 소속 테이블 번호)"""
+        if not 1 <= index < self.end_index:
+            raise PlanValidationError(
+                f"인덱스 {index}가 문서 범위 [1, {self.end_index}) 를 벗어남"
+            )
+        k = bisect_right(self._starts, index) - 1
+        element = self._content[k]
+        if isinstance(element, _Paragraph):
+            return self._content, self._starts, k, -1
+        cell, starts = self._locate_cell(element, self._starts[k], index)
+        return cell, starts, bisect_right(starts, index) - 1, k
+
+    def _commit(self, table_k: int, k: int, delta: int) -> None:
+        if table_k < 0:
+            self._reindex(k)
+        else:
+            self._content[table_k].length += delta
+            self._reindex(table_k + 1)
+
+    def _insert_text(self, index: int, text: str) -> None:
+        if not text:
+            raise PlanValidationError("빈 텍스트는 삽입할 수 없음")
+
+        elements, starts, k, table_k = self._locate(index)
+        paragraph = elements[k]
+        offset = _py_offset(paragraph, index - starts[k])
+        head, tail = paragraph.text[:offset], paragraph.text[offset:]
+        added = utf16_len(text)
+
+        if "\n" not in text:
+            paragraph.text = head + text + tail
+            paragraph.length += added
+        else:
+            parts = text.split("\n")
+            style = paragraph.style
+            new = [_Paragraph(head + parts[0] + "\n", style)]
+            new.extend(_Paragraph(part + "\n", style) for part in parts[1:-1])
+            new.append(_Paragraph(parts[-1] + tail, style))
+            elements[k:k + 1] = new
+
+        self._commit(table_k, k, added)
+
+    def _insert_table(self, index: int, rows: int, columns: int) -> None:
+        if rows < 1 or columns < 1:
+            raise PlanValidationError(f"잘못된 테이블 크기 ({rows}x{columns})")
+
+        elements, starts, k, table_k = self._locate(index)
+        if table_k >= 0:
+            raise PlanValidationError("테이블 셀 내부에는 테이블을 삽입할 수 없음")
+
+        paragraph = elements[k]
+        offset = _py_offset(paragraph, index - starts[k])
+        self._content[k:k + 1] = [
+            _Paragraph(paragraph.text[:offset] + "\n", paragraph.style),
+            _Table(rows, columns),
+            _Paragraph(paragraph.text[offset:], paragraph.style),
+        ]
+        self._reindex(k)
+
+    def _delete(self, start: int, end: int) -> None:
+        if start >= end:
+            raise PlanValidationError(f"빈 삭제 범위 [{start}, {end})")
+        if start < 1 or end > self.end_index:
+            raise PlanValidationError(
+                f"삭제 범위 [{start}, {end}) 가 문서 범위 [1, {self.end_index}) 를 벗어남"
+            )
+
+        k1 = bisect_right(self._starts, start) - 1
+        k2 = bisect_right(self._starts, end - 1) - 1
+        element = self._content[k1]
+        table_start = self._starts[k1]
+
+        # 단일 셀 내부 삭제
+        if (
+            k1 == k2
+            and isinstance(element, _Table)
+            and not (start == table_start and end == table_start + element.length)
+        ):
+            cell, cell_starts = self._locate_cell(element, table_start, start)
+            if end - 1 >= cell_starts[-1] + cell[-1].length:
+                raise PlanValidationError("여러 셀에 걸친 삭제는 지원하지 않음")
+            _delete_in(cell, cell_starts, start, end)
+            self._commit(k1, 0, start - end)
+            return
+
+        _delete_in(self._content, self._starts, start, end)
+        self._reindex(k1)
+
+    def _set_named_style(self, start: int, end: int, named: str) -> None:
+        k1 = bisect_right(self._starts, start) - 1
+        k2 = bisect_right(self._starts, max(start, end - 1)) - 1
+        for element in self._content[k1:k2 + 1]:
+            if isinstance(element, _Paragraph):
+                element.style = named
+
+    def _table_starting_at(self, index: int) -> _Table:
+        k = bisect_left(self._starts, index)
+        if k < len(self._starts) and self._starts[k] == index:
+            element = self._content[k]
+            if isinstance(element, _Table):
+                return element
+        raise PlanValidationError(f"인덱스 {index}에서 시작하는 테이블이 없음")
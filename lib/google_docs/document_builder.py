@@ -15,6 +15,7 @@ from google.auth.transport.requests import Request
 from googleapiclient.discovery import build
 
 from .notion_style import NotionStyle, PAGE_SETTINGS
+from .rate_governor import execute_request
 
 
 class GoogleDocsBuilder:
@@ -140,23 +141,21 @@ class GoogleDocsBuilder:
 
     def create_document(self, title: str, folder_id: Optional[str] = None) -> str:
         """새 문서 생성"""
-        doc = self.docs_service.documents().create(body={"title": title}).execute()
+        doc = execute_request(self.docs_service.documents().create(body={"title": title}))
         self.doc_id = doc["documentId"]
 
         # 폴더로 이동 (옵션)
         if folder_id:
             try:
-                file_info = (
-                    self.drive_service.files()
-                    .get(fileId=self.doc_id, fields="parents")
-                    .execute()
+                file_info = execute_request(
+                    self.drive_service.files().get(fileId=self.doc_id, fields="parents")
                 )
                 current_parents = ",".join(file_info.get("parents", []))
-                self.drive_service.files().update(
+                execute_request(self.drive_service.files().update(
                     fileId=self.doc_id,
                     addParents=folder_id,
                     removeParents=current_parents,
-                ).execute()
+                ))
             except Exception:
                 pass  # Drive API 권한 없으면 무시
 
@@ -165,13 +164,13 @@ class GoogleDocsBuilder:
     def apply_page_style(self):
         """페이지 스타일 적용 (A4, 72pt 여백, 115% 줄간격)"""
         requests = [self.style.get_page_style_request()]
-        self.docs_service.documents().batchUpdate(
+        execute_request(self.docs_service.documents().batchUpdate(
             documentId=self.doc_id, body={"requests": requests}
-        ).execute()
+        ))
 
     def get_current_end_index(self) -> int:
         """현재 문서 끝 인덱스 조회"""
-        doc = self.docs_service.documents().get(documentId=self.doc_id).execute()
+        doc = execute_request(self.docs_service.documents().get(documentId=self.doc_id))
         return max(el.get("endIndex", 1) for el in doc["body"]["content"])
 
     def insert_text(self, text: str, index: Optional[int] = None) -> int:
@@ -179,14 +178,14 @@ class GoogleDocsBuilder:
         if index is None:
             index = self.get_current_end_index() - 1
 
-        self.docs_service.documents().batchUpdate(
+        execute_request(self.docs_service.documents().batchUpdate(
             documentId=self.doc_id,
             body={
                 "requests": [
                     {"insertText": {"location": {"index": index}, "text": text}}
                 ]
             },
-        ).execute()
+        ))
 
         return index + len(text)
 
@@ -198,7 +197,7 @@ class GoogleDocsBuilder:
         self.insert_text(full_text, idx)
 
         # 스타일 적용
-        self.docs_service.documents().batchUpdate(
+        execute_request(self.docs_service.documents().batchUpdate(
             documentId=self.doc_id,
             body={
                 "requests": [
@@ -227,7 +226,7 @@ class GoogleDocsBuilder:
                     },
                 ]
             },
-        ).execute()
+        ))
 
     def insert_heading(self, text: str, level: int = 1):
         """헤딩 삽입 (전역 표준 스타일)"""
@@ -279,9 +278,9 @@ class GoogleDocsBuilder:
                 }
             )
 
-        self.docs_service.documents().batchUpdate(
+        execute_request(self.docs_service.documents().batchUpdate(
             documentId=self.doc_id, body={"requests": requests}
-        ).execute()
+        ))
 
     def insert_table(self, rows: list[list[str]]) -> int:
         """테이블 삽입 (마크다운 인라인 스타일 지원)"""
@@ -293,7 +292,7 @@ class GoogleDocsBuilder:
         num_cols = len(rows[0]) if rows else 0
 
         # 1. 테이블 생성
-        self.docs_service.documents().batchUpdate(
+        execute_request(self.docs_service.documents().batchUpdate(
             documentId=self.doc_id,
             body={
                 "requests": [
@@ -306,10 +305,10 @@ class GoogleDocsBuilder:
                     }
                 ]
             },
-        ).execute()
+        ))
 
         # 2. 문서 다시 로드하여 테이블 구조 확인
-        doc = self.docs_service.documents().get(documentId=self.doc_id).execute()
+        doc = execute_request(self.docs_service.documents().get(documentId=self.doc_id))
 
         # 테이블 찾기
         table_element = None
@@ -360,12 +359,12 @@ class GoogleDocsBuilder:
                             )
 
         if requests:
-            self.docs_service.documents().batchUpdate(
+            execute_request(self.docs_service.documents().batchUpdate(
                 documentId=self.doc_id, body={"requests": requests}
-            ).execute()
+            ))
 
         # 4. 문서 재조회 후 스타일 적용
-        doc = self.docs_service.documents().get(documentId=self.doc_id).execute()
+        doc = execute_request(self.docs_service.documents().get(documentId=self.doc_id))
 
         # 테이블 다시 찾기
         for element in doc["body"]["content"]:
@@ -491,9 +490,9 @@ class GoogleDocsBuilder:
                                     )
 
             if style_requests:
-                self.docs_service.documents().batchUpdate(
+                execute_request(self.docs_service.documents().batchUpdate(
                     documentId=self.doc_id, body={"requests": style_requests}
-                ).execute()
+                ))
 
         return self.get_current_end_index()
 
@@ -504,7 +503,7 @@ class GoogleDocsBuilder:
     def apply_line_spacing(self):
         """전체 줄간격 적용 (115%)"""
         end_index = self.get_current_end_index()
-        self.docs_service.documents().batchUpdate(
+        execute_request(self.docs_service.documents().batchUpdate(
             documentId=self.doc_id,
             body={
                 "requests": [
@@ -519,7 +518,7 @@ class GoogleDocsBuilder:
                     }
                 ]
             },
-        ).execute()
+        ))
 
     def get_document_url(self) -> str:
         """문서 URL 반환"""
@@ -0,0 +1,98 @@
+"""
+Google Drive batch 요청 실행
+
+여러 Drive 요청(휴지통 이동, 폴더 이동 등)을 batch 엔드포인트로 묶어
+HTTP 요청 1회당 최대 100개씩 보냅니다. batch 자체는 전역 RateGovernor의
+drive 버킷으로 실행하고, 개별 응답이 rate limit(429/403)이면 해당 항목만
+모아 잠시 기다린 뒤 다음 batch로 다시 보냅니다.
+
+Usage:
+    from lib.google_docs.drive_batch import execute_batch
+
+    outcomes = execute_batch(drive, {
+        file_id: drive.files().update(fileId=file_id, body={"trashed": True})
+        for file_id in file_ids
+    })
+    failed = [o for o in outcomes.values() if not o.ok]
+"""
+
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+from .rate_governor import execute_request, is_rate_limit_error
+
+# Drive batch 엔드포인트의 HTTP 요청당 최대 호출 수
+BATCH_SIZE = 100
+
+# 개별 rate limit 응답 재시도 횟수
+MAX_ROUNDS = 5
+
+
+@dataclass
+class BatchOutcome:
+    """batch 내 요청 1개의 결과"""
+
+    key: str
+    result: Optional[dict] = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def execute_batch(
+    service: Any,
+    requests: dict[str, Any],
+    batch_size: int = BATCH_SIZE,
+    max_rounds: int = MAX_ROUNDS,
+    sleep: Callable[[float], None] = time.sleep,
+) -> dict[str, BatchOutcome]:
+    """
+    Drive 요청들을 batch HTTP 요청으로 실행
+
+    Args:
+        service: Drive v3 서비스 (new_batch_http_request 제공)
+        requests: 키 → HttpRequest (키는 결과 식별용, 예: file_id)
+        batch_size: batch당 최대 요청 수 (Drive 최대 100)
+        max_rounds: 개별 rate limit 응답 재시도 횟수
+        sleep: 대기 함수 (테스트용)
+
+    Returns:
+        키 → BatchOutcome (requests 순서 유지)
+    """
+    outcomes = {key: BatchOutcome(key) for key in requests}
+    pending = list(requests)
+
+    for round_no in range(max_rounds):
+        limited: list[str] = []
+        answered: set[str] = set()
+
+        def _callback(request_id: str, response: Any, exception: Optional[Exception]) -> None:
+            answered.add(request_id)
+            outcome = outcomes[request_id]
+            outcome.result, outcome.error = response, exception
+            if exception is not None and is_rate_limit_error(exception):
+                limited.append(request_id)
+
+        for i in range(0, len(pending), batch_size):
+            chunk = pending[i:i + batch_size]
+            batch = service.new_batch_http_request(callback=_callback)
+            for key in chunk:
+                batch.add(requests[key], request_id=key)
+            try:
+                execute_request(batch, api="drive")
+            except Exception as e:
+                # batch 전체 실패: 응답을 받지 못한 항목에 같은 오류 기록
+                for key in chunk:
+                    if key not in answered:
+                        outcomes[key].result, outcomes[key].error = None, e
+
+        if not limited or round_no == max_rounds - 1:
+            break
+        print(f"     [429] Drive batch 항목 {len(limited)}개 rate limit, 재시도 ({round_no + 1}/{max_rounds})")
+        sleep(min(64.0, 2.0 ** (round_no + 1)))
+        pending = limited
+
+    return outcomes
@@ -0,0 +1,223 @@
+"""
+Google Drive 폴더 트리 크롤러 (너비 우선 + 목록 스냅샷)
+
+DriveOrganizer(재귀 파일 조회)와 DriveGuardian(구조 감사)이 공유하는
+폴더 목록 조회기입니다.
+
+- 같은 깊이의 폴더들을 스레드 풀에서 동시에 조회 (너비 우선)
+- files.list는 필요한 fields만 요청하고 페이지당 최대 1000개
+- 조회 결과를 폴더 ID + modifiedTime 기준 스냅샷으로 동기화 상태 저장소에
+  기록하여, 다음 실행에서는 부모 목록의 modifiedTime이 바뀐 폴더만 다시 조회
+- 루트로 지정한 폴더는 modifiedTime을 알 수 없으므로 항상 조회
+
+참고: Drive는 하위 항목 추가/삭제 시 폴더 modifiedTime을 항상 갱신하지는
+않으므로, 스냅샷은 max_age(기본 10분)가 지나면 modifiedTime이 같아도 다시
+조회합니다. 정확한 최신 목록이 필요하면 refresh=True로 스냅샷을 무시합니다.
+
+Usage:
+    crawler = DriveCrawler(lambda: build("drive", "v3", credentials=creds))
+    listings = crawler.crawl([root_id], max_depth=10)   # {folder_id: [file, ...]}
+    children = crawler.list_children(folder_id)
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Optional
+
+from googleapiclient.errors import HttpError
+
+from .rate_governor import execute_request
+from .sync_state import SyncStateStore, get_sync_store
+
+logger = logging.getLogger(__name__)
+
+FOLDER_MIME_TYPE = "application/vnd.google-apps.folder"
+
+# DriveOrganizer/DriveGuardian이 사용하는 파일 필드
+FILE_FIELDS = "id, name, mimeType, size, modifiedTime, md5Checksum, parents"
+
+# files.list 페이지 크기 (API 최대값)
+PAGE_SIZE = 1000
+
+DEFAULT_MAX_WORKERS = 4
+
+# 폴더 목록 스냅샷 최대 재사용 기간 (초): 연달아 실행하는 status/audit/organize는
+# 공유하되, modifiedTime이 갱신되지 않은 변경을 오래 놓치지 않도록 제한
+DEFAULT_MAX_AGE = 600
+
+
+@dataclass
+class CrawlStats:
+    """크롤링 통계"""
+
+    listed: int = 0  # API로 조회한 폴더 수
+    reused: int = 0  # 스냅샷을 재사용한 폴더 수
+    requests: int = 0  # files.list 호출 수
+
+
+class DriveCrawler:
+    """너비 우선 Drive 폴더 목록 조회 (스냅샷 재사용)"""
+
+    def __init__(
+        self,
+        service_factory: Callable[[], Any],
+        store: Optional[SyncStateStore] = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        fields: str = FILE_FIELDS,
+        refresh: bool = False,
+        max_age: float = DEFAULT_MAX_AGE,
+    ):
+        """
+        Args:
+            service_factory: Drive v3 서비스 생성 함수 (googleapiclient 서비스는
+                스레드 간 공유할 수 없으므로 조회 스레드마다 1회 호출)
+            store: 스냅샷 저장소 (없으면 기본 동기화 상태 저장소)
+            max_workers: 동시 조회 폴더 수
+            fields: files.list에서 요청할 파일 필드
+            refresh: True면 스냅샷을 사용하지 않고 모든 폴더를 다시 조회
+            max_age: 스냅샷 재사용 최대 기간 (초, 기록 시각 기준)
+        """
+        self._service_factory = service_factory
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self.store = store if store is not None else get_sync_store()
+        self.max_workers = max_workers
+        self.fields = fields
+        self.refresh = refresh
+        self.max_age = max_age
+        self.stats = CrawlStats()
+        # 이번 실행에서 확인한 폴더 목록 (다시 조회하지 않음)
+        self._listings: dict[str, list[dict]] = {}
+
+    def _service(self) -> Any:
+        service = getattr(self._local, "service", None)
+        if service is None:
+            service = self._local.service = self._service_factory()
+        return service
+
+    def _list_folder(self, folder_id: str) -> Optional[list[dict]]:
+        """files.list로 폴더의 직계 자식 조회 (실패 시 None)"""
+        service = self._service()
+        items: list[dict] = []
+        page_token = None
+        try:
+            while True:
+                results = execute_request(service.files().list(
+                    q=f"'{folder_id}' in parents and trashed=false",
+                    pageSize=PAGE_SIZE,
+                    pageToken=page_token,
+                    fields=f"nextPageToken, files({self.fields})",
+                ))
+                with self._lock:
+                    self.stats.requests += 1
+                items.extend(results.get("files", []))
+                page_token = results.get("nextPageToken")
+                if not page_token:
+                    break
+        except HttpError as e:
+            # 폴더 접근 불가 등: 빈 목록으로 처리 (스냅샷에는 기록하지 않음)
+            logger.warning("Drive API error for folder %s: %s", folder_id, e)
+            return None
+        return items
+
+    def _resolve(self, folder_id: str, modified_time: Optional[str]) -> list[dict]:
+        """폴더 목록 (이번 실행 결과 → 스냅샷 → API 순)"""
+        with self._lock:
+            if folder_id in self._listings:
+                return self._listings[folder_id]
+
+        items = None
+        if modified_time and not self.refresh:
+            snapshot = self.store.get_folder(folder_id)
+            if (
+                snapshot is not None
+                and snapshot["modified_time"] == modified_time
+                and snapshot["fields"] == self.fields
+                and time.time() - (snapshot["updated_at"] or 0) < self.max_age
+            ):
+                items = snapshot["items"]
+                with self._lock:
+                    self.stats.reused += 1
+
+        if items is None:
+            items = self._list_folder(folder_id)
+            if items is None:
+                return []
+            with self._lock:
+                self.stats.listed += 1
+            self.store.put_folder(folder_id, modified_time, self.fields, items)
+
+        with self._lock:
+            self._listings[folder_id] = items
+        return items
+
+    def crawl(
+        self,
+        root_ids: Iterable[str],
+        max_depth: Optional[int] = None,
+        follow: Optional[Callable[[dict], bool]] = None,
+    ) -> dict[str, list[dict]]:
+        """
+        루트 폴더들부터 너비 우선으로 폴더 목록 조회
+
+        Args:
+            root_ids: 시작 폴더 ID 목록 (깊이 0)
+            max_depth: 조회할 최대 깊이 (0이면 루트만, None이면 제한 없음)
+            follow: 하위 폴더 항목 → 조회 여부 (없으면 모든 하위 폴더)
+
+        Returns:
+            폴더 ID → 직계 자식 항목 리스트 (조회 순서 = 너비 우선)
+        """
+        listings: dict[str, list[dict]] = {}
+        level = [(folder_id, None) for folder_id in dict.fromkeys(root_ids)]
+        depth = 0
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            while level:
+                if len(level) == 1:
+                    results = [self._resolve(*level[0])]
+                else:
+                    results = list(pool.map(lambda entry: self._resolve(*entry), level))
+
+                next_level: dict[str, Optional[str]] = {}
+                for (folder_id, _), items in zip(level, results):
+                    listings[folder_id] = items
+                    for item in items:
+                        if item.get("mimeType") != FOLDER_MIME_TYPE:
+                            continue
+                        if item["id"] in listings or item["id"] in next_level:
+                            continue
+                        if follow is not None and not follow(item):
+                            continue
+                        if max_depth is not None and depth >= max_depth:
+                            if max_depth > 0:
+                                logger.warning(
+                                    "Max depth (%d) reached, skipping folder: %s",
+                                    max_depth, item.get("name", item["id"]),
+                                )
+                            continue
+                        next_level[item["id"]] = item.get("modifiedTime")
+
+                level = [entry for entry in next_level.items() if entry[0] not in listings]
+                depth += 1
+
+        return listings
+
+    def list_children(self, folder_id: str) -> list[dict]:
+        """폴더 1개의 직계 자식 항목"""
+        return self.crawl([folder_id], max_depth=0)[folder_id]
+
+    def invalidate(self, folder_ids: Iterable[str]) -> None:
+        """폴더 목록을 이번 실행 결과와 스냅샷에서 제거 (다음 조회 시 API 호출)
+
+        Drive는 하위 항목 이동 시 폴더 modifiedTime을 갱신하지 않을 수 있으므로,
+        파일을 옮기거나 폴더를 만든 뒤에는 관련 폴더를 직접 무효화합니다.
+        """
+        folder_ids = list(dict.fromkeys(folder_ids))
+        with self._lock:
+            for folder_id in folder_ids:
+                self._listings.pop(folder_id, None)
+        self.store.delete_folders(folder_ids)
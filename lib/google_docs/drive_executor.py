@@ -0,0 +1,294 @@
+"""
+Google Drive 일괄 이동/폴더 생성 실행기
+
+DriveGuardian.apply_fixes와 DriveOrganizer.organize_files/move_file이 공유하는
+교정 실행기입니다. 파일마다 files.get + files.update를 보내고 대상 폴더를
+매번 검색하던 방식 대신:
+
+- 대상 폴더 경로는 DriveCrawler 목록으로 만든 폴더 맵에서 1회만 확인하고,
+  없는 폴더는 같은 깊이끼리 묶어 batch로 생성
+- 현재 부모를 모르는 파일만 files.get을 batch로 조회
+- 부모 변경(addParents/removeParents)을 batch 요청(HTTP 1회당 최대 100개)으로 전송
+- job 이름을 주면 batch마다 항목별 결과를 동기화 상태 저장소에 기록하여,
+  중단 후 resume=True로 다시 실행할 때 이미 옮긴 파일은 건너뜀
+  (모든 항목이 성공하면 기록 삭제)
+
+Usage:
+    executor = DriveFixExecutor(drive, crawler)
+    folder_ids = executor.resolve_paths(root_id, ["images/prds/PRD-0001"])
+    outcomes = executor.move(
+        [MoveOp(file_id, folder_ids["images/prds/PRD-0001"], name="a.png")],
+        job="organize", resume=True,
+    )
+    failed = [o for o in outcomes if not o.ok]
+"""
+
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Optional
+
+from .drive_batch import BATCH_SIZE, execute_batch
+from .drive_crawler import FOLDER_MIME_TYPE, DriveCrawler
+
+
+@dataclass
+class MoveOp:
+    """파일 이동 요청"""
+    file_id: str
+    target_id: str                        # 이동 대상 폴더 ID
+    name: str = ""
+    parents: Optional[list[str]] = None   # 현재 부모 (None이면 files.get으로 조회)
+
+
+@dataclass
+class OpOutcome:
+    """항목 1개의 실행 결과"""
+    key: str                      # 파일 ID (move) 또는 "부모 ID/이름" (create_folder)
+    action: str                   # move, create_folder
+    status: str                   # done, skipped, error
+    name: str = ""
+    target: Optional[str] = None  # 이동 대상 폴더 ID 또는 생성된 폴더 ID
+    reason: str = ""              # skipped 사유 또는 오류 메시지
+
+    @property
+    def ok(self) -> bool:
+        return self.status != "error"
+
+
+def _error_message(error: Exception) -> str:
+    return f"{type(error).__name__}: {error}"
+
+
+class DriveFixExecutor:
+    """Drive 파일 이동/폴더 생성 batch 실행기"""
+
+    def __init__(
+        self,
+        service: Any,
+        crawler: DriveCrawler,
+        batch_size: int = BATCH_SIZE,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        Args:
+            service: Drive v3 서비스 (batch 요청 전송용)
+            crawler: 폴더 목록 조회기 (폴더 맵, 이동 후 목록 무효화, 작업 기록 저장소)
+            batch_size: batch당 최대 요청 수
+            sleep: rate limit 재시도 대기 함수 (테스트용)
+        """
+        self.service = service
+        self.crawler = crawler
+        self.store = crawler.store
+        self.batch_size = batch_size
+        self.sleep = sleep
+        # 폴더 맵: (부모 ID, 이름) → 폴더 ID
+        self._folders: dict[tuple[str, str], str] = {}
+        self._indexed: set[str] = set()
+
+    def _run_batch(self, requests: dict[str, Any]):
+        return execute_batch(self.service, requests, batch_size=self.batch_size, sleep=self.sleep)
+
+    def _index_folders(self, parent_ids: Iterable[str]) -> None:
+        """부모 폴더들의 하위 폴더를 폴더 맵에 등록 (부모당 1회, 동시 조회)"""
+        pending = [pid for pid in dict.fromkeys(parent_ids) if pid not in self._indexed]
+        if not pending:
+            return
+        listings = self.crawler.crawl(pending, max_depth=0)
+        for parent_id in pending:
+            for item in listings.get(parent_id, []):
+                if item.get("mimeType") == FOLDER_MIME_TYPE:
+                    self._folders.setdefault((parent_id, item["name"]), item["id"])
+            self._indexed.add(parent_id)
+
+    def create_folders(self, specs: Iterable[tuple[str, str]]) -> dict[tuple[str, str], OpOutcome]:
+        """폴더 생성 (이미 있으면 건너뜀)
+
+        Args:
+            specs: (부모 폴더 ID, 폴더 이름) 목록
+
+        Returns:
+            (부모 폴더 ID, 폴더 이름) → OpOutcome (target = 폴더 ID)
+        """
+        specs = list(dict.fromkeys(specs))
+        self._index_folders(parent_id for parent_id, _ in specs)
+
+        outcomes: dict[tuple[str, str], OpOutcome] = {}
+        missing: dict[str, tuple[str, str]] = {}
+        for spec in specs:
+            parent_id, name = spec
+            folder_id = self._folders.get(spec)
+            if folder_id:
+                outcomes[spec] = OpOutcome(
+                    f"{parent_id}/{name}", "create_folder", "skipped", name, folder_id, "이미 존재"
+                )
+            else:
+                missing[str(len(missing))] = spec
+
+        if not missing:
+            return outcomes
+
+        results = self._run_batch({
+            key: self.service.files().create(
+                body={"name": name, "mimeType": FOLDER_MIME_TYPE, "parents": [parent_id]},
+                fields="id",
+            )
+            for key, (parent_id, name) in missing.items()
+        })
+        for key, spec in missing.items():
+            parent_id, name = spec
+            result = results[key]
+            if result.ok:
+                self._folders[spec] = result.result["id"]
+                outcomes[spec] = OpOutcome(
+                    f"{parent_id}/{name}", "create_folder", "done", name, result.result["id"]
+                )
+            else:
+                outcomes[spec] = OpOutcome(
+                    f"{parent_id}/{name}", "create_folder", "error", name,
+                    reason=_error_message(result.error),
+                )
+        self.crawler.invalidate(parent_id for parent_id, _ in missing.values())
+        return outcomes
+
+    def resolve_paths(self, root_id: str, paths: Iterable[str], create: bool = True) -> dict[str, str]:
+        """루트 기준 폴더 경로들을 폴더 ID로 변환 (깊이별로 1회씩 조회/생성)
+
+        Args:
+            root_id: 기준 폴더 ID
+            paths: 폴더 경로 목록 (예: "images/prds/PRD-0001")
+            create: True면 없는 폴더 생성
+
+        Returns:
+            경로 → 폴더 ID (확인/생성하지 못한 경로는 제외)
+        """
+        paths = [p for p in dict.fromkeys(path.strip("/") for path in paths) if p]
+        resolved: dict[str, str] = {"": root_id}
+        depth = 1
+
+        while True:
+            level: dict[str, tuple[str, str]] = {}
+            for path in paths:
+                parts = path.split("/")
+                if len(parts) < depth:
+                    continue
+                prefix = "/".join(parts[:depth])
+                parent = "/".join(parts[:depth - 1])
+                if parent in resolved and prefix not in level:
+                    level[prefix] = (resolved[parent], parts[depth - 1])
+            if not level:
+                break
+
+            if create:
+                outcomes = self.create_folders(level.values())
+                for prefix, spec in level.items():
+                    if outcomes[spec].ok:
+                        resolved[prefix] = outcomes[spec].target
+                    else:
+                        print(f"     [WARN] 폴더 생성 실패: {prefix} ({outcomes[spec].reason})")
+            else:
+                self._index_folders(parent_id for parent_id, _ in level.values())
+                for prefix, spec in level.items():
+                    if spec in self._folders:
+                        resolved[prefix] = self._folders[spec]
+            depth += 1
+
+        return {path: resolved[path] for path in paths if path in resolved}
+
+    def move(self, ops: list[MoveOp], job: Optional[str] = None, resume: bool = False) -> list[OpOutcome]:
+        """파일 부모 변경 (batch)
+
+        Args:
+            ops: 이동 요청 목록 (같은 파일은 첫 요청만 사용)
+            job: 작업 이름 (주면 항목별 결과를 기록하여 재개 가능)
+            resume: True면 같은 job의 이전 실행에서 옮긴 파일은 건너뜀
+
+        Returns:
+            파일별 OpOutcome (ops 순서)
+        """
+        ops = list({op.file_id: op for op in reversed(ops)}.values())[::-1]
+        journal: dict[str, dict] = {}
+        if job:
+            if resume:
+                journal = self.store.get_job_items(job)
+            else:
+                self.store.clear_job(job)
+
+        outcomes: dict[str, OpOutcome] = {}
+        parents: dict[str, list[str]] = {}
+        pending: list[MoveOp] = []
+        for op in ops:
+            entry = journal.get(op.file_id)
+            if entry and entry["status"] == "done" and entry["target"] == op.target_id:
+                outcomes[op.file_id] = OpOutcome(
+                    op.file_id, "move", "skipped", op.name, op.target_id, "이전 실행에서 이동 완료"
+                )
+            else:
+                pending.append(op)
+                if op.parents is not None:
+                    parents[op.file_id] = list(op.parents)
+
+        # 현재 부모를 모르는 파일만 batch 조회
+        unknown = [op for op in pending if op.file_id not in parents]
+        if unknown:
+            results = self._run_batch({
+                op.file_id: self.service.files().get(fileId=op.file_id, fields="id, parents")
+                for op in unknown
+            })
+            for op in unknown:
+                result = results[op.file_id]
+                if result.ok:
+                    parents[op.file_id] = result.result.get("parents", [])
+                else:
+                    outcomes[op.file_id] = OpOutcome(
+                        op.file_id, "move", "error", op.name, op.target_id, _error_message(result.error)
+                    )
+
+        to_move: list[MoveOp] = []
+        for op in pending:
+            if op.file_id in outcomes:
+                continue
+            if parents[op.file_id] == [op.target_id]:
+                outcomes[op.file_id] = OpOutcome(
+                    op.file_id, "move", "skipped", op.name, op.target_id, "이미 대상 폴더에 있음"
+                )
+            else:
+                to_move.append(op)
+
+        touched: list[str] = []
+        for i in range(0, len(to_move), self.batch_size):
+            chunk = to_move[i:i + self.batch_size]
+            requests = {}
+            for op in chunk:
+                params = {
+                    "fileId": op.file_id,
+                    "removeParents": ",".join(p for p in parents[op.file_id] if p != op.target_id),
+                    "fields": "id, parents",
+                }
+                if op.target_id not in parents[op.file_id]:
+                    params["addParents"] = op.target_id
+                requests[op.file_id] = self.service.files().update(**params)
+            results = self._run_batch(requests)
+
+            for op in chunk:
+                result = results[op.file_id]
+                if result.ok:
+                    outcomes[op.file_id] = OpOutcome(op.file_id, "move", "done", op.name, op.target_id)
+                    touched.extend(parents[op.file_id] + [op.target_id])
+                else:
+                    outcomes[op.file_id] = OpOutcome(
+                        op.file_id, "move", "error", op.name, op.target_id, _error_message(result.error)
+                    )
+            if job:
+                # batch마다 기록 (중단되어도 완료된 batch는 재개 시 건너뜀)
+                self.store.record_job_items(job, [
+                    (op.file_id, op.target_id, outcomes[op.file_id].status, outcomes[op.file_id].reason or None)
+                    for op in chunk
+                ])
+
+        if touched:
+            self.crawler.invalidate(touched)
+
+        ordered = [outcomes[op.file_id] for op in ops]
+        if job and all(o.ok for o in ordered):
+            self.store.clear_job(job)
+        return ordered
@@ -10,10 +10,12 @@ from enum import Enum
 from typing import Optional
 
 from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
 
 from .auth import get_credentials
+from .drive_crawler import DriveCrawler
+from .drive_executor import DriveFixExecutor, MoveOp
 from .project_registry import ProjectRegistry
+from .rate_governor import execute_request
 
 
 class Severity(Enum):
@@ -34,7 +36,8 @@ class Violation:
     mime_type: Optional[str] = None
     current_location: Optional[str] = None
     suggested_action: Optional[str] = None
-    suggested_target: Optional[str] = None  # 이동 대상 folder_id
+    suggested_target: Optional[str] = None  # 이동 대상 folder_id (missing_subfolder: 생성할 위치)
+    parents: list[str] = field(default_factory=list)  # 현재 부모 folder_id (목록 조회 결과)
 
 
 @dataclass
@@ -111,6 +114,7 @@ class FixAction:
     target_folder_id: Optional[str] = None
     target_folder_name: Optional[str] = None
     description: str = ""
+    parents: list[str] = field(default_factory=list)  # 현재 부모 (비어 있으면 실행 시 조회)
 
 
 @dataclass
@@ -149,41 +153,44 @@ class FixPlan:
 class DriveGuardian:
     """Google Drive 구조 감사 및 교정 도구"""
 
-    def __init__(self):
+    def __init__(self, refresh: bool = False):
+        """
+        Args:
+            refresh: True면 폴더 목록 스냅샷을 무시하고 모든 폴더를 다시 조회
+        """
         self.registry = ProjectRegistry()
         self.creds = get_credentials()
         self.drive = build("drive", "v3", credentials=self.creds)
+        self.crawler = DriveCrawler(
+            lambda: build("drive", "v3", credentials=self.creds),
+            refresh=refresh,
+        )
         # NOTE: ProjectRegistry._config는 public getter가 없어 직접 접근
         self._config = self.registry._config
         self._governance = self._config.get("governance", {})
 
     def _list_children(self, folder_id: str) -> list[dict]:
-        """폴더 내 직계 자식 항목 조회"""
-        all_items = []
-        page_token = None
-
-        try:
-            while True:
-                query = f"'{folder_id}' in parents and trashed=false"
-                results = self.drive.files().list(
-                    q=query,
-                    pageSize=200,
-                    pageToken=page_token,
-                    fields="nextPageToken, files(id, name, mimeType, modifiedTime, parents)"
-                ).execute()
-
-                all_items.extend(results.get("files", []))
-
-                page_token = results.get("nextPageToken")
-                if not page_token:
-                    break
-
-        except HttpError as e:
-            # API 에러 시 빈 리스트 반환 (폴더 접근 불가 등)
-            print(f"Warning: Drive API error for folder {folder_id}: {e}")
-            return []
-
-        return all_items
+        """폴더 내 직계 자식 항목 조회 (API 에러 시 빈 리스트)"""
+        return self.crawler.list_children(folder_id)
+
+    def _prefetch(self, root_id: str) -> None:
+        """감사에 필요한 폴더 목록을 너비 우선으로 동시에 조회
+
+        루트 → 프로젝트 폴더 → documents/images 하위 폴더 순으로 내려가며,
+        루트 아래에 없는 프로젝트 폴더는 별도 루트로 조회합니다.
+        """
+        wanted = set()
+        for p_config in self._config.get("projects", {}).values():
+            wanted.add(p_config["folder_id"])
+            for sub_name in ["documents", "images"]:
+                sub_id = p_config.get("subfolders", {}).get(sub_name)
+                if sub_id:
+                    wanted.add(sub_id)
+
+        listings = self.crawler.crawl([root_id], max_depth=2, follow=lambda item: item["id"] in wanted)
+        missing = [folder_id for folder_id in wanted if folder_id not in listings]
+        if missing:
+            self.crawler.crawl(missing, max_depth=0)
 
     def _get_root_folder_id(self) -> str:
         """Claude Code 연동 Drive 루트 폴더 ID"""
@@ -193,9 +200,9 @@ class DriveGuardian:
         first_project = projects[0]
         folder_id = self.registry.get_folder_id(first_project)
         try:
-            file = self.drive.files().get(
+            file = execute_request(self.drive.files().get(
                 fileId=folder_id, fields="parents"
-            ).execute()
+            ))
         except Exception as e:
             raise RuntimeError(f"Drive API 호출 실패 (folder_id={folder_id}): {e}")
         parents = file.get("parents", [])
@@ -256,6 +263,7 @@ class DriveGuardian:
                         current_location="root",
                         suggested_action="_아카이브로 이동",
                         suggested_target=self._config.get("special_folders", {}).get("_아카이브", {}).get("folder_id"),
+                        parents=item.get("parents", []),
                     ))
             else:
                 # 루트에 파일 존재
@@ -274,6 +282,7 @@ class DriveGuardian:
                             current_location="root",
                             suggested_action=f"{project}/{subfolder}로 이동",
                             suggested_target=target_id,
+                            parents=item.get("parents", []),
                         ))
                     else:
                         archive_id = self._config.get("special_folders", {}).get("_아카이브", {}).get("folder_id")
@@ -287,6 +296,7 @@ class DriveGuardian:
                             current_location="root",
                             suggested_action="_아카이브로 이동",
                             suggested_target=archive_id,
+                            parents=item.get("parents", []),
                         ))
 
     def _audit_project_structure(
@@ -312,8 +322,10 @@ class DriveGuardian:
                     severity=Severity.WARNING,
                     category="missing_subfolder",
                     message=f"'{project_name}'에 필수 하위 폴더 누락: {sub_name}",
+                    file_name=sub_name,
                     current_location=project_name,
                     suggested_action=f"'{sub_name}' 폴더 생성",
+                    suggested_target=project_folder_id,
                 ))
 
         # 하위 폴더 내 파일 수 집계
@@ -337,6 +349,7 @@ class DriveGuardian:
                 current_location=project_name,
                 suggested_action=f"{project_name}/{subfolder}로 이동",
                 suggested_target=target_id,
+                parents=f.get("parents", []),
             ))
             status["other"] += 1
 
@@ -347,6 +360,7 @@ class DriveGuardian:
         report = AuditReport()
 
         root_id = self._get_root_folder_id()
+        self._prefetch(root_id)
         root_items = self._list_children(root_id)
         report.total_root_items = len(root_items)
 
@@ -382,6 +396,8 @@ class DriveGuardian:
             if v.category == "missing_subfolder":
                 plan.actions.append(FixAction(
                     action="create_folder",
+                    target_folder_id=v.suggested_target,
+                    target_folder_name=v.file_name,
                     description=v.message,
                 ))
             elif v.file_id and v.suggested_target:
@@ -391,12 +407,21 @@ class DriveGuardian:
                     file_name=v.file_name,
                     target_folder_id=v.suggested_target,
                     description=f"'{v.file_name}' → {v.suggested_action}",
+                    parents=v.parents,
                 ))
 
         return plan
 
-    def apply_fixes(self, plan: FixPlan, dry_run: bool = True) -> dict:
-        """교정 계획 실행"""
+    def apply_fixes(self, plan: FixPlan, dry_run: bool = True, resume: bool = False) -> dict:
+        """교정 계획 실행
+
+        폴더 생성과 파일 이동을 DriveFixExecutor로 batch 실행합니다.
+
+        Args:
+            plan: 교정 계획
+            dry_run: True면 실행하지 않고 대상만 반환
+            resume: True면 중단된 이전 실행에서 이미 옮긴 파일은 건너뜀
+        """
         result = {
             "dry_run": dry_run,
             "total_actions": len(plan.actions),
@@ -404,48 +429,56 @@ class DriveGuardian:
             "errors": [],
         }
 
+        moves = [a for a in plan.actions if a.action == "move" and a.file_id and a.target_folder_id]
+        creates = [
+            a for a in plan.actions
+            if a.action == "create_folder" and a.target_folder_id and a.target_folder_name
+        ]
+        move_outcomes = {}
+        create_outcomes = {}
+        if not dry_run:
+            executor = DriveFixExecutor(self.drive, self.crawler)
+            if creates:
+                create_outcomes = executor.create_folders(
+                    (a.target_folder_id, a.target_folder_name) for a in creates
+                )
+            if moves:
+                move_outcomes = {
+                    o.key: o
+                    for o in executor.move(
+                        [MoveOp(a.file_id, a.target_folder_id, a.file_name or "", a.parents or None) for a in moves],
+                        job="guardian-fix",
+                        resume=resume,
+                    )
+                }
+
         for action in plan.actions:
             if action.action == "move" and action.file_id and action.target_folder_id:
-                if dry_run:
-                    result["applied"].append({
-                        "action": "move",
-                        "file": action.file_name,
-                        "target": action.target_folder_id,
-                        "status": "dry_run",
-                    })
-                else:
-                    try:
-                        file = self.drive.files().get(
-                            fileId=action.file_id, fields="parents"
-                        ).execute()
-                        previous_parents = ",".join(file.get("parents", []))
-
-                        self.drive.files().update(
-                            fileId=action.file_id,
-                            addParents=action.target_folder_id,
-                            removeParents=previous_parents,
-                            fields="id, parents"
-                        ).execute()
-
-                        result["applied"].append({
-                            "action": "move",
-                            "file": action.file_name,
-                            "target": action.target_folder_id,
-                            "status": "done",
-                        })
-                    except Exception as e:
-                        result["errors"].append({
-                            "action": "move",
-                            "file": action.file_name,
-                            "target": action.target_folder_id,
-                            "error": f"{type(e).__name__}: {e}",
-                        })
-
+                entry = {
+                    "action": "move",
+                    "file": action.file_name,
+                    "target": action.target_folder_id,
+                }
+                outcome = move_outcomes.get(action.file_id)
             elif action.action == "create_folder":
-                result["applied"].append({
-                    "action": "create_folder",
-                    "description": action.description,
-                    "status": "dry_run" if dry_run else "skipped",
+                entry = {"action": "create_folder", "description": action.description}
+                outcome = create_outcomes.get((action.target_folder_id, action.target_folder_name))
+                if outcome is None and not dry_run:
+                    # 생성 위치를 알 수 없는 항목 (수동 처리)
+                    result["applied"].append({**entry, "status": "skipped"})
+                    continue
+            else:
+                continue
+
+            if dry_run:
+                result["applied"].append({**entry, "status": "dry_run"})
+            elif outcome.ok:
+                result["applied"].append({**entry, "status": outcome.status, "reason": outcome.reason})
+            else:
+                result["errors"].append({
+                    **entry,
+                    "file": action.file_name or action.target_folder_name,
+                    "error": outcome.reason,
                 })
 
         return result
@@ -13,7 +13,11 @@ from typing import Optional
 from googleapiclient.discovery import build
 
 from .auth import get_credentials, DEFAULT_FOLDER_ID
+from .drive_batch import execute_batch
+from .drive_crawler import DriveCrawler
+from .drive_executor import DriveFixExecutor, MoveOp
 from .project_registry import get_project_folder_id
+from .rate_governor import execute_request
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +37,10 @@ class FileInfo:
     def is_folder(self) -> bool:
         return self.mime_type == "application/vnd.google-apps.folder"
 
+    @property
+    def is_shortcut(self) -> bool:
+        return self.mime_type == "application/vnd.google-apps.shortcut"
+
     @property
     def is_image(self) -> bool:
         return self.mime_type.startswith("image/")
@@ -48,6 +56,7 @@ class DuplicateGroup:
     name: str
     files: list[FileInfo]
     keep: Optional[FileInfo] = None  # 유지할 파일
+    reason: str = "checksum"  # checksum (md5 + 크기), name (체크섬 없는 Google 파일의 이름 유사)
 
     @property
     def count(self) -> int:
@@ -60,6 +69,57 @@ class DuplicateGroup:
         return [f for f in self.files if f.id != self.keep.id]
 
 
+# 복사본 이름 표기 ("Copy of X", "X의 사본", "X (1)")
+_COPY_PREFIX = re.compile(r"^(copy of|사본\s*-)\s+", re.IGNORECASE)
+_COPY_SUFFIX = re.compile(r"(\s*의\s*사본|\s*-\s*사본|\s*\(\d+\))$")
+
+
+def _normalize_name(name: str) -> str:
+    """이름 유사 비교용 정규화 (복사본 표기 제거, 소문자, 공백 정리)"""
+    name = " ".join(name.split()).lower()
+    while True:
+        stripped = _COPY_SUFFIX.sub("", _COPY_PREFIX.sub("", name)).strip()
+        if stripped == name:
+            return name
+        name = stripped
+
+
+def group_duplicates(files: list[FileInfo]) -> list[DuplicateGroup]:
+    """내용 기반 중복 그룹 (폴더 제외, 모든 파일 형식)
+
+    - md5Checksum이 있는 파일: md5 + 크기가 같으면 중복
+    - 체크섬이 없는 Google 파일(Docs/Sheets 등): 같은 형식에 복사본 표기를
+      제거한 이름이 같으면 중복 (reason="name")
+    - 크기 0인 파일과 바로가기는 제외 (빈 파일은 모두 같은 md5를 가지므로
+      이름이 무관한 placeholder, .keep 등이 한 그룹으로 묶임)
+
+    각 그룹은 최신 파일을 유지 대상으로 선택하고, 그룹 크기 역순으로 정렬합니다.
+    """
+    groups: dict[tuple, list[FileInfo]] = defaultdict(list)
+    for f in files:
+        if f.is_folder or f.is_shortcut:
+            continue
+        if f.md5_checksum:
+            if f.size == 0:
+                continue
+            groups[("checksum", f.md5_checksum, f.size)].append(f)
+        elif f.is_google_doc:
+            groups[("name", f.mime_type, _normalize_name(f.name))].append(f)
+
+    duplicates = []
+    for key, group_files in groups.items():
+        if len(group_files) > 1:
+            sorted_files = sorted(group_files, key=lambda x: x.modified_time, reverse=True)
+            duplicates.append(DuplicateGroup(
+                name=sorted_files[0].name,
+                files=sorted_files,
+                keep=sorted_files[0],
+                reason=key[0],
+            ))
+
+    return sorted(duplicates, key=lambda x: -x.count)
+
+
 class DriveOrganizer:
     """Google Drive 정리 도구"""
 
@@ -92,134 +152,90 @@ class DriveOrganizer:
         (r"^\d{2}-", "images/prds/general"),  # 01-xxx, 02-xxx 등
     ]
 
-    def __init__(self, root_folder_id: Optional[str] = None):
+    def __init__(self, root_folder_id: Optional[str] = None, refresh: bool = False):
+        """
+        Args:
+            root_folder_id: 대상 폴더 ID (없으면 프로젝트 기본 폴더)
+            refresh: True면 폴더 목록 스냅샷을 무시하고 모든 폴더를 다시 조회
+        """
         try:
             self.root_folder_id = root_folder_id or get_project_folder_id()
         except Exception:
             self.root_folder_id = root_folder_id or DEFAULT_FOLDER_ID
         self.creds = get_credentials()
         self.drive = build("drive", "v3", credentials=self.creds)
+        self.crawler = DriveCrawler(
+            lambda: build("drive", "v3", credentials=self.creds),
+            refresh=refresh,
+        )
+        self.executor = DriveFixExecutor(self.drive, self.crawler)
         self._folder_cache: dict[str, str] = {}  # path → folder_id
 
-    def get_all_files(self, folder_id: Optional[str] = None, recursive: bool = False, max_depth: int = 10, _current_depth: int = 0) -> list[FileInfo]:
+    def get_all_files(self, folder_id: Optional[str] = None, recursive: bool = False, max_depth: int = 10) -> list[FileInfo]:
         """폴더 내 모든 파일 조회
 
+        재귀 탐색은 DriveCrawler로 같은 깊이의 폴더를 동시에 조회합니다 (너비 우선).
+
         Args:
             folder_id: 대상 폴더 ID (None이면 root)
             recursive: 재귀 탐색 여부
             max_depth: 최대 재귀 깊이 (기본 10)
-            _current_depth: 현재 깊이 (내부용)
         """
         folder_id = folder_id or self.root_folder_id
-        all_files = []
-        page_token = None
-
-        while True:
-            query = f"'{folder_id}' in parents and trashed=false"
-            results = self.drive.files().list(
-                q=query,
-                pageSize=200,
-                pageToken=page_token,
-                fields="nextPageToken, files(id, name, mimeType, size, modifiedTime, md5Checksum, parents)"
-            ).execute()
-
-            files = results.get("files", [])
-            for f in files:
-                file_info = FileInfo(
-                    id=f["id"],
-                    name=f["name"],
-                    mime_type=f.get("mimeType", ""),
-                    size=int(f.get("size", 0)),
-                    modified_time=f.get("modifiedTime", ""),
-                    md5_checksum=f.get("md5Checksum", ""),
-                    parents=f.get("parents", [])
-                )
-                all_files.append(file_info)
-
-                # 재귀적으로 하위 폴더 탐색 (max_depth 체크)
-                if recursive and file_info.is_folder:
-                    if _current_depth < max_depth:
-                        all_files.extend(
-                            self.get_all_files(
-                                file_info.id,
-                                recursive=True,
-                                max_depth=max_depth,
-                                _current_depth=_current_depth + 1
-                            )
-                        )
-                    else:
-                        logger.warning(
-                            "Max depth (%d) reached, skipping folder: %s",
-                            max_depth,
-                            file_info.name
-                        )
-
-            page_token = results.get("nextPageToken")
-            if not page_token:
-                break
-
-        return all_files
-
-    def find_duplicates(self, folder_id: Optional[str] = None) -> list[DuplicateGroup]:
-        """중복 파일 탐지 (파일명 + 크기 기반)"""
-        files = self.get_all_files(folder_id)
-
-        # 이미지 파일만 필터링
-        images = [f for f in files if f.is_image]
+        listings = self.crawler.crawl([folder_id], max_depth=max_depth if recursive else 0)
+
+        return [
+            FileInfo(
+                id=f["id"],
+                name=f["name"],
+                mime_type=f.get("mimeType", ""),
+                size=int(f.get("size", 0)),
+                modified_time=f.get("modifiedTime", ""),
+                md5_checksum=f.get("md5Checksum", ""),
+                parents=f.get("parents", [])
+            )
+            for items in listings.values()
+            for f in items
+        ]
+
+    def find_duplicates(self, folder_id: Optional[str] = None, recursive: bool = False) -> list[DuplicateGroup]:
+        """중복 파일 탐지 (md5 + 크기, 체크섬 없는 Google 파일은 이름 유사)"""
+        return group_duplicates(self.get_all_files(folder_id, recursive=recursive))
 
-        # 파일명으로 그룹화
-        by_name: dict[str, list[FileInfo]] = defaultdict(list)
-        for f in images:
-            by_name[f.name].append(f)
-
-        # 중복 그룹 생성
-        duplicates = []
-        for name, group_files in by_name.items():
-            if len(group_files) > 1:
-                # 최신 파일을 유지 대상으로 선택
-                sorted_files = sorted(group_files, key=lambda x: x.modified_time, reverse=True)
-                dup_group = DuplicateGroup(
-                    name=name,
-                    files=sorted_files,
-                    keep=sorted_files[0]
-                )
-                duplicates.append(dup_group)
-
-        return sorted(duplicates, key=lambda x: -x.count)
-
-    def delete_duplicates(self, dry_run: bool = True) -> dict:
-        """중복 파일 삭제"""
+    def delete_duplicates(self, dry_run: bool = True, include_similar: bool = False) -> dict:
+        """중복 파일 삭제 (휴지통 이동, batch 요청 1회당 최대 100개)
+
+        Args:
+            dry_run: True면 대상만 집계
+            include_similar: True면 이름 유사 그룹(reason="name")도 삭제
+                (내용 비교가 불가능하므로 기본값은 체크섬 일치 그룹만)
+        """
         duplicates = self.find_duplicates()
+        if not include_similar:
+            duplicates = [d for d in duplicates if d.reason == "checksum"]
 
+        to_delete = [f for group in duplicates for f in group.to_delete]
         result = {
             "total_groups": len(duplicates),
-            "files_to_delete": 0,
+            "files_to_delete": len(to_delete),
             "deleted": [],
             "errors": [],
             "dry_run": dry_run
         }
-
-        for group in duplicates:
-            for file_to_delete in group.to_delete:
-                result["files_to_delete"] += 1
-
-                if not dry_run:
-                    try:
-                        # Trash로 이동 (완전 삭제 대신)
-                        self.drive.files().update(
-                            fileId=file_to_delete.id,
-                            body={"trashed": True}
-                        ).execute()
-                        result["deleted"].append({
-                            "id": file_to_delete.id,
-                            "name": file_to_delete.name
-                        })
-                    except Exception as e:
-                        result["errors"].append({
-                            "id": file_to_delete.id,
-                            "name": file_to_delete.name,
-                            "error": str(e)
-                        })
+        if dry_run or not to_delete:
+            return result
+
+        # Trash로 이동 (완전 삭제 대신)
+        outcomes = execute_batch(self.drive, {
+            f.id: self.drive.files().update(fileId=f.id, body={"trashed": True}, fields="id")
+            for f in to_delete
+        })
+        for f in to_delete:
+            outcome = outcomes[f.id]
+            if outcome.ok:
+                result["deleted"].append({"id": f.id, "name": f.name})
+            else:
+                result["errors"].append({"id": f.id, "name": f.name, "error": str(outcome.error)})
 
         return result
 
@@ -227,7 +243,7 @@ class DriveOrganizer:
         """폴더 생성"""
         # 이미 존재하는지 확인
         query = f"name='{name}' and '{parent_id}' in parents and mimeType='application/vnd.google-apps.folder' and trashed=false"
-        results = self.drive.files().list(q=query, fields="files(id)").execute()
+        results = execute_request(self.drive.files().list(q=query, fields="files(id)"))
 
         if results.get("files"):
             return results["files"][0]["id"]
@@ -238,7 +254,7 @@ class DriveOrganizer:
             "mimeType": "application/vnd.google-apps.folder",
             "parents": [parent_id]
         }
-        folder = self.drive.files().create(body=file_metadata, fields="id").execute()
+        folder = execute_request(self.drive.files().create(body=file_metadata, fields="id"))
         return folder["id"]
 
     def create_folder_structure(self, structure: Optional[dict] = None, parent_id: Optional[str] = None) -> dict:
@@ -275,23 +291,24 @@ class DriveOrganizer:
 
     def move_file(self, file_id: str, new_parent_id: str) -> bool:
         """파일 이동 (폴더 변경)"""
-        try:
-            file = self.drive.files().get(fileId=file_id, fields="parents").execute()
-            previous_parents = ",".join(file.get("parents", []))
-
-            self.drive.files().update(
-                fileId=file_id,
-                addParents=new_parent_id,
-                removeParents=previous_parents,
-                fields="id, parents"
-            ).execute()
-            return True
-        except Exception as e:
+        outcome = self.executor.move([MoveOp(file_id, new_parent_id)])[0]
+        if not outcome.ok:
             logger.error(
                 "파일 이동 실패: file_id=%s, target=%s, error=%s",
-                file_id, new_parent_id, e
+                file_id, new_parent_id, outcome.reason
             )
-            return False
+        return outcome.ok
+
+    def _resolve_folder_paths(self, target_folders: list[str]) -> dict[str, str]:
+        """폴더 경로들 확보 (없으면 생성, 깊이별 batch)
+
+        Returns:
+            경로 → 폴더 ID (생성에 실패한 경로는 제외)
+        """
+        pending = [path for path in target_folders if path not in self._folder_cache]
+        if pending:
+            self._folder_cache.update(self.executor.resolve_paths(self.root_folder_id, pending))
+        return {path: self._folder_cache[path] for path in target_folders if path in self._folder_cache}
 
     def _ensure_folder_path(self, target_folder: str) -> str:
         """폴더 경로 확보 (없으면 생성)
@@ -302,27 +319,20 @@ class DriveOrganizer:
         Returns:
             폴더 ID
         """
-        # 캐시에 있으면 반환
-        if target_folder in self._folder_cache:
-            return self._folder_cache[target_folder]
-
-        # 경로 순회하며 폴더 생성
-        parts = target_folder.split("/")
-        current_parent = self.root_folder_id
-        current_path = ""
-
-        for part in parts:
-            current_path = f"{current_path}/{part}" if current_path else part
-            if current_path in self._folder_cache:
-                current_parent = self._folder_cache[current_path]
-            else:
-                current_parent = self.create_folder(part, current_parent)
-                self._folder_cache[current_path] = current_parent
+        folder_id = self._resolve_folder_paths([target_folder]).get(target_folder)
+        if folder_id is None:
+            raise RuntimeError(f"폴더를 만들 수 없습니다: {target_folder}")
+        return folder_id
+
+    def organize_files(self, dry_run: bool = True, resume: bool = False) -> dict:
+        """파일 자동 정리
 
-        return current_parent
+        대상 폴더는 한 번에 확보하고, 이동은 batch 요청으로 실행합니다.
 
-    def organize_files(self, dry_run: bool = True) -> dict:
-        """파일 자동 정리"""
+        Args:
+            dry_run: True면 분류 결과만 반환
+            resume: True면 중단된 이전 실행에서 이미 옮긴 파일은 건너뜀
+        """
         files = self.get_all_files()
         images = [f for f in files if f.is_image]
 
@@ -336,6 +346,7 @@ class DriveOrganizer:
             "dry_run": dry_run
         }
 
+        planned: list[tuple[FileInfo, str]] = []
         for file in images:
             target_folder = self.classify_file(file)
 
@@ -349,29 +360,39 @@ class DriveOrganizer:
                 continue
 
             result["classified"] += 1
+            planned.append((file, target_folder))
+
+        if dry_run:
+            result["moved"] = [
+                {"id": file.id, "name": file.name, "target": target_folder}
+                for file, target_folder in planned
+            ]
+            return result
+
+        folder_ids = self._resolve_folder_paths(list(dict.fromkeys(t for _, t in planned)))
+        outcomes = {
+            o.key: o
+            for o in self.executor.move(
+                [
+                    MoveOp(file.id, folder_ids[target_folder], file.name, file.parents or None)
+                    for file, target_folder in planned
+                    if target_folder in folder_ids
+                ],
+                job=f"organize:{self.root_folder_id}",
+                resume=resume,
+            )
+        }
 
-            if not dry_run:
-                folder_id = self._ensure_folder_path(target_folder)
-
-                # 파일 이동
-                if self.move_file(file.id, folder_id):
-                    result["moved"].append({
-                        "id": file.id,
-                        "name": file.name,
-                        "target": target_folder
-                    })
-                else:
-                    result["errors"].append({
-                        "id": file.id,
-                        "name": file.name,
-                        "error": "Move failed"
-                    })
+        for file, target_folder in planned:
+            outcome = outcomes.get(file.id)
+            if outcome is None:
+                result["errors"].append({"id": file.id, "name": file.name, "error": "Folder unavailable"})
+            elif outcome.status == "done":
+                result["moved"].append({"id": file.id, "name": file.name, "target": target_folder})
+            elif outcome.ok:
+                result["skipped"].append({"id": file.id, "name": file.name, "reason": outcome.reason})
             else:
-                result["moved"].append({
-                    "id": file.id,
-                    "name": file.name,
-                    "target": target_folder
-                })
+                result["errors"].append({"id": file.id, "name": file.name, "error": outcome.reason})
 
         return result
 
@@ -499,7 +520,8 @@ def print_duplicates(duplicates: list[DuplicateGroup]):
     print()
 
     for group in duplicates[:20]:
-        print(f"📁 {group.name} ({group.count}x)")
+        label = "" if group.reason == "checksum" else " [이름 유사]"
+        print(f"📁 {group.name} ({group.count}x){label}")
         print(f"   Keep: {group.keep.id[:15]}... (modified: {group.keep.modified_time[:10]})")
         for f in group.to_delete[:3]:
             print(f"   Delete: {f.id[:15]}...")
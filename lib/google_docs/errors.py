@@ -57,3 +57,16 @@ class APIError(GoogleDocsError):
     def __init__(self, message: str, status_code: int = 0):
         super().__init__(f"API Error ({status_code}): {message}")
         self.status_code = status_code
+
+
+class PlanValidationError(GoogleDocsConverterError):
+    """요청 계획 검증 오류 (인메모리 문서 모델에 적용할 수 없는 요청)"""
+
+    def __init__(self, message: str, request_index: int = -1, request_type: str = ""):
+        if request_index >= 0:
+            super().__init__(f"requests[{request_index}].{request_type}: {message}")
+        else:
+            super().__init__(message)
+        self.reason = message
+        self.request_index = request_index
+        self.request_type = request_type
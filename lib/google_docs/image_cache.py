@@ -0,0 +1,200 @@
+"""
+로컬 이미지 Drive 업로드 캐시 (내용 해시 기반)
+
+이미지 파일의 SHA-256 → (Drive 파일 ID, 공개 URL) 매핑을 동기화 상태
+저장소(sync_state, SQLite)에 기록하여 문서를 다시 생성할 때 내용이 같은
+이미지는 Drive 호출 없이 재사용합니다.
+이름 기반 검색(ImageInserter.find_existing_file)과 달리 파일명이 바뀌어도
+재사용되고, 같은 이름에 내용만 바뀐 이미지는 새로 업로드됩니다.
+
+캐시된 파일이 Drive에서 삭제되거나 휴지통으로 이동되면(중복 정리 등) 공개 URL이
+끊어지므로, 재사용 전에 file_id를 Drive batch(files.get, 100개당 HTTP 1회)로
+확인하고 없어진 항목은 캐시에서 제거한 뒤 다시 업로드합니다.
+
+캐시에 없는 이미지만 스레드 풀에서 동시에 업로드합니다.
+
+Usage:
+    from lib.google_docs.image_cache import ImageUploadCache, upload_local_images
+
+    uploaded = upload_local_images(
+        lambda: ImageInserter(creds, docs_service),
+        converter._pending_images,
+        folder_id,
+    )
+"""
+
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from .drive_batch import execute_batch
+from .sync_state import get_sync_store
+
+DEFAULT_MAX_WORKERS = 4
+
+
+def file_sha256(path: Path) -> str:
+    """파일 내용의 SHA-256"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ImageUploadCache:
+    """이미지 SHA-256 → (file_id, url) 인덱스 (동기화 상태 저장소의 images 테이블)
+
+    항목마다 즉시 upsert되므로 별도 저장 단계가 없고, 여러 스레드·프로세스가
+    동시에 업로드해도 서로의 기록을 덮어쓰지 않습니다.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        """
+        Args:
+            path: 동기화 상태 DB 경로 (없으면 기본 경로)
+        """
+        self._store = get_sync_store(path)
+
+    def __len__(self) -> int:
+        return self._store.image_count()
+
+    def get(self, digest: str) -> Optional[tuple[str, str]]:
+        """캐시된 (file_id, url) 또는 None"""
+        return self._store.get_image(digest)
+
+    def put(self, digest: str, file_id: str, url: str, name: str = "") -> None:
+        self._store.put_image(digest, file_id, url, name)
+
+    def invalidate(self, digest: str) -> None:
+        """Drive에서 삭제된 파일 등 더 이상 유효하지 않은 항목 제거"""
+        self._store.delete_image(digest)
+
+    def prune(self, drive_service: Any, entries: dict[str, str]) -> set[str]:
+        """
+        Drive에서 삭제·휴지통 이동된 캐시 항목 제거
+
+        Args:
+            drive_service: Drive v3 서비스
+            entries: 이미지 SHA-256 → 캐시된 file_id
+
+        Returns:
+            제거한 SHA-256 (다시 업로드 필요)
+        """
+        outcomes = execute_batch(drive_service, {
+            digest: drive_service.files().get(fileId=file_id, fields="id, trashed")
+            for digest, file_id in entries.items()
+        })
+        stale = set()
+        for digest, outcome in outcomes.items():
+            if outcome.ok:
+                gone = bool((outcome.result or {}).get("trashed"))
+            else:
+                # 404만 삭제로 판단 (rate limit·네트워크 오류는 캐시 유지)
+                gone = getattr(getattr(outcome.error, "resp", None), "status", None) == 404
+            if gone:
+                self.invalidate(digest)
+                stale.add(digest)
+        return stale
+
+
+def upload_local_images(
+    inserter_factory: Callable[[], Any],
+    images: list[dict],
+    folder_id: Optional[str],
+    cache: Optional[ImageUploadCache] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> int:
+    """
+    로컬 이미지를 Drive에 업로드하고 url을 공개 URL로 교체
+
+    캐시에 있는 이미지는 file_id가 Drive에 남아 있는지 batch로 확인한 뒤
+    재사용하고, 나머지는 내용이 같은 이미지끼리 묶어 한 번씩만 동시에
+    업로드합니다.
+
+    Args:
+        inserter_factory: ImageInserter 생성 함수 (googleapiclient 서비스는
+            스레드 간 공유할 수 없으므로 업로드 스레드마다 1회 호출)
+        images: {url, is_local, original_url} 이미지 정보 리스트 (제자리 갱신)
+        folder_id: 업로드 대상 폴더 ID
+        cache: 업로드 캐시 (없으면 기본 경로의 캐시)
+        max_workers: 동시 업로드 수
+
+    Returns:
+        새로 업로드한 이미지 수 (캐시 재사용 제외)
+    """
+    cache = cache if cache is not None else ImageUploadCache()
+
+    # 내용 해시별 이미지 그룹 (같은 이미지가 여러 번 나와도 업로드 1회)
+    groups: dict[str, list[dict]] = {}
+    paths: dict[str, Path] = {}
+    for img_info in images:
+        if not img_info.get("is_local", False):
+            continue
+        local_path = Path(img_info["url"])
+        try:
+            digest = file_sha256(local_path)
+        except OSError:
+            continue
+        groups.setdefault(digest, []).append(img_info)
+        paths.setdefault(digest, local_path)
+
+    def _resolve(digest: str, url: str) -> None:
+        for img_info in groups[digest]:
+            img_info["url"] = url
+            img_info["is_local"] = False
+
+    local = threading.local()
+
+    def _inserter() -> Any:
+        inserter = getattr(local, "inserter", None)
+        if inserter is None:
+            inserter = local.inserter = inserter_factory()
+        return inserter
+
+    cached = {digest: cache.get(digest) for digest in groups}
+    cached = {digest: entry for digest, entry in cached.items() if entry is not None}
+    if cached:
+        stale = cache.prune(_inserter().drive_service, {d: entry[0] for d, entry in cached.items()})
+        if stale:
+            print(f"     캐시된 이미지 {len(stale)}개가 Drive에 없음, 다시 업로드")
+        cached = {digest: entry for digest, entry in cached.items() if digest not in stale}
+
+    reused = 0
+    pending = []
+    for digest in groups:
+        if digest in cached:
+            _resolve(digest, cached[digest][1])
+            reused += 1
+        else:
+            pending.append(digest)
+
+    def _upload(digest: str) -> bool:
+        inserter = _inserter()
+        local_path = paths[digest]
+        try:
+            # 내용 해시로 중복을 판단하므로 이름 기반 검색은 생략
+            file_id, public_url = inserter.upload_to_drive(
+                local_path,
+                folder_id=folder_id,
+                make_public=True,
+                skip_duplicates=False,
+            )
+        except Exception as upload_err:
+            original = groups[digest][0].get("original_url", "")
+            print(f"     이미지 업로드 실패 ({original}): {upload_err}")
+            return False
+        cache.put(digest, file_id, public_url, local_path.name)
+        _resolve(digest, public_url)
+        return True
+
+    uploaded_count = 0
+    if pending:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(pending))) as pool:
+            uploaded_count = sum(pool.map(_upload, pending))
+
+    if uploaded_count > 0 or reused > 0:
+        print(f"     로컬 이미지 {uploaded_count}개 업로드됨 (캐시 재사용 {reused}개)")
+    return uploaded_count
@@ -30,6 +30,8 @@ from typing import Optional
 from googleapiclient.discovery import build
 from googleapiclient.http import MediaFileUpload
 
+from .rate_governor import execute_request
+
 
 class ImageInserter:
     """이미지를 Google Docs에 삽입"""
@@ -69,11 +71,11 @@ class ImageInserter:
         query = " and ".join(query_parts)
 
         try:
-            results = self.drive_service.files().list(
+            results = execute_request(self.drive_service.files().list(
                 q=query,
                 pageSize=1,
                 fields="files(id, thumbnailLink)"
-            ).execute()
+            ))
 
             files = results.get("files", [])
             if files:
@@ -146,14 +148,12 @@ class ImageInserter:
         # 업로드
         media = MediaFileUpload(str(file_path), mimetype=mimetype, resumable=True)
 
-        file = (
-            self.drive_service.files()
-            .create(
+        file = execute_request(
+            self.drive_service.files().create(
                 body=file_metadata,
                 media_body=media,
                 fields="id, webContentLink, webViewLink",
             )
-            .execute()
         )
 
         file_id = file.get("id")
@@ -161,9 +161,9 @@ class ImageInserter:
         # 공개 권한 설정
         if make_public:
             try:
-                self.drive_service.permissions().create(
+                execute_request(self.drive_service.permissions().create(
                     fileId=file_id, body={"type": "anyone", "role": "reader"}
-                ).execute()
+                ))
             except Exception as e:
                 print(f"공개 권한 설정 실패: {e}")
 
@@ -171,10 +171,10 @@ class ImageInserter:
         # 기존 drive.google.com/uc?id= 는 deprecated됨
         # thumbnailLink에서 lh3 URL 추출
         try:
-            file_meta = self.drive_service.files().get(
+            file_meta = execute_request(self.drive_service.files().get(
                 fileId=file_id,
                 fields="thumbnailLink"
-            ).execute()
+            ))
             thumbnail_link = file_meta.get("thumbnailLink", "")
 
             if thumbnail_link and "lh3.googleusercontent.com" in thumbnail_link:
@@ -219,9 +219,9 @@ class ImageInserter:
         ]
 
         try:
-            self.docs_service.documents().batchUpdate(
+            execute_request(self.docs_service.documents().batchUpdate(
                 documentId=doc_id, body={"requests": requests}
-            ).execute()
+            ))
             return True
         except Exception as e:
             print(f"이미지 삽입 실패: {e}")
@@ -242,7 +242,7 @@ class ImageInserter:
         Returns:
             텍스트 끝 위치 (없으면 None)
         """
-        doc = self.docs_service.documents().get(documentId=doc_id).execute()
+        doc = execute_request(self.docs_service.documents().get(documentId=doc_id))
         body_content = doc.get("body", {}).get("content", [])
 
         for element in body_content:
@@ -305,9 +305,9 @@ class ImageInserter:
         )
 
         try:
-            self.docs_service.documents().batchUpdate(
+            execute_request(self.docs_service.documents().batchUpdate(
                 documentId=doc_id, body={"requests": requests}
-            ).execute()
+            ))
             return True
         except Exception as e:
             print(f"이미지 삽입 실패: {e}")
@@ -332,7 +332,7 @@ class ImageInserter:
         Returns:
             성공 여부
         """
-        doc = self.docs_service.documents().get(documentId=doc_id).execute()
+        doc = execute_request(self.docs_service.documents().get(documentId=doc_id))
         body_content = doc.get("body", {}).get("content", [])
 
         for i, element in enumerate(body_content):
@@ -371,9 +371,9 @@ class ImageInserter:
                             ]
 
                             try:
-                                self.docs_service.documents().batchUpdate(
+                                execute_request(self.docs_service.documents().batchUpdate(
                                     documentId=doc_id, body={"requests": requests}
-                                ).execute()
+                                ))
                                 return True
                             except Exception as e:
                                 print(f"이미지 삽입 실패: {e}")
@@ -410,9 +410,9 @@ class ImageInserter:
         ]
 
         try:
-            self.docs_service.documents().batchUpdate(
+            execute_request(self.docs_service.documents().batchUpdate(
                 documentId=doc_id, body={"requests": requests}
-            ).execute()
+            ))
             return True
         except Exception as e:
             print(f"이미지 삭제 실패: {e}")
@@ -0,0 +1,322 @@
+"""
+섹션 단위 증분 업데이트
+
+기존 문서와 새 마크다운을 H1/H2 섹션 목록으로 비교하여 추가·삭제·이동·수정된
+섹션 구간만 다시 작성합니다. 각 구간은 plan 모드(인메모리 문서 모델)로 변환하므로
+네이티브 테이블과 이미지가 포함된 섹션도 documents().get 없이 인덱스가 계산됩니다.
+
+흐름:
+    1. 캐시된 섹션 키 [heading, level, hash] ↔ 새 섹션 키를 difflib로 비교
+    2. 문서의 섹션 경계(_extract_doc_section_map)가 캐시된 제목 목록과 같은지 확인
+       (다르면 문서가 외부에서 수정된 것이므로 None → 전체 재작성)
+    3. 바뀐 구간마다 문서 뒤쪽부터: 기존 범위 삭제 → 구분 단락 삽입 + 스타일 초기화
+       → 새 섹션 삽입 → 구분 단락 삭제 (모두 단일 요청 목록)
+    4. 이미지 placeholder는 앞쪽 구간의 길이 변화를 반영한 최종 인덱스로 일괄 교체
+
+구분 단락: 섹션 시작 위치에 텍스트를 넣으면 새 단락이 다음 제목의 단락 스타일
+(HEADING_N, 여백, 하단 구분선)을 물려받으므로, 스타일을 초기화한 빈 단락을 먼저
+넣고 그 앞에 삽입합니다. 빈 문서의 마지막 단락과 같은 역할입니다.
+
+Usage:
+    plan = build_incremental_plan(content, store.get_doc(doc_id), body_content)
+    if plan is not None:
+        execute_incremental_plan(docs_service, doc_id, plan)
+"""
+
+import difflib
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from .converter import (
+    MarkdownToDocsConverter,
+    _extract_doc_section_map,
+    _parse_md_sections,
+    _reference_links_hash,
+    _replace_image_placeholders,
+)
+from .planner import MAX_BATCH_SIZE, plan_image_operations
+from .rate_governor import execute_request
+
+# 구분 단락에서 초기화할 스타일 필드 (제목 단락에서 물려받을 수 있는 항목)
+_RESET_PARAGRAPH_FIELDS = "namedStyleType,spaceAbove,spaceBelow,lineSpacing,borderBottom"
+_RESET_TEXT_FIELDS = "bold,italic,underline,strikethrough,foregroundColor,backgroundColor,fontSize,weightedFontFamily,link"
+
+# (heading, level, content_hash, 첫 H1(TITLE) 여부)
+SectionKey = tuple[str, int, str, bool]
+
+
+def section_keys(entries: list[list]) -> list[SectionKey]:
+    """[heading, level, hash] 목록 → 비교 키
+
+    첫 H1은 TITLE 스타일로 렌더링되므로 같은 섹션이라도 TITLE 여부가
+    바뀌면 다시 작성해야 합니다.
+    """
+    keys = []
+    title_seen = False
+    for heading, level, digest in entries:
+        keys.append((heading, level, digest, level == 1 and not title_seen))
+        title_seen = title_seen or level == 1
+    return keys
+
+
+@dataclass
+class RegionEdit:
+    """다시 작성할 연속 섹션 구간"""
+
+    start: int  # 기존 문서 구간 [start, end)
+    end: int
+    headings: list[str]  # 새로 작성하는 섹션 제목
+    removed: int  # 삭제되는 기존 섹션 수
+    length: int = 0  # 삽입되는 콘텐츠 길이 (이미지 교체 전, UTF-16)
+
+    @property
+    def delta(self) -> int:
+        """구간 적용 후 뒤쪽 인덱스 변화량"""
+        return self.length - (self.end - self.start)
+
+
+@dataclass
+class IncrementalPlan:
+    """증분 업데이트 요청 계획
+
+    requests는 현재 문서에 순서대로 적용 가능한 요청 (구간은 문서 뒤쪽부터),
+    images는 모든 요청 적용 후 기준 인덱스의 이미지 교체 작업입니다 (index 역순).
+    """
+
+    requests: list[dict[str, Any]]
+    images: list[dict[str, Any]]
+    regions: list[RegionEdit]
+    mermaid_temp_files: list[str] = field(default_factory=list)
+
+    def batches(self, max_size: int = MAX_BATCH_SIZE) -> list[list[dict[str, Any]]]:
+        return [
+            self.requests[i:i + max_size]
+            for i in range(0, len(self.requests), max_size)
+        ]
+
+    def summary(self) -> dict[str, int]:
+        return {
+            "regions": len(self.regions),
+            "sections_written": sum(len(r.headings) for r in self.regions),
+            "sections_removed": sum(r.removed for r in self.regions),
+            "requests": len(self.requests),
+            "images": len(self.images),
+        }
+
+
+def _cached_entries(cached: dict, doc_sections: list[dict]) -> Optional[list[list]]:
+    """캐시 항목 → [heading, level, hash] 목록 (맨 앞은 __preamble__)
+
+    section_list가 없는 이전 형식은 제목이 중복되지 않을 때만 문서의 제목
+    순서로 복원합니다.
+    """
+    entries = cached.get("section_list")
+    if entries is not None:
+        return [list(entry) for entry in entries]
+
+    hashes = cached.get("sections")
+    headings = [sec["heading"] for sec in doc_sections]
+    if not hashes or len(set(headings)) != len(headings):
+        return None
+    return [["__preamble__", 0, hashes.get("__preamble__", "")]] + [
+        [sec["heading"], sec["level"], hashes.get(sec["heading"], "")]
+        for sec in doc_sections
+    ]
+
+
+def _plan_region(
+    markdown: str,
+    title: bool,
+    use_native_tables: bool,
+    base_path: Optional[str],
+    reference_links: dict[str, str],
+) -> MarkdownToDocsConverter:
+    """구간 마크다운을 plan 모드로 변환 (빈 문서 기준, index 1부터)"""
+    converter = MarkdownToDocsConverter(
+        markdown,
+        use_native_tables=use_native_tables,
+        base_path=base_path,
+        plan=True,
+    )
+    # 문서 전체 기준 상태: 첫 H1(TITLE) 여부, 다른 섹션에 정의된 참조 링크
+    converter._is_first_h1 = title
+    converter._reference_links = {**reference_links, **converter._reference_links}
+    converter.parse()
+    return converter
+
+
+def _region_requests(
+    region: RegionEdit,
+    converter: Optional[MarkdownToDocsConverter],
+    apply_page_style: bool,
+) -> list[dict[str, Any]]:
+    """구간 1개의 요청: 삭제 → 구분 단락 → 새 섹션 → 구분 단락 삭제"""
+    s = region.start
+    requests: list[dict[str, Any]] = []
+    if region.end > s:
+        requests.append(
+            {"deleteContentRange": {"range": {"startIndex": s, "endIndex": region.end}}}
+        )
+    if converter is None or not region.length:
+        return requests
+
+    sentinel = {"startIndex": s, "endIndex": s + 1}
+    requests += [
+        {"insertText": {"location": {"index": s}, "text": "\n"}},
+        {
+            "updateParagraphStyle": {
+                "range": sentinel,
+                "paragraphStyle": {"namedStyleType": "NORMAL_TEXT"},
+                "fields": _RESET_PARAGRAPH_FIELDS,
+            }
+        },
+        {"deleteParagraphBullets": {"range": sentinel}},
+        {"updateTextStyle": {"range": sentinel, "textStyle": {}, "fields": _RESET_TEXT_FIELDS}},
+    ]
+    requests += converter._adjust_request_indices(converter.requests, s)
+
+    end = s + region.length
+    if apply_page_style:
+        # 전체 재작성의 줄간격(115%) 단계와 동일
+        requests.append(
+            {
+                "updateParagraphStyle": {
+                    "range": {"startIndex": s, "endIndex": end},
+                    "paragraphStyle": {"lineSpacing": 115},
+                    "fields": "lineSpacing",
+                }
+            }
+        )
+    requests.append(
+        {"deleteContentRange": {"range": {"startIndex": end, "endIndex": end + 1}}}
+    )
+    return requests
+
+
+def build_incremental_plan(
+    content: str,
+    cached: dict,
+    body_content: list[dict],
+    use_native_tables: bool = True,
+    apply_page_style: bool = True,
+    base_path: Optional[str] = None,
+) -> Optional[IncrementalPlan]:
+    """
+    캐시된 섹션 상태 + 현재 문서 → 증분 업데이트 계획 (Docs API 호출 없음)
+
+    Args:
+        content: 새 마크다운 콘텐츠
+        cached: 동기화 상태의 문서 항목 (_section_cache_entry 형식)
+        body_content: 현재 문서 body.content (documents().get 결과)
+        use_native_tables: 네이티브 테이블 사용 여부
+        apply_page_style: 새 섹션에 줄간격(115%) 적용 여부
+        base_path: 마크다운 파일의 기준 경로 (상대 이미지 경로 해석용)
+
+    Returns:
+        IncrementalPlan, 문서가 캐시와 맞지 않거나 참조 링크 정의가 바뀐 경우 None
+        (전체 재작성 필요)
+    """
+    doc_sections = _extract_doc_section_map(body_content)
+    old_entries = _cached_entries(cached, doc_sections)
+    if old_entries is None:
+        return None
+
+    # 문서 섹션 경계가 캐시 기록과 일치해야 구간 인덱스를 신뢰할 수 있음
+    if [(sec["heading"], sec["level"]) for sec in doc_sections] != [
+        (heading, level) for heading, level, _ in old_entries[1:]
+    ]:
+        return None
+
+    # 참조 링크 정의는 다른 섹션의 렌더링에도 영향 → 바뀌면 전체 재작성
+    refs_hash, reference_links = _reference_links_hash(content)
+    if cached.get("refs_hash", _reference_links_hash("")[0]) != refs_hash:
+        return None
+
+    new_sections = _parse_md_sections(content)
+    old_keys = section_keys(old_entries)
+    new_keys = section_keys(
+        [[sec["heading"], sec["level"], sec["content_hash"]] for sec in new_sections]
+    )
+
+    doc_end = body_content[-1].get("endIndex", 2) - 1 if body_content else 1
+    starts = [1] + [sec["para_start"] for sec in doc_sections] + [doc_end]
+
+    matcher = difflib.SequenceMatcher(None, old_keys, new_keys, autojunk=False)
+    edits = [op for op in matcher.get_opcodes() if op[0] != "equal"]
+
+    regions: list[RegionEdit] = []
+    converters: list[Optional[MarkdownToDocsConverter]] = []
+    for _, i1, i2, j1, j2 in edits:
+        region = RegionEdit(
+            start=starts[i1],
+            end=starts[i2],
+            headings=[sec["heading"] for sec in new_sections[j1:j2]],
+            removed=i2 - i1,
+        )
+        converter = None
+        if j2 > j1:
+            converter = _plan_region(
+                "\n".join(sec["content"] for sec in new_sections[j1:j2]),
+                title=any(key[3] for key in new_keys[j1:j2]),
+                use_native_tables=use_native_tables,
+                base_path=base_path,
+                reference_links=reference_links,
+            )
+            region.length = converter.doc_model.end_index - 2
+        regions.append(region)
+        converters.append(converter)
+
+    # 문서 뒤쪽 구간부터 적용하여 앞쪽 구간의 기존 인덱스 유지
+    requests: list[dict[str, Any]] = []
+    for region, converter in reversed(list(zip(regions, converters))):
+        requests += _region_requests(region, converter, apply_page_style)
+
+    # 이미지: 모든 구간 적용 후 인덱스 = 구간 내 인덱스 + 구간 시작 + 앞쪽 구간 변화량
+    images: list[dict[str, Any]] = []
+    temp_files: list[str] = []
+    shift = 0
+    for region, converter in zip(regions, converters):
+        if converter is not None:
+            for op in plan_image_operations(converter):
+                images.append({**op, "index": op["index"] + region.start - 1 + shift})
+            temp_files += converter._mermaid_temp_files
+        shift += region.delta
+    images.sort(key=lambda op: op["index"], reverse=True)
+
+    return IncrementalPlan(
+        requests=requests,
+        images=images,
+        regions=regions,
+        mermaid_temp_files=temp_files,
+    )
+
+
+def execute_incremental_plan(docs_service: Any, doc_id: str, plan: IncrementalPlan) -> dict[str, int]:
+    """
+    증분 업데이트 계획 실행 (documents().get 없음)
+
+    업로드되지 않은 로컬 이미지(is_local)는 placeholder를 유지합니다.
+
+    Returns:
+        {batches, images_inserted, images_failed, revision_id}
+        revision_id: 본문 요청 적용 직후 문서 revisionId (응답에 없으면 None)
+    """
+    batches = plan.batches()
+    revision_id = None
+    for batch in batches:
+        response = execute_request(docs_service.documents().batchUpdate(
+            documentId=doc_id, body={"requests": batch}
+        ))
+        revision_id = (response or {}).get("writeControl", {}).get("requiredRevisionId", revision_id)
+
+    operations = [op for op in plan.images if not op.get("is_local", False)]
+    inserted, failed = 0, 0
+    if operations:
+        inserted, failed = _replace_image_placeholders(docs_service, doc_id, operations)
+
+    return {
+        "batches": len(batches),
+        "images_inserted": inserted,
+        "images_failed": failed,
+        "revision_id": revision_id,
+    }
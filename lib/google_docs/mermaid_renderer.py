@@ -7,46 +7,232 @@ Mermaid 다이어그램 하이브리드 렌더러
 3. Playwright 브라우저 렌더링
 
 모든 전략은 로컬 PNG 파일 경로를 반환합니다.
+
+렌더링 결과는 다이어그램 코드 + 렌더 옵션의 해시를 키로 디스크에 캐시되며
+(크기 기준 LRU 정리), prerender_mermaid()로 문서의 다이어그램을 미리
+병렬 렌더링할 수 있습니다.
+
+환경 변수:
+    MERMAID_CACHE_DIR     캐시 디렉토리 (빈 문자열이면 캐시 사용 안 함)
+    MERMAID_CACHE_MAX_MB  캐시 최대 크기 (MB, 기본 200)
+    MERMAID_MMDC          mmdc 실행 파일 경로 (mmdc 호환 대체 명령 지정 가능)
+    MERMAID_STRATEGIES    사용할 전략 (쉼표 구분: ink,mmdc,playwright)
 """
 
 import base64
+import hashlib
+import json
+import os
 import shutil
 import subprocess
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from urllib.request import urlopen, Request
 from urllib.error import URLError
 
+# 렌더 옵션 (모든 전략 공통, 캐시 키에 포함)
+RENDER_WIDTH = 720
+RENDER_BACKGROUND = "white"
+RENDER_SCALE = 2
+
+# 캐시 키 버전 (렌더링 방식 변경 시 증가)
+CACHE_VERSION = 1
+
+DEFAULT_CACHE_MAX_MB = 200
+
+# 전략 이름 → 렌더 함수 (호출 시점에 모듈 전역을 조회)
+_STRATEGIES = {
+    "ink": lambda code: _render_via_mermaid_ink(code),
+    "mmdc": lambda code: _render_via_mmdc(code),
+    "playwright": lambda code: _render_via_playwright(code),
+}
+
+
+def _default_cache_dir() -> Path:
+    _base = Path(__file__).resolve().parent.parent.parent  # → C:/claude/
+    return _base / "json" / ".mermaid_cache"
+
+
+class MermaidCache:
+    """
+    렌더링된 PNG의 내용 주소 기반 디스크 캐시
+
+    파일명은 cache_key() 해시이며, 조회할 때마다 mtime을 갱신하여
+    최대 크기를 넘으면 가장 오래 사용하지 않은 파일부터 삭제합니다.
+    """
+
+    def __init__(self, directory: Path, max_bytes: int = DEFAULT_CACHE_MAX_MB * 1024 * 1024):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.png"
+
+    def get(self, key: str) -> Path | None:
+        """캐시된 PNG 경로 (없으면 None)"""
+        path = self._path(key)
+        try:
+            os.utime(path)
+        except OSError:
+            return None
+        return path
+
+    def put(self, key: str, png_path: str) -> Path | None:
+        """PNG를 캐시에 복사 (실패 시 None)"""
+        path = self._path(key)
+        tmp = None
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            os.close(fd)
+            shutil.copyfile(png_path, tmp)
+            os.replace(tmp, path)
+        except OSError:
+            if tmp:
+                Path(tmp).unlink(missing_ok=True)
+            return None
+        self.evict()
+        return path
+
+    def evict(self) -> int:
+        """최대 크기 초과분을 오래된 순으로 삭제 → 삭제한 파일 수"""
+        with self._lock:
+            entries = []
+            for path in self.directory.glob("*.png"):
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+            total = sum(size for _, size, _ in entries)
+            removed = 0
+            for _, size, path in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                path.unlink(missing_ok=True)
+                total -= size
+                removed += 1
+            return removed
+
+
+def cache_key(code: str) -> str:
+    """다이어그램 코드 + 렌더 옵션의 SHA-256"""
+    payload = json.dumps(
+        {
+            "code": code,
+            "width": RENDER_WIDTH,
+            "background": RENDER_BACKGROUND,
+            "scale": RENDER_SCALE,
+            "version": CACHE_VERSION,
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def get_cache() -> MermaidCache | None:
+    """환경 변수 기준 캐시 (MERMAID_CACHE_DIR="" 이면 None)"""
+    directory = os.environ.get("MERMAID_CACHE_DIR")
+    if directory == "":
+        return None
+    max_mb = float(os.environ.get("MERMAID_CACHE_MAX_MB", DEFAULT_CACHE_MAX_MB))
+    return MermaidCache(
+        Path(directory) if directory else _default_cache_dir(),
+        max_bytes=int(max_mb * 1024 * 1024),
+    )
+
+
+def _strategy_names() -> list[str]:
+    names = os.environ.get("MERMAID_STRATEGIES", "")
+    selected = [n.strip() for n in names.split(",") if n.strip() in _STRATEGIES]
+    return selected or list(_STRATEGIES)
+
 
-def render_mermaid(code: str) -> str | None:
+def render_mermaid(code: str, use_cache: bool = True) -> str | None:
     """
-    하이브리드 Mermaid 렌더링 (3단계 폴백)
+    하이브리드 Mermaid 렌더링 (캐시 → 3단계 폴백)
 
     Args:
         code: Mermaid 다이어그램 코드
+        use_cache: 디스크 캐시 사용 여부
 
     Returns:
-        str | None: 생성된 PNG 파일 절대 경로, 모든 전략 실패 시 None
+        str | None: 생성된 PNG 파일 절대 경로 (호출자가 삭제 관리),
+            모든 전략 실패 시 None
     """
-    # Strategy 1: Mermaid.ink API
-    result = _render_via_mermaid_ink(code)
-    if result:
-        return result
-
-    # Strategy 2: mmdc CLI
-    result = _render_via_mmdc(code)
-    if result:
-        return result
+    cache = get_cache() if use_cache else None
+    key = cache_key(code)
+
+    if cache is not None:
+        cached = cache.get(key)
+        if cached is not None:
+            # 호출자가 삭제할 수 있도록 임시 사본 반환
+            fd, png_path = tempfile.mkstemp(suffix=".png", prefix="mermaid_cache_")
+            os.close(fd)
+            shutil.copyfile(cached, png_path)
+            print(f"     Mermaid 캐시 사용: {key[:12]}")
+            return png_path
 
-    # Strategy 3: Playwright
-    result = _render_via_playwright(code)
-    if result:
-        return result
+    for name in _strategy_names():
+        result = _STRATEGIES[name](code)
+        if result:
+            if cache is not None:
+                cache.put(key, result)
+            return result
 
     print("     [WARN] Mermaid 렌더링 실패 (모든 전략 실패) - 코드 블록으로 표시")
     return None
 
 
+def prerender_mermaid(codes: list[str], max_workers: int = 4) -> dict[str, bool]:
+    """
+    캐시에 없는 다이어그램을 병렬 렌더링하여 캐시에 저장
+
+    이후 render_mermaid()는 캐시 사본만 복사하므로 변환(파싱)과
+    렌더링이 직렬화되지 않습니다. 캐시를 사용하지 않으면 아무것도 하지 않습니다.
+
+    Args:
+        codes: Mermaid 다이어그램 코드 리스트 (중복 허용)
+        max_workers: 동시 렌더링 수
+
+    Returns:
+        dict: {코드: 렌더링 성공 여부} (캐시 적중 포함, 실패한 코드는 False)
+    """
+    cache = get_cache()
+    if cache is None or not codes:
+        return {}
+
+    results: dict[str, bool] = {}
+    pending = []
+    for code in dict.fromkeys(codes):
+        if cache.get(cache_key(code)) is not None:
+            results[code] = True
+        else:
+            pending.append(code)
+
+    def _render(code: str) -> bool:
+        png_path = render_mermaid(code, use_cache=False)
+        if not png_path:
+            return False
+        try:
+            # 디스크 오류 등으로 저장하지 못하면 실패로 보고 (PNG는 아래에서 삭제됨)
+            return cache.put(cache_key(code), png_path) is not None
+        finally:
+            Path(png_path).unlink(missing_ok=True)
+
+    if pending:
+        print(f"     Mermaid 사전 렌더링: {len(pending)}개 (캐시 적중 {len(results)}개)")
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(pending))) as pool:
+            for code, ok in zip(pending, pool.map(_render, pending)):
+                results[code] = ok
+
+    return results
+
+
 def _render_via_mermaid_ink(code: str) -> str | None:
     """
     Mermaid.ink API를 사용하여 PNG 다운로드
@@ -62,7 +248,10 @@ def _render_via_mermaid_ink(code: str) -> str | None:
     """
     try:
         encoded = base64.urlsafe_b64encode(code.encode("utf-8")).decode("ascii")
-        url = f"https://mermaid.ink/img/{encoded}?type=png&bgColor=white&width=720"
+        url = (
+            f"https://mermaid.ink/img/{encoded}"
+            f"?type=png&bgColor={RENDER_BACKGROUND}&width={RENDER_WIDTH}"
+        )
 
         # URL 길이 제한 검사 (Google Docs API URI 제한: 2KB)
         if len(url) > 2048:
@@ -131,13 +320,17 @@ def _render_via_mmdc(code: str) -> str | None:
         png_path = mmd_path.replace(".mmd", ".png")
 
         # shutil.which()로 실행 파일 경로를 직접 해결 (shell=True 회피)
-        mmdc_path = shutil.which("mmdc")
+        # MERMAID_MMDC: mmdc 호환 대체 명령 (오프라인 테스트 등)
+        mmdc_path = os.environ.get("MERMAID_MMDC") or shutil.which("mmdc")
         if not mmdc_path:
             print("     [INFO] mmdc 미설치 - 다음 전략 시도")
             return None
 
         result = subprocess.run(
-            [mmdc_path, "-i", mmd_path, "-o", png_path, "-b", "white", "-s", "2", "-w", "720"],
+            [
+                mmdc_path, "-i", mmd_path, "-o", png_path,
+                "-b", RENDER_BACKGROUND, "-s", str(RENDER_SCALE), "-w", str(RENDER_WIDTH),
+            ],
             capture_output=True,
             text=True,
             timeout=60,
@@ -0,0 +1,186 @@
+"""
+오프라인 요청 계획 (plan 모드)
+
+마크다운 전체를 인메모리 문서 모델(DocModel) 위에서 변환하여
+batchUpdate 요청 시퀀스를 네트워크 없이 미리 계산하고 검증합니다.
+
+기존 흐름과의 차이:
+    - 테이블/코드 블록마다 반복되던 documents().get + _adjust_request_indices 보정 제거
+    - 페이지 스타일, 본문, 테이블, 줄간격을 최소 횟수의 batchUpdate로 실행
+    - 이미지 placeholder 위치를 모델에서 바로 계산 (조회 없음)
+
+Usage:
+    plan = build_document_plan(markdown)        # Docs API 호출 없음
+    print(plan.summary())
+    execute_document_plan(docs_service, doc_id, plan)
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from .converter import (
+    IMAGE_BATCH_SIZE,
+    MarkdownToDocsConverter,
+    _image_replace_requests,
+    _replace_image_placeholders,
+    utf16_len,
+)
+from .doc_model import DocModel
+from .errors import PlanValidationError
+from .notion_style import NotionStyle
+from .rate_governor import execute_request
+
+# batchUpdate 1회당 최대 요청 수
+MAX_BATCH_SIZE = 300
+
+
+@dataclass
+class DocumentPlan:
+    """문서 생성 요청 계획
+
+    requests는 빈 문서 기준으로 순서대로 적용 가능한 전체 콘텐츠 요청이며,
+    images는 콘텐츠 적용 후 실행할 placeholder → 이미지 교체 작업입니다 (index 역순).
+    model은 모든 요청(이미지 포함)을 적용한 최종 문서 상태입니다.
+    """
+
+    requests: list[dict[str, Any]]
+    images: list[dict[str, Any]]
+    model: DocModel
+    mermaid_temp_files: list[str] = field(default_factory=list)
+
+    def batches(self, max_size: int = MAX_BATCH_SIZE) -> list[list[dict[str, Any]]]:
+        """콘텐츠 요청을 batchUpdate 단위로 분할"""
+        return [
+            self.requests[i:i + max_size]
+            for i in range(0, len(self.requests), max_size)
+        ]
+
+    @property
+    def api_call_count(self) -> int:
+        """실행에 필요한 batchUpdate 호출 수 (이미지 교체 실패가 없을 때)"""
+        return len(self.batches()) + -(-len(self.images) // IMAGE_BATCH_SIZE)
+
+    def summary(self) -> dict[str, int]:
+        return {
+            "requests": len(self.requests),
+            "batches": len(self.batches()),
+            "tables": self.model.table_count,
+            "images": len(self.images),
+            "end_index": self.model.end_index,
+            "api_calls": self.api_call_count,
+        }
+
+
+def build_document_plan(
+    content: str,
+    include_toc: bool = False,
+    use_native_tables: bool = True,
+    apply_page_style: bool = True,
+    base_path: Optional[str] = None,
+) -> DocumentPlan:
+    """
+    마크다운 → 전체 요청 계획 (Docs API 호출 없음)
+
+    Args:
+        content: 마크다운 콘텐츠
+        include_toc: 목차 포함 여부
+        use_native_tables: 네이티브 테이블 사용 여부
+        apply_page_style: 페이지 스타일 + 전체 줄간격(115%) 포함 여부
+        base_path: 마크다운 파일의 기준 경로 (상대 이미지 경로 해석용)
+
+    Returns:
+        DocumentPlan
+
+    Raises:
+        PlanValidationError: 모델에 적용할 수 없는 요청이 생성된 경우
+    """
+    converter = MarkdownToDocsConverter(
+        content,
+        include_toc=include_toc,
+        use_native_tables=use_native_tables,
+        base_path=base_path,
+        plan=True,
+    )
+    requests = list(converter.parse())
+    model = converter.doc_model
+
+    if apply_page_style:
+        # 페이지 스타일은 인덱스와 무관하므로 맨 앞에 배치
+        requests.insert(0, NotionStyle.default().get_page_style_request())
+
+        # 전체 줄간격 (115%) - 이미지는 단락을 만들지 않으므로 교체 전에 적용
+        if model.end_index > 2:
+            spacing = {
+                "updateParagraphStyle": {
+                    "range": {"startIndex": 1, "endIndex": model.end_index - 1},
+                    "paragraphStyle": {"lineSpacing": 115},
+                    "fields": "lineSpacing",
+                }
+            }
+            model.apply([spacing], offset=len(requests))
+            requests.append(spacing)
+
+    images = plan_image_operations(converter)
+
+    # 역순 적용 (뒤에서부터 교체하여 앞쪽 인덱스 유지)
+    images.sort(key=lambda x: x["index"], reverse=True)
+    for op in images:
+        model.apply(_image_replace_requests(op))
+
+    return DocumentPlan(
+        requests=requests,
+        images=images,
+        model=model,
+        mermaid_temp_files=converter._mermaid_temp_files,
+    )
+
+
+def plan_image_operations(converter: MarkdownToDocsConverter) -> list[dict[str, Any]]:
+    """
+    plan 모드 변환 결과의 이미지 교체 작업 (placeholder 위치 검증 포함)
+
+    placeholder 위치 = 삽입 시점 인덱스 (이후 요청은 모두 그 뒤에 추가됨)
+
+    Returns:
+        {index, delete_length, url, alt, ...} 리스트 (문서 순서)
+
+    Raises:
+        PlanValidationError: 모델의 placeholder 위치가 기록과 다른 경우
+    """
+    model = converter.doc_model
+    images = []
+    for img_info in converter._pending_images:
+        placeholder = f"[🖼 {img_info['alt']}]"
+        length = utf16_len(placeholder)
+        index = img_info["index"]
+        if model.text_range(index, index + length) != placeholder:
+            raise PlanValidationError(
+                f"이미지 placeholder 위치 불일치 (index={index}, alt={img_info['alt']})"
+            )
+        images.append({**img_info, "delete_length": length})
+    return images
+
+
+def execute_document_plan(docs_service: Any, doc_id: str, plan: DocumentPlan) -> dict[str, int]:
+    """
+    요청 계획 실행 (중간 documents().get 없음)
+
+    빈 문서를 대상으로 콘텐츠 배치를 순서대로 실행한 뒤 이미지를 교체합니다.
+    업로드되지 않은 로컬 이미지(is_local)는 placeholder를 유지합니다.
+
+    Returns:
+        {batches, images_inserted, images_failed}
+    """
+    batches = plan.batches()
+    for n, batch in enumerate(batches, 1):
+        execute_request(docs_service.documents().batchUpdate(
+            documentId=doc_id, body={"requests": batch}
+        ))
+        print(f"     배치 {n}/{len(batches)} 완료 ({len(batch)} 요청)")
+
+    operations = [op for op in plan.images if not op.get("is_local", False)]
+    inserted, failed = 0, 0
+    if operations:
+        inserted, failed = _replace_image_placeholders(docs_service, doc_id, operations)
+
+    return {"batches": len(batches), "images_inserted": inserted, "images_failed": failed}
@@ -0,0 +1,357 @@
+"""
+Google API 호출 속도 조절기 (프로세스 전역)
+
+API 종류별 토큰 버킷(docs 쓰기/읽기, drive, sheets)을 모든 스레드와
+asyncio 태스크가 공유합니다. 호출마다 따로 429를 처리하며 고정 대기하던
+방식과 달리, 429를 관찰하면 해당 버킷 전체의 속도를 절반으로 낮추고
+잠시 멈춘 뒤(cooldown), 성공이 이어지면 기본 속도까지 점진적으로 회복합니다.
+
+버킷 분류 (HttpRequest.uri / method 기준):
+    - docs_write: docs.googleapis.com POST (create, batchUpdate)
+    - docs_read:  docs.googleapis.com GET
+    - drive:      Drive API (업로드 포함)
+    - sheets:     sheets.googleapis.com
+    - default:    그 외 (분류 불가)
+
+Usage:
+    from lib.google_docs.rate_governor import execute_request, get_governor
+
+    doc = execute_request(docs_service.documents().get(documentId=doc_id))
+    result = await execute_request_async(request)     # asyncio 태스크용
+    print(get_governor().summary())                    # 대기 시간 vs API 시간
+
+    with track_calls() as calls:                       # 범위 내 호출 수 (문서 단위 등)
+        create_google_doc(...)
+    print(calls.writes)
+"""
+
+import asyncio
+import random
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Iterator, Optional
+
+# 버킷별 기본 속도 (초당 요청 수) - 사용자당 분당 쿼터 기준
+DEFAULT_RATES: dict[str, float] = {
+    "docs_write": 1.0,  # 분당 60회
+    "docs_read": 5.0,  # 분당 300회
+    "drive": 10.0,
+    "sheets": 1.0,  # 분당 60회
+    "default": 5.0,
+}
+
+# 429 이후 최소 속도 (기본 속도 대비 비율)
+MIN_RATE_RATIO = 0.05
+
+# 성공 1회당 회복량 (기본 속도 대비 비율)
+RECOVERY_RATIO = 0.1
+
+_RATE_LIMIT_REASONS = ("ratelimitexceeded", "userratelimitexceeded")
+
+
+@dataclass
+class BucketMetrics:
+    """버킷별 호출 통계"""
+
+    calls: int = 0
+    throttled: int = 0  # 관찰한 429 (재시도 포함)
+    queued_seconds: float = 0.0  # 토큰/cooldown 대기 시간
+    api_seconds: float = 0.0  # 실제 API 실행 시간
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass
+class CallCounter:
+    """track_calls() 범위 안의 버킷별 API 호출 수 (429 재시도 포함)"""
+
+    calls: dict[str, int] = field(default_factory=dict)
+
+    def __getitem__(self, api: str) -> int:
+        return self.calls.get(api, 0)
+
+    @property
+    def writes(self) -> int:
+        """Docs 쓰기 호출 수 (create, batchUpdate)"""
+        return self["docs_write"]
+
+    @property
+    def total(self) -> int:
+        return sum(self.calls.values())
+
+
+# 현재 컨텍스트에서 활성화된 카운터 (중첩 가능)
+_active_counters: ContextVar[tuple[CallCounter, ...]] = ContextVar(
+    "rate_governor_counters", default=()
+)
+
+
+@contextmanager
+def track_calls() -> Iterator[CallCounter]:
+    """
+    범위 안에서 실행된 API 호출 수 집계
+
+    전역 metrics()와 달리 현재 스레드/asyncio 태스크의 호출만 셉니다.
+    """
+    counter = CallCounter()
+    token = _active_counters.set(_active_counters.get() + (counter,))
+    try:
+        yield counter
+    finally:
+        _active_counters.reset(token)
+
+
+class _Bucket:
+    """토큰 버킷 (토큰이 음수가 되도록 예약하여 대기 시간을 계산)"""
+
+    def __init__(self, rate: float, burst: float, now: float):
+        self.base_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = now
+        self.cooldown_until = 0.0
+        self.strikes = 0
+        self.metrics = BucketMetrics()
+
+    def reserve(self, now: float) -> float:
+        """토큰 1개 예약 → 사용 가능할 때까지 대기할 시간 (초)"""
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= 1
+        wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        return max(wait, self.cooldown_until - now)
+
+    def throttle(self, now: float, retry_after: Optional[float], max_backoff: float) -> float:
+        """429 관찰: 속도 절반 + cooldown 설정 → cooldown 길이 (초)"""
+        self.strikes += 1
+        self.rate = max(self.base_rate * MIN_RATE_RATIO, self.rate / 2)
+        if retry_after is None:
+            backoff = min(max_backoff, 2.0 ** self.strikes)
+            retry_after = backoff * random.uniform(0.75, 1.0)
+        self.cooldown_until = max(self.cooldown_until, now + retry_after)
+        # 대기 중 누적된 토큰으로 한꺼번에 재시도하지 않도록 초기화
+        self.tokens = min(self.tokens, 0.0)
+        return retry_after
+
+    def recover(self) -> None:
+        """성공: 기본 속도까지 점진적 회복"""
+        self.strikes = 0
+        if self.rate < self.base_rate:
+            self.rate = min(self.base_rate, self.rate + self.base_rate * RECOVERY_RATIO)
+
+
+def classify_request(request: Any) -> str:
+    """googleapiclient HttpRequest → 버킷 이름"""
+    uri = getattr(request, "uri", "")
+    method = getattr(request, "method", "")
+    if not isinstance(uri, str):
+        return "default"
+
+    if "docs.googleapis.com" in uri:
+        return "docs_read" if method == "GET" else "docs_write"
+    if "/drive/" in uri or "drive.googleapis.com" in uri:
+        return "drive"
+    if "sheets.googleapis.com" in uri:
+        return "sheets"
+    return "default"
+
+
+def _rate_limit_info(error: Exception) -> tuple[bool, Optional[float]]:
+    """HttpError → (rate limit 여부, Retry-After 초)"""
+    resp = getattr(error, "resp", None)
+    status = getattr(resp, "status", None)
+    if status == 429:
+        limited = True
+    elif status == 403:
+        content = getattr(error, "content", b"") or b""
+        if isinstance(content, bytes):
+            content = content.decode("utf-8", "replace")
+        limited = any(reason in content.lower() for reason in _RATE_LIMIT_REASONS)
+    else:
+        return False, None
+
+    retry_after = None
+    if limited and hasattr(resp, "get"):
+        try:
+            retry_after = float(resp.get("retry-after"))
+        except (TypeError, ValueError):
+            retry_after = None
+    return limited, retry_after
+
+
+def is_rate_limit_error(error: Exception) -> bool:
+    """rate limit 응답(429, 403 rateLimitExceeded) 여부 (batch 개별 응답 처리용)"""
+    return _rate_limit_info(error)[0]
+
+
+class RateGovernor:
+    """API 종류별 토큰 버킷 + 429 기반 적응형 백오프"""
+
+    def __init__(
+        self,
+        rates: Optional[dict[str, float]] = None,
+        burst: float = 5.0,
+        max_retries: int = 5,
+        max_backoff: float = 64.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        Args:
+            rates: 버킷별 초당 요청 수 (지정하지 않은 버킷은 DEFAULT_RATES)
+            burst: 버킷 최대 토큰 수 (순간 허용 요청 수)
+            max_retries: rate limit 응답 시 최대 시도 횟수
+            max_backoff: Retry-After가 없을 때 최대 cooldown (초)
+            clock: 단조 시계 (테스트용)
+            sleep: 동기 대기 함수 (테스트용)
+        """
+        self.rates = {**DEFAULT_RATES, **(rates or {})}
+        self.burst = burst
+        self.max_retries = max_retries
+        self.max_backoff = max_backoff
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._buckets: dict[str, _Bucket] = {}
+
+    def _bucket(self, api: str) -> _Bucket:
+        bucket = self._buckets.get(api)
+        if bucket is None:
+            rate = self.rates.get(api, self.rates["default"])
+            bucket = self._buckets[api] = _Bucket(rate, self.burst, self._clock())
+        return bucket
+
+    def reserve(self, api: str) -> float:
+        """토큰 예약 → 호출 전 대기할 시간 (초)"""
+        with self._lock:
+            bucket = self._bucket(api)
+            wait = bucket.reserve(self._clock())
+            bucket.metrics.queued_seconds += wait
+            return wait
+
+    def _record(self, api: str, error: Optional[Exception], elapsed: float) -> tuple[bool, float]:
+        """호출 결과 반영 → (재시도 여부, cooldown)"""
+        limited, retry_after = _rate_limit_info(error) if error else (False, None)
+        with self._lock:
+            bucket = self._bucket(api)
+            bucket.metrics.calls += 1
+            bucket.metrics.api_seconds += elapsed
+            for counter in _active_counters.get():
+                counter.calls[api] = counter[api] + 1
+            if not limited:
+                if error is None:
+                    bucket.recover()
+                return False, 0.0
+            bucket.metrics.throttled += 1
+            return True, bucket.throttle(self._clock(), retry_after, self.max_backoff)
+
+    def execute(self, request: Any, api: Optional[str] = None) -> Any:
+        """
+        HttpRequest 실행 (속도 조절 + rate limit 재시도)
+
+        Args:
+            request: googleapiclient HttpRequest (execute() 보유 객체)
+            api: 버킷 이름 (None이면 요청 URI로 분류)
+
+        Raises:
+            HttpError: rate limit 외 오류, 또는 재시도 후에도 rate limit인 경우
+        """
+        api = api or classify_request(request)
+        for attempt in range(self.max_retries):
+            wait = self.reserve(api)
+            if wait > 0:
+                self._sleep(wait)
+
+            start = time.perf_counter()
+            try:
+                result = request.execute()
+            except Exception as e:
+                retry, cooldown = self._record(api, e, time.perf_counter() - start)
+                if not retry or attempt == self.max_retries - 1:
+                    raise
+                print(f"     [429] {api} rate limit, 속도 조절 후 재시도 ({attempt + 1}/{self.max_retries}, {cooldown:.1f}초)")
+                continue
+            self._record(api, None, time.perf_counter() - start)
+            return result
+
+    async def execute_async(self, request: Any, api: Optional[str] = None) -> Any:
+        """execute()의 asyncio 버전 (대기는 이벤트 루프를 막지 않음)"""
+        api = api or classify_request(request)
+        for attempt in range(self.max_retries):
+            wait = self.reserve(api)
+            if wait > 0:
+                await asyncio.sleep(wait)
+
+            start = time.perf_counter()
+            try:
+                result = await asyncio.to_thread(request.execute)
+            except Exception as e:
+                retry, cooldown = self._record(api, e, time.perf_counter() - start)
+                if not retry or attempt == self.max_retries - 1:
+                    raise
+                print(f"     [429] {api} rate limit, 속도 조절 후 재시도 ({attempt + 1}/{self.max_retries}, {cooldown:.1f}초)")
+                continue
+            self._record(api, None, time.perf_counter() - start)
+            return result
+
+    def current_rate(self, api: str) -> float:
+        """버킷의 현재 속도 (초당 요청 수)"""
+        with self._lock:
+            return self._bucket(api).rate
+
+    def metrics(self) -> dict[str, dict[str, Any]]:
+        """버킷별 {calls, throttled, queued_seconds, api_seconds}"""
+        with self._lock:
+            return {api: bucket.metrics.to_dict() for api, bucket in self._buckets.items()}
+
+    def reset_metrics(self) -> None:
+        with self._lock:
+            for bucket in self._buckets.values():
+                bucket.metrics = BucketMetrics()
+
+    def summary(self) -> str:
+        """한 줄 요약 (버킷별 호출 수, 429 수, 대기/API 시간)"""
+        parts = [
+            f"{api} {m['calls']}회 (429 {m['throttled']}, "
+            f"대기 {m['queued_seconds']:.1f}s / API {m['api_seconds']:.1f}s)"
+            for api, m in sorted(self.metrics().items())
+            if m["calls"]
+        ]
+        return ", ".join(parts) if parts else "API 호출 없음"
+
+
+_governor: Optional[RateGovernor] = None
+_governor_lock = threading.Lock()
+
+
+def get_governor() -> RateGovernor:
+    """프로세스 전역 RateGovernor"""
+    global _governor
+    if _governor is None:
+        with _governor_lock:
+            if _governor is None:
+                _governor = RateGovernor()
+    return _governor
+
+
+def set_governor(governor: RateGovernor) -> RateGovernor:
+    """프로세스 전역 RateGovernor 교체 (이전 인스턴스 반환)"""
+    global _governor
+    with _governor_lock:
+        previous, _governor = _governor, governor
+    return previous
+
+
+def execute_request(request: Any, api: Optional[str] = None) -> Any:
+    """전역 RateGovernor로 HttpRequest 실행"""
+    return get_governor().execute(request, api)
+
+
+async def execute_request_async(request: Any, api: Optional[str] = None) -> Any:
+    """전역 RateGovernor로 HttpRequest 실행 (asyncio)"""
+    return await get_governor().execute_async(request, api)
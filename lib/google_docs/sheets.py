@@ -17,6 +17,7 @@ from typing import Optional
 from googleapiclient.discovery import build
 
 from .auth import get_sheets_credentials
+from .rate_governor import execute_request
 
 
 def parse_sheet_url(url: str) -> dict:
@@ -51,10 +52,10 @@ class SheetsClient:
 
     def get_metadata(self, spreadsheet_id: str) -> dict:
         """스프레드시트 메타데이터 조회 (제목, 시트 목록 등)"""
-        result = self._sheets.get(
+        result = execute_request(self._sheets.get(
             spreadsheetId=spreadsheet_id,
             fields="spreadsheetId,properties.title,sheets.properties",
-        ).execute()
+        ))
         return result
 
     def get_sheet_name_by_gid(self, spreadsheet_id: str, gid: str) -> Optional[str]:
@@ -84,11 +85,11 @@ class SheetsClient:
         Returns:
             list[list[str]]: 2D 배열 형태의 시트 데이터
         """
-        result = self._sheets.values().get(
+        result = execute_request(self._sheets.values().get(
             spreadsheetId=spreadsheet_id,
             range=range_notation,
             valueRenderOption=value_render,
-        ).execute()
+        ))
         return result.get("values", [])
 
     def read_from_url(
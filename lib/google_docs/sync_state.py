@@ -0,0 +1,381 @@
+"""
+Google Docs 동기화 상태 저장소 (SQLite, WAL 모드)
+
+문서별 전체 해시·섹션 해시·마지막 revisionId, 로컬 이미지 업로드 기록
+(SHA-256 → Drive 파일 ID), Drive 폴더 목록 스냅샷(drive_crawler), Drive 일괄
+이동 작업 기록(drive_executor, 재개용)을 하나의 SQLite 파일에 보관합니다.
+JSON 파일 전체를 읽고 다시 쓰던 방식과 달리 키 단위 upsert이므로
+BatchConverter의 병렬 변환(스레드)이나 여러 프로세스가 동시에 기록해도
+서로의 항목을 덮어쓰지 않습니다.
+
+- 연결은 스레드마다 1개 (sqlite3 연결은 스레드 간 공유 불가)
+- WAL 모드 + busy_timeout으로 프로세스 간 동시 읽기/쓰기
+- 처음 열 때 같은 디렉토리의 이전 JSON 캐시를 1회 가져옴
+  (.gdocs_hash_cache.json, .gdocs_image_cache.json - 원본 파일은 유지)
+
+Usage:
+    from lib.google_docs.sync_state import get_sync_store
+
+    store = get_sync_store()
+    entry = store.get_doc(doc_id)          # {full_hash, sections, section_list, refs_hash, revision_id}
+    store.put_doc(doc_id, entry)
+    store.put_image(sha256, file_id, url)
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+# 이전 JSON 캐시 파일명 (저장소 파일과 같은 디렉토리)
+LEGACY_HASH_CACHE = ".gdocs_hash_cache.json"
+LEGACY_IMAGE_CACHE = ".gdocs_image_cache.json"
+
+# 잠금 대기 시간 (초)
+BUSY_TIMEOUT = 30.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS docs (
+    doc_id       TEXT PRIMARY KEY,
+    full_hash    TEXT,
+    sections     TEXT,
+    section_list TEXT,
+    refs_hash    TEXT,
+    revision_id  TEXT,
+    updated_at   REAL
+);
+CREATE TABLE IF NOT EXISTS images (
+    sha256     TEXT PRIMARY KEY,
+    file_id    TEXT NOT NULL,
+    url        TEXT NOT NULL,
+    name       TEXT,
+    updated_at REAL
+);
+CREATE TABLE IF NOT EXISTS drive_folders (
+    folder_id     TEXT PRIMARY KEY,
+    modified_time TEXT,
+    fields        TEXT,
+    items         TEXT NOT NULL,
+    updated_at    REAL
+);
+CREATE TABLE IF NOT EXISTS drive_jobs (
+    job        TEXT NOT NULL,
+    item       TEXT NOT NULL,
+    target     TEXT,
+    status     TEXT NOT NULL,
+    error      TEXT,
+    updated_at REAL,
+    PRIMARY KEY (job, item)
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+def _sync_state_path() -> Path:
+    """동기화 상태 DB 경로"""
+    _base = Path(__file__).resolve().parent.parent.parent  # → C:/claude/
+    return _base / "json" / ".gdocs_sync_state.db"
+
+
+class SyncStateStore:
+    """문서/이미지 동기화 상태 (키 단위 원자적 upsert)"""
+
+    def __init__(self, path: Optional[Path] = None):
+        """
+        Args:
+            path: SQLite 파일 경로 (없으면 json/.gdocs_sync_state.db)
+        """
+        self.path = Path(path) if path else _sync_state_path()
+        self._local = threading.local()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+        self._migrate_json()
+
+    def _connect(self) -> sqlite3.Connection:
+        """현재 스레드의 연결 (with 블록 = 트랜잭션)"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=BUSY_TIMEOUT)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def close(self) -> None:
+        """현재 스레드의 연결 닫기"""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    # =========================================================================
+    # 문서
+    # =========================================================================
+
+    def get_doc(self, doc_id: str) -> Optional[dict[str, Any]]:
+        """문서 항목 {full_hash, sections, section_list, refs_hash, revision_id} 또는 None"""
+        row = self._connect().execute(
+            "SELECT * FROM docs WHERE doc_id = ?", (doc_id,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        entry: dict[str, Any] = {"full_hash": row["full_hash"]}
+        for column in ("sections", "section_list"):
+            if row[column] is not None:
+                entry[column] = json.loads(row[column])
+        for column in ("refs_hash", "revision_id"):
+            if row[column] is not None:
+                entry[column] = row[column]
+        return entry
+
+    def put_doc(self, doc_id: str, entry: dict[str, Any]) -> None:
+        """문서 항목 upsert (entry에 없는 필드는 NULL, revision_id는 유지)"""
+        sections = entry.get("sections")
+        section_list = entry.get("section_list")
+        with self._connect() as conn:
+            conn.execute(
+                """
+                INSERT INTO docs (doc_id, full_hash, sections, section_list, refs_hash, revision_id, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(doc_id) DO UPDATE SET
+                    full_hash = excluded.full_hash,
+                    sections = excluded.sections,
+                    section_list = excluded.section_list,
+                    refs_hash = excluded.refs_hash,
+                    revision_id = COALESCE(excluded.revision_id, docs.revision_id),
+                    updated_at = excluded.updated_at
+                """,
+                (
+                    doc_id,
+                    entry.get("full_hash"),
+                    json.dumps(sections, ensure_ascii=False) if sections is not None else None,
+                    json.dumps(section_list, ensure_ascii=False) if section_list is not None else None,
+                    entry.get("refs_hash"),
+                    entry.get("revision_id"),
+                    time.time(),
+                ),
+            )
+
+    def set_revision(self, doc_id: str, revision_id: str) -> None:
+        """마지막으로 확인한 문서 revisionId 기록"""
+        with self._connect() as conn:
+            conn.execute(
+                """
+                INSERT INTO docs (doc_id, revision_id, updated_at) VALUES (?, ?, ?)
+                ON CONFLICT(doc_id) DO UPDATE SET
+                    revision_id = excluded.revision_id,
+                    updated_at = excluded.updated_at
+                """,
+                (doc_id, revision_id, time.time()),
+            )
+
+    def delete_doc(self, doc_id: str) -> None:
+        with self._connect() as conn:
+            conn.execute("DELETE FROM docs WHERE doc_id = ?", (doc_id,))
+
+    # =========================================================================
+    # 이미지
+    # =========================================================================
+
+    def get_image(self, sha256: str) -> Optional[tuple[str, str]]:
+        """업로드된 이미지 (file_id, url) 또는 None"""
+        row = self._connect().execute(
+            "SELECT file_id, url FROM images WHERE sha256 = ?", (sha256,)
+        ).fetchone()
+        return (row["file_id"], row["url"]) if row else None
+
+    def put_image(self, sha256: str, file_id: str, url: str, name: str = "") -> None:
+        with self._connect() as conn:
+            conn.execute(
+                """
+                INSERT INTO images (sha256, file_id, url, name, updated_at) VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(sha256) DO UPDATE SET
+                    file_id = excluded.file_id,
+                    url = excluded.url,
+                    name = excluded.name,
+                    updated_at = excluded.updated_at
+                """,
+                (sha256, file_id, url, name, time.time()),
+            )
+
+    def delete_image(self, sha256: str) -> None:
+        with self._connect() as conn:
+            conn.execute("DELETE FROM images WHERE sha256 = ?", (sha256,))
+
+    def image_count(self) -> int:
+        return self._connect().execute("SELECT COUNT(*) FROM images").fetchone()[0]
+
+    # =========================================================================
+    # Drive 폴더 목록 스냅샷
+    # =========================================================================
+
+    def get_folder(self, folder_id: str) -> Optional[dict[str, Any]]:
+        """폴더 목록 스냅샷 {modified_time, fields, items, updated_at} 또는 None"""
+        row = self._connect().execute(
+            "SELECT modified_time, fields, items, updated_at FROM drive_folders WHERE folder_id = ?",
+            (folder_id,),
+        ).fetchone()
+        if row is None:
+            return None
+        return {
+            "modified_time": row["modified_time"],
+            "fields": row["fields"],
+            "items": json.loads(row["items"]),
+            "updated_at": row["updated_at"],
+        }
+
+    def put_folder(
+        self,
+        folder_id: str,
+        modified_time: Optional[str],
+        fields: str,
+        items: list[dict[str, Any]],
+    ) -> None:
+        with self._connect() as conn:
+            conn.execute(
+                """
+                INSERT INTO drive_folders (folder_id, modified_time, fields, items, updated_at)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(folder_id) DO UPDATE SET
+                    modified_time = excluded.modified_time,
+                    fields = excluded.fields,
+                    items = excluded.items,
+                    updated_at = excluded.updated_at
+                """,
+                (folder_id, modified_time, fields, json.dumps(items, ensure_ascii=False), time.time()),
+            )
+
+    def delete_folders(self, folder_ids: list[str]) -> None:
+        """폴더 목록 스냅샷 무효화 (이동/생성으로 목록이 바뀐 폴더)"""
+        with self._connect() as conn:
+            conn.executemany(
+                "DELETE FROM drive_folders WHERE folder_id = ?",
+                [(folder_id,) for folder_id in folder_ids],
+            )
+
+    # =========================================================================
+    # Drive 일괄 작업 기록 (중단 후 재개)
+    # =========================================================================
+
+    def get_job_items(self, job: str) -> dict[str, dict[str, Any]]:
+        """작업 항목별 마지막 결과 {item: {target, status, error}}"""
+        rows = self._connect().execute(
+            "SELECT item, target, status, error FROM drive_jobs WHERE job = ?", (job,)
+        ).fetchall()
+        return {
+            row["item"]: {"target": row["target"], "status": row["status"], "error": row["error"]}
+            for row in rows
+        }
+
+    def record_job_items(
+        self,
+        job: str,
+        items: list[tuple[str, Optional[str], str, Optional[str]]],
+    ) -> None:
+        """작업 항목 결과 upsert
+
+        Args:
+            job: 작업 이름
+            items: (item, target, status, error) 리스트
+        """
+        now = time.time()
+        with self._connect() as conn:
+            conn.executemany(
+                """
+                INSERT INTO drive_jobs (job, item, target, status, error, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(job, item) DO UPDATE SET
+                    target = excluded.target,
+                    status = excluded.status,
+                    error = excluded.error,
+                    updated_at = excluded.updated_at
+                """,
+                [(job, item, target, status, error, now) for item, target, status, error in items],
+            )
+
+    def clear_job(self, job: str) -> None:
+        with self._connect() as conn:
+            conn.execute("DELETE FROM drive_jobs WHERE job = ?", (job,))
+
+    # =========================================================================
+    # 이전 JSON 캐시 가져오기
+    # =========================================================================
+
+    def _migrate_json(self) -> None:
+        """같은 디렉토리의 JSON 캐시를 1회 가져옴 (기존 항목은 덮어쓰지 않음)"""
+        conn = self._connect()
+        with conn:
+            # 쓰기 잠금을 먼저 잡아 여러 프로세스가 동시에 가져오지 않도록 함
+            conn.execute("BEGIN IMMEDIATE")
+            done = conn.execute(
+                "SELECT value FROM meta WHERE key = 'json_migrated'"
+            ).fetchone()
+            if done:
+                return
+
+            docs = _read_json(self.path.parent / LEGACY_HASH_CACHE)
+            for doc_id, entry in docs.items():
+                if not isinstance(entry, dict):
+                    continue
+                conn.execute(
+                    """
+                    INSERT OR IGNORE INTO docs (doc_id, full_hash, sections, section_list, refs_hash, updated_at)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    """,
+                    (
+                        doc_id,
+                        entry.get("full_hash"),
+                        json.dumps(entry["sections"], ensure_ascii=False) if "sections" in entry else None,
+                        json.dumps(entry["section_list"], ensure_ascii=False) if "section_list" in entry else None,
+                        entry.get("refs_hash"),
+                        time.time(),
+                    ),
+                )
+
+            images = _read_json(self.path.parent / LEGACY_IMAGE_CACHE)
+            for sha256, entry in images.items():
+                if not isinstance(entry, dict) or "file_id" not in entry or "url" not in entry:
+                    continue
+                conn.execute(
+                    "INSERT OR IGNORE INTO images (sha256, file_id, url, name, updated_at) VALUES (?, ?, ?, ?, ?)",
+                    (sha256, entry["file_id"], entry["url"], entry.get("name", ""), time.time()),
+                )
+
+            conn.execute(
+                "INSERT INTO meta (key, value) VALUES ('json_migrated', ?)",
+                (f"docs={len(docs)} images={len(images)}",),
+            )
+        if docs or images:
+            print(f"     동기화 상태 마이그레이션: 문서 {len(docs)}개, 이미지 {len(images)}개 (JSON → SQLite)")
+
+
+def _read_json(path: Path) -> dict:
+    if not path.exists():
+        return {}
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except Exception:
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+_stores: dict[Path, SyncStateStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_sync_store(path: Optional[Path] = None) -> SyncStateStore:
+    """경로별 공유 SyncStateStore (프로세스 내 재사용)"""
+    path = Path(path) if path else _sync_state_path()
+    with _stores_lock:
+        store = _stores.get(path)
+        if store is None:
+            store = _stores[path] = SyncStateStore(path)
+        return store
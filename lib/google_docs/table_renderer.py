@@ -45,6 +45,48 @@ class ParsedCellContent:
     styles: list[CellInlineStyle] = field(default_factory=list)
 
 
+@dataclass
+class TableMeasurement:
+    """테이블 측정 결과 (셀당 1회 파싱, 헤더 포함 행 순서)"""
+
+    cells: list[list[ParsedCellContent]]  # 행/열별 파싱 결과
+    lengths: list[list[int]]              # 행/열별 plain text UTF-16 길이
+    column_widths_pt: list[float]         # 열별 최대 텍스트 너비 (패딩 포함)
+
+
+# 전각 문자 범위 (글자폭 CHAR_WIDTH_PT_CJK) - 나머지는 CHAR_WIDTH_PT_ASCII
+_WIDE_CHAR_RANGES = (
+    ("\u4e00", "\u9fff"),  # CJK 통합 한자
+    ("\uac00", "\ud7af"),  # 한글 음절
+    ("\u3040", "\u30ff"),  # 히라가나/가타카나
+    ("\uff00", "\uffef"),  # 전각 문자
+)
+_WIDE_CHAR_RE = re.compile("[" + "".join(f"{lo}-{hi}" for lo, hi in _WIDE_CHAR_RANGES) + "]")
+
+# 셀 인라인 마크다운 패턴 (순서 중요 - 긴 패턴 먼저)
+_CELL_INLINE_PATTERNS = [
+    (re.compile(pattern), style)
+    for pattern, style in [
+        # 중첩 포맷 (bold + italic)
+        (r"\*\*\*(.+?)\*\*\*", "bold_italic"),  # ***bold italic***
+        (r"___(.+?)___", "bold_italic"),  # ___bold italic___
+        (r"\*\*_(.+?)_\*\*", "bold_italic"),  # **_bold italic_**
+        (r"__\*(.+?)\*__", "bold_italic"),  # __*bold italic*__
+        (r"\*__(.+?)__\*", "bold_italic"),  # *__bold italic__*
+        (r"_\*\*(.+?)\*\*_", "bold_italic"),  # _**bold italic**_
+        # 단일 포맷
+        (r"\*\*(.+?)\*\*", "bold"),  # **bold**
+        (r"__(.+?)__", "bold"),  # __bold__
+        (r"\*(.+?)\*", "italic"),  # *italic*
+        (r"_(.+?)_", "italic"),  # _italic_
+        (r"`([^`]+)`", "code"),  # `code`
+    ]
+]
+
+# 인라인 마크다운 기호 (없으면 파싱 생략)
+_CELL_INLINE_MARKERS = re.compile(r"[*_`]")
+
+
 class NativeTableRenderer:
     """마크다운 테이블을 Google Docs 네이티브 테이블로 변환 (2단계 방식)"""
 
@@ -70,35 +112,25 @@ class NativeTableRenderer:
         4: [127.5, 127.5, 127.5, 127.5],  # 4열: 4.5cm × 4
     }
 
+    def __init__(self):
+        # 마지막으로 측정한 테이블 (같은 TableData의 너비/삽입/끝 인덱스 계산에서 재사용)
+        self._measured: tuple[TableData, TableMeasurement] | None = None
+
     def _parse_cell_inline_formatting(self, text: str) -> ParsedCellContent:
         """
         셀 내용에서 인라인 마크다운 파싱
 
         **bold**, *italic*, `code` 등을 추출하고 plain text 반환
         """
-        styles: list[CellInlineStyle] = []
+        if not _CELL_INLINE_MARKERS.search(text):
+            return ParsedCellContent(plain_text=text)
 
-        # 정규식 패턴들 (순서 중요 - 긴 패턴 먼저)
-        patterns = [
-            # 중첩 포맷 (bold + italic)
-            (r"\*\*\*(.+?)\*\*\*", "bold_italic"),  # ***bold italic***
-            (r"___(.+?)___", "bold_italic"),  # ___bold italic___
-            (r"\*\*_(.+?)_\*\*", "bold_italic"),  # **_bold italic_**
-            (r"__\*(.+?)\*__", "bold_italic"),  # __*bold italic*__
-            (r"\*__(.+?)__\*", "bold_italic"),  # *__bold italic__*
-            (r"_\*\*(.+?)\*\*_", "bold_italic"),  # _**bold italic**_
-            # 단일 포맷
-            (r"\*\*(.+?)\*\*", "bold"),  # **bold**
-            (r"__(.+?)__", "bold"),  # __bold__
-            (r"\*(.+?)\*", "italic"),  # *italic*
-            (r"_(.+?)_", "italic"),  # _italic_
-            (r"`([^`]+)`", "code"),  # `code`
-        ]
+        styles: list[CellInlineStyle] = []
 
         # 모든 매치 찾기
         all_matches = []
-        for pattern, style in patterns:
-            for match in re.finditer(pattern, text):
+        for pattern, style in _CELL_INLINE_PATTERNS:
+            for match in pattern.finditer(text):
                 all_matches.append((match.start(), match.end(), match.group(1), style))
 
         # 위치순 정렬
@@ -242,17 +274,8 @@ class NativeTableRenderer:
         if table_data.column_count == 0:
             return []
 
-        # 각 열의 최대 텍스트 너비 계산 (pt 단위)
-        all_rows = [table_data.headers] + table_data.rows
-        max_widths_pt = [0.0] * table_data.column_count
-
-        for row in all_rows:
-            for col_idx, cell in enumerate(row):
-                if col_idx < table_data.column_count:
-                    # 마크다운 기호 제거 후 너비 계산
-                    parsed = self._parse_cell_inline_formatting(cell)
-                    text_width = self._calculate_text_width_pt(parsed.plain_text)
-                    max_widths_pt[col_idx] = max(max_widths_pt[col_idx], text_width)
+        # 각 열의 최대 텍스트 너비 (pt 단위, 마크다운 기호 제거 후)
+        max_widths_pt = self.measure_table(table_data).column_widths_pt
 
         # 모든 열이 비어있으면 균등 분배
         total_width = sum(max_widths_pt)
@@ -268,11 +291,46 @@ class NativeTableRenderer:
 
         return widths
 
+    def measure_table(self, table_data: TableData) -> TableMeasurement:
+        """
+        테이블 셀을 1회씩 파싱하여 plain text, UTF-16 길이, 열별 최대 너비 계산
+
+        같은 TableData를 다시 측정하면 이전 결과를 반환합니다
+        (컬럼 너비 → 텍스트 삽입 → 끝 인덱스 계산이 같은 측정을 공유).
+
+        Args:
+            table_data: 파싱된 테이블 데이터
+
+        Returns:
+            TableMeasurement: 헤더 포함 행 순서의 측정 결과
+        """
+        if self._measured is not None and self._measured[0] is table_data:
+            return self._measured[1]
+
+        col_count = table_data.column_count
+        cells: list[list[ParsedCellContent]] = []
+        lengths: list[list[int]] = []
+        column_widths_pt = [0.0] * col_count
+
+        for row in [table_data.headers] + table_data.rows:
+            parsed_row = [self._parse_cell_inline_formatting(cell) for cell in row]
+            cells.append(parsed_row)
+            lengths.append([utf16_len(parsed.plain_text) for parsed in parsed_row])
+            for col_idx, parsed in enumerate(parsed_row[:col_count]):
+                width = self._calculate_text_width_pt(parsed.plain_text)
+                if width > column_widths_pt[col_idx]:
+                    column_widths_pt[col_idx] = width
+
+        measurement = TableMeasurement(cells=cells, lengths=lengths, column_widths_pt=column_widths_pt)
+        self._measured = (table_data, measurement)
+        return measurement
+
     def _calculate_text_width_pt(self, text: str) -> float:
         """
         텍스트의 예상 표시 너비 계산 (pt 단위)
 
         Google Docs 기본 폰트 기준으로 ASCII와 CJK 문자를 구분하여 계산합니다.
+        전각 문자 수는 _WIDE_CHAR_RANGES 정규식으로 문자열 전체에서 한 번에 셉니다.
         패딩(10pt)을 포함한 실제 필요 너비를 반환합니다.
 
         Args:
@@ -284,19 +342,8 @@ class NativeTableRenderer:
         if not text:
             return 0.0
 
-        width = 0.0
-        for char in text:
-            # CJK 문자 판별 (한글, 중국어, 일본어)
-            if '\u4e00' <= char <= '\u9fff':  # CJK 통합 한자
-                width += self.CHAR_WIDTH_PT_CJK
-            elif '\uac00' <= char <= '\ud7af':  # 한글 음절
-                width += self.CHAR_WIDTH_PT_CJK
-            elif '\u3040' <= char <= '\u30ff':  # 히라가나/가타카나
-                width += self.CHAR_WIDTH_PT_CJK
-            elif '\uff00' <= char <= '\uffef':  # 전각 문자
-                width += self.CHAR_WIDTH_PT_CJK
-            else:
-                width += self.CHAR_WIDTH_PT_ASCII
+        wide = 0 if text.isascii() else len(_WIDE_CHAR_RE.findall(text))
+        width = wide * self.CHAR_WIDTH_PT_CJK + (len(text) - wide) * self.CHAR_WIDTH_PT_ASCII
 
         # 셀 패딩 추가 (좌우 각 5pt)
         return width + (self.CELL_PADDING_PT * 2)
@@ -456,6 +503,92 @@ class NativeTableRenderer:
             }
         }
 
+    def render_table_at(
+        self,
+        table_data: TableData,
+        location: int,
+    ) -> list[dict[str, Any]]:
+        """
+        테이블 구조 + 콘텐츠/스타일 요청을 한 번에 생성 (documents().get 불필요)
+
+        insertTable 직후의 빈 테이블 구조는 크기만으로 결정되므로,
+        _calc_cell_index()로 계산한 테이블 요소에 render_table_content_and_styles()를
+        적용합니다. 반환된 요청은 location 앞쪽 문서가 확정된 상태에서
+        순서대로 실행해야 합니다 (여러 테이블은 뒤에서부터 삽입).
+
+        Args:
+            table_data: 파싱된 테이블 데이터
+            location: insertTable 삽입 위치 (테이블은 location + 1에서 시작)
+
+        Returns:
+            list: insertTable + 텍스트/셀 스타일 요청 (빈 테이블이면 빈 리스트)
+        """
+        structure_request = self.render_table_structure(table_data, location)
+        if not structure_request:
+            return []
+
+        table_element = self.empty_table_element(table_data, location + 1)
+        return [structure_request] + self.render_table_content_and_styles(
+            table_data, table_element
+        )
+
+    def empty_table_element(self, table_data: TableData, table_start: int) -> dict[str, Any]:
+        """
+        insertTable 직후의 빈 테이블 요소 (documents().get 형식, 계산값)
+
+        Args:
+            table_data: 파싱된 테이블 데이터
+            table_start: 테이블 시작 인덱스 (insertTable 위치 + 1)
+
+        Returns:
+            dict: startIndex/endIndex/table.tableRows를 가진 테이블 요소
+        """
+        col_count = table_data.column_count
+        table_rows = []
+        for row_idx in range(table_data.row_count):
+            table_cells = []
+            for col_idx in range(col_count):
+                para_start = self._calc_cell_index(table_start, row_idx, col_idx, col_count)
+                table_cells.append(
+                    {
+                        "startIndex": para_start - 1,
+                        "endIndex": para_start + 1,
+                        "content": [
+                            {
+                                "startIndex": para_start,
+                                "endIndex": para_start + 1,
+                                "paragraph": {
+                                    "elements": [
+                                        {
+                                            "startIndex": para_start,
+                                            "endIndex": para_start + 1,
+                                            "textRun": {"content": "\n"},
+                                        }
+                                    ],
+                                    "paragraphStyle": {"namedStyleType": "NORMAL_TEXT"},
+                                },
+                            }
+                        ],
+                    }
+                )
+            table_rows.append(
+                {
+                    "startIndex": table_cells[0]["startIndex"] - 1,
+                    "endIndex": table_cells[-1]["endIndex"],
+                    "tableCells": table_cells,
+                }
+            )
+
+        return {
+            "startIndex": table_start,
+            "endIndex": table_start + 2 + table_data.row_count * (1 + 2 * col_count),
+            "table": {
+                "rows": table_data.row_count,
+                "columns": col_count,
+                "tableRows": table_rows,
+            },
+        }
+
     def render_table_content(
         self,
         table_data: TableData,
@@ -481,6 +614,7 @@ class NativeTableRenderer:
 
         # 모든 행 데이터 수집
         all_rows = [table_data.headers] + table_data.rows
+        measurement = self.measure_table(table_data)
 
         # 셀 내용 파싱 및 삽입 준비 (역순으로 - 인덱스 시프트 방지)
         insertions = []
@@ -493,8 +627,8 @@ class NativeTableRenderer:
                 ):
                     cell_start = cell_indices[row_idx][col_idx]
 
-                    # 마크다운 파싱 (** 제거, 스타일 정보 추출)
-                    parsed = self._parse_cell_inline_formatting(content)
+                    # 마크다운 파싱 결과 (** 제거, 스타일 정보)
+                    parsed = measurement.cells[row_idx][col_idx]
 
                     insertions.append(
                         {
@@ -612,6 +746,7 @@ class NativeTableRenderer:
 
         # 모든 행 데이터 수집
         all_rows = [table_data.headers] + table_data.rows
+        measurement = self.measure_table(table_data)
 
         for row_idx, row in enumerate(all_rows):
             for col_idx, content in enumerate(row):
@@ -622,8 +757,8 @@ class NativeTableRenderer:
                 ):
                     cell_start = cell_indices[row_idx][col_idx]
 
-                    # 마크다운 파싱
-                    parsed = self._parse_cell_inline_formatting(content)
+                    # 마크다운 파싱 결과
+                    parsed = measurement.cells[row_idx][col_idx]
                     plain_text = parsed.plain_text
 
                     if not plain_text:
@@ -635,7 +770,7 @@ class NativeTableRenderer:
                             "updateTextStyle": {
                                 "range": {
                                     "startIndex": cell_start,
-                                    "endIndex": cell_start + utf16_len(plain_text),
+                                    "endIndex": cell_start + measurement.lengths[row_idx][col_idx],
                                 },
                                 "textStyle": {
                                     "foregroundColor": {
@@ -718,8 +853,9 @@ class NativeTableRenderer:
         if not cell_indices:
             return requests
 
-        # 모든 행 데이터 수집
+        # 모든 행 데이터 수집 (셀 파싱은 measure_table에서 1회)
         all_rows = [table_data.headers] + table_data.rows
+        measurement = self.measure_table(table_data)
 
         # =====================================================================
         # Phase 1: 텍스트 삽입 정보 수집 및 역순 삽입
@@ -735,13 +871,14 @@ class NativeTableRenderer:
                 ):
                     cell_start = cell_indices[row_idx][col_idx]
 
-                    # 마크다운 파싱 (** 제거, 스타일 정보 추출)
-                    parsed = self._parse_cell_inline_formatting(content)
+                    # 마크다운 파싱 결과 (** 제거, 스타일 정보)
+                    parsed = measurement.cells[row_idx][col_idx]
 
                     insertions.append(
                         {
                             "index": cell_start,
                             "content": parsed.plain_text,
+                            "length": measurement.lengths[row_idx][col_idx],
                             "parsed": parsed,
                             "row_idx": row_idx,
                             "col_idx": col_idx,
@@ -852,7 +989,6 @@ class NativeTableRenderer:
             shift = index_shifts.get(original_index, 0)
             shifted_start = original_index + shift
             parsed = item["parsed"]
-            plain_text = parsed.plain_text
             is_header = item["row_idx"] == 0
 
             # 셀 전체에 본문 색상 적용
@@ -871,7 +1007,7 @@ class NativeTableRenderer:
                     "updateTextStyle": {
                         "range": {
                             "startIndex": shifted_start,
-                            "endIndex": shifted_start + utf16_len(plain_text),
+                            "endIndex": shifted_start + item["length"],
                         },
                         "textStyle": text_style,
                         "fields": ",".join(fields),
@@ -928,28 +1064,23 @@ class NativeTableRenderer:
         따라서 각 인덱스는 자신보다 앞에 있는 삽입 텍스트 길이만큼 시프트됨.
 
         Args:
-            insertions: 역순 정렬된 삽입 정보 리스트
+            insertions: 역순 정렬된 삽입 정보 리스트 (length가 없으면 content로 계산)
 
         Returns:
             dict: {원래_인덱스: 시프트_량}
         """
         shifts: dict[int, int] = {}
 
-        # 역순 삽입 후 스타일 적용 시 인덱스 시프트 계산
         # 역순 삽입: 인덱스 큰 것부터 삽입 (예: 100, 80, 60, 40, 20)
-        # 스타일 적용 시: 인덱스 작은 것은 큰 것들의 삽입으로 인해 밀림
-        for i, item in enumerate(insertions):
-            current_index = item["index"]
-            shift = 0
-
-            # 자신보다 인덱스가 작은 것들에 삽입된 텍스트 길이만큼 시프트됨
-            # (역순 정렬이므로 i 이후에 있는 것들이 인덱스가 작음)
-            for j in range(i + 1, len(insertions)):
-                other = insertions[j]
-                if other["index"] < current_index:
-                    shift += utf16_len(other["content"]) if other["content"] else 0
-
-            shifts[current_index] = shift
+        # 스타일 적용 시: 각 인덱스는 더 작은 인덱스들의 삽입 길이 합만큼 밀림
+        # → 인덱스 오름차순으로 누적합 (같은 인덱스끼리는 서로 밀지 않음)
+        total = 0
+        for item in reversed(insertions):
+            shifts.setdefault(item["index"], total)
+            length = item.get("length")
+            if length is None:
+                length = utf16_len(item["content"]) if item["content"] else 0
+            total += length
 
         return shifts
 
@@ -1048,6 +1179,9 @@ class NativeTableRenderer:
             }
         )
 
+        # 삽입 위치 앞에 줄바꿈이 추가되므로 테이블은 start_index + 1에서 시작
+        table_start = start_index + 1
+
         # 2. 모든 행 데이터 수집 (헤더 + 데이터 행)
         all_rows = [table_data.headers] + table_data.rows
 
@@ -1057,7 +1191,7 @@ class NativeTableRenderer:
         for row_idx in range(len(all_rows)):
             for col_idx in range(table_data.column_count):
                 cell_index = self._calc_cell_index(
-                    start_index, row_idx, col_idx, table_data.column_count
+                    table_start, row_idx, col_idx, table_data.column_count
                 )
                 content = (
                     all_rows[row_idx][col_idx]
@@ -1097,7 +1231,7 @@ class NativeTableRenderer:
             )
             if header_content:
                 header_index = self._calc_cell_index(
-                    start_index, 0, col_idx, table_data.column_count
+                    table_start, 0, col_idx, table_data.column_count
                 )
                 # SKILL.md 표준: 진한 회색 #404040
                 requests.append(
@@ -1125,7 +1259,7 @@ class NativeTableRenderer:
                 )
 
         # 5. 새로운 끝 인덱스 계산
-        new_index = self._calc_table_end_index(start_index, table_data)
+        new_index = self._calc_table_end_index(table_start, table_data)
 
         return requests, new_index
 
@@ -1137,12 +1271,18 @@ class NativeTableRenderer:
         col_count: int,
     ) -> int:
         """
-        [레거시] 테이블 셀의 삽입 인덱스 계산 (추정값)
+        빈 테이블 셀 (row_idx, col_idx)의 단락 시작 인덱스
+
+        insertTable 직후 구조 기준의 정확한 값입니다 (셀 내용 삽입 전).
 
         Google Docs 테이블 구조:
-        - 테이블 요소: 1
+        - 테이블 시작: 1
         - 각 행: 1
-        - 각 셀: 2 (셀 요소 + 단락)
+        - 각 셀: 2 (셀 요소 + 빈 단락 "\\n")
+        - 테이블 끝: 1
+
+        Args:
+            table_start: 테이블 시작 인덱스 (insertTable 위치 + 1)
         """
         base = table_start + 2
         row_offset = row_idx * (1 + col_count * 2)
@@ -1151,15 +1291,15 @@ class NativeTableRenderer:
 
     def _calc_table_end_index(self, table_start: int, table_data: TableData) -> int:
         """
-        [레거시] 테이블 끝 인덱스 계산 (추정값)
+        셀 내용(마크다운 제거된 텍스트)까지 채운 테이블의 끝 인덱스
+
+        Args:
+            table_start: 테이블 시작 인덱스 (insertTable 위치 + 1)
         """
         size = 1
         row_size = 1 + table_data.column_count * 2
         size += table_data.row_count * row_size
 
-        all_rows = [table_data.headers] + table_data.rows
-        for row in all_rows:
-            for cell in row:
-                size += len(cell)
+        size += sum(sum(row) for row in self.measure_table(table_data).lengths)
 
         return table_start + size + 1
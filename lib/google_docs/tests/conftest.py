@@ -0,0 +1,175 @@
+"""Google Docs/Drive 테스트 공용 fixture 및 Drive API 대체 객체"""
+
+import re
+import threading
+from types import SimpleNamespace
+from typing import Optional
+
+import pytest
+
+from lib.google_docs.rate_governor import DEFAULT_RATES, RateGovernor, set_governor
+from lib.google_docs.sync_state import SyncStateStore
+
+
+@pytest.fixture
+def unlimited_governor():
+    """전역 RateGovernor를 속도 제한 없는 인스턴스로 교체"""
+    previous = set_governor(RateGovernor(rates={api: 1e9 for api in DEFAULT_RATES}))
+    yield
+    set_governor(previous)
+
+
+@pytest.fixture
+def store(tmp_path):
+    """임시 경로의 동기화 상태 저장소"""
+    return SyncStateStore(tmp_path / "state.db")
+
+
+class FakeHttpError(Exception):
+    """HttpError 대체 (resp.status만 제공, 429면 rate limit으로 분류)"""
+
+    def __init__(self, status: int):
+        super().__init__(f"HTTP {status}")
+        self.resp = SimpleNamespace(status=status)
+
+
+class FakeRequest:
+    """HttpRequest 대체 (uri/method로 drive 버킷 분류)"""
+
+    uri = "https://www.googleapis.com/drive/v3/files"
+
+    def __init__(self, drive: "FakeDrive", method: str, **kwargs):
+        self.drive, self.kind, self.kwargs = drive, method, kwargs
+        self.method = "GET" if method in ("list", "get") else "POST"
+
+    def execute(self):
+        with self.drive.lock:
+            self.drive.http += 1
+        return self.drive.run(self)
+
+
+class FakeBatch:
+    """BatchHttpRequest 대체: 요청을 순서대로 실행하고 항목별 callback 호출"""
+
+    def __init__(self, drive: "FakeDrive", callback):
+        self.drive, self.callback, self.requests = drive, callback, []
+
+    def add(self, request: FakeRequest, request_id: str) -> None:
+        assert len(self.requests) < 100
+        self.requests.append((request_id, request))
+
+    def execute(self):
+        with self.drive.lock:
+            self.drive.http += 1
+            self.drive.batches.append(len(self.requests))
+        for request_id, request in self.requests:
+            try:
+                self.callback(request_id, self.drive.run(request), None)
+            except Exception as e:
+                self.callback(request_id, None, e)
+
+
+class FakeDrive:
+    """Drive v3 files() 대체
+
+    파일 ID → {name, mimeType, parents, ...}. list/get/update/create와 batch를
+    지원하고 HTTP 요청 수(http), batch 크기(batches), files.list 대상 폴더(listed),
+    휴지통 이동(trashed)을 기록합니다.
+    """
+
+    def __init__(self, files: Optional[dict[str, dict]] = None, page_size: int = 1000, limited: int = 0):
+        self.files_by_id = files if files is not None else {}
+        self.page_size = page_size
+        self.limited = limited  # 처음 N개 update는 429
+        self.fail_updates: set[str] = set()  # update가 실패할 파일 ID
+        self.http = 0
+        self.batches: list[int] = []
+        self.listed: list[str] = []
+        self.trashed: list[str] = []
+        self.lock = threading.Lock()
+        self._next_id = 0
+
+    @classmethod
+    def from_tree(cls, tree: dict[str, list[dict]], **kwargs) -> "FakeDrive":
+        """폴더 ID → 자식 항목 리스트로 생성 (항목 순서 유지)"""
+        files = {}
+        for folder_id, children in tree.items():
+            for child in children:
+                files[child["id"]] = {**child, "parents": [folder_id]}
+        return cls(files, **kwargs)
+
+    @classmethod
+    def from_items(cls, items: list[dict], parent: str = "root", **kwargs) -> "FakeDrive":
+        """폴더 1개 아래의 항목 리스트로 생성"""
+        return cls({item["id"]: {**item, "parents": [parent]} for item in items}, **kwargs)
+
+    def files(self):
+        return self
+
+    def list(self, **kwargs):
+        return FakeRequest(self, "list", **kwargs)
+
+    def get(self, **kwargs):
+        return FakeRequest(self, "get", **kwargs)
+
+    def update(self, **kwargs):
+        return FakeRequest(self, "update", **kwargs)
+
+    def create(self, **kwargs):
+        return FakeRequest(self, "create", **kwargs)
+
+    def new_batch_http_request(self, callback):
+        return FakeBatch(self, callback)
+
+    def run(self, request: FakeRequest) -> dict:
+        kwargs = request.kwargs
+        if request.kind == "list":
+            return self._list(**kwargs)
+        if request.kind == "create":
+            with self.lock:
+                self._next_id += 1
+                folder_id = f"new{self._next_id}"
+            body = kwargs["body"]
+            self.files_by_id[folder_id] = {
+                "name": body["name"], "mimeType": body["mimeType"], "parents": body["parents"],
+            }
+            return {"id": folder_id}
+
+        file_id = kwargs["fileId"]
+        if request.kind == "update" and self.limited:
+            with self.lock:
+                self.limited -= 1
+            raise FakeHttpError(429)
+        file = self.files_by_id.get(file_id)
+        if file is None:
+            raise FakeHttpError(404)
+        if request.kind == "get":
+            return {"id": file_id, **file, "parents": list(file.get("parents", []))}
+        if file_id in self.fail_updates:
+            raise RuntimeError("backend error")
+        if kwargs.get("body", {}).get("trashed"):
+            file["trashed"] = True
+            with self.lock:
+                self.trashed.append(file_id)
+        removed = set(filter(None, kwargs.get("removeParents", "").split(",")))
+        if removed or kwargs.get("addParents"):
+            file["parents"] = [p for p in file.get("parents", []) if p not in removed]
+            if kwargs.get("addParents"):
+                file["parents"].append(kwargs["addParents"])
+        return {"id": file_id, "parents": file.get("parents", [])}
+
+    def _list(self, q: str, pageSize: int = 1000, fields: str = "", pageToken: Optional[str] = None) -> dict:
+        parent = re.match(r"'([^']+)' in parents", q).group(1)
+        with self.lock:
+            self.listed.append(parent)
+        children = [
+            {"id": file_id, **f}
+            for file_id, f in self.files_by_id.items()
+            if parent in f.get("parents", []) and not f.get("trashed")
+        ]
+        start = int(pageToken or 0)
+        end = start + min(pageSize, self.page_size)
+        result = {"files": children[start:end]}
+        if end < len(children):
+            result["nextPageToken"] = str(end)
+        return result
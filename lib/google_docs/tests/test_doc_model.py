@@ -0,0 +1,138 @@
+"""인메모리 Google Docs 문서 모델 테스트"""
+
+import pytest
+
+from lib.google_docs.doc_model import DocModel
+from lib.google_docs.errors import PlanValidationError
+
+
+def _insert(index, text):
+    return {"insertText": {"location": {"index": index}, "text": text}}
+
+
+def _table(index, rows, columns):
+    return {"insertTable": {"rows": rows, "columns": columns, "location": {"index": index}}}
+
+
+class TestText:
+
+    def test_empty_document(self):
+        model = DocModel()
+        assert model.end_index == 2
+        assert model.text_range(1, 2) == "\n"
+
+    def test_insert_splits_paragraphs(self):
+        model = DocModel().apply([_insert(1, "첫째\n둘째\n")])
+
+        content = model.to_document()["body"]["content"]
+        starts = [el["startIndex"] for el in content[1:]]
+        assert starts == [1, 4, 7]
+        assert model.end_index == 8
+
+    def test_utf16_surrogate_pairs(self):
+        """이모지는 2 유닛, 쌍 중간 인덱스는 거부"""
+        model = DocModel().apply([_insert(1, "a🙂b\n")])
+        assert model.end_index == 7
+        assert model.text_range(2, 4) == "🙂"
+
+        with pytest.raises(PlanValidationError):
+            model.apply([_insert(3, "x")])
+
+    def test_named_style_tracking(self):
+        model = DocModel().apply(
+            [
+                _insert(1, "제목\n본문\n"),
+                {
+                    "updateParagraphStyle": {
+                        "range": {"startIndex": 1, "endIndex": 3},
+                        "paragraphStyle": {"namedStyleType": "HEADING_1"},
+                        "fields": "namedStyleType",
+                    }
+                },
+            ]
+        )
+        styles = [
+            el["paragraph"]["paragraphStyle"]["namedStyleType"]
+            for el in model.to_document()["body"]["content"][1:]
+        ]
+        assert styles == ["HEADING_1", "NORMAL_TEXT", "NORMAL_TEXT"]
+
+
+class TestTable:
+
+    def test_cell_indices(self):
+        """빈 셀 (r, c) 단락 시작 = 테이블 시작 + 3 + r * (1 + 2 * 열수) + 2 * c"""
+        model = DocModel().apply([_table(1, 2, 3)])
+
+        table = model.table_at(2)
+        indices = [
+            [cell["content"][0]["startIndex"] for cell in row["tableCells"]]
+            for row in table["table"]["tableRows"]
+        ]
+        assert indices == [[5, 7, 9], [12, 14, 16]]
+        assert table["endIndex"] == 2 + 2 + 2 * 7
+        assert model.end_index == table["endIndex"] + 1
+
+    def test_cell_text_shifts_following_content(self):
+        model = DocModel().apply([_table(1, 1, 2), _insert(7, "나"), _insert(5, "가")])
+
+        cells = model.table_at(2)["table"]["tableRows"][0]["tableCells"]
+        assert [c["content"][0]["paragraph"]["elements"][0]["textRun"]["content"] for c in cells] == [
+            "가\n",
+            "나\n",
+        ]
+        model.apply([_insert(model.end_index - 1, "끝\n")])
+        assert model.text_range(model.end_index - 3, model.end_index - 1) == "끝\n"
+
+    def test_structural_index_rejected(self):
+        model = DocModel().apply([_table(1, 1, 1)])
+        with pytest.raises(PlanValidationError) as exc:
+            model.apply([_insert(3, "x")], offset=10)
+        assert exc.value.request_index == 10
+        assert exc.value.request_type == "insertText"
+
+    def test_cell_style_bounds(self):
+        model = DocModel().apply([_table(1, 2, 2)])
+        request = {
+            "updateTableCellStyle": {
+                "tableRange": {
+                    "tableCellLocation": {
+                        "tableStartLocation": {"index": 2},
+                        "rowIndex": 2,
+                        "columnIndex": 0,
+                    },
+                    "rowSpan": 1,
+                    "columnSpan": 1,
+                },
+                "tableCellStyle": {},
+                "fields": "backgroundColor",
+            }
+        }
+        with pytest.raises(PlanValidationError):
+            model.apply([request])
+
+
+class TestDelete:
+
+    def test_placeholder_replaced_by_image(self):
+        model = DocModel().apply([_insert(1, "앞\n[🖼 a]\n뒤\n")])
+        model.apply(
+            [
+                {"deleteContentRange": {"range": {"startIndex": 3, "endIndex": 9}}},
+                {"insertInlineImage": {"location": {"index": 3}, "uri": "https://x/a.png"}},
+            ]
+        )
+        assert model.inline_object_count == 1
+        paragraph = model.to_document()["body"]["content"][2]["paragraph"]
+        assert "inlineObjectElement" in paragraph["elements"][0]
+        assert model.text_range(5, 7) == "뒤\n"
+
+    def test_delete_across_paragraphs_merges(self):
+        model = DocModel().apply([_insert(1, "ab\ncd\n")])
+        model.apply([{"deleteContentRange": {"range": {"startIndex": 2, "endIndex": 5}}}])
+        assert model.text_range(1, model.end_index) == "ad\n\n"
+
+    def test_final_newline_protected(self):
+        model = DocModel().apply([_insert(1, "ab")])
+        with pytest.raises(PlanValidationError):
+            model.apply([{"deleteContentRange": {"range": {"startIndex": 1, "endIndex": 4}}}])
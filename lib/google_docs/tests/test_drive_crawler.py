@@ -0,0 +1,94 @@
+"""Drive 폴더 크롤러 테스트"""
+
+import time
+
+import pytest
+
+from lib.google_docs import drive_crawler
+from lib.google_docs.drive_crawler import DEFAULT_MAX_AGE, FOLDER_MIME_TYPE, DriveCrawler
+from lib.google_docs.tests.conftest import FakeDrive
+
+pytestmark = pytest.mark.usefixtures("unlimited_governor")
+
+
+def _folder(folder_id: str, modified: str = "t1") -> dict:
+    return {"id": folder_id, "name": folder_id, "mimeType": FOLDER_MIME_TYPE, "modifiedTime": modified}
+
+
+def _file(file_id: str) -> dict:
+    return {"id": file_id, "name": f"{file_id}.png", "mimeType": "image/png"}
+
+
+def _tree() -> dict[str, list[dict]]:
+    """root → a, b / a → a1"""
+    return {
+        "root": [_folder("a"), _folder("b"), _file("r0")],
+        "a": [_folder("a1"), _file("a0")],
+        "b": [_file(f"b{i}") for i in range(5)],
+        "a1": [_file("x0"), _file("x1")],
+    }
+
+
+class TestCrawl:
+
+    def test_breadth_first(self, store):
+        drive = FakeDrive.from_tree(_tree(), page_size=2)
+        listings = DriveCrawler(lambda: drive, store).crawl(["root"])
+
+        assert list(listings) == ["root", "a", "b", "a1"]
+        assert [f["id"] for f in listings["b"]] == [f"b{i}" for i in range(5)]
+
+    def test_max_depth(self, store):
+        drive = FakeDrive.from_tree(_tree())
+        listings = DriveCrawler(lambda: drive, store).crawl(["root"], max_depth=1)
+        assert set(listings) == {"root", "a", "b"}
+
+    def test_follow(self, store):
+        drive = FakeDrive.from_tree(_tree())
+        listings = DriveCrawler(lambda: drive, store).crawl(["root"], follow=lambda f: f["id"] == "b")
+        assert set(listings) == {"root", "b"}
+
+    def test_listing_reused_within_run(self, store):
+        drive = FakeDrive.from_tree(_tree())
+        crawler = DriveCrawler(lambda: drive, store)
+        crawler.crawl(["root"])
+        crawler.list_children("a")
+        assert sorted(drive.listed) == ["a", "a1", "b", "root"]
+
+
+class TestSnapshot:
+
+    def test_only_changed_folders_relisted(self, store):
+        tree = _tree()
+        DriveCrawler(lambda: FakeDrive.from_tree(tree), store).crawl(["root"])
+
+        # b만 변경 (부모 목록의 modifiedTime 갱신)
+        tree["b"].append(_file("b5"))
+        tree["root"][1] = _folder("b", modified="t2")
+        drive = FakeDrive.from_tree(tree)
+        crawler = DriveCrawler(lambda: drive, store)
+        listings = crawler.crawl(["root"])
+
+        assert sorted(drive.listed) == ["b", "root"]
+        assert crawler.stats.reused == 2
+        assert len(listings["b"]) == 6
+        assert [f["id"] for f in listings["a1"]] == ["x0", "x1"]
+
+    def test_refresh(self, store):
+        DriveCrawler(lambda: FakeDrive.from_tree(_tree()), store).crawl(["root"])
+        drive = FakeDrive.from_tree(_tree())
+        DriveCrawler(lambda: drive, store, refresh=True).crawl(["root"])
+        assert len(drive.listed) == 4
+
+    def test_expired_snapshot_relisted(self, store, monkeypatch):
+        DriveCrawler(lambda: FakeDrive.from_tree(_tree()), store).crawl(["root"])
+
+        # modifiedTime이 그대로여도 max_age가 지나면 다시 조회
+        now = time.time()
+        monkeypatch.setattr(drive_crawler.time, "time", lambda: now + DEFAULT_MAX_AGE + 1)
+        drive = FakeDrive.from_tree(_tree())
+        crawler = DriveCrawler(lambda: drive, store)
+        crawler.crawl(["root"])
+
+        assert sorted(drive.listed) == ["a", "a1", "b", "root"]
+        assert crawler.stats.reused == 0
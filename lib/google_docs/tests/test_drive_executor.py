@@ -0,0 +1,96 @@
+"""Drive 일괄 이동/폴더 생성 실행기 테스트"""
+
+import pytest
+
+from lib.google_docs.drive_crawler import FOLDER_MIME_TYPE, DriveCrawler
+from lib.google_docs.drive_executor import DriveFixExecutor, MoveOp
+from lib.google_docs.sync_state import SyncStateStore
+from lib.google_docs.tests.conftest import FakeDrive
+
+pytestmark = pytest.mark.usefixtures("unlimited_governor")
+
+
+def _folder(name: str, parent: str) -> dict:
+    return {"name": name, "mimeType": FOLDER_MIME_TYPE, "parents": [parent]}
+
+
+def _image(name: str, parent: str = "root") -> dict:
+    return {"name": name, "mimeType": "image/png", "parents": [parent]}
+
+
+def _executor(drive: FakeDrive, store: SyncStateStore) -> DriveFixExecutor:
+    return DriveFixExecutor(drive, DriveCrawler(lambda: drive, store), sleep=lambda s: None)
+
+
+class TestResolvePaths:
+
+    def test_existing_and_missing_folders(self, store):
+        drive = FakeDrive({"images": _folder("images", "root")})
+        executor = _executor(drive, store)
+
+        paths = [f"images/prds/PRD-{i:04d}" for i in range(5)] + ["images/diagrams"]
+        folder_ids = executor.resolve_paths("root", paths)
+
+        assert set(folder_ids) == set(paths)
+        assert folder_ids["images/diagrams"] != folder_ids["images/prds/PRD-0000"]
+        # 깊이별 목록 조회 + 생성 batch (prds·diagrams 1회, PRD-xxxx 1회)
+        assert drive.batches == [2, 5]
+
+        http = drive.http
+        assert executor.resolve_paths("root", paths) == folder_ids
+        assert drive.http == http
+
+
+class TestMove:
+
+    def test_batched_moves(self, store):
+        files = {"dst": _folder("dst", "root")}
+        files.update({f"f{i}": _image(f"{i}.png") for i in range(250)})
+        drive = FakeDrive(files)
+        executor = _executor(drive, store)
+
+        ops = [MoveOp(f"f{i}", "dst", parents=["root"]) for i in range(200)]
+        ops += [MoveOp(f"f{i}", "dst") for i in range(200, 250)]  # 부모 조회 필요
+        outcomes = executor.move(ops)
+
+        assert [o.status for o in outcomes] == ["done"] * 250
+        assert all(drive.files_by_id[f"f{i}"]["parents"] == ["dst"] for i in range(250))
+        # get 50개 batch 1회 + update batch 3회
+        assert drive.batches == [50, 100, 100, 50]
+
+    def test_already_in_target_skipped(self, store):
+        drive = FakeDrive({"dst": _folder("dst", "root"), "f": _image("f.png", "dst")})
+        outcome = _executor(drive, store).move([MoveOp("f", "dst")])[0]
+
+        assert (outcome.status, outcome.ok) == ("skipped", True)
+        assert drive.batches == [1]
+
+    def test_resume_after_failure(self, store):
+        files = {"dst": _folder("dst", "root")}
+        files.update({f"f{i}": _image(f"{i}.png") for i in range(5)})
+        drive = FakeDrive(files)
+        drive.fail_updates = {"f3"}
+        ops = [MoveOp(f"f{i}", "dst", parents=["root"]) for i in range(5)]
+
+        first = _executor(drive, store).move(ops, job="organize")
+        assert [o.status for o in first] == ["done", "done", "done", "error", "done"]
+        assert "backend error" in first[3].reason
+
+        # 재개: 이전 실행에서 옮긴 파일은 요청하지 않음 (stale parents 그대로 전달)
+        drive.fail_updates = set()
+        drive.batches = []
+        second = _executor(drive, store).move(ops, job="organize", resume=True)
+
+        assert [o.status for o in second] == ["skipped"] * 3 + ["done", "skipped"]
+        assert drive.batches == [1]
+        assert store.get_job_items("organize") == {}
+
+    def test_snapshots_invalidated(self, store):
+        drive = FakeDrive({"dst": _folder("dst", "root"), "f": _image("f.png")})
+        executor = _executor(drive, store)
+        assert [i["id"] for i in executor.crawler.list_children("root")] == ["dst", "f"]
+
+        executor.move([MoveOp("f", "dst", parents=["root"])])
+
+        assert [i["id"] for i in executor.crawler.list_children("root")] == ["dst"]
+        assert [i["id"] for i in executor.crawler.list_children("dst")] == ["f"]
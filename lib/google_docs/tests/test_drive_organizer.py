@@ -0,0 +1,120 @@
+"""Drive 중복 탐지 및 batch 정리 테스트"""
+
+from unittest import mock
+
+import pytest
+
+from lib.google_docs import drive_crawler, drive_organizer
+from lib.google_docs.drive_batch import execute_batch
+from lib.google_docs.drive_organizer import DriveOrganizer, FileInfo, group_duplicates
+from lib.google_docs.tests.conftest import FakeDrive
+
+pytestmark = pytest.mark.usefixtures("unlimited_governor")
+
+DOC = "application/vnd.google-apps.document"
+
+
+def _info(file_id, name, md5="", size=0, mime="image/png", modified="2026-01-01"):
+    return FileInfo(id=file_id, name=name, mime_type=mime, size=size, modified_time=modified, md5_checksum=md5)
+
+
+def _raw(info: FileInfo) -> dict:
+    return {
+        "id": info.id, "name": info.name, "mimeType": info.mime_type, "size": str(info.size),
+        "modifiedTime": info.modified_time, "md5Checksum": info.md5_checksum,
+    }
+
+
+@pytest.fixture
+def make_organizer(store):
+    """FakeDrive를 사용하는 DriveOrganizer 생성 (크롤러 서비스는 지연 생성되므로 테스트 동안 patch 유지)"""
+    drives = []
+    with mock.patch.object(drive_organizer, "get_credentials", return_value=None), \
+            mock.patch.object(drive_organizer, "build", side_effect=lambda *a, **k: drives[-1]), \
+            mock.patch.object(drive_crawler, "get_sync_store", return_value=store):
+
+        def _make(drive: FakeDrive) -> DriveOrganizer:
+            drives.append(drive)
+            return DriveOrganizer("root", refresh=True)
+
+        yield _make
+
+
+class TestGroupDuplicates:
+
+    def test_checksum_and_size(self):
+        files = [
+            _info("a", "screenshot.png", md5="m1", size=10, modified="2026-01-02"),
+            _info("b", "screenshot (1).png", md5="m1", size=10),
+            _info("c", "screenshot.png", md5="m2", size=10),  # 같은 이름, 다른 내용
+            _info("d", "report.pdf", md5="m1", size=11, mime="application/pdf"),
+        ]
+        groups = group_duplicates(files)
+
+        assert len(groups) == 1
+        assert groups[0].reason == "checksum"
+        assert groups[0].keep.id == "a"
+        assert [f.id for f in groups[0].to_delete] == ["b"]
+
+    def test_google_files_by_similar_name(self):
+        files = [
+            _info("a", "PRD-0001 기획서", mime=DOC, modified="2026-01-02"),
+            _info("b", "PRD-0001 기획서의 사본", mime=DOC),
+            _info("c", "Copy of PRD-0001  기획서", mime=DOC),
+            _info("d", "PRD-0001 기획서", mime="application/vnd.google-apps.spreadsheet"),
+        ]
+        groups = group_duplicates(files)
+
+        assert [(g.reason, g.count) for g in groups] == [("name", 3)]
+
+    def test_empty_files_and_shortcuts_skipped(self):
+        empty_md5 = "d41d8cd98f00b204e9800998ecf8427e"
+        shortcut = "application/vnd.google-apps.shortcut"
+        files = [
+            _info("a", ".keep", md5=empty_md5, mime="application/octet-stream"),
+            _info("b", "__init__.py", md5=empty_md5, mime="text/x-python"),
+            _info("c", "placeholder.txt", md5=empty_md5, mime="text/plain"),
+            _info("d", "PRD-0001 기획서", mime=shortcut),
+            _info("e", "PRD-0001 기획서", mime=shortcut),
+        ]
+
+        assert group_duplicates(files) == []
+
+
+class TestDeleteDuplicates:
+
+    def test_batched_trash(self, make_organizer):
+        originals = [_info(f"o{i}", f"shot{i}.png", md5=f"m{i}", size=i + 1) for i in range(150)]
+        copies = [_info(f"c{i}", f"shot{i} (1).png", md5=f"m{i}", size=i + 1, modified="2025-12-31") for i in range(150)]
+        drive = FakeDrive.from_items([_raw(f) for f in originals + copies])
+
+        result = make_organizer(drive).delete_duplicates(dry_run=False)
+
+        assert result["files_to_delete"] == 150
+        assert len(result["deleted"]) == 150 and not result["errors"]
+        assert len(drive.batches) == 2
+        assert sorted(drive.trashed) == sorted(f.id for f in copies)
+
+    def test_similar_names_kept_by_default(self, make_organizer):
+        files = [_info("a", "문서", mime=DOC), _info("b", "문서의 사본", mime=DOC)]
+        drive = FakeDrive.from_items([_raw(f) for f in files])
+        organizer = make_organizer(drive)
+
+        assert organizer.delete_duplicates(dry_run=False)["files_to_delete"] == 0
+        assert len(organizer.delete_duplicates(dry_run=False, include_similar=True)["deleted"]) == 1
+
+
+class TestExecuteBatch:
+
+    def test_rate_limited_items_retried(self):
+        drive = FakeDrive.from_items([{"id": f"f{i}"} for i in range(5)], limited=2)
+        trash = {"trashed": True}
+        requests = {f"f{i}": drive.update(fileId=f"f{i}", body=trash) for i in range(5)}
+        requests["missing"] = drive.update(fileId="missing", body=trash)
+        sleeps = []
+
+        outcomes = execute_batch(drive, requests, sleep=sleeps.append)
+
+        assert [key for key, o in outcomes.items() if not o.ok] == ["missing"]
+        assert sorted(drive.trashed) == [f"f{i}" for i in range(5)]
+        assert len(drive.batches) == 2 and len(sleeps) == 1
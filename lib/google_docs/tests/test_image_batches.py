@@ -0,0 +1,99 @@
+"""이미지 placeholder 일괄 교체 테스트"""
+
+import pytest
+
+from lib.google_docs.benchmarks.api_calls import count_calls
+from lib.google_docs.converter import IMAGE_BATCH_SIZE, _replace_image_placeholders
+from lib.google_docs.doc_model import DocModel
+from lib.google_docs.planner import build_document_plan
+from lib.google_docs.rate_governor import track_calls
+
+pytestmark = pytest.mark.usefixtures("unlimited_governor")
+
+
+def _image_doc(count: int, bad: set[int] = frozenset()) -> str:
+    lines = ["# 이미지 문서", ""]
+    for i in range(count):
+        host = "bad.example.com" if i in bad else "example.com"
+        lines += [f"문단 {i}", "", f"![그림 {i}](https://{host}/{i}.png)", ""]
+    return "\n".join(lines)
+
+
+class FakeBatchUpdate:
+    """batchUpdate 요청 대체: 실패 URL이 있으면 배치 전체 실패 (원자성)"""
+
+    uri = "https://docs.googleapis.com/v1/documents/doc:batchUpdate"
+    method = "POST"
+
+    def __init__(self, model: DocModel, requests: list[dict]):
+        self._model = model
+        self._requests = requests
+
+    def execute(self):
+        for req in self._requests:
+            if "bad.example.com" in req.get("insertInlineImage", {}).get("uri", ""):
+                raise RuntimeError("invalid image")
+        self._model.apply(self._requests)
+        return {}
+
+
+class FakeDocsService:
+    def __init__(self, model: DocModel):
+        self.model = model
+
+    def documents(self):
+        return self
+
+    def batchUpdate(self, documentId, body):
+        return FakeBatchUpdate(self.model, body["requests"])
+
+
+def _run(content: str) -> tuple[FakeDocsService, tuple[int, int], int]:
+    plan = build_document_plan(content, apply_page_style=False)
+    service = FakeDocsService(DocModel().apply(plan.requests))
+    with track_calls() as calls:
+        result = _replace_image_placeholders(service, "doc", plan.images)
+    return service, result, calls.writes
+
+
+class TestReplaceImagePlaceholders:
+
+    def test_single_batch(self):
+        service, result, writes = _run(_image_doc(IMAGE_BATCH_SIZE))
+
+        assert result == (IMAGE_BATCH_SIZE, 0)
+        assert writes == 1
+        assert service.model.inline_object_count == IMAGE_BATCH_SIZE
+
+    def test_same_document_as_plan(self):
+        content = _image_doc(IMAGE_BATCH_SIZE + 5)
+        plan = build_document_plan(content, apply_page_style=False)
+        service, result, writes = _run(content)
+
+        assert writes == 2
+        assert plan.api_call_count == len(plan.batches()) + 2
+        assert service.model.to_document() == plan.model.to_document()
+
+    def test_only_failed_images_isolated(self):
+        service, result, writes = _run(_image_doc(16, bad={3, 11}))
+
+        assert result == (14, 2)
+        assert service.model.inline_object_count == 14
+        # 16 → 8+8 → 4+4 (x2) → 2+2 (x2) → 1+1 (x2): 실패한 배치만 분할
+        assert writes == 1 + 2 + 4 + 4 + 4
+        text = service.model.text_range(1, service.model.end_index)
+        assert "[🖼 그림 3]" in text and "[🖼 그림 11]" in text
+        assert "[🖼 그림 4]" not in text
+
+
+class TestWriteCount:
+
+    def test_document_write_calls_constant(self):
+        """이미지 수와 무관한 문서당 Docs 쓰기 호출 수"""
+        with track_calls() as small:
+            count_calls(_image_doc(5))
+        with track_calls() as large:
+            count_calls(_image_doc(IMAGE_BATCH_SIZE))
+
+        # 이미지 교체는 1회 (본문 요청 증가로 콘텐츠 배치만 최대 1회 추가)
+        assert small.writes <= large.writes <= small.writes + 1
@@ -0,0 +1,114 @@
+"""로컬 이미지 Drive 업로드 캐시 테스트"""
+
+import threading
+
+import pytest
+
+from lib.google_docs.image_cache import ImageUploadCache, file_sha256, upload_local_images
+from lib.google_docs.tests.conftest import FakeDrive
+
+pytestmark = pytest.mark.usefixtures("unlimited_governor")
+
+
+class FakeInserter:
+    """upload_to_drive 호출 기록 (스레드 안전), 업로드한 파일은 drive_service에 추가"""
+
+    def __init__(self, fail_names=(), drive_service=None):
+        self.uploads: list[str] = []
+        self.fail_names = set(fail_names)
+        self.drive_service = drive_service if drive_service is not None else FakeDrive()
+        self._lock = threading.Lock()
+
+    def upload_to_drive(self, file_path, folder_id=None, make_public=True, skip_duplicates=True):
+        assert skip_duplicates is False  # 이름 기반 Drive 검색 생략
+        if file_path.name in self.fail_names:
+            raise RuntimeError("upload failed")
+        with self._lock:
+            self.uploads.append(file_path.name)
+            n = len(self.uploads)
+            self.drive_service.files_by_id[f"file-{n}"] = {"name": file_path.name, "parents": [folder_id]}
+        return f"file-{n}", f"https://lh3.googleusercontent.com/d/file-{n}"
+
+
+def _images(tmp_path, count, prefix="img"):
+    images = []
+    for i in range(count):
+        path = tmp_path / f"{prefix}{i}.png"
+        path.write_bytes(b"\x89PNG" + str(i).encode())
+        images.append({"url": str(path), "is_local": True, "original_url": path.name})
+    return images
+
+
+class TestUploadLocalImages:
+
+    def test_regenerate_makes_no_uploads(self, tmp_path):
+        cache_path = tmp_path / "state.db"
+        inserter = FakeInserter()
+
+        first = _images(tmp_path, 60)
+        assert upload_local_images(lambda: inserter, first, "folder", ImageUploadCache(cache_path)) == 60
+        assert len(inserter.uploads) == 60
+        assert not any(img["is_local"] for img in first)
+
+        # 다시 생성 (같은 저장소에서 조회)
+        second = _images(tmp_path, 60)
+        assert upload_local_images(lambda: inserter, second, "folder", ImageUploadCache(cache_path)) == 0
+        assert len(inserter.uploads) == 60
+        assert [img["url"] for img in second] == [img["url"] for img in first]
+        # 캐시 확인은 files.get batch (100개당 HTTP 1회)
+        assert inserter.drive_service.batches == [60]
+
+    def test_deleted_drive_file_reuploaded(self, tmp_path):
+        cache = ImageUploadCache(tmp_path / "state.db")
+        inserter = FakeInserter()
+        images = _images(tmp_path, 3)
+        upload_local_images(lambda: inserter, images, "folder", cache)
+
+        # 중복 정리 등으로 Drive 파일 1개 삭제, 1개 휴지통 이동
+        del inserter.drive_service.files_by_id["file-1"]
+        inserter.drive_service.files_by_id["file-2"]["trashed"] = True
+
+        again = _images(tmp_path, 3)
+        assert upload_local_images(lambda: inserter, again, "folder", cache) == 2
+        assert len(inserter.uploads) == 5
+        assert all(not img["is_local"] for img in again)
+        dead = {f"https://lh3.googleusercontent.com/d/file-{n}" for n in (1, 2)}
+        assert not {img["url"] for img in again} & dead
+        assert len(cache) == 3
+
+    def test_same_content_uploaded_once(self, tmp_path):
+        inserter = FakeInserter()
+        a = tmp_path / "a.png"
+        b = tmp_path / "renamed.png"
+        a.write_bytes(b"same")
+        b.write_bytes(b"same")
+        images = [
+            {"url": str(a), "is_local": True},
+            {"url": str(b), "is_local": True},
+            {"url": "https://example.com/x.png", "is_local": False},
+        ]
+
+        assert upload_local_images(lambda: inserter, images, None, ImageUploadCache(tmp_path / "state.db")) == 1
+        assert images[0]["url"] == images[1]["url"]
+        assert images[2]["url"] == "https://example.com/x.png"
+
+    def test_failed_upload_not_cached(self, tmp_path):
+        cache = ImageUploadCache(tmp_path / "state.db")
+        images = _images(tmp_path, 3)
+
+        uploaded = upload_local_images(lambda: FakeInserter(fail_names={"img1.png"}), images, None, cache)
+
+        assert uploaded == 2
+        assert images[1]["is_local"] is True
+        assert cache.get(file_sha256(tmp_path / "img1.png")) is None
+        assert len(ImageUploadCache(tmp_path / "state.db")) == 2
+
+    def test_inserter_per_thread(self, tmp_path):
+        created = []
+
+        def factory():
+            created.append(threading.get_ident())
+            return FakeInserter()
+
+        upload_local_images(factory, _images(tmp_path, 12), None, ImageUploadCache(tmp_path / "state.db"), max_workers=3)
+        assert len(created) == len(set(created)) <= 3
@@ -0,0 +1,132 @@
+"""섹션 단위 증분 업데이트 테스트"""
+
+from lib.google_docs.benchmarks.incremental_update import move_section, update_calls
+from lib.google_docs.converter import _image_replace_requests, _parse_md_sections, _section_cache_entry
+from lib.google_docs.incremental import build_incremental_plan, section_keys
+from lib.google_docs.planner import build_document_plan
+
+from .test_planner import SAMPLE_MD
+
+DOC_MD = SAMPLE_MD + """
+## 0. 일정
+
+| 단계 | 기간 |
+|------|------|
+| 설계 | 1주 |
+
+## 1. 위험
+
+본문 텍스트 1.
+
+![위험도](https://example.com/risk.png)
+
+## 2. 부록
+
+```
+plain code
+```
+
+참고 [문서][ref]
+
+[ref]: https://example.com/ref
+"""
+
+
+def _body(content: str) -> list[dict]:
+    plan = build_document_plan(content, apply_page_style=False)
+    return plan.model.to_document()["body"]["content"]
+
+
+class TestSectionKeys:
+
+    def test_first_h1_is_title(self):
+        keys = section_keys([["__preamble__", 0, "a"], ["제목", 1, "b"], ["둘", 2, "c"], ["셋", 1, "d"]])
+        assert [key[3] for key in keys] == [False, True, False, False]
+
+
+class TestParseMdSections:
+
+    def test_has_table_follows_rendered_tables(self):
+        content = "\n".join([
+            "# 표", "이름 | 값", "--- | ---", "a | 1",
+            "## 코드", "```", "| 코드 안 | 표 |", "|---|---|", "# 주석", "```",
+            "## 구분선 없음", "| 한 줄 |",
+        ])
+        sections = _parse_md_sections(content)
+
+        assert [(s["heading"], s["has_table"]) for s in sections] == [
+            ("__preamble__", False), ("표", True), ("코드", False), ("구분선 없음", False),
+        ]
+
+
+class TestBuildIncrementalPlan:
+
+    def test_unchanged_document(self):
+        plan = build_incremental_plan(DOC_MD, _section_cache_entry(DOC_MD), _body(DOC_MD))
+        assert plan.regions == [] and plan.requests == []
+
+    def test_only_changed_section_written(self):
+        edited = DOC_MD.replace("본문 텍스트 1.", "본문 텍스트 1 (수정).")
+        plan = build_incremental_plan(edited, _section_cache_entry(DOC_MD), _body(DOC_MD))
+
+        assert plan.summary()["sections_written"] == 1
+        assert [r.headings for r in plan.regions] == [["1. 위험"]]
+        assert len(plan.images) == 1
+
+    def test_externally_edited_document(self):
+        """문서 제목 구조가 캐시와 다르면 None (전체 재작성)"""
+        body = _body(DOC_MD.replace("## 1. 위험", "## 1. 위험 (문서에서 직접 수정)"))
+        assert build_incremental_plan(DOC_MD, _section_cache_entry(DOC_MD), body) is None
+
+    def test_reference_link_change(self):
+        edited = DOC_MD.replace("https://example.com/ref", "https://example.com/other")
+        assert build_incremental_plan(edited, _section_cache_entry(DOC_MD), _body(DOC_MD)) is None
+
+    def test_legacy_cache_entry(self):
+        """section_list 없는 이전 형식: 문서 제목 순서로 복원"""
+        content = DOC_MD.split("참고 [문서]")[0]  # 이전 형식에는 참조 링크 해시가 없음
+        entry = _section_cache_entry(content)
+        legacy = {"full_hash": entry["full_hash"], "sections": entry["sections"]}
+        edited = content.replace("plain code", "changed code")
+
+        plan = build_incremental_plan(edited, legacy, _body(content))
+        assert [r.headings for r in plan.regions] == [["2. 부록"]]
+
+    def test_requests_apply_to_current_document(self):
+        """구간 요청 + 이미지 교체 결과 = 새 내용의 전체 렌더링"""
+        edited = (
+            "# 새 최상위 제목\n\n"
+            + DOC_MD.replace("| 설계 | 1주 |", "| 설계 | 2주 |\n| 구현 | 3주 |")
+        )
+        old = build_document_plan(DOC_MD, apply_page_style=False).model
+        plan = build_incremental_plan(edited, _section_cache_entry(DOC_MD), old.to_document()["body"]["content"])
+
+        model = old.apply(plan.requests)
+        for op in plan.images:
+            model.apply(_image_replace_requests(op))
+
+        expected = build_document_plan(edited, apply_page_style=False).model
+        assert model.to_document() == expected.to_document()
+
+
+class TestUpdateGoogleDoc:
+
+    def test_edit_in_table_section(self):
+        edited = DOC_MD.replace("| 설계 | 1주 |", "| 설계 | 2주 |")
+        incremental = update_calls(DOC_MD, edited)
+        full = update_calls(DOC_MD, edited, incremental=False)
+
+        assert incremental["matches"] and full["matches"]
+        assert incremental["get"] == 1
+        assert incremental["batchUpdate"] == 1
+        assert incremental["requests"] < full["requests"] // 3
+
+    def test_moved_section(self):
+        content = DOC_MD.replace("## 2. 부록", "## 3. 끝\n\n마지막\n\n## 2. 부록")
+        result = update_calls(content, move_section(content, 1))
+        assert result["matches"]
+        assert result["get"] == 1
+
+    def test_unchanged_content_skips_api(self):
+        result = update_calls(DOC_MD, DOC_MD)
+        assert result["batchUpdate"] == 0 and result["get"] == 0
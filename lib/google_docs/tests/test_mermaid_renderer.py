@@ -1,13 +1,49 @@
 """Mermaid 하이브리드 렌더러 테스트"""
 
 import os
+import sys
+import time
 
+import pytest
 from unittest.mock import patch, MagicMock
 
 # Test constants
 SAMPLE_MERMAID = "graph TD\n    A[Start] --> B[End]"
 FAKE_PNG_DATA = b"\x89PNG\r\n\x1a\n" + b"\x00" * 100
 
+# mmdc 호환 대체 명령: -i 코드를 -o 경로에 PNG 헤더와 함께 기록
+FAKE_MMDC = """
+import sys
+args = sys.argv[1:]
+src = open(args[args.index("-i") + 1], "rb").read()
+if b"FAIL" in src:
+    sys.exit(1)
+open(args[args.index("-o") + 1], "wb").write(b"\\x89PNG\\r\\n\\x1a\\n" + src)
+"""
+
+
+@pytest.fixture(autouse=True)
+def mermaid_cache_dir(tmp_path, monkeypatch):
+    """테스트마다 빈 캐시 디렉토리 사용"""
+    cache_dir = tmp_path / "mermaid_cache"
+    monkeypatch.setenv("MERMAID_CACHE_DIR", str(cache_dir))
+    monkeypatch.delenv("MERMAID_MMDC", raising=False)
+    monkeypatch.delenv("MERMAID_STRATEGIES", raising=False)
+    return cache_dir
+
+
+@pytest.fixture
+def fake_mmdc(tmp_path, monkeypatch):
+    """오프라인 mmdc 대체 명령 (mmdc 전략만 사용)"""
+    script = tmp_path / "fake_mmdc.py"
+    script.write_text(FAKE_MMDC)
+    wrapper = tmp_path / "mmdc"
+    wrapper.write_text(f'#!/bin/sh\nexec "{sys.executable}" "{script}" "$@"\n')
+    wrapper.chmod(0o755)
+    monkeypatch.setenv("MERMAID_MMDC", str(wrapper))
+    monkeypatch.setenv("MERMAID_STRATEGIES", "mmdc")
+    return wrapper
+
 
 # --- Mermaid.ink 전략 테스트 ---
 
@@ -347,3 +383,117 @@ class TestCleanup:
         # 정리
         os.unlink(result)
         assert not os.path.exists(result)
+
+
+# --- 캐시 / 사전 렌더링 테스트 ---
+
+
+class TestMermaidCache:
+
+    def test_key_includes_render_options(self):
+        from lib.google_docs import mermaid_renderer
+
+        key = mermaid_renderer.cache_key(SAMPLE_MERMAID)
+        assert key == mermaid_renderer.cache_key(SAMPLE_MERMAID)
+        assert key != mermaid_renderer.cache_key(SAMPLE_MERMAID + " ")
+        with patch.object(mermaid_renderer, "RENDER_WIDTH", 1024):
+            assert key != mermaid_renderer.cache_key(SAMPLE_MERMAID)
+
+    def test_hit_skips_render(self, fake_mmdc, mermaid_cache_dir):
+        from lib.google_docs.mermaid_renderer import render_mermaid
+
+        first = render_mermaid(SAMPLE_MERMAID)
+        assert len(list(mermaid_cache_dir.glob("*.png"))) == 1
+
+        with patch("lib.google_docs.mermaid_renderer._render_via_mmdc") as mock_mmdc:
+            second = render_mermaid(SAMPLE_MERMAID)
+        mock_mmdc.assert_not_called()
+
+        # 캐시 적중 시에도 호출자가 삭제할 수 있는 별도 사본
+        assert second != first
+        with open(first, "rb") as f1, open(second, "rb") as f2:
+            assert f1.read() == f2.read()
+        os.unlink(first)
+        os.unlink(second)
+        assert len(list(mermaid_cache_dir.glob("*.png"))) == 1
+
+    def test_disabled_by_empty_dir(self, fake_mmdc, monkeypatch, mermaid_cache_dir):
+        from lib.google_docs.mermaid_renderer import render_mermaid
+
+        monkeypatch.setenv("MERMAID_CACHE_DIR", "")
+        os.unlink(render_mermaid(SAMPLE_MERMAID))
+        assert not mermaid_cache_dir.exists()
+
+    def test_lru_eviction(self, tmp_path):
+        from lib.google_docs.mermaid_renderer import MermaidCache
+
+        src = tmp_path / "src.png"
+        src.write_bytes(b"x" * 100)
+        cache = MermaidCache(tmp_path / "cache", max_bytes=250)
+
+        cache.put("a", str(src))
+        cache.put("b", str(src))
+        # a를 최근 사용으로 갱신 → c 추가 시 b가 제거됨
+        past = time.time() - 60
+        os.utime(cache.directory / "b.png", (past, past))
+        os.utime(cache.directory / "a.png", (past - 60, past - 60))
+        assert cache.get("a") is not None
+        cache.put("c", str(src))
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+
+
+class TestPrerender:
+
+    def test_renders_unique_codes_once(self, fake_mmdc, mermaid_cache_dir):
+        from lib.google_docs.mermaid_renderer import prerender_mermaid
+
+        codes = [f"graph TD\n    A{i} --> B" for i in range(6)]
+        results = prerender_mermaid(codes + codes[:2] + ["graph TD\n    FAIL"])
+
+        assert len(results) == 7
+        assert results["graph TD\n    FAIL"] is False
+        assert sum(results.values()) == 6
+        assert len(list(mermaid_cache_dir.glob("*.png"))) == 6
+
+        # 두 번째 실행은 모두 캐시 적중
+        with patch("lib.google_docs.mermaid_renderer._render_via_mmdc") as mock_mmdc:
+            assert all(prerender_mermaid(codes).values())
+        mock_mmdc.assert_not_called()
+
+    def test_failed_cache_write_reported(self, fake_mmdc, mermaid_cache_dir):
+        from lib.google_docs.mermaid_renderer import MermaidCache, prerender_mermaid
+
+        rendered = []
+
+        def put(self, key, png_path):
+            rendered.append(png_path)
+            return None  # 디스크 오류 등
+
+        with patch.object(MermaidCache, "put", put):
+            assert prerender_mermaid([SAMPLE_MERMAID]) == {SAMPLE_MERMAID: False}
+        assert len(rendered) == 1 and not os.path.exists(rendered[0])
+
+
+    def test_converter_uses_prerendered(self, fake_mmdc):
+        """파싱 중에는 캐시 사본만 사용, 실패한 다이어그램은 재시도 안 함"""
+        from lib.google_docs import mermaid_renderer
+        from lib.google_docs.converter import MarkdownToDocsConverter
+
+        content = "# 다이어그램\n\n```mermaid\ngraph TD\n    A --> B\n```\n\n```mermaid\nFAIL\n```\n"
+        converter = MarkdownToDocsConverter(content, plan=True)
+
+        with patch.object(
+            mermaid_renderer, "_render_via_mmdc", wraps=mermaid_renderer._render_via_mmdc
+        ) as spy:
+            converter.parse()
+
+        try:
+            assert spy.call_count == 2  # 사전 렌더링 2회, 파싱 중 0회
+            assert len(converter._mermaid_temp_files) == 1
+            assert converter._mermaid_failed == {"FAIL"}
+        finally:
+            for path in converter._mermaid_temp_files:
+                os.unlink(path)
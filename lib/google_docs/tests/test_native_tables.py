@@ -0,0 +1,113 @@
+"""네이티브 테이블 일괄 삽입 (계산된 셀 인덱스 + 역순 삽입) 테스트"""
+
+from unittest.mock import MagicMock, patch
+
+from lib.google_docs.converter import MarkdownToDocsConverter
+from lib.google_docs.doc_model import DocModel
+from lib.google_docs.table_renderer import NativeTableRenderer
+
+from .test_planner import SAMPLE_MD
+
+TABLE_LINES = [
+    "| 이름 | 설명 |",
+    "|------|------|",
+    "| **굵게** | `코드` 🙂 |",
+]
+
+# 연속 테이블 + 이미지 + 언어 없는 코드 블록
+MULTI_MD = SAMPLE_MD + """
+| a | b |
+|---|---|
+| 1 | 2 |
+| x | y |
+|---|---|
+| 3 | 4 |
+
+## 끝
+```
+plain
+
+code
+```
+![두번째](https://example.com/second.png)
+"""
+
+
+class TestCalculatedIndices:
+
+    def test_empty_table_element_matches_model(self):
+        renderer = NativeTableRenderer()
+        table_data = renderer.parse_markdown_table(TABLE_LINES)
+
+        model = DocModel().apply([renderer.render_table_structure(table_data, 1)])
+        assert renderer.empty_table_element(table_data, 2) == model.table_at(2)
+
+    def test_table_end_index_uses_plain_text(self):
+        """마크다운 제거 + UTF-16 길이 기준"""
+        renderer = NativeTableRenderer()
+        table_data = renderer.parse_markdown_table(TABLE_LINES)
+
+        model = DocModel().apply(renderer.render_table_at(table_data, 1))
+        table = model.table_at(2)
+        assert renderer._calc_table_end_index(2, table_data) == table["endIndex"]
+
+
+class TestMeasurement:
+
+    def test_cells_parsed_once_per_table(self):
+        renderer = NativeTableRenderer()
+        table_data = renderer.parse_markdown_table(TABLE_LINES)
+
+        with patch.object(
+            renderer, "_parse_cell_inline_formatting", wraps=renderer._parse_cell_inline_formatting
+        ) as parse:
+            requests = renderer.render_table_at(table_data, 1)
+            renderer._calc_table_end_index(2, table_data)
+        assert parse.call_count == 4
+        # 측정 결과의 UTF-16 길이 = 실제 삽입 텍스트
+        model = DocModel().apply(requests)
+        assert renderer._calc_table_end_index(2, table_data) == model.table_at(2)["endIndex"]
+
+    def test_text_width_by_char_class(self):
+        renderer = NativeTableRenderer()
+        ascii_w, cjk_w, padding = (
+            renderer.CHAR_WIDTH_PT_ASCII, renderer.CHAR_WIDTH_PT_CJK, renderer.CELL_PADDING_PT * 2,
+        )
+        assert renderer._calculate_text_width_pt("") == 0.0
+        assert renderer._calculate_text_width_pt("ab c") == 4 * ascii_w + padding
+        # 한글 2 + 한자 1 + 가나 1 + 전각 1 → 전각폭, 이모지/악센트 → ASCII폭
+        assert renderer._calculate_text_width_pt("한글漢あＡé🙂") == 5 * cjk_w + 2 * ascii_w + padding
+
+
+class TestDeferredTables:
+
+    def test_same_document_as_sequential_plan(self):
+        """역순 일괄 삽입 결과 = 순차 삽입(plan 모드) 결과"""
+        service = MagicMock()
+        converter = MarkdownToDocsConverter(MULTI_MD, docs_service=service, doc_id="doc")
+        requests = converter.parse()
+
+        planned = MarkdownToDocsConverter(MULTI_MD, plan=True)
+        planned.parse()
+
+        model = DocModel().apply(requests)
+        assert model.table_count == 4
+        assert model.to_document() == planned.doc_model.to_document()
+        assert [img["index"] for img in converter._pending_images] == [
+            img["index"] for img in planned._pending_images
+        ]
+        assert converter.current_index == model.end_index - 1
+        service.documents.assert_not_called()
+
+    def test_tables_appended_back_to_front(self):
+        converter = MarkdownToDocsConverter(MULTI_MD, docs_service=MagicMock(), doc_id="doc")
+        requests = converter.parse()
+
+        locations = [
+            req["insertTable"]["location"]["index"] for req in requests if "insertTable" in req
+        ]
+        assert locations == sorted(locations, reverse=True)
+
+        # 본문 요청이 모두 끝난 뒤 테이블 요청만 이어짐
+        first = next(i for i, req in enumerate(requests) if "insertTable" in req)
+        assert not any("updateParagraphStyle" in req for req in requests[first:])
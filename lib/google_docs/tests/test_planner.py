@@ -0,0 +1,89 @@
+"""오프라인 요청 계획 (plan 모드) 테스트"""
+
+from unittest.mock import MagicMock
+
+from lib.google_docs.doc_model import DocModel
+from lib.google_docs.planner import build_document_plan, execute_document_plan
+
+SAMPLE_MD = """# 제품 요구사항 🚀
+
+개요 **굵게** 와 `code`.
+
+## 기능
+
+| 항목 | 설명 |
+|------|------|
+| **로그인** | `OAuth` 지원 🙂 |
+| 검색 | 전문 검색 |
+
+```python
+def hello():
+    return "world"
+```
+
+![구성도](https://example.com/arch.png)
+
+- 마지막 항목
+"""
+
+
+def _table_texts(table):
+    return [
+        [
+            "".join(
+                el["textRun"]["content"]
+                for para in cell["content"]
+                for el in para["paragraph"]["elements"]
+            )
+            for cell in row["tableCells"]
+        ]
+        for row in table["table"]["tableRows"]
+    ]
+
+
+class TestBuildDocumentPlan:
+
+    def test_requests_replay_on_fresh_model(self):
+        """계획된 콘텐츠 요청은 빈 문서에 그대로 적용 가능"""
+        plan = build_document_plan(SAMPLE_MD)
+
+        replay = DocModel().apply(plan.requests)
+        assert replay.table_count == 2  # 표 + 코드 블록
+        assert plan.summary()["batches"] == 1
+
+    def test_table_cells_filled(self):
+        plan = build_document_plan(SAMPLE_MD, apply_page_style=False)
+        tables = [
+            el for el in plan.model.to_document()["body"]["content"] if "table" in el
+        ]
+
+        assert _table_texts(tables[0]) == [
+            ["항목\n", "설명\n"],
+            ["로그인\n", "OAuth 지원 🙂\n"],
+            ["검색\n", "전문 검색\n"],
+        ]
+        assert _table_texts(tables[1]) == [
+            ["📄 PYTHON\n"],
+            ['def hello():\n    return "world"\n'],
+        ]
+
+    def test_image_operations(self):
+        plan = build_document_plan(SAMPLE_MD)
+
+        assert len(plan.images) == 1
+        assert plan.images[0]["delete_length"] == len("[🖼 구성도]") + 1  # 🖼 = 2 유닛
+        assert plan.model.inline_object_count == 1
+
+
+class TestExecuteDocumentPlan:
+
+    def test_minimal_calls(self):
+        """콘텐츠 1회 + 이미지 1회 batchUpdate, documents().get 없음"""
+        plan = build_document_plan(SAMPLE_MD)
+        service = MagicMock()
+
+        result = execute_document_plan(service, "doc", plan)
+
+        assert result == {"batches": 1, "images_inserted": 1, "images_failed": 0}
+        assert service.documents().batchUpdate.call_count == 2
+        service.documents().get.assert_not_called()
@@ -0,0 +1,141 @@
+"""전역 API 속도 조절기 (RateGovernor) 테스트"""
+
+import asyncio
+
+import httplib2
+import pytest
+from googleapiclient.errors import HttpError
+
+from lib.google_docs.rate_governor import RateGovernor, classify_request
+
+
+class FakeClock:
+    """time.monotonic / time.sleep 대체 (sleep하면 시계가 진행)"""
+
+    def __init__(self):
+        self.now = 0.0
+        self.slept: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+class FakeRequest:
+    def __init__(self, results, uri="https://docs.googleapis.com/v1/documents/d:batchUpdate", method="POST"):
+        self.uri = uri
+        self.method = method
+        self._results = list(results)
+        self.calls = 0
+
+    def execute(self):
+        self.calls += 1
+        result = self._results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+def _http_error(status: int, content: bytes = b"", headers: dict | None = None) -> HttpError:
+    resp = httplib2.Response({"status": status, **(headers or {})})
+    return HttpError(resp, content)
+
+
+def _governor(clock: FakeClock, **kwargs) -> RateGovernor:
+    return RateGovernor(clock=clock, sleep=clock.sleep, **kwargs)
+
+
+class TestClassify:
+
+    @pytest.mark.parametrize(
+        "uri, method, expected",
+        [
+            ("https://docs.googleapis.com/v1/documents/x", "GET", "docs_read"),
+            ("https://docs.googleapis.com/v1/documents/x:batchUpdate", "POST", "docs_write"),
+            ("https://www.googleapis.com/drive/v3/files?q=x", "GET", "drive"),
+            ("https://www.googleapis.com/upload/drive/v3/files", "POST", "drive"),
+            ("https://sheets.googleapis.com/v4/spreadsheets/x", "GET", "sheets"),
+        ],
+    )
+    def test_buckets(self, uri, method, expected):
+        assert classify_request(FakeRequest([], uri=uri, method=method)) == expected
+
+    def test_unknown_request(self):
+        assert classify_request(object()) == "default"
+
+
+class TestPacing:
+
+    def test_burst_then_rate(self):
+        clock = FakeClock()
+        governor = _governor(clock, rates={"docs_write": 2.0}, burst=2)
+
+        for _ in range(4):
+            governor.execute(FakeRequest([{}]))
+
+        # 버스트 2회는 즉시, 이후 0.5초 간격
+        assert clock.slept == [0.5, 0.5]
+        metrics = governor.metrics()["docs_write"]
+        assert metrics["calls"] == 4
+        assert metrics["queued_seconds"] == pytest.approx(1.0)
+
+
+class TestAdaptiveBackoff:
+
+    def test_429_retry_halves_rate(self):
+        clock = FakeClock()
+        governor = _governor(clock, rates={"docs_write": 2.0})
+        request = FakeRequest([_http_error(429, headers={"retry-after": "3"}), {"ok": True}])
+
+        assert governor.execute(request) == {"ok": True}
+        assert request.calls == 2
+        assert clock.slept == [3.0]  # Retry-After 우선
+        assert governor.metrics()["docs_write"]["throttled"] == 1
+        # 절반으로 낮춘 뒤 성공 1회만큼 회복
+        assert governor.current_rate("docs_write") == pytest.approx(1.0 + 0.2)
+
+    def test_cooldown_shared_by_bucket(self):
+        """한 호출의 429가 같은 버킷의 다른 호출도 멈춤"""
+        clock = FakeClock()
+        governor = _governor(clock, rates={"docs_write": 100.0}, max_retries=1)
+
+        with pytest.raises(HttpError):
+            governor.execute(FakeRequest([_http_error(429, headers={"retry-after": "5"})]))
+        assert governor.reserve("docs_write") == pytest.approx(5.0)
+        assert governor.reserve("docs_read") == 0.0
+
+    def test_403_rate_limit_reason(self):
+        clock = FakeClock()
+        governor = _governor(clock)
+        error = _http_error(403, b'{"error": {"errors": [{"reason": "userRateLimitExceeded"}]}}')
+        request = FakeRequest([error, {}], uri="https://www.googleapis.com/drive/v3/files", method="GET")
+
+        governor.execute(request)
+        assert request.calls == 2
+        assert governor.metrics()["drive"]["throttled"] == 1
+
+    def test_other_errors_not_retried(self):
+        clock = FakeClock()
+        governor = _governor(clock)
+        request = FakeRequest([_http_error(404)])
+
+        with pytest.raises(HttpError):
+            governor.execute(request)
+        assert request.calls == 1
+        assert clock.slept == []
+
+
+class TestAsync:
+
+    def test_execute_async(self):
+        governor = RateGovernor()
+
+        async def run():
+            requests = [FakeRequest([{"n": i}]) for i in range(3)]
+            return await asyncio.gather(*(governor.execute_async(r) for r in requests))
+
+        assert asyncio.run(run()) == [{"n": 0}, {"n": 1}, {"n": 2}]
+        assert governor.metrics()["docs_write"]["calls"] == 3
@@ -0,0 +1,101 @@
+"""동기화 상태 저장소 테스트"""
+
+import json
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+from lib.google_docs.converter import _section_cache_entry
+from lib.google_docs.sync_state import LEGACY_HASH_CACHE, LEGACY_IMAGE_CACHE, SyncStateStore
+
+CONTENT = "# 제목\n\n본문\n\n## 1. 개요\n\n내용\n"
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+
+# 별도 프로세스에서 실행할 쓰기 작업 (argv: DB 경로, worker 번호, 항목 수)
+WRITER = """
+import sys
+from lib.google_docs.sync_state import SyncStateStore
+
+path, worker, count = sys.argv[1], int(sys.argv[2]), int(sys.argv[3])
+store = SyncStateStore(path)
+for i in range(count):
+    store.put_doc(f"doc-{worker}-{i}", {"full_hash": f"{worker}:{i}"})
+"""
+
+
+class TestDocs:
+
+    def test_round_trip(self, tmp_path):
+        store = SyncStateStore(tmp_path / "state.db")
+        entry = _section_cache_entry(CONTENT)
+        store.put_doc("doc", entry)
+
+        assert store.get_doc("doc") == entry
+        assert store.get_doc("missing") is None
+
+    def test_revision_kept_on_content_update(self, tmp_path):
+        store = SyncStateStore(tmp_path / "state.db")
+        store.put_doc("doc", {**_section_cache_entry(CONTENT), "revision_id": "r1"})
+        store.put_doc("doc", _section_cache_entry(CONTENT + "추가\n"))
+
+        assert store.get_doc("doc")["revision_id"] == "r1"
+        store.set_revision("doc", "r2")
+        assert store.get_doc("doc")["revision_id"] == "r2"
+
+
+class TestMigration:
+
+    def test_json_caches_imported_once(self, tmp_path):
+        entry = _section_cache_entry(CONTENT)
+        (tmp_path / LEGACY_HASH_CACHE).write_text(json.dumps({"doc": entry}), encoding="utf-8")
+        (tmp_path / LEGACY_IMAGE_CACHE).write_text(
+            json.dumps({"abc": {"file_id": "f1", "url": "https://x/f1", "name": "a.png"}}),
+            encoding="utf-8",
+        )
+
+        store = SyncStateStore(tmp_path / "state.db")
+        assert store.get_doc("doc") == entry
+        assert store.get_image("abc") == ("f1", "https://x/f1")
+
+        # 가져온 뒤의 JSON 변경은 반영하지 않음
+        store.delete_doc("doc")
+        store.close()
+        assert SyncStateStore(tmp_path / "state.db").get_doc("doc") is None
+
+
+class TestConcurrency:
+
+    def test_threads_do_not_lose_entries(self, tmp_path):
+        store = SyncStateStore(tmp_path / "state.db")
+
+        def work(worker: int) -> None:
+            for i in range(50):
+                store.put_doc(f"doc-{worker}-{i}", {"full_hash": str(i)})
+                store.put_image(f"{worker}-{i}", f"file-{i}", f"https://x/{i}")
+
+        threads = [threading.Thread(target=work, args=(n,)) for n in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert store.image_count() == 400
+        assert all(store.get_doc(f"doc-{n}-49") for n in range(8))
+
+    def test_processes_do_not_lose_entries(self, tmp_path):
+        path = tmp_path / "state.db"
+        SyncStateStore(path).close()
+
+        procs = [
+            subprocess.Popen([sys.executable, "-c", WRITER, str(path), str(n), "30"], cwd=REPO_ROOT)
+            for n in range(4)
+        ]
+        assert [p.wait(timeout=60) for p in procs] == [0] * 4
+
+        store = SyncStateStore(path)
+        assert all(
+            store.get_doc(f"doc-{n}-{i}") == {"full_hash": f"{n}:{i}"}
+            for n in range(4) for i in range(30)
+        )
@@ -0,0 +1,22 @@
+"""
+마크다운 블록 토크나이저 - 공통 모듈
+
+Google Docs 변환기, 섹션 해시, PDF 청커가 공유하는 단일 패스 블록 토크나이저.
+
+Usage:
+    from lib.md_blocks import tokenize, MdBlockKind
+
+    for block in tokenize(markdown):
+        if block.kind is MdBlockKind.HEADING:
+            print(block.level, block.text)
+"""
+
+from .tokenizer import MdBlock, MdBlockKind, iter_blocks, split_lines, tokenize
+
+__all__ = [
+    "MdBlock",
+    "MdBlockKind",
+    "iter_blocks",
+    "split_lines",
+    "tokenize",
+]
@@ -0,0 +1,87 @@
+"""마크다운 블록 토크나이저 테스트"""
+
+from lib.md_blocks import MdBlockKind, split_lines, tokenize
+
+
+def kinds(md: str) -> list[MdBlockKind]:
+    return [b.kind for b in tokenize(md)]
+
+
+class TestBlockKinds:
+
+    def test_heading_level_and_text(self):
+        block = tokenize("### 제목 3  ")[0]
+        assert block.kind is MdBlockKind.HEADING
+        assert block.level == 3
+        assert block.text == "제목 3"
+
+    def test_list_items(self):
+        blocks = tokenize("- 항목\n* 별표\n+ 플러스\n1. 번호\n- [x] 완료\n- [ ] 할 일")
+        assert [b.kind for b in blocks] == [
+            MdBlockKind.BULLET,
+            MdBlockKind.BULLET,
+            MdBlockKind.BULLET,
+            MdBlockKind.NUMBERED,
+            MdBlockKind.CHECKLIST,
+            MdBlockKind.CHECKLIST,
+        ]
+        assert blocks[3].number == "1"
+        assert blocks[3].text == "번호"
+        assert blocks[4].checked is True
+        assert blocks[5].checked is False
+        assert blocks[5].text == "할 일"
+
+    def test_quote_hr_blank_text(self):
+        assert kinds("> 인용\n---\n\n본문") == [
+            MdBlockKind.QUOTE,
+            MdBlockKind.HR,
+            MdBlockKind.BLANK,
+            MdBlockKind.TEXT,
+        ]
+
+    def test_standalone_and_linked_image(self):
+        plain, linked = tokenize("![alt](a.png)\n[![로고](b.png)](https://x.com)")
+        assert (plain.kind, plain.text, plain.url) == (MdBlockKind.IMAGE, "alt", "a.png")
+        assert (linked.kind, linked.text, linked.url) == (MdBlockKind.IMAGE, "로고", "b.png")
+
+    def test_inline_image_is_text(self):
+        assert kinds("앞 ![alt](a.png) 뒤") == [MdBlockKind.TEXT]
+
+
+class TestMultiLineBlocks:
+
+    def test_table_spans_all_pipe_rows(self):
+        md = "| A | B |\n|---|---|\n| 1 | 2 |\n| 3 | 4 |\n다음"
+        table, text = tokenize(md)
+        assert table.kind is MdBlockKind.TABLE
+        assert (table.start, table.end) == (0, 4)
+        assert table.lines[-1] == "| 3 | 4 |"
+        assert text.kind is MdBlockKind.TEXT
+
+    def test_pipe_without_separator_is_text(self):
+        assert kinds("a | b\n일반 줄") == [MdBlockKind.TEXT, MdBlockKind.TEXT]
+
+    def test_fence_hides_markdown_inside(self):
+        md = "```bash\n# 주석\n- 항목\n```\n# 제목"
+        fence, heading = tokenize(md)
+        assert fence.kind is MdBlockKind.FENCE
+        assert fence.lang == "bash"
+        assert fence.text == "# 주석\n- 항목"
+        assert fence.raw == "```bash\n# 주석\n- 항목\n```"
+        assert heading.kind is MdBlockKind.HEADING
+
+    def test_unclosed_fence_runs_to_end(self):
+        fence, = tokenize("```\ncode\nmore")
+        assert fence.end == 3
+        assert fence.text == "code\nmore"
+
+
+def test_split_lines_normalizes_newlines():
+    assert split_lines("a\r\nb\rc\nd") == ["a", "b", "c", "d"]
+
+
+def test_block_ranges_cover_every_line():
+    md = "# T\n\n| a | b |\n|---|---|\n\n```\nx\n```\ntext"
+    blocks = tokenize(md)
+    covered = [i for b in blocks for i in range(b.start, b.end)]
+    assert covered == list(range(len(split_lines(md))))
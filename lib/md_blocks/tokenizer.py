@@ -0,0 +1,207 @@
+"""
+마크다운 블록 토크나이저
+
+문서를 한 번만 순회하여 타입이 지정된 블록 스트림을 생성합니다.
+MarkdownToDocsConverter.parse(), _parse_md_sections(), MDParser가
+같은 토큰 스트림을 공유하여 동일한 마크다운을 반복 토큰화하지 않습니다.
+
+블록 문법 (우선순위 순):
+    FENCE      ``` 로 시작하는 줄 ~ 닫는 ``` (들여쓰기 허용)
+    HEADING    # 로 시작하는 줄 (level = 선행 # 개수)
+    TABLE      | 포함 줄 + 다음 줄에 --- 또는 :- → | 포함 줄이 끝날 때까지
+    CHECKLIST  - [ ] / - [x] / - [X]
+    BULLET     - / * / + 글머리 기호
+    NUMBERED   1. 텍스트
+    QUOTE      > 인용
+    HR         --- / *** / ___
+    IMAGE      ![alt](url) 또는 [![alt](url)](link) 단독 줄
+    BLANK      빈 줄
+    TEXT       그 외
+"""
+
+import re
+from dataclasses import dataclass
+from enum import Enum
+from typing import Iterator
+
+
+class MdBlockKind(Enum):
+    BLANK = "blank"
+    TEXT = "text"
+    HEADING = "heading"
+    FENCE = "fence"
+    TABLE = "table"
+    CHECKLIST = "checklist"
+    BULLET = "bullet"
+    NUMBERED = "numbered"
+    QUOTE = "quote"
+    HR = "hr"
+    IMAGE = "image"
+
+
+@dataclass(slots=True)
+class MdBlock:
+    """토큰화된 마크다운 블록
+
+    start/end는 원본 줄 번호 범위 (end 미포함)입니다.
+    원본 줄은 복사하지 않고 source 참조로 보관하며 lines/raw에서 잘라 씁니다.
+    """
+
+    kind: MdBlockKind
+    start: int
+    end: int
+    source: list[str]
+    text: str = ""       # HEADING/리스트/QUOTE/TEXT: 본문, FENCE: 코드 내용, IMAGE: alt
+    level: int = 0       # HEADING: 선행 # 개수
+    lang: str = ""       # FENCE: 언어 태그
+    checked: bool = False  # CHECKLIST: 체크 여부
+    number: str = ""     # NUMBERED: 번호
+    url: str = ""        # IMAGE: 이미지 URL
+
+    @property
+    def line(self) -> str:
+        """블록 첫 줄 (단일 줄 블록의 원본)"""
+        return self.source[self.start]
+
+    @property
+    def lines(self) -> list[str]:
+        """블록 원본 줄 목록"""
+        return self.source[self.start:self.end]
+
+    @property
+    def raw(self) -> str:
+        """블록 원본 텍스트"""
+        return "\n".join(self.source[self.start:self.end])
+
+
+# 토큰화 루프용 로컬 별칭
+_BLANK, _TEXT, _HEADING, _FENCE, _TABLE = (
+    MdBlockKind.BLANK, MdBlockKind.TEXT, MdBlockKind.HEADING,
+    MdBlockKind.FENCE, MdBlockKind.TABLE,
+)
+_CHECKLIST, _BULLET, _NUMBERED, _QUOTE, _HR, _IMAGE = (
+    MdBlockKind.CHECKLIST, MdBlockKind.BULLET, MdBlockKind.NUMBERED,
+    MdBlockKind.QUOTE, MdBlockKind.HR, MdBlockKind.IMAGE,
+)
+
+_NUMBERED_RE = re.compile(r"^(\d+)\.\s+(.+)$")
+_IMAGE_RE = re.compile(r"^\s*!\[([^\]]*)\]\(([^)]+)\)\s*$")
+_LINKED_IMAGE_RE = re.compile(r"^\s*\[!\[([^\]]*)\]\(([^)]+)\)\]\([^)]*\)\s*$")
+
+_HR_LINES = frozenset(("---", "***", "___"))
+_CHECKLIST_PREFIXES = ("- [ ]", "- [x]", "- [X]")
+_BULLET_PREFIXES = ("- ", "* ", "+ ")
+
+
+def split_lines(content: str) -> list[str]:
+    """줄바꿈 정규화 후 줄 단위 분할 (\\r\\n, \\r → \\n)"""
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+    return content.split("\n")
+
+
+def _is_table_separator(line: str) -> bool:
+    return "---" in line or ":-" in line
+
+
+def iter_blocks(lines: list[str]) -> Iterator[MdBlock]:
+    """줄 목록을 단일 패스로 순회하며 MdBlock을 생성
+
+    Args:
+        lines: split_lines()로 분할된 줄 목록
+
+    Yields:
+        MdBlock (문서 순서)
+    """
+    n = len(lines)
+    i = 0
+    while i < n:
+        line = lines[i]
+        stripped = line.strip()
+
+        if not stripped:
+            yield MdBlock(_BLANK, i, i + 1, lines)
+            i += 1
+            continue
+
+        first = stripped[0]
+
+        # 코드 블록
+        if first == "`" and stripped.startswith("```"):
+            start = i
+            i += 1
+            while i < n and not lines[i].lstrip().startswith("```"):
+                i += 1
+            closed = i < n
+            body = "\n".join(lines[start + 1:i])
+            if closed:
+                i += 1
+            yield MdBlock(_FENCE, start, i, lines, body, 0, stripped[3:].strip())
+            continue
+
+        # 제목
+        if line[0] == "#":
+            hashes = len(line) - len(line.lstrip("#"))
+            yield MdBlock(_HEADING, i, i + 1, lines, line.lstrip("#").strip(), hashes)
+            i += 1
+            continue
+
+        # 테이블
+        if "|" in line and i + 1 < n and _is_table_separator(lines[i + 1]):
+            start = i
+            while i < n and "|" in lines[i]:
+                i += 1
+            yield MdBlock(_TABLE, start, i, lines)
+            continue
+
+        if first in "-*+":
+            # 체크리스트
+            if stripped.startswith(_CHECKLIST_PREFIXES):
+                yield MdBlock(
+                    _CHECKLIST, i, i + 1, lines, stripped[5:].strip(),
+                    checked="x" in stripped[3:5].lower(),
+                )
+                i += 1
+                continue
+
+            # 글머리 기호 리스트
+            if stripped.startswith(_BULLET_PREFIXES):
+                yield MdBlock(_BULLET, i, i + 1, lines, stripped[2:])
+                i += 1
+                continue
+
+        # 번호 리스트
+        elif first.isdigit():
+            m = _NUMBERED_RE.match(stripped)
+            if m:
+                yield MdBlock(_NUMBERED, i, i + 1, lines, m.group(2), number=m.group(1))
+                i += 1
+                continue
+
+        # 인용문
+        elif first == ">":
+            yield MdBlock(_QUOTE, i, i + 1, lines, stripped[1:].strip())
+            i += 1
+            continue
+
+        # 수평선
+        if stripped in _HR_LINES:
+            yield MdBlock(_HR, i, i + 1, lines)
+            i += 1
+            continue
+
+        # 단독 이미지 줄: ![alt](url) / [![alt](url)](link)
+        if first == "!" or first == "[":
+            m = _IMAGE_RE.match(line) or _LINKED_IMAGE_RE.match(line)
+            if m:
+                yield MdBlock(_IMAGE, i, i + 1, lines, m.group(1), url=m.group(2))
+                i += 1
+                continue
+
+        yield MdBlock(_TEXT, i, i + 1, lines, line)
+        i += 1
+
+
+def tokenize(content: str) -> list[MdBlock]:
+    """마크다운 문자열을 MdBlock 리스트로 변환"""
+    return list(iter_blocks(split_lines(content)))
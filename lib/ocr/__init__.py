@@ -30,6 +30,7 @@ from .graphic_detector import GraphicDetector
 from .som_annotator import SoMAnnotator
 from .hybrid_pipeline import HybridPipeline
 from .models import UIElement, HybridAnalysisResult
+from .batch import OCRBatchEngine, BatchResult, BatchSummary
 
 __version__ = "1.0.0"
 
@@ -57,6 +58,10 @@ __all__ = [
     "HybridPipeline",
     "UIElement",
     "HybridAnalysisResult",
+    # 일괄 처리 (프로세스 풀)
+    "OCRBatchEngine",
+    "BatchResult",
+    "BatchSummary",
 ]
 
 
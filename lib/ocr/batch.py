@@ -0,0 +1,220 @@
+"""
+다중 이미지 OCR 일괄 처리 엔진
+
+이미지마다 OCRExtractor를 새로 만들고 Tesseract 설치 검증(tesseract 2회 실행)과
+추출(2회 실행)을 반복하던 방식 대신:
+
+- CPU 코어 수만큼의 프로세스 풀에 이미지를 분산
+- 워커 프로세스는 시작 시 1회만 Tesseract/언어팩을 검증하고 풀이 끝날 때까지 유지
+- 이미지는 워커에서 1회 로드/전처리한 배열을 그대로 single_pass 추출에 사용
+  (Tesseract 실행 1회/이미지)
+- 이미지별 제한 시간(timeout)을 Tesseract 호출에 적용
+- 완료되는 순서대로 BatchResult를 반환하여 JSONL로 바로 출력 가능
+
+Tesseract 자체는 pytesseract 방식대로 이미지마다 하위 프로세스로 실행되며,
+워커당 Tesseract는 1스레드(OMP_THREAD_LIMIT=1)로 제한하여 코어 과점유를 막습니다.
+
+Usage:
+    engine = OCRBatchEngine(lang="kor+eng", timeout=30)
+    for item in engine.run(collect_images("./screenshots")):
+        print(item.to_json())
+    print(engine.summary.images_per_sec)
+"""
+
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional
+
+from PIL import Image
+
+from .extractor import OCRExtractor
+from .models import OCRResult
+
+IMAGE_SUFFIXES = {".png", ".jpg", ".jpeg", ".bmp", ".tif", ".tiff", ".webp"}
+
+# 워커 프로세스 상태 (initializer에서 설정)
+_WORKER_ERROR: Optional[str] = None
+
+
+@dataclass
+class BatchResult:
+    """이미지 1개의 일괄 처리 결과"""
+    path: str
+    result: Optional[OCRResult] = None
+    error: str = ""
+    elapsed: float = 0.0  # 워커에서의 로드 + 전처리 + 추출 시간 (초)
+
+    @property
+    def ok(self) -> bool:
+        return self.result is not None
+
+    def to_dict(self) -> dict:
+        """딕셔너리로 변환 (JSONL 출력용)"""
+        data = {"path": self.path, "ok": self.ok, "elapsed": round(self.elapsed, 4)}
+        if self.result is not None:
+            data.update(self.result.to_dict())
+        else:
+            data["error"] = self.error
+        return data
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict(), ensure_ascii=False)
+
+
+@dataclass
+class BatchSummary:
+    """일괄 처리 처리량 통계"""
+    total: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    elapsed: float = 0.0  # 전체 경과 시간 (초)
+    workers: int = 0
+
+    @property
+    def images_per_sec(self) -> float:
+        return self.total / self.elapsed if self.elapsed > 0 else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "total": self.total,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "elapsed": round(self.elapsed, 3),
+            "workers": self.workers,
+            "images_per_sec": round(self.images_per_sec, 2),
+        }
+
+
+def collect_images(directory: str | Path, recursive: bool = False) -> List[Path]:
+    """디렉토리의 이미지 파일 목록 (경로순 정렬)"""
+    directory = Path(directory)
+    candidates = directory.rglob("*") if recursive else directory.iterdir()
+    return sorted(p for p in candidates if p.is_file() and p.suffix.lower() in IMAGE_SUFFIXES)
+
+
+def _init_worker(lang: str, tesseract_cmd: Optional[str]) -> None:
+    """워커 초기화: Tesseract 스레드 제한 + 설치/언어팩 검증 1회
+
+    검증 실패는 예외로 풀을 깨뜨리지 않고 기록해 두었다가 이미지별 오류로 반환합니다.
+    """
+    global _WORKER_ERROR
+    os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+    try:
+        OCRExtractor(Image.new("L", (1, 1), color=255), lang=lang, tesseract_cmd=tesseract_cmd)
+        _WORKER_ERROR = None
+    except Exception as e:
+        _WORKER_ERROR = f"{type(e).__name__}: {e}"
+
+
+def _ocr_one(
+    path: str,
+    lang: str,
+    preprocess: bool,
+    single_pass: bool,
+    config: Optional[str],
+    timeout: float,
+) -> BatchResult:
+    """워커에서 이미지 1개 처리 (예외는 BatchResult.error로 반환)"""
+    start = time.perf_counter()
+    if _WORKER_ERROR:
+        return BatchResult(path, error=_WORKER_ERROR)
+    try:
+        with Image.open(path) as image:
+            image.load()
+            extractor = OCRExtractor(image, lang=lang, verify=False, timeout=timeout)
+            result = extractor.extract_text(preprocess=preprocess, config=config, single_pass=single_pass)
+        return BatchResult(path, result, elapsed=time.perf_counter() - start)
+    except Exception as e:
+        return BatchResult(path, error=f"{type(e).__name__}: {e}", elapsed=time.perf_counter() - start)
+
+
+class OCRBatchEngine:
+    """프로세스 풀 기반 다중 이미지 OCR 엔진"""
+
+    def __init__(
+        self,
+        lang: str = "kor+eng",
+        workers: Optional[int] = None,
+        timeout: float = 60,
+        preprocess: bool = True,
+        single_pass: bool = True,
+        config: Optional[str] = None,
+        tesseract_cmd: Optional[str] = None,
+    ):
+        """
+        Args:
+            lang: Tesseract 언어 코드
+            workers: 워커 프로세스 수 (None이면 CPU 코어 수, 0이면 현재 프로세스에서 순차 처리)
+            timeout: 이미지당 Tesseract 제한 시간 (초, 0이면 무제한)
+            preprocess: 전처리(grayscale/threshold/denoise) 적용 여부
+            single_pass: Tesseract 1회 실행 모드 (False면 이미지당 2회)
+            config: Tesseract 설정 문자열 (None이면 기본값)
+            tesseract_cmd: Tesseract 실행 파일 경로 (None이면 자동 탐색)
+        """
+        self.lang = lang
+        self.workers = (os.cpu_count() or 1) if workers is None else workers
+        self.timeout = timeout
+        self.preprocess = preprocess
+        self.single_pass = single_pass
+        self.config = config
+        self.tesseract_cmd = tesseract_cmd
+        self.summary = BatchSummary()
+
+    def _task_args(self, path: Path) -> tuple:
+        return (str(path), self.lang, self.preprocess, self.single_pass, self.config, self.timeout)
+
+    def run(self, paths: Iterable[str | Path]) -> Iterator[BatchResult]:
+        """이미지 목록 처리 (완료 순서대로 반환)
+
+        반복이 끝나면 self.summary에 처리량 통계가 기록됩니다.
+
+        Args:
+            paths: 이미지 파일 경로 목록
+
+        Yields:
+            BatchResult: 이미지별 결과 (실패도 error와 함께 반환)
+        """
+        paths = [Path(p) for p in paths]
+        workers = min(self.workers, len(paths))
+        self.summary = BatchSummary(total=len(paths), workers=workers)
+        start = time.perf_counter()
+        if not paths:
+            return
+
+        for item in self._run_pool(paths, workers) if workers > 0 else self._run_inline(paths):
+            if item.ok:
+                self.summary.succeeded += 1
+            else:
+                self.summary.failed += 1
+            self.summary.elapsed = time.perf_counter() - start
+            yield item
+
+        self.summary.elapsed = time.perf_counter() - start
+
+    def _run_inline(self, paths: List[Path]) -> Iterator[BatchResult]:
+        """현재 프로세스에서 순차 처리 (디버깅/테스트용)"""
+        _init_worker(self.lang, self.tesseract_cmd)
+        for path in paths:
+            yield _ocr_one(*self._task_args(path))
+
+    def _run_pool(self, paths: List[Path], workers: int) -> Iterator[BatchResult]:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(self.lang, self.tesseract_cmd),
+        ) as pool:
+            futures = {pool.submit(_ocr_one, *self._task_args(path)): path for path in paths}
+            try:
+                for future in as_completed(futures):
+                    try:
+                        yield future.result()
+                    except Exception as e:
+                        # 워커 비정상 종료(BrokenProcessPool) 등
+                        yield BatchResult(str(futures[future]), error=f"{type(e).__name__}: {e}")
+            finally:
+                # 반복을 중간에 멈추면 아직 시작하지 않은 이미지는 취소
+                pool.shutdown(cancel_futures=True)
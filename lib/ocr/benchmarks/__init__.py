@@ -0,0 +1 @@
+"""OCR 파이프라인 벤치마크 (pytest 수집 대상 아님)"""
@@ -0,0 +1,113 @@
+"""
+IoU 중복 제거 확장성 벤치마크 (100 → 20,000 BBox)
+
+밀집 UI 스크린샷 형태의 BBox 집합(단어 격자 + 재검출 중복 + 큰 패널)에 대해
+기존 O(n²) Python 비교와 lib.ocr.spatial(격자 인덱스 + NumPy IoU)의
+소요 시간을 비교하고, 두 방식의 결과가 같은지 확인합니다.
+
+- merge: HybridPipeline._merge_and_deduplicate (greedy, 임계값 0.5)
+- filter: GraphicDetector.filter_overlapping (그래픽 n/10개 × 텍스트 n개)
+
+기존 방식은 느리므로 --max-reference 이하 크기에서만 측정합니다.
+
+Usage:
+    python -m lib.ocr.benchmarks.dedup_scaling
+    python -m lib.ocr.benchmarks.dedup_scaling --sizes 100 1000 20000 --max-reference 20000
+"""
+
+import argparse
+import random
+import time
+from typing import Callable, List
+
+from lib.ocr.models import BBox
+
+DEFAULT_SIZES = [100, 1000, 5000, 20000]
+
+
+def build_boxes(count: int, seed: int = 0) -> List[BBox]:
+    """단어 BBox 격자 (약 15%는 약간 어긋난 재검출 중복, 1%는 큰 패널)"""
+    rng = random.Random(seed)
+    columns = 40
+    boxes: List[BBox] = []
+    while len(boxes) < count:
+        n = len(boxes)
+        if n and rng.random() < 0.15:
+            src = boxes[rng.randrange(n)]
+            boxes.append(BBox(src.x + rng.randint(-2, 2), src.y + rng.randint(-2, 2), src.width, src.height))
+        elif rng.random() < 0.01:
+            boxes.append(BBox(rng.randint(0, 1500), rng.randint(0, 20000), rng.randint(200, 900), rng.randint(100, 600)))
+        else:
+            row, col = divmod(n, columns)
+            boxes.append(BBox(col * 48 + rng.randint(0, 6), row * 22 + rng.randint(0, 3), rng.randint(20, 44), rng.randint(12, 18)))
+    return boxes
+
+
+def _reference_iou(a: BBox, b: BBox) -> float:
+    ix1, iy1 = max(a.x, b.x), max(a.y, b.y)
+    ix2, iy2 = min(a.x + a.width, b.x + b.width), min(a.y + a.height, b.y + b.height)
+    if ix2 <= ix1 or iy2 <= iy1:
+        return 0.0
+    inter = (ix2 - ix1) * (iy2 - iy1)
+    union = a.width * a.height + b.width * b.height - inter
+    return inter / union if union > 0 else 0.0
+
+
+def reference_merge(boxes: List[BBox], threshold: float = 0.5) -> List[int]:
+    kept: List[int] = []
+    for i, box in enumerate(boxes):
+        if not any(_reference_iou(box, boxes[k]) > threshold for k in kept):
+            kept.append(i)
+    return kept
+
+
+def reference_filter(graphics: List[BBox], texts: List[BBox], threshold: float = 0.5) -> List[bool]:
+    return [any(_reference_iou(g, t) > threshold for t in texts) for g in graphics]
+
+
+def _timed(fn: Callable[[], object]) -> tuple[float, object]:
+    start = time.perf_counter()
+    result = fn()
+    return (time.perf_counter() - start) * 1000, result
+
+
+def run(sizes: List[int] = DEFAULT_SIZES, max_reference: int = 5000) -> dict[int, dict[str, float]]:
+    """벤치마크 실행
+
+    Returns:
+        {BBox 수: {측정 항목: ms}}
+    """
+    from lib.ocr.spatial import greedy_deduplicate, overlapping_mask
+
+    greedy_deduplicate(build_boxes(10))  # NumPy 첫 호출 비용 제외
+    results: dict[int, dict[str, float]] = {}
+    print(f"{'boxes':>7s} {'merge(old)':>12s} {'merge(new)':>12s} {'filter(old)':>12s} {'filter(new)':>12s}")
+    for size in sizes:
+        boxes = build_boxes(size)
+        graphics = build_boxes(max(size // 10, 1), seed=1)
+        row: dict[str, float] = {}
+
+        row["merge_new"], kept = _timed(lambda: greedy_deduplicate(boxes))
+        row["filter_new"], mask = _timed(lambda: overlapping_mask(graphics, boxes, 0.5))
+        if size <= max_reference:
+            row["merge_old"], expected = _timed(lambda: reference_merge(boxes))
+            assert kept == expected, "merge 결과 불일치"
+            row["filter_old"], expected = _timed(lambda: reference_filter(graphics, boxes))
+            assert mask.tolist() == expected, "filter 결과 불일치"
+
+        results[size] = row
+        cells = [row.get(key) for key in ("merge_old", "merge_new", "filter_old", "filter_new")]
+        print(f"{size:7,d} " + " ".join(f"{c:9.1f} ms" if c is not None else f"{'-':>12s}" for c in cells))
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="IoU 중복 제거 확장성 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="BBox 수 목록")
+    parser.add_argument("--max-reference", type=int, default=5000, help="기존 방식을 측정할 최대 BBox 수")
+    args = parser.parse_args()
+    run(args.sizes, args.max_reference)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+HybridPipeline 이미지당 지연 시간 벤치마크
+
+스크린샷형 fixture 이미지(기본 1280×720)를 파일 경로와 PIL 이미지로 각각 넘겨
+HybridPipeline.analyze(mode="coords")의 이미지당 소요 시간을 측정합니다.
+Tesseract가 없으면 Layer 2는 설치 검증 단계에서 실패하고 빈 결과를 반환하므로,
+이 경우 수치는 이미지 디코딩/전달 + Layer 1 + 병합 비용만 나타냅니다.
+
+Usage:
+    python -m lib.ocr.benchmarks.hybrid_latency
+    python -m lib.ocr.benchmarks.hybrid_latency --count 8 --repeat 5 --lang eng
+"""
+
+import argparse
+import logging
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, List
+
+from PIL import Image
+
+from lib.ocr.benchmarks.single_pass import build_fixture_images
+
+
+def _ms_per_image(fn: Callable[[object], object], inputs: List[object], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for item in inputs:
+            fn(item)
+        best = min(best, time.perf_counter() - start)
+    return best / len(inputs) * 1000
+
+
+def run(count: int = 8, lang: str = "eng", repeat: int = 5) -> dict[str, float]:
+    """벤치마크 실행
+
+    Returns:
+        {입력 종류: ms/image}
+    """
+    from lib.ocr.hybrid_pipeline import HybridPipeline
+
+    # Tesseract 미설치 경고가 측정에 섞이지 않도록
+    logging.getLogger("lib.ocr.hybrid_pipeline").setLevel(logging.ERROR)
+    pipeline = HybridPipeline(lang=lang)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = build_fixture_images(Path(tmp), count)
+        images = [Image.open(p).convert("RGB") for p in paths]
+
+        results = {
+            "path": _ms_per_image(lambda p: pipeline.analyze(str(p), mode="coords"), paths, repeat),
+            "pil": _ms_per_image(lambda im: pipeline.analyze(im, mode="coords"), images, repeat),
+        }
+
+    print(f"이미지 {count}개 ({images[0].width}×{images[0].height}), lang={lang} (best of {repeat})")
+    for name, ms in results.items():
+        print(f"  {name:6s} {ms:8.2f} ms/image")
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="HybridPipeline 이미지당 지연 시간 벤치마크")
+    parser.add_argument("--count", type=int, default=8, help="합성 이미지 수")
+    parser.add_argument("--lang", default="eng", help="Tesseract 언어 코드")
+    parser.add_argument("--repeat", type=int, default=5, help="반복 횟수 (최솟값 사용)")
+    args = parser.parse_args()
+    run(args.count, args.lang, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
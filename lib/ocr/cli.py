@@ -1,7 +1,9 @@
 import argparse
 import json
+import sys
 from pathlib import Path
 from . import OCRExtractor, check_installation
+from .batch import OCRBatchEngine, collect_images
 
 
 def main():
@@ -49,6 +51,59 @@ def main():
         action="store_true",
         help="표 감지 및 추출 모드"
     )
+    extract_parser.add_argument(
+        "--single-pass",
+        action="store_true",
+        help="Tesseract 1회 실행 (TSV에서 텍스트/신뢰도/레이아웃 재구성, 약 2배 빠름)"
+    )
+
+    # batch 서브커맨드
+    batch_parser = subparsers.add_parser(
+        "batch",
+        help="디렉토리 이미지 일괄 추출 (프로세스 풀, JSONL 출력)"
+    )
+    batch_parser.add_argument(
+        "directory",
+        type=str,
+        help="이미지 디렉토리"
+    )
+    batch_parser.add_argument(
+        "--lang",
+        type=str,
+        default="kor+eng",
+        help="언어 코드 (기본값: kor+eng)"
+    )
+    batch_parser.add_argument(
+        "--workers",
+        type=int,
+        help="워커 프로세스 수 (기본값: CPU 코어 수, 0이면 순차 처리)"
+    )
+    batch_parser.add_argument(
+        "--timeout",
+        type=float,
+        default=60,
+        help="이미지당 제한 시간 (초, 기본값: 60)"
+    )
+    batch_parser.add_argument(
+        "--no-preprocess",
+        action="store_true",
+        help="전처리 비활성화"
+    )
+    batch_parser.add_argument(
+        "--two-pass",
+        action="store_true",
+        help="이미지당 Tesseract 2회 실행 (image_to_string 텍스트 사용)"
+    )
+    batch_parser.add_argument(
+        "--recursive",
+        action="store_true",
+        help="하위 디렉토리 포함"
+    )
+    batch_parser.add_argument(
+        "--output",
+        type=str,
+        help="출력 파일 경로 (JSONL, 기본값: 표준 출력)"
+    )
 
     # check 서브커맨드
     check_parser = subparsers.add_parser(
@@ -70,6 +125,9 @@ def main():
 
         return 0
 
+    elif args.command == "batch":
+        return _run_batch(args)
+
     elif args.command == "extract":
         image_path = Path(args.image_path)
 
@@ -108,7 +166,10 @@ def main():
 
             else:
                 # 일반 텍스트 추출 모드
-                result = extractor.extract_text(preprocess=not args.no_preprocess)
+                result = extractor.extract_text(
+                    preprocess=not args.no_preprocess,
+                    single_pass=args.single_pass
+                )
 
                 if args.output:
                     Path(args.output).write_text(
@@ -126,5 +187,39 @@ def main():
         return 0
 
 
+def _run_batch(args) -> int:
+    """batch 서브커맨드: 완료 순서대로 OCRResult JSONL 출력 + 처리량 보고 (stderr)"""
+    directory = Path(args.directory)
+    if not directory.is_dir():
+        print(f"Error: 디렉토리를 찾을 수 없음: {directory}", file=sys.stderr)
+        return 1
+
+    paths = collect_images(directory, recursive=args.recursive)
+    engine = OCRBatchEngine(
+        lang=args.lang,
+        workers=args.workers,
+        timeout=args.timeout,
+        preprocess=not args.no_preprocess,
+        single_pass=not args.two_pass,
+    )
+
+    output = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    try:
+        for item in engine.run(paths):
+            output.write(item.to_json() + "\n")
+            output.flush()
+    finally:
+        if args.output:
+            output.close()
+
+    summary = engine.summary
+    print(
+        f"[Batch] {summary.total}개 이미지 (성공 {summary.succeeded}, 실패 {summary.failed}), "
+        f"워커 {summary.workers}개, {summary.elapsed:.2f}s, {summary.images_per_sec:.2f} images/sec",
+        file=sys.stderr
+    )
+    return 1 if summary.failed else 0
+
+
 if __name__ == "__main__":
     exit(main())
@@ -16,9 +16,10 @@ class OCRExtractor:
     전처리, 영역 기반 추출, 표 감지, 레이아웃 분석 기능 제공.
 
     Attributes:
-        image_path (Path): 처리할 이미지 파일 경로
+        image_path (Path): 처리할 이미지 파일 경로 (이미지/배열로 생성하면 None일 수 있음)
         lang (str): Tesseract 언어 코드 (예: "kor+eng")
-        _image (Image.Image): 로드된 PIL 이미지 객체
+        _image (Image.Image): 로드된 PIL 이미지 객체 (배열로 생성하면 필요할 때 변환)
+        _pixels (np.ndarray): 배열로 생성한 경우의 픽셀 배열 (복사 없이 사용)
         _preprocessor (ImagePreprocessor): 이미지 전처리 파이프라인
 
     Example:
@@ -30,45 +31,90 @@ class OCRExtractor:
 
     def __init__(
         self,
-        image_path: str | Path,
+        image_path: str | Path | Image.Image | np.ndarray,
         lang: str = "kor+eng",
-        tesseract_cmd: Optional[str] = None
+        tesseract_cmd: Optional[str] = None,
+        verify: bool = True,
+        timeout: float = 0
     ):
         """
         OCRExtractor 초기화
 
         Args:
-            image_path: 처리할 이미지 파일 경로
+            image_path: 처리할 이미지 파일 경로, 이미 로드한 PIL 이미지 또는
+                NumPy 배열 (uint8 흑백 H×W / RGB H×W×3, 파일 저장 없이 그대로 사용)
             lang: Tesseract 언어 코드 (기본값: "kor+eng")
             tesseract_cmd: Tesseract 실행 파일 경로 (None이면 자동 탐색)
+            verify: Tesseract 설치/언어팩 검증 여부 (검증은 tesseract를 2회 실행하므로
+                같은 프로세스에서 반복 생성할 때는 1회만 검증하고 False로 생성)
+            timeout: Tesseract 호출당 제한 시간 (초, 0이면 무제한)
 
         Raises:
             ImageLoadError: 이미지 로드 실패
             TesseractNotFoundError: Tesseract 바이너리 미발견
         """
-        self.image_path = Path(image_path)
         self.lang = lang
+        self.timeout = timeout
         self._preprocessor = ImagePreprocessor()
 
         # Tesseract 경로 설정
         if tesseract_cmd:
             pytesseract.pytesseract.tesseract_cmd = tesseract_cmd
-        else:
+        elif verify:
             self._auto_detect_tesseract()
 
         # Tesseract 설치 검증
-        self._verify_tesseract()
+        if verify:
+            self._verify_tesseract()
 
         # 이미지 로드
+        self._pil: Optional[Image.Image] = None
+        self._pixels: Optional[np.ndarray] = None
+        if isinstance(image_path, np.ndarray):
+            self.image_path = None
+            self._pixels = image_path
+            return
+        if isinstance(image_path, Image.Image):
+            self.image_path = Path(image_path.filename) if getattr(image_path, "filename", "") else None
+            self._pil = image_path
+            return
+
+        self.image_path = Path(image_path)
         try:
-            self._image = Image.open(self.image_path)
+            self._pil = Image.open(self.image_path)
         except Exception as e:
             raise ImageLoadError(f"Failed to load image: {e}")
 
+    @property
+    def _image(self) -> Image.Image:
+        """PIL 이미지 (배열로 생성한 경우 최초 접근 시 1회 변환)"""
+        if self._pil is None:
+            self._pil = Image.fromarray(self._pixels)
+        return self._pil
+
+    def _source(self):
+        """추출 입력 이미지: 배열은 그대로(읽기 전용 공유), PIL 이미지는 사본"""
+        if self._pixels is not None:
+            return self._pixels
+        return self._image.copy()
+
+    @staticmethod
+    def _crop(image, bbox: BBox):
+        """PIL 이미지/배열에서 bbox 영역 잘라내기"""
+        if isinstance(image, np.ndarray):
+            return image[bbox.y:bbox.y + bbox.height, bbox.x:bbox.x + bbox.width]
+        return image.crop((
+            bbox.x,
+            bbox.y,
+            bbox.x + bbox.width,
+            bbox.y + bbox.height
+        ))
+
     def extract_text(
         self,
         preprocess: bool = True,
-        config: Optional[str] = None
+        config: Optional[str] = None,
+        single_pass: bool = False
     ) -> OCRResult:
         """
         전체 이미지에서 텍스트 추출
@@ -76,6 +122,10 @@ class OCRExtractor:
         Args:
             preprocess: 전처리 활성화 여부 (기본값: True)
             config: Tesseract 설정 문자열 (예: "--psm 6")
+            single_pass: True면 Tesseract를 1회(image_to_data, TSV)만 실행하고
+                텍스트/신뢰도/레이아웃을 모두 그 결과에서 재구성.
+                텍스트는 단어를 공백, 줄을 줄바꿈, 문단을 빈 줄로 이어 붙이므로
+                image_to_string 출력과 공백 처리가 다를 수 있음
 
         Returns:
             OCRResult: 추출된 텍스트, 신뢰도, 레이아웃 정보
@@ -89,7 +139,7 @@ class OCRExtractor:
         start_time = time.time()
 
         # 전처리
-        image = self._image.copy()
+        image = self._source()
         if preprocess:
             image = self._preprocessor.pipeline(
                 image,
@@ -101,18 +151,30 @@ class OCRExtractor:
 
         # 텍스트 추출
         try:
-            text = pytesseract.image_to_string(
-                image,
-                lang=self.lang,
-                config=tesseract_config
-            )
-
-            # 신뢰도 정보 추출 (pytesseract.image_to_data 사용)
-            data = pytesseract.image_to_data(
-                image,
-                lang=self.lang,
-                output_type=pytesseract.Output.DICT
-            )
+            if single_pass:
+                data = pytesseract.image_to_data(
+                    image,
+                    lang=self.lang,
+                    config=tesseract_config,
+                    output_type=pytesseract.Output.DICT,
+                    timeout=self.timeout
+                )
+                text = self._text_from_data(data)
+            else:
+                text = pytesseract.image_to_string(
+                    image,
+                    lang=self.lang,
+                    config=tesseract_config,
+                    timeout=self.timeout
+                )
+
+                # 신뢰도 정보 추출 (pytesseract.image_to_data 사용)
+                data = pytesseract.image_to_data(
+                    image,
+                    lang=self.lang,
+                    output_type=pytesseract.Output.DICT,
+                    timeout=self.timeout
+                )
             confidence = self._calculate_confidence(data)
 
             # 레이아웃 정보 추출
@@ -134,7 +196,8 @@ class OCRExtractor:
     def extract_regions(
         self,
         boxes: List[BBox],
-        preprocess: bool = True
+        preprocess: bool = True,
+        single_pass: bool = False
     ) -> List[TextRegion]:
         """
         특정 영역(bbox)에서만 텍스트 추출
@@ -142,6 +205,7 @@ class OCRExtractor:
         Args:
             boxes: 추출할 영역 리스트 [(x, y, width, height), ...]
             preprocess: 전처리 활성화 여부
+            single_pass: True면 영역당 Tesseract 1회 (image_to_data에서 텍스트 재구성)
 
         Returns:
             List[TextRegion]: 각 영역의 텍스트, bbox, 신뢰도
@@ -152,7 +216,7 @@ class OCRExtractor:
             >>> for region in regions:
             ...     print(f"{region.text} (conf: {region.confidence})")
         """
-        image = self._image.copy()
+        image = self._source()
         if preprocess:
             image = self._preprocessor.pipeline(
                 image,
@@ -162,20 +226,19 @@ class OCRExtractor:
         regions = []
         for bbox in boxes:
             # 영역 크롭
-            cropped = image.crop((
-                bbox.x,
-                bbox.y,
-                bbox.x + bbox.width,
-                bbox.y + bbox.height
-            ))
+            cropped = self._crop(image, bbox)
 
             # OCR 수행
-            text = pytesseract.image_to_string(cropped, lang=self.lang)
             data = pytesseract.image_to_data(
                 cropped,
                 lang=self.lang,
-                output_type=pytesseract.Output.DICT
+                output_type=pytesseract.Output.DICT,
+                timeout=self.timeout
             )
+            if single_pass:
+                text = self._text_from_data(data)
+            else:
+                text = pytesseract.image_to_string(cropped, lang=self.lang, timeout=self.timeout)
             confidence = self._calculate_confidence(data)
 
             regions.append(TextRegion(
@@ -352,6 +415,27 @@ class OCRExtractor:
             return 0.0
         return sum(confidences) / len(confidences) / 100.0
 
+    def _text_from_data(self, data: Dict[str, Any]) -> str:
+        """
+        pytesseract.image_to_data 결과로부터 plain text 재구성
+
+        같은 줄의 단어는 공백, 줄은 줄바꿈, 문단(block/par 변경)은 빈 줄로 연결
+        """
+        paragraphs: Dict[tuple, Dict[int, List[str]]] = {}
+
+        for i, word in enumerate(data["text"]):
+            word = str(word).strip()
+            if not word:
+                continue
+            par_key = (data["block_num"][i], data["par_num"][i])
+            line_num = data["line_num"][i]
+            paragraphs.setdefault(par_key, {}).setdefault(line_num, []).append(word)
+
+        return "\n\n".join(
+            "\n".join(" ".join(words) for words in lines.values())
+            for lines in paragraphs.values()
+        )
+
     def _extract_layout_info(self, data: Dict[str, Any]) -> LayoutInfo:
         """pytesseract.image_to_data로부터 레이아웃 정보 추출"""
         # block_num, par_num, line_num, word_num 계층 파싱
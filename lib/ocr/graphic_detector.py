@@ -3,13 +3,15 @@ lib.ocr.graphic_detector - OpenCV 기반 비텍스트 그래픽 요소 감지
 
 cv2.findContours()로 UI 요소 감지, BBox 좌표 반환
 """
-from typing import List, Optional
+from typing import List, Optional, Union
 
 import cv2
 import numpy as np
 from PIL import Image
 
 from .models import BBox, UIElement
+from .preprocessor import to_array, to_gray
+from .spatial import overlapping_mask
 
 
 class GraphicDetector:
@@ -30,9 +32,9 @@ class GraphicDetector:
         self.max_area = max_area
         self.overlap_threshold = overlap_threshold
 
-    def detect(self, image: Image.Image) -> List[BBox]:
-        """비텍스트 요소 BBox 리스트 반환."""
-        img_cv = cv2.cvtColor(np.array(image.convert("RGB")), cv2.COLOR_RGB2GRAY)
+    def detect(self, image: Union[Image.Image, np.ndarray]) -> List[BBox]:
+        """비텍스트 요소 BBox 리스트 반환 (PIL 이미지 또는 RGB/흑백 NumPy 배열)."""
+        img_cv = to_gray(to_array(image))
         _, binary = cv2.threshold(
             img_cv, 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU
         )
@@ -50,7 +52,7 @@ class GraphicDetector:
             bboxes.append(BBox(x=x, y=y, width=w, height=h))
         return bboxes
 
-    def detect_with_type(self, image: Image.Image) -> List[UIElement]:
+    def detect_with_type(self, image: Union[Image.Image, np.ndarray]) -> List[UIElement]:
         """detect() 결과를 UIElement(element_type='graphic', layer=1)로 변환."""
         bboxes = self.detect(image)
         return [
@@ -64,15 +66,12 @@ class GraphicDetector:
         text_elements: List[UIElement],
     ) -> List[UIElement]:
         """텍스트 BBox와 IoU overlap_threshold 초과 중복 그래픽 요소 제거."""
-        result = []
-        for g in graphic_elements:
-            overlaps = any(
-                self._compute_iou(g.bbox, t.bbox) > self.overlap_threshold
-                for t in text_elements
-            )
-            if not overlaps:
-                result.append(g)
-        return result
+        overlaps = overlapping_mask(
+            [g.bbox for g in graphic_elements],
+            [t.bbox for t in text_elements],
+            self.overlap_threshold,
+        )
+        return [g for g, overlap in zip(graphic_elements, overlaps) if not overlap]
 
     def _compute_iou(self, bbox1: BBox, bbox2: BBox) -> float:
         """두 BBox 간 IoU(Intersection over Union) 계산."""
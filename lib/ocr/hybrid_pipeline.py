@@ -4,6 +4,9 @@ lib.ocr.hybrid_pipeline - 3-Layer Hybrid OCR Pipeline
 Layer 1: OpenCV findContours (비텍스트 그래픽 감지)
 Layer 2: Tesseract OCR (텍스트 요소 + BBox 좌표)
 Layer 3: Set-of-Mark + Vision LLM (시맨틱 분류, mode="ui"/"full"만)
+
+이미지는 analyze()에서 1회 디코딩한 읽기 전용 NumPy 배열을 Layer 1/2가 공유한다
+(임시 파일 저장/재로드, 레이어별 PIL↔OpenCV 변환 없음).
 """
 import logging
 import os
@@ -11,12 +14,15 @@ import tempfile
 import time
 from typing import List, Optional, Union
 
+import numpy as np
 from PIL import Image
 
 from .extractor import OCRExtractor
 from .graphic_detector import GraphicDetector
-from .models import BBox, HybridAnalysisResult, UIElement
+from .models import HybridAnalysisResult, UIElement
+from .preprocessor import to_array
 from .som_annotator import SoMAnnotator
+from .spatial import greedy_deduplicate
 
 logger = logging.getLogger(__name__)
 
@@ -79,8 +85,10 @@ class HybridPipeline:
         if isinstance(image, str):
             image = Image.open(image)
 
-        graphics = self._layer1_detect_graphics(image)
-        texts = self._layer2_extract_text(image)
+        # 1회 디코딩한 픽셀 배열을 Layer 1/2가 공유 (Layer 3 어노테이션만 PIL 사용)
+        pixels = to_array(image)
+        graphics = self._layer1_detect_graphics(pixels)
+        texts = self._layer2_extract_text(pixels)
         elements = self._merge_and_deduplicate(graphics, texts)
 
         annotated_path = None
@@ -109,26 +117,15 @@ class HybridPipeline:
             mode=mode,
         )
 
-    def _layer1_detect_graphics(self, image: Image.Image) -> List[UIElement]:
-        return self.graphic_detector.detect_with_type(image)
+    def _layer1_detect_graphics(self, pixels: np.ndarray) -> List[UIElement]:
+        return self.graphic_detector.detect_with_type(pixels)
 
-    def _layer2_extract_text(self, image: Image.Image) -> List[UIElement]:
+    def _layer2_extract_text(self, pixels: np.ndarray) -> List[UIElement]:
         try:
             extractor_cls = self._get_ocr_extractor()
-            import uuid
-
-            tmp_path = os.path.join(
-                tempfile.gettempdir(), f"ocr_{uuid.uuid4().hex}.png"
-            )
-            try:
-                image.save(tmp_path)
-                extractor = extractor_cls(tmp_path, lang=self.lang)
-                ocr_result = extractor.extract_text(preprocess=False)
-            finally:
-                try:
-                    os.unlink(tmp_path)
-                except Exception as e:
-                    logger.warning("Failed to delete temp OCR file: %s", e)
+            extractor = extractor_cls(pixels, lang=self.lang)
+            # 단어 bbox만 사용하므로 Tesseract 1회 실행 (TSV)
+            ocr_result = extractor.extract_text(preprocess=False, single_pass=True)
 
             elements = []
             for block in ocr_result.layout_info.blocks:
@@ -171,25 +168,10 @@ class HybridPipeline:
         graphics: List[UIElement],
         texts: List[UIElement],
     ) -> List[UIElement]:
-        """IoU 기반 중복 제거 (임계값 0.5)."""
+        """IoU 기반 중복 제거 (임계값 0.5, 그래픽 → 텍스트 순서의 greedy)."""
         all_elements = graphics + texts
         if not all_elements:
             return []
 
-        def iou(a: BBox, b: BBox) -> float:
-            ax2, ay2 = a.x + a.width, a.y + a.height
-            bx2, by2 = b.x + b.width, b.y + b.height
-            ix1, iy1 = max(a.x, b.x), max(a.y, b.y)
-            ix2, iy2 = min(ax2, bx2), min(ay2, by2)
-            if ix2 <= ix1 or iy2 <= iy1:
-                return 0.0
-            inter = (ix2 - ix1) * (iy2 - iy1)
-            union = a.width * a.height + b.width * b.height - inter
-            return inter / union if union > 0 else 0.0
-
-        kept = []
-        for elem in all_elements:
-            duplicate = any(iou(elem.bbox, k.bbox) > 0.5 for k in kept)
-            if not duplicate:
-                kept.append(elem)
-        return kept
+        kept = greedy_deduplicate([e.bbox for e in all_elements], threshold=0.5)
+        return [all_elements[i] for i in kept]
@@ -3,16 +3,76 @@ lib.ocr.preprocessor - 이미지 전처리 파이프라인
 
 OCR 정확도를 높이기 위한 이미지 전처리 단계 제공.
 OpenCV와 Pillow 조합 사용.
+
+각 단계는 PIL 이미지와 NumPy 배열(uint8, 흑백 H×W 또는 RGB H×W×3)을 모두 받으며,
+배열을 넣으면 PIL 변환 없이 OpenCV로 처리한 배열을 반환합니다.
 """
 
+from pathlib import Path
 from PIL import Image, ImageFilter, ImageEnhance
 import cv2
 import numpy as np
-from typing import List, Literal
+from typing import List, Literal, Union
 
 
 PreprocessStep = Literal["grayscale", "threshold", "deskew", "denoise", "sharpen"]
 
+ImageLike = Union[Image.Image, np.ndarray]
+
+# PIL ImageFilter.SMOOTH 커널 (ImageEnhance.Sharpness의 기준 이미지)
+_SMOOTH_KERNEL = np.array([[1, 1, 1], [1, 5, 1], [1, 1, 1]], dtype=np.float32) / 13
+
+
+def to_array(image: Union[str, Path, ImageLike]) -> np.ndarray:
+    """
+    이미지를 1회 디코딩하여 읽기 전용 NumPy 배열로 변환
+
+    흑백(L) 이미지는 H×W, 그 외는 RGB H×W×3 uint8 배열이 됩니다.
+    배열은 읽기 전용으로 표시되므로 여러 단계가 복사 없이 공유할 수 있습니다.
+
+    Args:
+        image: 이미지 파일 경로, PIL 이미지 또는 NumPy 배열 (배열은 그대로 반환)
+
+    Returns:
+        np.ndarray: 이미지 픽셀 배열
+    """
+    if isinstance(image, np.ndarray):
+        return image
+    if isinstance(image, (str, Path)):
+        with Image.open(image) as opened:
+            return to_array(opened)
+
+    if image.mode not in ("L", "RGB"):
+        image = image.convert("RGB")
+    pixels = np.asarray(image)
+    pixels.flags.writeable = False
+    return pixels
+
+
+def to_gray(pixels: np.ndarray) -> np.ndarray:
+    """RGB 배열 → 흑백 배열 (이미 흑백이면 그대로)"""
+    return pixels if pixels.ndim == 2 else cv2.cvtColor(pixels, cv2.COLOR_RGB2GRAY)
+
+
+def _pil_gray(pixels: np.ndarray) -> np.ndarray:
+    """RGB 배열 → 흑백 배열, PIL convert("L")과 같은 정수 계수
+
+    OpenCV COLOR_RGB2GRAY는 계수 반올림이 달라 일부 픽셀이 1 차이 납니다.
+    """
+    if pixels.ndim == 2:
+        return pixels
+    rgb = pixels.astype(np.uint32)
+    gray = rgb[..., 0] * 19595 + rgb[..., 1] * 38470 + rgb[..., 2] * 7471 + 0x8000
+    return (gray >> 16).astype(np.uint8)
+
+
+def _pil_smooth(pixels: np.ndarray) -> np.ndarray:
+    """PIL ImageFilter.SMOOTH과 같은 결과 (가장자리 1픽셀은 원본 유지)"""
+    smooth = cv2.filter2D(pixels, -1, _SMOOTH_KERNEL)
+    smooth[0], smooth[-1] = pixels[0], pixels[-1]
+    smooth[:, 0], smooth[:, -1] = pixels[:, 0], pixels[:, -1]
+    return smooth
+
 
 class ImagePreprocessor:
     """
@@ -28,42 +88,47 @@ class ImagePreprocessor:
     """
 
     @staticmethod
-    def grayscale(image: Image.Image) -> Image.Image:
+    def grayscale(image: ImageLike) -> ImageLike:
         """
         흑백 변환 (RGB → Grayscale)
 
         Args:
-            image: PIL 이미지 객체
+            image: PIL 이미지 객체 또는 NumPy 배열
 
         Returns:
-            Image.Image: 흑백 변환된 이미지
+            흑백 변환된 이미지 (입력과 같은 타입)
         """
+        if isinstance(image, np.ndarray):
+            return _pil_gray(image)
         return image.convert("L")
 
     @staticmethod
     def threshold(
-        image: Image.Image,
+        image: ImageLike,
         method: Literal["otsu", "adaptive_gaussian", "adaptive_mean"] = "adaptive_gaussian"
-    ) -> Image.Image:
+    ) -> ImageLike:
         """
         이진화 (흑백 → 0 또는 255)
 
         Args:
-            image: PIL 이미지 (흑백 권장)
+            image: PIL 이미지 또는 NumPy 배열 (흑백 권장)
             method: 이진화 방법
                 - "otsu": Otsu's method (전역 임계값)
                 - "adaptive_gaussian": Adaptive Gaussian Threshold (지역 임계값)
                 - "adaptive_mean": Adaptive Mean Threshold
 
         Returns:
-            Image.Image: 이진화된 이미지
+            이진화된 이미지 (입력과 같은 타입)
 
         Example:
             >>> gray = ImagePreprocessor.grayscale(image)
             >>> binary = ImagePreprocessor.threshold(gray, method="adaptive_gaussian")
         """
-        img_cv = cv2.cvtColor(np.array(image), cv2.COLOR_RGB2BGR)
-        gray = cv2.cvtColor(img_cv, cv2.COLOR_BGR2GRAY)
+        if isinstance(image, np.ndarray):
+            gray = to_gray(image)
+        else:
+            img_cv = cv2.cvtColor(np.array(image), cv2.COLOR_RGB2BGR)
+            gray = cv2.cvtColor(img_cv, cv2.COLOR_BGR2GRAY)
 
         if method == "otsu":
             _, binary = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
@@ -88,24 +153,32 @@ class ImagePreprocessor:
         else:
             raise ValueError(f"Unknown threshold method: {method}")
 
+        if isinstance(image, np.ndarray):
+            return binary
         return Image.fromarray(binary)
 
     @staticmethod
-    def deskew(image: Image.Image, angle_threshold: float = 0.5) -> Image.Image:
+    def deskew(image: ImageLike, angle_threshold: float = 0.5) -> ImageLike:
         """
         기울기 보정 (Skew correction)
 
         Hough Line Transform으로 텍스트 줄 기울기 감지 → 회전 보정
 
         Args:
-            image: PIL 이미지
+            image: PIL 이미지 또는 NumPy 배열
             angle_threshold: 보정 최소 각도 (도). 이 값 미만이면 보정 스킵
 
         Returns:
-            Image.Image: 기울기 보정된 이미지
+            기울기 보정된 이미지 (입력과 같은 타입)
         """
-        img_cv = cv2.cvtColor(np.array(image), cv2.COLOR_RGB2BGR)
-        gray = cv2.cvtColor(img_cv, cv2.COLOR_BGR2GRAY)
+        is_array = isinstance(image, np.ndarray)
+        if is_array:
+            # 회전은 채널 순서와 무관하므로 RGB/흑백 배열 그대로 사용
+            img_cv = image
+            gray = to_gray(image)
+        else:
+            img_cv = cv2.cvtColor(np.array(image), cv2.COLOR_RGB2BGR)
+            gray = cv2.cvtColor(img_cv, cv2.COLOR_BGR2GRAY)
 
         # Canny edge detection
         edges = cv2.Canny(gray, 50, 150, apertureSize=3)
@@ -139,26 +212,39 @@ class ImagePreprocessor:
             borderMode=cv2.BORDER_REPLICATE
         )
 
+        if is_array:
+            return rotated
         return Image.fromarray(cv2.cvtColor(rotated, cv2.COLOR_BGR2RGB))
 
     @staticmethod
     def denoise(
-        image: Image.Image,
+        image: ImageLike,
         method: Literal["gaussian", "median", "bilateral"] = "gaussian"
-    ) -> Image.Image:
+    ) -> ImageLike:
         """
         노이즈 제거
 
         Args:
-            image: PIL 이미지
+            image: PIL 이미지 또는 NumPy 배열
             method: 노이즈 제거 방법
                 - "gaussian": Gaussian Blur (빠름, 경계 흐림)
                 - "median": Median Filter (Salt-and-pepper 노이즈 효과적)
                 - "bilateral": Bilateral Filter (경계 보존, 느림)
 
         Returns:
-            Image.Image: 노이즈 제거된 이미지
+            노이즈 제거된 이미지 (입력과 같은 타입)
         """
+        if isinstance(image, np.ndarray):
+            # 필터는 채널 순서와 무관하므로 RGB/흑백 배열 그대로 사용
+            if method == "gaussian":
+                # PIL GaussianBlur(radius=1)과 픽셀값 차이 ±3 이내
+                return cv2.GaussianBlur(image, (0, 0), sigmaX=1)
+            if method == "median":
+                return cv2.medianBlur(image, ksize=3)
+            if method == "bilateral":
+                return cv2.bilateralFilter(image, d=9, sigmaColor=75, sigmaSpace=75)
+            raise ValueError(f"Unknown denoise method: {method}")
+
         if method == "gaussian":
             return image.filter(ImageFilter.GaussianBlur(radius=1))
 
@@ -174,36 +260,43 @@ class ImagePreprocessor:
         return Image.fromarray(cv2.cvtColor(denoised, cv2.COLOR_BGR2RGB))
 
     @staticmethod
-    def sharpen(image: Image.Image, strength: float = 1.0) -> Image.Image:
+    def sharpen(image: ImageLike, strength: float = 1.0) -> ImageLike:
         """
         샤프닝 (선명도 향상)
 
         Args:
-            image: PIL 이미지
+            image: PIL 이미지 또는 NumPy 배열
             strength: 샤프닝 강도 (0.0 ~ 2.0)
 
         Returns:
-            Image.Image: 샤프닝된 이미지
+            샤프닝된 이미지 (입력과 같은 타입)
         """
+        if isinstance(image, np.ndarray):
+            # ImageEnhance.Sharpness와 같은 방식: SMOOTH 이미지에서 멀어지는 방향으로 보간
+            # (Image.blend처럼 float32로 계산 후 소수점 버림)
+            smooth = _pil_smooth(image).astype(np.float32)
+            blended = smooth + np.float32(1.0 + strength) * (image - smooth)
+            return np.clip(blended, 0, 255).astype(np.uint8)
+
         enhancer = ImageEnhance.Sharpness(image)
         return enhancer.enhance(1.0 + strength)
 
     def pipeline(
         self,
-        image: Image.Image,
+        image: ImageLike,
         steps: List[PreprocessStep],
         **kwargs
-    ) -> Image.Image:
+    ) -> ImageLike:
         """
         전처리 파이프라인 실행
 
         Args:
-            image: PIL 이미지
+            image: PIL 이미지 또는 NumPy 배열 (배열이면 전 단계를 배열로 처리)
             steps: 전처리 단계 리스트 (순서대로 실행)
             **kwargs: 각 단계별 파라미터 (예: threshold_method="otsu")
 
         Returns:
-            Image.Image: 전처리된 이미지
+            전처리된 이미지 (입력과 같은 타입)
 
         Example:
             >>> preprocessor = ImagePreprocessor()
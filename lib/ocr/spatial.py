@@ -0,0 +1,199 @@
+"""
+lib.ocr.spatial - 격자 공간 인덱스 + NumPy 일괄 IoU 기반 BBox 중복 제거
+
+HybridPipeline._merge_and_deduplicate와 GraphicDetector.filter_overlapping이 공유한다.
+모든 쌍을 Python에서 비교하던 O(n²) 방식 대신:
+
+1. 면적이 있는 BBox를 격자 셀(중앙 크기의 2배)에 등록하고, 같은 셀을 공유하는
+   쌍만 후보로 생성 (셀을 많이 덮는 큰 BBox는 전체와 직접 비교)
+2. 후보 쌍의 IoU를 NumPy로 한 번에 계산 (정수 좌표의 교집합/합집합은 정확,
+   나눗셈도 Python과 같은 float64 연산이므로 임계값 비교 결과 동일)
+3. 중복 제거는 기존과 같은 순서의 greedy 규칙을 임계값 초과 쌍에만 적용
+
+IoU > threshold(≥ 0)인 쌍은 반드시 양의 면적으로 겹치므로, 겹치지 않는 쌍을
+건너뛰어도 결과는 전체 비교와 같다.
+"""
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .models import BBox
+
+# 이보다 많은 셀을 덮는 BBox는 격자에 등록하지 않고 전체와 직접 비교
+MAX_CELLS_PER_BOX = 64
+
+_EMPTY = np.empty(0, dtype=np.int64)
+
+
+def _to_arrays(boxes: Sequence[BBox]) -> Tuple[np.ndarray, np.ndarray]:
+    """BBox 목록 → (n, 4) [x1, y1, x2, y2] 배열, (n,) 면적 배열"""
+    if not boxes:
+        return np.empty((0, 4), dtype=np.int64), np.empty(0, dtype=np.int64)
+    coords = np.array([(b.x, b.y, b.x + b.width, b.y + b.height) for b in boxes])
+    areas = np.array([b.width * b.height for b in boxes])
+    return coords, areas
+
+
+def _cell_ranges(coords: np.ndarray, origin: np.ndarray, cell: float) -> np.ndarray:
+    """BBox별 덮는 셀 범위 (n, 4) [cx1, cy1, cx2, cy2] (양 끝 포함)"""
+    return np.floor((coords - np.tile(origin, 2)) / cell).astype(np.int64)
+
+
+def _expand_cells(idx: np.ndarray, ranges: np.ndarray, stride: int) -> Tuple[np.ndarray, np.ndarray]:
+    """BBox별 셀 범위를 (셀 키, BBox 인덱스) 항목으로 펼침"""
+    nx = ranges[:, 2] - ranges[:, 0] + 1
+    ny = ranges[:, 3] - ranges[:, 1] + 1
+    counts = nx * ny
+    owner = np.repeat(np.arange(len(idx)), counts)
+    offset = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    gx = ranges[owner, 0] + offset % nx[owner]
+    gy = ranges[owner, 1] + offset // nx[owner]
+    return gy * stride + gx, idx[owner]
+
+
+def _grid_join(
+    a_keys: np.ndarray, a_idx: np.ndarray, b_keys: np.ndarray, b_idx: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """같은 셀 키를 가진 (a, b) 항목 쌍"""
+    order = np.argsort(b_keys, kind="stable")
+    b_keys, b_idx = b_keys[order], b_idx[order]
+    lo = np.searchsorted(b_keys, a_keys, side="left")
+    counts = np.searchsorted(b_keys, a_keys, side="right") - lo
+    total = int(counts.sum())
+    if not total:
+        return _EMPTY, _EMPTY
+    ia = np.repeat(a_idx, counts)
+    pos = np.repeat(lo, counts) + np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+    return ia, b_idx[pos]
+
+
+def _brute_pairs(
+    a: np.ndarray, a_idx: np.ndarray, b: np.ndarray, b_idx: np.ndarray, chunk: int = 1024
+) -> Tuple[np.ndarray, np.ndarray]:
+    """a_idx × b_idx 전체 비교로 양의 면적으로 겹치는 쌍 (큰 BBox용)"""
+    if not len(a_idx) or not len(b_idx):
+        return _EMPTY, _EMPTY
+    parts_a, parts_b = [], []
+    bb = b[b_idx]
+    for start in range(0, len(a_idx), chunk):
+        ids = a_idx[start:start + chunk]
+        aa = a[ids][:, None, :]
+        hit = (
+            (np.minimum(aa[..., 2], bb[:, 2]) > np.maximum(aa[..., 0], bb[:, 0])) &
+            (np.minimum(aa[..., 3], bb[:, 3]) > np.maximum(aa[..., 1], bb[:, 1]))
+        )
+        rows, cols = np.nonzero(hit)
+        parts_a.append(ids[rows])
+        parts_b.append(b_idx[cols])
+    return np.concatenate(parts_a), np.concatenate(parts_b)
+
+
+def _candidate_pairs(a: np.ndarray, b: np.ndarray, same: bool) -> Tuple[np.ndarray, np.ndarray]:
+    """겹칠 가능성이 있는 (a 인덱스, b 인덱스) 쌍 (중복 없음, same이면 i < j)"""
+    va = np.flatnonzero((a[:, 2] > a[:, 0]) & (a[:, 3] > a[:, 1]))
+    vb = va if same else np.flatnonzero((b[:, 2] > b[:, 0]) & (b[:, 3] > b[:, 1]))
+    if not len(va) or not len(vb):
+        return _EMPTY, _EMPTY
+
+    sized = np.concatenate([a[va], b[vb]]) if not same else a[va]
+    cell = max(float(np.median(np.maximum(sized[:, 2] - sized[:, 0], sized[:, 3] - sized[:, 1]))) * 2, 1.0)
+    origin = sized[:, :2].min(axis=0)
+    ra = _cell_ranges(a[va], origin, cell)
+    rb = ra if same else _cell_ranges(b[vb], origin, cell)
+    stride = int(max(ra[:, 2].max(), rb[:, 2].max())) + 1
+
+    def split(valid, ranges):
+        cells = (ranges[:, 2] - ranges[:, 0] + 1) * (ranges[:, 3] - ranges[:, 1] + 1)
+        small = cells <= MAX_CELLS_PER_BOX
+        return valid[small], ranges[small], valid[~small]
+
+    sa, sa_ranges, la = split(va, ra)
+    sb, sb_ranges, lb = (sa, sa_ranges, la) if same else split(vb, rb)
+
+    a_keys, a_idx = _expand_cells(sa, sa_ranges, stride)
+    b_keys, b_idx = (a_keys, a_idx) if same else _expand_cells(sb, sb_ranges, stride)
+    parts = [
+        _grid_join(a_keys, a_idx, b_keys, b_idx),
+        _brute_pairs(a, la, b, vb),   # 큰 a × 전체 b
+        _brute_pairs(a, sa, b, lb),   # 작은 a × 큰 b
+    ]
+    ia = np.concatenate([p[0] for p in parts])
+    ib = np.concatenate([p[1] for p in parts])
+    if same:
+        keep = ia < ib
+        ia, ib = ia[keep], ib[keep]
+    keys = np.unique(ia * len(b) + ib)
+    return keys // len(b), keys % len(b)
+
+
+def _pair_iou(
+    a: np.ndarray, a_area: np.ndarray, ia: np.ndarray,
+    b: np.ndarray, b_area: np.ndarray, ib: np.ndarray,
+) -> np.ndarray:
+    """후보 쌍별 IoU (겹치지 않거나 합집합이 0이면 0.0)"""
+    pa, pb = a[ia], b[ib]
+    iw = np.minimum(pa[:, 2], pb[:, 2]) - np.maximum(pa[:, 0], pb[:, 0])
+    ih = np.minimum(pa[:, 3], pb[:, 3]) - np.maximum(pa[:, 1], pb[:, 1])
+    inter = iw * ih
+    union = a_area[ia] + b_area[ib] - inter
+    valid = (iw > 0) & (ih > 0) & (union > 0)
+    iou = np.zeros(len(ia), dtype=np.float64)
+    np.divide(inter, union, out=iou, where=valid)
+    return iou
+
+
+def overlap_pairs(
+    boxes: Sequence[BBox],
+    others: Optional[Sequence[BBox]] = None,
+    threshold: float = 0.5,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    IoU가 threshold를 초과하는 BBox 쌍
+
+    Args:
+        boxes: 기준 BBox 목록
+        others: 비교 대상 BBox 목록 (None이면 boxes 내부의 i < j 쌍)
+        threshold: IoU 임계값
+
+    Returns:
+        (boxes 인덱스 배열, others 인덱스 배열) - 인덱스 오름차순
+    """
+    a, a_area = _to_arrays(boxes)
+    same = others is None
+    b, b_area = (a, a_area) if same else _to_arrays(others)
+    if not len(a) or not len(b):
+        return _EMPTY, _EMPTY
+
+    if threshold < 0:
+        # IoU 0인 쌍도 임계값을 넘으므로 모든 쌍
+        ia, ib = np.triu_indices(len(a), k=1) if same else np.indices((len(a), len(b))).reshape(2, -1)
+        return ia, ib
+
+    ia, ib = _candidate_pairs(a, b, same)
+    keep = _pair_iou(a, a_area, ia, b, b_area, ib) > threshold
+    return ia[keep], ib[keep]
+
+
+def greedy_deduplicate(boxes: Sequence[BBox], threshold: float = 0.5) -> List[int]:
+    """
+    순서대로 보면서 이미 남긴 BBox와 IoU가 threshold를 초과하면 버리는 greedy 중복 제거
+
+    Returns:
+        남긴 BBox 인덱스 (입력 순서)
+    """
+    ia, ib = overlap_pairs(boxes, threshold=threshold)
+    duplicate = [False] * len(boxes)
+    # 뒤 인덱스 순으로 처리하면 앞 BBox의 중복 여부는 이미 확정되어 있음
+    order = np.lexsort((ia, ib))
+    for i, j in zip(ia[order].tolist(), ib[order].tolist()):
+        if not duplicate[j] and not duplicate[i]:
+            duplicate[j] = True
+    return [i for i, dup in enumerate(duplicate) if not dup]
+
+
+def overlapping_mask(boxes: Sequence[BBox], others: Sequence[BBox], threshold: float) -> np.ndarray:
+    """boxes 중 others의 어느 하나와 IoU가 threshold를 초과하는 항목 (bool 배열)"""
+    mask = np.zeros(len(boxes), dtype=bool)
+    ia, _ = overlap_pairs(boxes, others, threshold)
+    mask[ia] = True
+    return mask
@@ -0,0 +1,87 @@
+"""
+lib.ocr.batch 테스트
+
+워커 0개(현재 프로세스 순차 처리) 모드로 mock pytesseract를 사용해 검증
+"""
+
+import json
+
+from lib.ocr.batch import OCRBatchEngine, collect_images
+from lib.ocr.cli import main
+
+
+def _make_images(directory, sample_image, count=3):
+    paths = []
+    for i in range(count):
+        path = directory / f"img_{i}.png"
+        sample_image.save(path)
+        paths.append(path)
+    return paths
+
+
+class TestCollectImages:
+
+    def test_filters_and_sorts(self, tmp_path, sample_image):
+        _make_images(tmp_path, sample_image, 2)
+        (tmp_path / "notes.txt").write_text("x")
+        (tmp_path / "sub").mkdir()
+        sample_image.save(tmp_path / "sub" / "deep.jpg")
+
+        assert [p.name for p in collect_images(tmp_path)] == ["img_0.png", "img_1.png"]
+        assert len(collect_images(tmp_path, recursive=True)) == 3
+
+
+class TestOCRBatchEngine:
+
+    def test_inline_run(self, tmp_path, sample_image, mock_pytesseract):
+        paths = _make_images(tmp_path, sample_image)
+        engine = OCRBatchEngine(lang="kor+eng", workers=0, timeout=5)
+
+        results = list(engine.run(paths))
+
+        assert [r.ok for r in results] == [True] * 3
+        assert results[0].result.text == "Mocked OCR Text"
+        # 검증 1회 + single_pass로 이미지당 image_to_data 1회
+        assert mock_pytesseract.get_tesseract_version.call_count == 1
+        assert mock_pytesseract.image_to_data.call_count == 3
+        mock_pytesseract.image_to_string.assert_not_called()
+        assert mock_pytesseract.image_to_data.call_args.kwargs["timeout"] == 5
+        assert (engine.summary.total, engine.summary.succeeded) == (3, 3)
+        assert engine.summary.images_per_sec > 0
+
+    def test_errors_reported_per_image(self, tmp_path, sample_image, mock_pytesseract):
+        paths = _make_images(tmp_path, sample_image, 2)
+        broken = tmp_path / "broken.png"
+        broken.write_bytes(b"not an image")
+
+        results = list(OCRBatchEngine(workers=0).run(paths + [broken]))
+
+        assert [r.ok for r in results] == [True, True, False]
+        assert "broken.png" in results[2].path and results[2].error
+        assert json.loads(results[2].to_json())["ok"] is False
+
+    def test_missing_tesseract(self, tmp_path, sample_image, mock_tesseract_not_installed):
+        paths = _make_images(tmp_path, sample_image, 2)
+        engine = OCRBatchEngine(workers=0)
+
+        results = list(engine.run(paths))
+
+        assert all("TesseractNotFoundError" in r.error for r in results)
+        assert engine.summary.failed == 2
+
+
+class TestBatchCommand:
+
+    def test_jsonl_output(self, tmp_path, sample_image, mock_pytesseract, monkeypatch, capsys):
+        _make_images(tmp_path, sample_image, 2)
+        output = tmp_path / "out.jsonl"
+        monkeypatch.setattr(
+            "sys.argv",
+            ["python -m lib.ocr", "batch", str(tmp_path), "--workers", "0", "--output", str(output)],
+        )
+
+        assert main() == 0
+
+        lines = [json.loads(line) for line in output.read_text(encoding="utf-8").splitlines()]
+        assert [line["text"] for line in lines] == ["Mocked OCR Text"] * 2
+        assert "images/sec" in capsys.readouterr().err
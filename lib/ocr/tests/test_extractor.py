@@ -145,6 +145,72 @@ class TestExtractRegions:
             assert len(regions) == 2
 
 
+class TestSinglePass:
+    """single_pass 모드 (Tesseract 1회 실행) 테스트"""
+
+    # 2문단 (1문단 2줄), 빈 단어/비단어 레벨(conf -1) 포함
+    TSV_DATA = {
+        "text": ["", "Hello", "World", "", "Second", "line", "", "다음", "문단"],
+        "conf": [-1, 96, 94, -1, 90, 88, -1, 80, 82],
+        "left": [0, 10, 60, 0, 10, 70, 0, 10, 50],
+        "top": [0, 10, 10, 0, 30, 30, 0, 60, 60],
+        "width": [200, 40, 40, 0, 50, 30, 0, 30, 30],
+        "height": [100, 15, 15, 0, 15, 15, 0, 15, 15],
+        "block_num": [1, 1, 1, 1, 1, 1, 2, 2, 2],
+        "par_num": [1, 1, 1, 1, 1, 1, 1, 1, 1],
+        "line_num": [1, 1, 1, 2, 2, 2, 1, 1, 1],
+        "word_num": [0, 1, 2, 0, 1, 2, 0, 1, 2],
+    }
+
+    def test_extract_text_runs_tesseract_once(self, tmp_image_path, mock_pytesseract):
+        """image_to_data 1회로 텍스트/신뢰도/레이아웃 재구성"""
+        mock_pytesseract.image_to_data.return_value = self.TSV_DATA
+        with patch("lib.ocr.extractor.pytesseract", mock_pytesseract):
+            extractor = OCRExtractor(tmp_image_path, lang="eng")
+            result = extractor.extract_text(preprocess=False, config="--psm 6", single_pass=True)
+
+        mock_pytesseract.image_to_string.assert_not_called()
+        mock_pytesseract.image_to_data.assert_called_once()
+        assert mock_pytesseract.image_to_data.call_args[1]["config"] == "--psm 6"
+
+        assert result.text == "Hello World\nSecond line\n\n다음 문단"
+        assert result.confidence == pytest.approx(sum([96, 94, 90, 88, 80, 82]) / 6 / 100)
+        assert result.layout_info.num_blocks == 2
+        assert result.layout_info.num_lines == 3
+
+    def test_extract_regions_single_pass(self, tmp_image_path, mock_pytesseract):
+        """영역당 image_to_data 1회"""
+        with patch("lib.ocr.extractor.pytesseract", mock_pytesseract):
+            extractor = OCRExtractor(tmp_image_path, lang="eng")
+            boxes = [BBox(x=10, y=10, width=50, height=20), BBox(x=70, y=10, width=50, height=20)]
+            regions = extractor.extract_regions(boxes, preprocess=False, single_pass=True)
+
+        mock_pytesseract.image_to_string.assert_not_called()
+        assert mock_pytesseract.image_to_data.call_count == 2
+        assert [r.text for r in regions] == ["Mocked OCR Text"] * 2
+
+
+class TestArrayInput:
+    """NumPy 배열 입력 (파일 저장/복사 없이 사용)"""
+
+    def test_extract_from_array(self, sample_image, mock_pytesseract):
+        """배열을 그대로 Tesseract에 전달, 영역은 배열 슬라이스"""
+        from lib.ocr.preprocessor import to_array
+
+        pixels = to_array(sample_image)
+        with patch("lib.ocr.extractor.pytesseract", mock_pytesseract):
+            extractor = OCRExtractor(pixels, lang="eng", verify=False)
+            result = extractor.extract_text(preprocess=False, single_pass=True)
+            regions = extractor.extract_regions([BBox(x=10, y=20, width=50, height=30)], preprocess=False)
+
+        assert extractor.image_path is None
+        assert result.text == "Mocked OCR Text"
+        assert mock_pytesseract.image_to_data.call_args_list[0].args[0] is pixels
+        assert mock_pytesseract.image_to_string.call_args.args[0].shape == (30, 50, 3)
+        assert len(regions) == 1
+        mock_pytesseract.get_tesseract_version.assert_not_called()
+
+
 class TestCalculateConfidence:
     """_calculate_confidence 메서드 테스트"""
 
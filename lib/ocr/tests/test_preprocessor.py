@@ -9,7 +9,7 @@ from PIL import Image
 from unittest.mock import patch
 import numpy as np
 
-from lib.ocr.preprocessor import ImagePreprocessor
+from lib.ocr.preprocessor import ImagePreprocessor, to_array
 
 
 class TestGrayscale:
@@ -217,3 +217,48 @@ class TestGetPreset:
         """잘못된 프리셋 → ValueError"""
         with pytest.raises(ValueError, match="Unknown preset"):
             ImagePreprocessor.get_preset("invalid_preset")
+
+
+class TestArrayInput:
+    """NumPy 배열 입력 (PIL 변환 없이 배열 반환)"""
+
+    def test_to_array_shared_read_only(self, sample_image, tmp_image_path):
+        """1회 디코딩한 배열은 읽기 전용, 배열은 그대로 반환"""
+        pixels = to_array(sample_image)
+
+        assert pixels.shape == (100, 200, 3)
+        assert not pixels.flags.writeable
+        assert to_array(pixels) is pixels
+        assert np.array_equal(to_array(tmp_image_path), pixels)
+
+    def test_pipeline_matches_pil(self, sample_image):
+        """grayscale → threshold 결과가 PIL 입력과 동일"""
+        preprocessor = ImagePreprocessor()
+        steps = ["grayscale", "threshold"]
+
+        from_array = preprocessor.pipeline(to_array(sample_image), steps)
+        from_pil = preprocessor.pipeline(sample_image, steps)
+
+        assert isinstance(from_array, np.ndarray)
+        assert np.array_equal(from_array, np.asarray(from_pil))
+
+    @pytest.fixture
+    def textured_image(self):
+        """가장자리까지 픽셀값이 제각각인 무작위 RGB 이미지 (홀수 크기)"""
+        rng = np.random.default_rng(0)
+        return Image.fromarray(rng.integers(0, 256, (97, 131, 3), dtype=np.uint8))
+
+    def test_grayscale_matches_pil(self, textured_image):
+        """흑백 변환 배열 구현이 convert("L")과 동일"""
+        gray = ImagePreprocessor.grayscale(to_array(textured_image))
+
+        assert np.array_equal(gray, np.asarray(textured_image.convert("L")))
+
+    @pytest.mark.parametrize("strength", [0.5, 1.0, 2.0])
+    @pytest.mark.parametrize("mode", ["RGB", "L"])
+    def test_sharpen_matches_pil(self, textured_image, mode, strength):
+        """샤프닝 배열 구현이 ImageEnhance.Sharpness와 동일 (가장자리 포함)"""
+        image = textured_image.convert(mode)
+        sharpened = ImagePreprocessor.sharpen(to_array(image), strength=strength)
+
+        assert np.array_equal(sharpened, np.asarray(ImagePreprocessor.sharpen(image, strength=strength)))
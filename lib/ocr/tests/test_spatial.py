@@ -0,0 +1,85 @@
+"""
+lib.ocr.spatial 테스트
+
+격자 인덱스 + NumPy IoU 결과가 기존 전체 비교(greedy)와 동일한지 검증
+"""
+
+import random
+
+import pytest
+
+from lib.ocr.models import BBox
+from lib.ocr.spatial import greedy_deduplicate, overlap_pairs, overlapping_mask
+
+
+def _iou(a: BBox, b: BBox) -> float:
+    ix1, iy1 = max(a.x, b.x), max(a.y, b.y)
+    ix2, iy2 = min(a.x + a.width, b.x + b.width), min(a.y + a.height, b.y + b.height)
+    if ix2 <= ix1 or iy2 <= iy1:
+        return 0.0
+    inter = (ix2 - ix1) * (iy2 - iy1)
+    union = a.width * a.height + b.width * b.height - inter
+    return inter / union if union > 0 else 0.0
+
+
+def _reference_dedup(boxes, threshold):
+    kept = []
+    for i, box in enumerate(boxes):
+        if not any(_iou(box, boxes[k]) > threshold for k in kept):
+            kept.append(i)
+    return kept
+
+
+def _random_boxes(rng: random.Random, count: int) -> list[BBox]:
+    """작은 단어 박스 + 어긋난 중복 + 큰 패널 + 면적 0 박스 (음수 좌표 포함)"""
+    boxes: list[BBox] = []
+    for _ in range(count):
+        r = rng.random()
+        if r < 0.05:
+            boxes.append(BBox(rng.randint(-50, 400), rng.randint(-50, 400), rng.randint(200, 600), rng.randint(200, 600)))
+        elif r < 0.1:
+            boxes.append(BBox(rng.randint(0, 400), rng.randint(0, 400), rng.choice([0, 3]), rng.choice([0, 5])))
+        elif r < 0.35 and boxes:
+            src = rng.choice(boxes)
+            boxes.append(BBox(src.x + rng.randint(-3, 3), src.y + rng.randint(-3, 3), src.width + rng.randint(-2, 2), src.height))
+        else:
+            boxes.append(BBox(rng.randint(0, 600), rng.randint(0, 600), rng.randint(1, 60), rng.randint(1, 25)))
+    return boxes
+
+
+class TestGreedyDeduplicate:
+
+    @pytest.mark.parametrize("threshold", [0.5, 0.0, 0.9, -0.1])
+    def test_matches_reference(self, threshold):
+        rng = random.Random(7)
+        for _ in range(40):
+            boxes = _random_boxes(rng, rng.randint(0, 120))
+            assert greedy_deduplicate(boxes, threshold) == _reference_dedup(boxes, threshold)
+
+    def test_order_preserved(self):
+        boxes = [BBox(0, 0, 10, 10), BBox(1, 1, 10, 10), BBox(50, 50, 5, 5), BBox(0, 0, 10, 10)]
+        assert greedy_deduplicate(boxes) == [0, 2]
+
+    def test_chain_kept_when_middle_dropped(self):
+        """b는 a와 중복이라 버려지고, c는 b하고만 겹치므로 남음"""
+        a, b, c = BBox(0, 0, 10, 10), BBox(2, 0, 10, 10), BBox(5, 0, 10, 10)
+        assert _iou(a, c) <= 0.5 < _iou(b, c)
+        assert greedy_deduplicate([a, b, c]) == [0, 2]
+
+
+class TestOverlappingMask:
+
+    @pytest.mark.parametrize("threshold", [0.5, 0.0, 0.3, -1.0])
+    def test_matches_reference(self, threshold):
+        rng = random.Random(11)
+        for _ in range(40):
+            boxes = _random_boxes(rng, rng.randint(0, 80))
+            others = _random_boxes(rng, rng.randint(0, 120))
+            expected = [any(_iou(b, o) > threshold for o in others) for b in boxes]
+            assert overlapping_mask(boxes, others, threshold).tolist() == expected
+
+    def test_pairs_sorted(self):
+        boxes = [BBox(0, 0, 10, 10), BBox(100, 100, 10, 10)]
+        others = [BBox(100, 100, 10, 10), BBox(0, 0, 10, 9)]
+        ia, ib = overlap_pairs(boxes, others)
+        assert list(zip(ia.tolist(), ib.tolist())) == [(0, 1), (1, 0)]
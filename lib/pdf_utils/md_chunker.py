@@ -10,6 +10,7 @@ from pathlib import Path
 from typing import List
 
 from .prd_models import PRDChunk, PRDChunkResult
+from ..md_blocks import MdBlockKind, iter_blocks
 from .strategy import (
     estimate_tokens, auto_select_strategy, detect_prd_structure, enrich_chunk_metadata
 )
@@ -26,6 +27,10 @@ class BlockType(Enum):
     PARAGRAPH = "paragraph"
 
 
+_LIST_KINDS = (MdBlockKind.BULLET, MdBlockKind.NUMBERED, MdBlockKind.CHECKLIST)
+_HEADING_RE = re.compile(r'^#{1,4}\s')
+
+
 @dataclass
 class Block:
     type: BlockType
@@ -41,85 +46,88 @@ class Block:
 # ──────────────────────────────────────────────
 class MDParser:
     def parse(self, text: str) -> List[Block]:
-        """MD 텍스트를 Block 목록으로 파싱"""
+        """MD 텍스트를 Block 목록으로 파싱 (공유 블록 토크나이저 기반)
+
+        블록 규칙 (lib.md_blocks와 Google Docs 변환기와 동일):
+        - 표: '|'가 있는 줄 + 바로 다음 줄에 '---' 또는 ':-' → '|'가 있는 줄이
+          끝날 때까지 (앞뒤 '|' 불필요, 구분선의 대시 수 무관)
+        - 코드블록: ``` ~ 닫는 ``` (들여쓰기 허용, 내부 '#' 줄은 헤딩 아님)
+        - 헤딩: '#' 1~4개 + 공백. 그 외 '#' 줄(H5+, #태그)은 단락 텍스트
+        - 목록: -, *, +, 1. 항목과 들여쓰기된 연속 줄 (빈 줄 없이 단락 뒤에
+          이어지는 항목은 단락에 포함)
+        - 단락: 빈 줄 사이의 나머지 줄. 표가 아닌 '|' 줄도 단락에 포함
+
+        이전 줄 단위 파서는 구분선이 정확히 |---| 형태가 아닌 표와 표가 아닌
+        '|' 줄, H5+ 줄을 어떤 블록에도 넣지 않고 버렸습니다. 이 규칙에서는
+        입력의 모든 비어 있지 않은 줄이 블록에 포함됩니다.
+        """
         blocks = []
-        lines = text.split('\n')
-        i = 0
-        while i < len(lines):
-            line = lines[i]
-
-            # 코드블록
-            if line.strip().startswith('```'):
-                code_lines = [line]
-                i += 1
-                while i < len(lines) and not lines[i].strip().startswith('```'):
-                    code_lines.append(lines[i])
-                    i += 1
-                if i < len(lines):
-                    code_lines.append(lines[i])
-                i += 1
+        group_type = None      # 진행 중인 LIST / PARAGRAPH 그룹
+        group_lines: List[str] = []
+
+        def flush_group():
+            nonlocal group_type, group_lines
+            if group_lines:
+                blocks.append(Block(type=group_type, text='\n'.join(group_lines)))
+            group_type = None
+            group_lines = []
+
+        for mb in iter_blocks(text.split('\n')):
+            kind = mb.kind
+
+            # 목록: 연속된 항목 + 들여쓰기된 연속 줄
+            if kind in _LIST_KINDS:
+                if group_type is None:
+                    group_type = BlockType.LIST
+                group_lines.append(mb.line)
+                continue
+            if group_type is BlockType.LIST and kind is not MdBlockKind.BLANK \
+                    and mb.line.startswith('  '):
+                group_lines.extend(mb.lines)
+                continue
+
+            # 코드블록 / 표: 원자 블록
+            if kind is MdBlockKind.FENCE:
+                flush_group()
                 blocks.append(Block(
                     type=BlockType.CODE_BLOCK,
-                    text='\n'.join(code_lines),
+                    text=mb.raw,
                     is_atomic=True,
                     has_code=True
                 ))
                 continue
+            if kind is MdBlockKind.TABLE:
+                flush_group()
+                blocks.append(Block(
+                    type=BlockType.TABLE,
+                    text=mb.raw,
+                    is_atomic=True,
+                    has_table=True
+                ))
+                continue
 
-            # 표: 현재 행이 | 로 시작하고 다음 3행 이내에 구분선 존재
-            if line.strip().startswith('|'):
-                next_3 = lines[i+1:i+4]
-                is_table_start = any(
-                    '|---|' in l or '|:---|' in l or '|---:|' in l
-                    for l in next_3
-                )
-                if is_table_start or '|---|' in line:
-                    table_lines = []
-                    while i < len(lines) and lines[i].strip().startswith('|'):
-                        table_lines.append(lines[i])
-                        i += 1
-                    blocks.append(Block(
-                        type=BlockType.TABLE,
-                        text='\n'.join(table_lines),
-                        is_atomic=True,
-                        has_table=True
-                    ))
-                    continue
-
-            # 헤딩
-            heading_match = re.match(r'^(#{1,4})\s+(.*)', line)
-            if heading_match:
-                level = len(heading_match.group(1))
+            # 헤딩 (H1~H4, # 뒤 공백 필수)
+            if kind is MdBlockKind.HEADING and _HEADING_RE.match(mb.line):
+                flush_group()
                 blocks.append(Block(
                     type=BlockType.HEADING,
-                    text=line,
-                    level=level
+                    text=mb.line,
+                    level=mb.level
                 ))
-                i += 1
                 continue
 
-            # 목록
-            if re.match(r'^(\s*[-*+]|\s*\d+\.)\s+', line):
-                list_lines = []
-                while i < len(lines) and (
-                    re.match(r'^(\s*[-*+]|\s*\d+\.)\s+', lines[i]) or
-                    (lines[i].startswith('  ') and list_lines)
-                ):
-                    list_lines.append(lines[i])
-                    i += 1
-                blocks.append(Block(type=BlockType.LIST, text='\n'.join(list_lines)))
+            # 빈 줄: 단락/목록 경계
+            if kind is MdBlockKind.BLANK:
+                flush_group()
                 continue
 
-            # 단락
-            para_lines = []
-            while i < len(lines) and lines[i].strip() and not lines[i].startswith('#') and not lines[i].strip().startswith('|') and not lines[i].strip().startswith('```'):
-                para_lines.append(lines[i])
-                i += 1
-            if para_lines:
-                blocks.append(Block(type=BlockType.PARAGRAPH, text='\n'.join(para_lines)))
-            else:
-                i += 1
+            # 단락 (목록 그룹은 단락 줄에서 종료)
+            if group_type is BlockType.LIST:
+                flush_group()
+            group_type = BlockType.PARAGRAPH
+            group_lines.extend(mb.lines)
 
+        flush_group()
         return blocks
 
 
@@ -235,3 +235,57 @@ def test_tc09_performance_large_document(tmp_path):
 
     assert result.chunk_count >= 1
     assert elapsed < 30.0, f"Hierarchical 청킹이 30초 초과: {elapsed:.2f}초"
+
+
+# ──────────────────────────────────────────────
+# TC10: 블록 규칙 — 공유 토크나이저 기반 파싱 결과 고정
+# ──────────────────────────────────────────────
+def _blocks(md_content):
+    return [(b.type, b.text) for b in MDParser().parse(md_content)]
+
+
+def test_tc10_table_without_outer_pipes_and_wide_separator():
+    md_content = "| 항목 | 수량 |\n|:----:|------|\n| 메일 | 4개 |\n\n이름 | 값\n--- | ---\na | 1"
+
+    assert _blocks(md_content) == [
+        (BlockType.TABLE, "| 항목 | 수량 |\n|:----:|------|\n| 메일 | 4개 |"),
+        (BlockType.TABLE, "이름 | 값\n--- | ---\na | 1"),
+    ]
+
+
+def test_tc10_table_continues_while_lines_contain_pipe():
+    md_content = "| a | b |\n|---|---|\n| 1 | 2 |\n설명 a|b 포함\n다음 단락"
+
+    assert _blocks(md_content) == [
+        (BlockType.TABLE, "| a | b |\n|---|---|\n| 1 | 2 |\n설명 a|b 포함"),
+        (BlockType.PARAGRAPH, "다음 단락"),
+    ]
+
+
+def test_tc10_pipe_line_without_separator_kept_as_paragraph():
+    md_content = "| 제목만 있는 줄 |\n\n|---|"
+
+    assert _blocks(md_content) == [
+        (BlockType.PARAGRAPH, "| 제목만 있는 줄 |"),
+        (BlockType.PARAGRAPH, "|---|"),
+    ]
+
+
+def test_tc10_paragraph_then_list_and_list_then_paragraph():
+    assert _blocks("소개 문장\n- 항목1\n- 항목2") == [
+        (BlockType.PARAGRAPH, "소개 문장\n- 항목1\n- 항목2"),
+    ]
+    assert _blocks("- 항목1\n  이어지는 줄\n1. 항목2\n다음 단락") == [
+        (BlockType.LIST, "- 항목1\n  이어지는 줄\n1. 항목2"),
+        (BlockType.PARAGRAPH, "다음 단락"),
+    ]
+
+
+def test_tc10_h5_and_hash_lines_are_paragraph_text():
+    md_content = "#### H4\n##### H5 제목\n#태그\n\n```\n# 주석\n```"
+
+    assert _blocks(md_content) == [
+        (BlockType.HEADING, "#### H4"),
+        (BlockType.PARAGRAPH, "##### H5 제목\n#태그"),
+        (BlockType.CODE_BLOCK, "```\n# 주석\n```"),
+    ]
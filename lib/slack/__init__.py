@@ -21,6 +21,12 @@ Usage:
     # List channels
     channels = client.list_channels(include_private=True)
 
+asyncio (concurrent calls across channels, requires aiohttp):
+    from lib.slack import AsyncSlackClient
+
+    async with AsyncSlackClient() as client:
+        members = await asyncio.gather(*(client.get_channel_members(c) for c in channel_ids))
+
 User Token (for Slack Lists API):
     from lib.slack import SlackUserClient
 
@@ -38,12 +44,17 @@ CLI Usage:
     python -m lib.slack login --user    # Bot + User token (for Lists API)
     python -m lib.slack send "#general" "Hello!"
     python -m lib.slack history "#general"
+    python -m lib.slack sync C123       # Local archive (history/search from disk)
+    python -m lib.slack search C123 "release"
     python -m lib.slack channels
 """
 
 __version__ = "1.0.0"
 
-from .client import SlackClient, SlackUserClient, RateLimiter, load_token
+from .client import SlackClient, SlackUserClient, RateLimiter, get_rate_limiter, load_token
+from .async_client import AsyncSlackClient, AsyncSlackUserClient
+from .archive import SlackArchive
+from .directory import UserDirectory
 from .auth import login, get_token, get_user_token, load_credentials, save_token
 from .models import (
     SlackCredentials,
@@ -53,6 +64,7 @@ from .models import (
     SlackChannel,
     SlackUser,
     SendResult,
+    SyncResult,
 )
 from .errors import (
     SlackError,
@@ -71,8 +83,14 @@ __all__ = [
     # Client
     "SlackClient",
     "SlackUserClient",
+    "AsyncSlackClient",
+    "AsyncSlackUserClient",
     "RateLimiter",
+    "get_rate_limiter",
     "load_token",
+    # Archive / cache
+    "SlackArchive",
+    "UserDirectory",
     # Auth
     "login",
     "get_token",
@@ -87,6 +105,7 @@ __all__ = [
     "SlackChannel",
     "SlackUser",
     "SendResult",
+    "SyncResult",
     # Errors
     "SlackError",
     "SlackAuthError",
@@ -0,0 +1,333 @@
+"""
+Local Slack Channel Archive
+
+One SQLite file per channel holding every synced message and thread reply,
+with an FTS5 index over message text. ``sync`` only fetches messages newer
+than the stored high-water ts (``oldest=``), so repeated ``history``/``search``
+calls are answered from disk and hit the API only for the delta.
+
+Thread replies never move their parent past the high-water mark, so replies
+are fetched for new parents and, on each sync, for archived threads that were
+active within the last ``thread_days`` days. The history delta starts at the
+start of that window rather than at the high-water mark, so a message that
+gets its first reply after it was archived has its ``reply_count`` refreshed
+and its thread fetched.
+
+Usage:
+    archive = SlackArchive("C123")
+    result = archive.sync(SlackClient())
+    messages = archive.history(limit=20)
+    hits = archive.search("release notes")
+"""
+
+import json
+import sqlite3
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, Optional
+
+from .client import SlackClient
+from .models import SlackMessage, SyncResult
+
+# Archive directory — __file__ 기반 상대 경로 (이식성)
+_BASE = Path(__file__).resolve().parent.parent.parent  # → C:/claude/
+ARCHIVE_DIR = _BASE / "json" / "slack_archive"
+
+# Page size for conversations.history / conversations.replies during sync
+SYNC_PAGE_SIZE = 200
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS messages (
+    ts TEXT PRIMARY KEY,
+    thread_ts TEXT,
+    user TEXT,
+    text TEXT NOT NULL DEFAULT '',
+    reply_count INTEGER NOT NULL DEFAULT 0,
+    latest_reply TEXT,
+    files TEXT NOT NULL DEFAULT '[]'
+);
+CREATE INDEX IF NOT EXISTS idx_messages_thread ON messages (thread_ts, ts);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TRIGGER IF NOT EXISTS messages_ai AFTER INSERT ON messages BEGIN
+    INSERT INTO messages_fts (rowid, text) VALUES (new.rowid, new.text);
+END;
+CREATE TRIGGER IF NOT EXISTS messages_ad AFTER DELETE ON messages BEGIN
+    INSERT INTO messages_fts (messages_fts, rowid, text) VALUES ('delete', old.rowid, old.text);
+END;
+CREATE TRIGGER IF NOT EXISTS messages_au AFTER UPDATE OF text ON messages BEGIN
+    INSERT INTO messages_fts (messages_fts, rowid, text) VALUES ('delete', old.rowid, old.text);
+    INSERT INTO messages_fts (rowid, text) VALUES (new.rowid, new.text);
+END;
+"""
+
+# trigram matches substrings, so Korean words with attached particles are found
+# (needs SQLite 3.34+; older builds fall back to word tokens)
+_FTS_TOKENIZERS = ("trigram", "unicode61")
+_TRIGRAM_MIN = 3
+
+
+def archive_path(channel: str, archive_dir: Optional[Path] = None) -> Path:
+    """Archive file for a channel ID or name (#general → general.db)."""
+    return Path(archive_dir or ARCHIVE_DIR) / f"{channel.lstrip('#')}.db"
+
+
+class SlackArchive:
+    """
+    SQLite archive of one channel.
+
+    Usage:
+        archive = SlackArchive("C123")
+        archive.sync(client)
+        archive.search("deploy")
+    """
+
+    def __init__(self, channel: str, archive_dir: Optional[Path] = None):
+        """
+        Open (or create) the archive.
+
+        Args:
+            channel: Channel ID (C...) or name, as passed to the API
+            archive_dir: Directory holding archives. If None, uses ARCHIVE_DIR.
+        """
+        self.channel = channel
+        self.path = archive_path(channel, archive_dir)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path)
+        self._conn.row_factory = sqlite3.Row
+        self.tokenizer = self._create_fts()
+        self._conn.executescript(_SCHEMA)
+
+    @staticmethod
+    def exists(channel: str, archive_dir: Optional[Path] = None) -> bool:
+        return archive_path(channel, archive_dir).exists()
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def _create_fts(self) -> str:
+        existing = self._conn.execute(
+            "SELECT sql FROM sqlite_master WHERE name = 'messages_fts'"
+        ).fetchone()
+        if existing:
+            return "trigram" if "trigram" in existing[0] else "unicode61"
+        for tokenizer in _FTS_TOKENIZERS:
+            try:
+                self._conn.execute(
+                    "CREATE VIRTUAL TABLE messages_fts USING fts5("
+                    f"text, content='messages', content_rowid='rowid', tokenize='{tokenizer}')"
+                )
+                return tokenizer
+            except sqlite3.OperationalError:
+                continue
+        raise sqlite3.OperationalError("SQLite FTS5 is not available")
+
+    # --- meta ---
+
+    def _get_meta(self, key: str) -> Optional[str]:
+        row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key: str, value: str) -> None:
+        self._conn.execute(
+            "INSERT INTO meta (key, value) VALUES (?, ?) ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+            (key, value),
+        )
+
+    @property
+    def high_water(self) -> Optional[str]:
+        """Newest archived top-level message ts (the next sync's ``oldest``)."""
+        return self._get_meta("high_water")
+
+    @property
+    def last_sync(self) -> Optional[datetime]:
+        value = self._get_meta("last_sync")
+        return datetime.fromtimestamp(float(value)) if value else None
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM messages").fetchone()[0]
+
+    # --- write ---
+
+    def store(self, messages: Iterable[SlackMessage]) -> int:
+        """Insert or update messages. Returns the number of rows written."""
+        rows = [
+            (m.ts, m.thread_ts, m.user, m.text, m.reply_count, m.latest_reply, json.dumps(m.files, ensure_ascii=False))
+            for m in messages
+        ]
+        with self._conn:
+            self._conn.executemany(
+                "INSERT INTO messages (ts, thread_ts, user, text, reply_count, latest_reply, files) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(ts) DO UPDATE SET thread_ts = excluded.thread_ts, user = excluded.user, "
+                "text = excluded.text, reply_count = excluded.reply_count, "
+                "latest_reply = excluded.latest_reply, files = excluded.files",
+                rows,
+            )
+        return len(rows)
+
+    def _sync_thread(self, client: SlackClient, thread_ts: str, oldest: Optional[str]) -> int:
+        """Fetch replies of one thread newer than oldest. Returns the number of replies stored."""
+        replies = 0
+        cursor = None
+        while True:
+            page, cursor = client.get_replies_with_cursor(
+                self.channel, thread_ts, limit=SYNC_PAGE_SIZE, oldest=oldest, cursor=cursor
+            )
+            self.store(page)
+            replies += sum(1 for m in page if m.ts != thread_ts and (oldest is None or m.ts > oldest))
+            if not cursor:
+                return replies
+
+    def sync(self, client: SlackClient, thread_days: float = 7) -> SyncResult:
+        """
+        Fetch messages newer than the high-water mark and their thread replies.
+
+        Args:
+            client: SlackClient used for the delta
+            thread_days: Also re-check archived threads with a reply in this many
+                         days, and re-read messages posted in this many days
+                         (0 = only threads of newly fetched messages)
+
+        Returns:
+            SyncResult
+        """
+        start = time.perf_counter()
+        result = SyncResult(channel=self.channel)
+        oldest = self.high_water
+        newest = oldest
+        threads: dict[str, Optional[str]] = {}
+
+        # Re-read archived messages inside the thread window as well: their
+        # reply_count/latest_reply may have changed since they were stored
+        cutoff = f"{time.time() - thread_days * 86400:.6f}"
+        window = oldest
+        if thread_days > 0 and oldest is not None and float(cutoff) < float(oldest):
+            window = cutoff
+
+        cursor = None
+        while True:
+            page, cursor = client.get_history_with_cursor(
+                self.channel, limit=SYNC_PAGE_SIZE, oldest=window, cursor=cursor
+            )
+            page = [m for m in page if window is None or m.ts > window]
+            self.store(page)
+            for message in page:
+                if oldest is not None and message.ts <= oldest:
+                    continue
+                result.new_messages += 1
+                if newest is None or message.ts > newest:
+                    newest = message.ts
+                if message.reply_count:
+                    threads[message.ts] = None
+            if not cursor:
+                break
+
+        if thread_days > 0:
+            for row in self._conn.execute(
+                "SELECT p.ts, MAX(r.ts) FROM messages p LEFT JOIN messages r "
+                "ON r.thread_ts = p.ts AND r.ts != p.ts "
+                "WHERE p.reply_count > 0 AND (p.thread_ts IS NULL OR p.thread_ts = p.ts) "
+                "AND p.latest_reply > ? GROUP BY p.ts",
+                (cutoff,),
+            ).fetchall():
+                threads.setdefault(row[0], row[1])
+
+        for thread_ts, reply_oldest in threads.items():
+            result.new_replies += self._sync_thread(client, thread_ts, reply_oldest)
+        result.threads_checked = len(threads)
+
+        # Advance the high-water mark only after the whole delta is stored
+        with self._conn:
+            if newest:
+                self._set_meta("high_water", newest)
+            self._set_meta("last_sync", f"{time.time():.6f}")
+
+        result.high_water = newest
+        result.total = len(self)
+        result.elapsed = time.perf_counter() - start
+        return result
+
+    # --- read ---
+
+    def _to_message(self, row: sqlite3.Row) -> SlackMessage:
+        return SlackMessage(
+            ts=row["ts"],
+            text=row["text"],
+            channel=self.channel,
+            user=row["user"],
+            thread_ts=row["thread_ts"],
+            reply_count=row["reply_count"],
+            latest_reply=row["latest_reply"],
+            timestamp=datetime.fromtimestamp(float(row["ts"])),
+            files=json.loads(row["files"]),
+        )
+
+    def history(
+        self,
+        limit: int = 100,
+        oldest: Optional[str] = None,
+        latest: Optional[str] = None,
+        include_replies: bool = False,
+    ) -> list[SlackMessage]:
+        """
+        Archived messages, newest first (same order as conversations.history).
+
+        Args:
+            limit: Max messages to return
+            oldest: Only messages after this ts
+            latest: Only messages before this ts
+            include_replies: Include thread replies (default: top-level only)
+        """
+        sql = "SELECT * FROM messages WHERE 1"
+        params: list = []
+        if not include_replies:
+            sql += " AND (thread_ts IS NULL OR thread_ts = ts)"
+        if oldest is not None:
+            sql += " AND ts > ?"
+            params.append(oldest)
+        if latest is not None:
+            sql += " AND ts < ?"
+            params.append(latest)
+        sql += " ORDER BY ts DESC LIMIT ?"
+        params.append(limit)
+        return [self._to_message(row) for row in self._conn.execute(sql, params)]
+
+    def thread(self, thread_ts: str) -> list[SlackMessage]:
+        """Parent and replies of a thread, oldest first."""
+        rows = self._conn.execute(
+            "SELECT * FROM messages WHERE ts = ? OR thread_ts = ? ORDER BY ts", (thread_ts, thread_ts)
+        )
+        return [self._to_message(row) for row in rows]
+
+    def search(self, query: str, limit: int = 20) -> list[SlackMessage]:
+        """
+        Full-text search over archived messages and replies, newest first.
+
+        Every whitespace-separated term must appear. Terms too short for the
+        trigram index are matched with LIKE on the FTS candidates (or on the
+        whole archive when no term can use the index).
+        """
+        terms = [t for t in query.split() if t]
+        if not terms:
+            return []
+
+        indexable = [t for t in terms if self.tokenizer != "trigram" or len(t) >= _TRIGRAM_MIN]
+        short = [t for t in terms if t not in indexable]
+
+        if indexable:
+            match = " AND ".join('"' + t.replace('"', '""') + '"' for t in indexable)
+            sql = (
+                "SELECT m.* FROM messages_fts f JOIN messages m ON m.rowid = f.rowid "
+                "WHERE messages_fts MATCH ?"
+            )
+            params: list = [match]
+        else:
+            sql = "SELECT m.* FROM messages m WHERE 1"
+            params = []
+        for term in short:
+            sql += " AND m.text LIKE ? ESCAPE '\\'"
+            params.append("%" + term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%")
+        sql += " ORDER BY m.ts DESC LIMIT ?"
+        params.append(limit)
+        return [self._to_message(row) for row in self._conn.execute(sql, params)]
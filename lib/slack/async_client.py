@@ -0,0 +1,532 @@
+"""
+asyncio Slack Client with Rate Limiting
+
+Same surface as SlackClient, built on the SDK's AsyncWebClient (requires aiohttp).
+Calls draw from the same cross-process RateLimiter buckets, so calls to
+different methods run concurrently while calls to the same method are paced
+by its tier.
+
+Usage:
+    async with AsyncSlackClient() as client:
+        channels = await client.list_channels()
+        members = await asyncio.gather(*(client.get_channel_members(ch.id) for ch in channels))
+
+        # Fan a report out to many channels
+        await asyncio.gather(*(client.send_message(ch, report) for ch in targets))
+"""
+
+import asyncio
+from pathlib import Path
+from typing import Any, Optional
+
+from slack_sdk.errors import SlackApiError
+from slack_sdk.http_retry.async_handler import AsyncRetryHandler
+
+try:
+    from slack_sdk.web.async_client import AsyncWebClient
+except ImportError:
+    AsyncWebClient = None
+
+from .client import (
+    RateLimiter,
+    SlackClient,
+    _api_method,
+    _retry_after,
+    get_rate_limiter,
+    list_create_params,
+    list_initial_fields,
+    load_token,
+    parse_message,
+)
+from .directory import UserDirectory
+from .errors import SlackAPIError, SlackAuthError
+from .models import SlackChannel, SlackMessage, SlackUser, SendResult
+
+
+class AsyncSlackRateLimitRetryHandler(AsyncRetryHandler):
+    """asyncio version of SlackRateLimitRetryHandler (re-queue 429s through the shared buckets)."""
+
+    def __init__(self, limiter: RateLimiter, max_retry_count: int = 3):
+        super().__init__(max_retry_count=max_retry_count)
+        self.limiter = limiter
+
+    async def _can_retry_async(self, *, state, request, response=None, error=None) -> bool:
+        return response is not None and response.status_code == 429
+
+    async def prepare_for_next_attempt_async(self, *, state, request, response=None, error=None) -> None:
+        method = _api_method(request.url)
+        self.limiter.defer(method, _retry_after(response))
+        await asyncio.sleep(self.limiter.reserve(method))
+        state.next_attempt_requested = True
+        state.increment_current_attempt()
+
+
+class AsyncSlackClient:
+    """
+    asyncio Slack Web API client with rate limiting.
+
+    Usage:
+        async with AsyncSlackClient() as client:
+            result = await client.send_message("#general", "Hello!")
+    """
+
+    # Error mapping and parsing are shared with SlackClient
+    _handle_error = SlackClient._handle_error
+    _parse_user = staticmethod(SlackClient._parse_user)
+
+    def __init__(self, token: Optional[str] = None, rate_limiter: Optional[RateLimiter] = None):
+        """
+        Initialize client.
+
+        Args:
+            token: Bot token (xoxb-...). If None, loads from file.
+            rate_limiter: Limiter to use. If None, uses the process-wide shared limiter.
+        """
+        if AsyncWebClient is None:
+            raise ImportError("AsyncSlackClient requires aiohttp: pip install aiohttp")
+
+        if token is None:
+            token_obj = load_token()
+            token = token_obj.access_token
+
+        self._token = token
+        self._rate_limiter = rate_limiter or get_rate_limiter()
+        self._client = AsyncWebClient(token=token)
+        self._client.retry_handlers.append(AsyncSlackRateLimitRetryHandler(self._rate_limiter))
+        self._session = None
+        self._users: Optional[UserDirectory] = None
+
+    async def __aenter__(self) -> "AsyncSlackClient":
+        # One HTTP session for every request made inside the block
+        import aiohttp
+
+        self._session = aiohttp.ClientSession()
+        self._client.session = self._session
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+            self._client.session = None
+
+    async def _wait(self, method: str) -> float:
+        """Take a token from the shared bucket and sleep without blocking other tasks."""
+        delay = self._rate_limiter.reserve(method)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+
+    def _check_ok(self, response) -> dict:
+        if not response.data.get("ok"):
+            raise SlackAPIError(response.data.get("error", "unknown"), response.data)
+        return response.data
+
+    # --- messages ---
+
+    async def send_message(
+        self,
+        channel: str,
+        text: str,
+        thread_ts: Optional[str] = None,
+    ) -> SendResult:
+        """Send a message to a channel. See SlackClient.send_message."""
+        await self._wait("chat.postMessage")
+
+        try:
+            response = await self._client.chat_postMessage(channel=channel, text=text, thread_ts=thread_ts)
+            return SendResult(
+                ok=response.data.get("ok", True),
+                ts=response.data["ts"],
+                channel=response.data["channel"],
+                message=response.data.get("message"),
+            )
+        except SlackApiError as e:
+            self._handle_error(e)
+
+    async def upload_file(
+        self,
+        channel: str,
+        file_path: str,
+        title: str = "",
+        initial_comment: str = "",
+    ) -> SendResult:
+        """Upload a file to a channel. See SlackClient.upload_file."""
+        await self._wait("files.upload")
+
+        try:
+            response = await self._client.files_upload_v2(
+                channel=channel,
+                file=file_path,
+                title=title or Path(file_path).name,
+                initial_comment=initial_comment,
+            )
+
+            shares = response.data.get("file", {}).get("shares", {})
+            share_list = shares.get("public", {}).get(channel, []) or shares.get("private", {}).get(channel, [])
+            ts = share_list[0].get("ts", "") if share_list else ""
+
+            return SendResult(ok=response.data.get("ok", True), ts=ts, channel=channel)
+        except SlackApiError as e:
+            self._handle_error(e)
+            raise  # _handle_error always raises, but explicit for type safety
+
+    async def update_message(self, channel: str, ts: str, text: str) -> SendResult:
+        """Update an existing message. See SlackClient.update_message."""
+        await self._wait("chat.update")
+
+        try:
+            response = await self._client.chat_update(channel=channel, ts=ts, text=text)
+            return SendResult(
+                ok=response.data.get("ok", True),
+                ts=response.data["ts"],
+                channel=response.data["channel"],
+                message=response.data.get("message"),
+            )
+        except SlackApiError as e:
+            self._handle_error(e)
+
+    async def delete_message(self, channel: str, ts: str) -> bool:
+        """Delete a message from a channel."""
+        await self._wait("chat.delete")
+
+        try:
+            response = await self._client.chat_delete(channel=channel, ts=ts)
+            return response.data.get("ok", False)
+        except SlackApiError as e:
+            self._handle_error(e)
+
+    async def get_history(
+        self,
+        channel: str,
+        limit: int = 100,
+        oldest: Optional[str] = None,
+        latest: Optional[str] = None,
+    ) -> list[SlackMessage]:
+        """Get channel message history. See SlackClient.get_history."""
+        await self._wait("conversations.history")
+
+        try:
+            params = {"channel": channel, "limit": limit}
+            if oldest is not None:
+                params["oldest"] = oldest
+            if latest is not None:
+                params["latest"] = latest
+
+            response = await self._client.conversations_history(**params)
+            return [parse_message(msg, channel) for msg in response.data.get("messages", [])]
+        except SlackApiError as e:
+            self._handle_error(e)
+
+    async def get_history_with_cursor(
+        self,
+        channel: str,
+        limit: int = 100,
+        oldest: Optional[str] = None,
+        cursor: Optional[str] = None,
+    ) -> tuple[list[SlackMessage], Optional[str]]:
+        """cursor 기반 채널 히스토리 페이지네이션. See SlackClient.get_history_with_cursor."""
+        await self._wait("conversations.history")
+
+        try:
+            params: dict = {"channel": channel, "limit": limit}
+            if oldest is not None:
+                params["oldest"] = oldest
+            if cursor is not None:
+                params["cursor"] = cursor
+
+            response = await self._client.conversations_history(**params)
+            messages = [parse_message(msg, channel) for msg in response.data.get("messages", [])]
+            next_cursor = response.data.get("response_metadata", {}).get("next_cursor") or None
+            return messages, next_cursor
+        except SlackApiError as e:
+            self._handle_error(e)
+            return [], None
+
+    async def get_replies_with_cursor(
+        self,
+        channel: str,
+        thread_ts: str,
+        limit: int = 200,
+        oldest: Optional[str] = None,
+        cursor: Optional[str] = None,
+    ) -> tuple[list[SlackMessage], Optional[str]]:
+        """cursor 기반 스레드 답글 페이지네이션. See SlackClient.get_replies_with_cursor."""
+        await self._wait("conversations.replies")
+
+        try:
+            params: dict = {"channel": channel, "ts": thread_ts, "limit": limit}
+            if oldest is not None:
+                params["oldest"] = oldest
+            if cursor is not None:
+                params["cursor"] = cursor
+
+            response = await self._client.conversations_replies(**params)
+            messages = [parse_message(msg, channel) for msg in response.data.get("messages", [])]
+            next_cursor = response.data.get("response_metadata", {}).get("next_cursor") or None
+            return messages, next_cursor
+        except SlackApiError as e:
+            self._handle_error(e)
+            return [], None
+
+    async def get_reactions(self, channel: str, ts: str) -> list[dict]:
+        """Get reactions on a specific message."""
+        await self._wait("reactions.get")
+
+        try:
+            response = await self._client.reactions_get(channel=channel, timestamp=ts)
+            return response.data.get("message", {}).get("reactions", [])
+        except SlackApiError as e:
+            if e.response.data.get("error") == "no_item_found":
+                return []
+            self._handle_error(e)
+            return []
+
+    # --- channels ---
+
+    async def list_channels(
+        self,
+        include_private: bool = False,
+        exclude_archived: bool = True,
+    ) -> list[SlackChannel]:
+        """List channels the bot can access. See SlackClient.list_channels."""
+        types = "public_channel,private_channel" if include_private else "public_channel"
+        channels = []
+        cursor = None
+
+        try:
+            while True:
+                await self._wait("conversations.list")
+
+                params = {"types": types, "exclude_archived": exclude_archived, "limit": 200}
+                if cursor:
+                    params["cursor"] = cursor
+
+                response = await self._client.conversations_list(**params)
+
+                for ch in response.data.get("channels", []):
+                    channels.append(SlackChannel(
+                        id=ch["id"],
+                        name=ch["name"],
+                        is_private=ch.get("is_private", False),
+                        is_archived=ch.get("is_archived", False),
+                        is_member=ch.get("is_member", False),
+                        num_members=ch.get("num_members"),
+                        topic=ch.get("topic", {}).get("value") if isinstance(ch.get("topic"), dict) else None,
+                        purpose=ch.get("purpose", {}).get("value") if isinstance(ch.get("purpose"), dict) else None,
+                    ))
+
+                cursor = response.data.get("response_metadata", {}).get("next_cursor")
+                if not cursor:
+                    break
+
+            return channels
+        except SlackApiError as e:
+            self._handle_error(e)
+
+    async def get_channel_info(self, channel_id: str) -> dict:
+        """Get channel information."""
+        await self._wait("conversations.info")
+
+        try:
+            response = await self._client.conversations_info(channel=channel_id)
+            return response.data["channel"]
+        except SlackApiError as e:
+            self._handle_error(e)
+
+    async def get_channel_members(self, channel_id: str) -> list[str]:
+        """Get channel members."""
+        await self._wait("conversations.members")
+
+        try:
+            response = await self._client.conversations_members(channel=channel_id)
+            return response.data["members"]
+        except SlackApiError as e:
+            self._handle_error(e)
+
+    async def get_pins(self, channel_id: str) -> list[dict]:
+        """Get pinned messages in a channel."""
+        await self._wait("pins.list")
+
+        try:
+            response = await self._client.pins_list(channel=channel_id)
+            return response.data["items"]
+        except SlackApiError as e:
+            self._handle_error(e)
+
+    # --- users ---
+
+    @property
+    def _directory(self) -> UserDirectory:
+        """
+        Cached workspace user directory, shared on disk with SlackClient.
+
+        Built without a fetching client: its sync fetch methods (get, ensure,
+        refresh, resolve_names) would get coroutines back from this client, so
+        they raise instead. Use get_user / resolve_user_names.
+        """
+        if self._users is None:
+            self._users = UserDirectory(None)
+        return self._users
+
+    async def fetch_user(self, user_id: str) -> SlackUser:
+        """Get user information directly from users.info (no cache)."""
+        await self._wait("users.info")
+
+        try:
+            response = await self._client.users_info(user=user_id)
+            return self._parse_user(response.data.get("user", {}), user_id)
+        except SlackApiError as e:
+            self._handle_error(e)
+
+    async def list_users(self) -> list[SlackUser]:
+        """List every user in the workspace (users.list, 200 per page)."""
+        users = []
+        cursor = None
+
+        try:
+            while True:
+                await self._wait("users.list")
+
+                params = {"limit": 200}
+                if cursor:
+                    params["cursor"] = cursor
+
+                response = await self._client.users_list(**params)
+                users.extend(self._parse_user(member) for member in response.data.get("members", []))
+
+                cursor = response.data.get("response_metadata", {}).get("next_cursor")
+                if not cursor:
+                    break
+
+            return users
+        except SlackApiError as e:
+            self._handle_error(e)
+
+    async def get_user(self, user_id: str) -> SlackUser:
+        """Get user information from the cached user directory."""
+        if self._directory.stale([user_id]):
+            self._directory.update([await self.fetch_user(user_id)])
+        return self._directory.cached(user_id)
+
+    async def resolve_user_names(self, user_ids: list[str]) -> dict[str, str]:
+        """
+        Map user IDs to display names using the cached user directory.
+
+        Stale users are refreshed with one users.list pass or concurrent users.info
+        calls, whichever costs fewer API calls.
+        """
+        directory = self._directory
+        stale = directory.stale(user_ids)
+        if stale:
+            if directory.bulk_is_cheaper(len(stale)):
+                directory.update(await self.list_users(), full=True)
+                stale = [uid for uid in stale if directory.cached(uid) is None]
+            results = await asyncio.gather(*(self.fetch_user(uid) for uid in stale), return_exceptions=True)
+            for result in results:
+                if isinstance(result, Exception) and not isinstance(result, SlackAPIError):
+                    raise result
+            fetched = [result for result in results if isinstance(result, SlackUser)]
+            if fetched:
+                directory.update(fetched)
+        return directory.names(user_ids)
+
+    # --- auth ---
+
+    async def validate_token(self) -> bool:
+        """Check if token is valid."""
+        try:
+            await self._wait("auth.test")
+            response = await self._client.auth_test()
+            return response.data.get("ok", False)
+        except SlackApiError:
+            return False
+
+    async def auth_test(self) -> dict:
+        """Test authentication and get user/team info."""
+        await self._wait("auth.test")
+
+        try:
+            response = await self._client.auth_test()
+            return response.data
+        except SlackApiError as e:
+            self._handle_error(e)
+
+    # --- Slack Lists API (user token) ---
+
+    async def create_list(
+        self,
+        name: str,
+        description: str = "",
+        todo_mode: bool = True,
+        schema: Optional[list[dict]] = None,
+    ) -> dict:
+        """Create a new Slack List. See SlackClient.create_list."""
+        await self._wait("slackLists.create")
+
+        try:
+            response = await self._client.api_call(
+                "slackLists.create",
+                json=list_create_params(name, description, todo_mode, schema),
+            )
+            return self._check_ok(response)
+        except SlackApiError as e:
+            self._handle_error(e)
+
+    async def add_list_item(self, list_id: str, fields: dict[str, Any]) -> dict:
+        """Add an item to a Slack List. See SlackClient.add_list_item."""
+        await self._wait("slackLists.items.create")
+
+        try:
+            response = await self._client.api_call(
+                "slackLists.items.create",
+                json={"list_id": list_id, "initial_fields": list_initial_fields(fields)},
+            )
+            return self._check_ok(response)
+        except SlackApiError as e:
+            self._handle_error(e)
+
+    async def get_list_items(self, list_id: str, limit: int = 100) -> dict:
+        """Get items from a Slack List."""
+        await self._wait("slackLists.items.list")
+
+        try:
+            response = await self._client.api_call(
+                "slackLists.items.list",
+                params={"list_id": list_id, "limit": limit},
+            )
+            return self._check_ok(response)
+        except SlackApiError as e:
+            self._handle_error(e)
+
+
+class AsyncSlackUserClient(AsyncSlackClient):
+    """
+    asyncio Slack client using User Token (Slack Lists API).
+
+    Usage:
+        async with AsyncSlackUserClient() as client:
+            await client.create_list("My List", "Description")
+    """
+
+    def __init__(self, token: Optional[str] = None, rate_limiter: Optional[RateLimiter] = None):
+        """
+        Initialize client with user token.
+
+        Args:
+            token: User token (xoxp-...). If None, loads from file.
+            rate_limiter: Limiter to use. If None, uses the process-wide shared limiter.
+        """
+        if token is None:
+            from .auth import get_user_token
+            user_token = get_user_token()
+            if user_token is None:
+                raise SlackAuthError(
+                    "User token not found. Run 'python -m lib.slack login --user' to authenticate."
+                )
+            token = user_token.access_token
+
+        super().__init__(token=token, rate_limiter=rate_limiter)
@@ -3,10 +3,15 @@ Slack CLI
 
 Usage:
     python -m lib.slack login
+    python -m lib.slack --wait-report history "#general"
     python -m lib.slack send "#general" "Hello!"
     python -m lib.slack history "#general" --limit 10
+    python -m lib.slack sync C123456789
+    python -m lib.slack search C123456789 "release notes"
     python -m lib.slack channels --include-private
+    python -m lib.slack channels --with-members
     python -m lib.slack user U123456789
+    python -m lib.slack users --refresh
     python -m lib.slack list-create "My List" --description "Todo list"
     python -m lib.slack list-add F0ACFAJ50BE "Task 1"
 """
@@ -34,6 +39,35 @@ app = typer.Typer(
 console = Console()
 
 
+@app.callback()
+def main_options(
+    ctx: typer.Context,
+    wait_report: bool = typer.Option(False, "--wait-report", help="Print time spent waiting on rate limits to stderr"),
+):
+    """
+    Slack CLI - Message sending and channel management
+    """
+    if wait_report:
+        ctx.call_on_close(_print_wait_report)
+
+
+def _print_wait_report() -> None:
+    """Print rate limit wait time of this invocation to stderr."""
+    from .client import get_rate_limiter
+
+    report = get_rate_limiter().report()
+    err = Console(stderr=True)
+    err.print(
+        f"[dim]Rate limit: {report['calls']} calls, waited {report['waited']:.1f}s, "
+        f"ratelimited {report['ratelimited']}x[/dim]"
+    )
+    for method, entry in report["methods"].items():
+        err.print(
+            f"[dim]  {method}: {entry['calls']} calls, waited {entry['waited']:.1f}s, "
+            f"ratelimited {entry['ratelimited']}x[/dim]"
+        )
+
+
 @app.command()
 def login(
     port: int = typer.Option(None, "--port", "-p", help="OAuth callback port (default: auto-detect)"),
@@ -194,36 +228,109 @@ def update(
         raise typer.Exit(1)
 
 
+def _print_messages(channel: str, messages: list, source: str = "", names: Optional[dict] = None) -> None:
+    """Print messages oldest first (messages are newest first)."""
+    suffix = f" [dim]({source})[/dim]" if source else ""
+    console.print(f"[bold]Messages in {channel} (latest {len(messages)}):[/bold]{suffix}\n")
+
+    for msg in reversed(messages):  # Show oldest first
+        user_display = (names or {}).get(msg.user, msg.user) or "bot"
+        text_preview = msg.text[:100] + "..." if len(msg.text) > 100 else msg.text
+        timestamp = msg.timestamp.strftime("%Y-%m-%d %H:%M") if msg.timestamp else msg.ts
+
+        if msg.thread_ts and msg.thread_ts != msg.ts:
+            console.print(f"  [dim]↳ {timestamp}[/dim] [cyan]{user_display}[/cyan]: {text_preview}")
+        else:
+            console.print(f"  [dim]{timestamp}[/dim] [cyan]{user_display}[/cyan]: {text_preview}")
+
+
+def _messages_json(messages: list, names: Optional[dict] = None) -> list[dict]:
+    output = []
+    for msg in messages:
+        item = {
+            "ts": msg.ts,
+            "user": msg.user,
+            "text": msg.text,
+            "thread_ts": msg.thread_ts,
+            "timestamp": msg.timestamp.isoformat() if msg.timestamp else None,
+        }
+        if names is not None:
+            item["user_name"] = names.get(msg.user)
+        output.append(item)
+    return output
+
+
+@app.command()
+def sync(
+    channel: str = typer.Argument(..., help="Channel ID (C...) or name"),
+    thread_days: float = typer.Option(7, "--thread-days", help="Re-check threads with replies in the last N days (0 = new threads only)"),
+    json_output: bool = typer.Option(False, "--json", "-j", help="Output as JSON"),
+):
+    """
+    Sync a channel into the local archive (only messages newer than the last sync).
+    """
+    from .archive import SlackArchive
+    from .client import SlackClient
+    from .errors import SlackError
+
+    try:
+        archive = SlackArchive(channel)
+        result = archive.sync(SlackClient(), thread_days=thread_days)
+
+        if json_output:
+            print(json.dumps({"ok": True, **result.model_dump(), "path": str(archive.path)}, ensure_ascii=False, indent=2))
+        else:
+            console.print(f"[green]✓ Synced {channel}[/green]")
+            console.print(f"  New messages: {result.new_messages}")
+            console.print(f"  New replies: {result.new_replies} ({result.threads_checked} threads checked)")
+            console.print(f"  Archived: {result.total} messages ({result.elapsed:.1f}s)")
+            console.print(f"  Archive: {archive.path}")
+    except SlackError as e:
+        if json_output:
+            print(json.dumps({"ok": False, "error": str(e)}, ensure_ascii=False))
+        else:
+            console.print(f"[red]✗ Failed to sync channel: {e}[/red]")
+        raise typer.Exit(1)
+
+
 @app.command()
 def history(
     channel: str = typer.Argument(..., help="Channel ID (C...) or name"),
     limit: int = typer.Option(10, "--limit", "-n", help="Number of messages to retrieve"),
     cursor: Optional[str] = typer.Option(None, "--cursor", help="Pagination cursor from previous response"),
+    offline: bool = typer.Option(False, "--offline", help="Read the local archive without fetching new messages"),
+    resolve_names: bool = typer.Option(False, "--names", help="Show author names from the cached user directory"),
     json_output: bool = typer.Option(False, "--json", "-j", help="Output as JSON"),
 ):
     """
     Read message history from a channel.
+
+    Channels synced with 'sync' are read from the local archive after fetching
+    only the messages newer than the last sync.
     """
+    from .archive import SlackArchive
     from .client import SlackClient
     from .errors import SlackError
 
     try:
         client = SlackClient()
-        messages, next_cursor = client.get_history_with_cursor(channel, limit=limit, cursor=cursor)
+        if cursor is None and SlackArchive.exists(channel):
+            archive = SlackArchive(channel)
+            if not offline:
+                archive.sync(client, thread_days=0)
+            messages, next_cursor, source = archive.history(limit=limit), None, "archive"
+        else:
+            messages, next_cursor = client.get_history_with_cursor(channel, limit=limit, cursor=cursor)
+            source = "api"
+        names = client.resolve_user_names([msg.user for msg in messages]) if resolve_names else None
 
         if json_output:
-            output = [{
-                "ts": msg.ts,
-                "user": msg.user,
-                "text": msg.text,
-                "thread_ts": msg.thread_ts,
-                "timestamp": msg.timestamp.isoformat() if msg.timestamp else None,
-            } for msg in messages]
             result = {
                 "channel": channel,
                 "count": len(messages),
-                "messages": output,
+                "messages": _messages_json(messages, names),
                 "response_metadata": {"next_cursor": next_cursor or ""},
+                "source": source,
             }
             print(json.dumps(result, ensure_ascii=False, indent=2))
         else:
@@ -231,17 +338,7 @@ def history(
                 console.print("[yellow]No messages found.[/yellow]")
                 return
 
-            console.print(f"[bold]Messages in {channel} (latest {len(messages)}):[/bold]\n")
-
-            for msg in reversed(messages):  # Show oldest first
-                user_display = msg.user or "bot"
-                text_preview = msg.text[:100] + "..." if len(msg.text) > 100 else msg.text
-                timestamp = msg.timestamp.strftime("%Y-%m-%d %H:%M") if msg.timestamp else msg.ts
-
-                if msg.thread_ts and msg.thread_ts != msg.ts:
-                    console.print(f"  [dim]↳ {timestamp}[/dim] [cyan]{user_display}[/cyan]: {text_preview}")
-                else:
-                    console.print(f"  [dim]{timestamp}[/dim] [cyan]{user_display}[/cyan]: {text_preview}")
+            _print_messages(channel, messages, source if source == "archive" else "", names)
 
             if next_cursor:
                 console.print(f"\n[dim]더 많은 메시지가 있습니다. --cursor {next_cursor} 옵션으로 다음 페이지 조회[/dim]")
@@ -253,10 +350,78 @@ def history(
         raise typer.Exit(1)
 
 
+@app.command()
+def search(
+    channel: str = typer.Argument(..., help="Channel ID (C...) or name (must be synced first)"),
+    query: str = typer.Argument(..., help="Search terms (all must match)"),
+    limit: int = typer.Option(20, "--limit", "-n", help="Max results"),
+    offline: bool = typer.Option(False, "--offline", help="Search the local archive without fetching new messages"),
+    resolve_names: bool = typer.Option(False, "--names", help="Show author names from the cached user directory"),
+    json_output: bool = typer.Option(False, "--json", "-j", help="Output as JSON"),
+):
+    """
+    Full-text search in a synced channel archive (messages and thread replies).
+    """
+    from .archive import SlackArchive
+    from .client import SlackClient
+    from .errors import SlackError
+
+    if not SlackArchive.exists(channel):
+        if json_output:
+            print(json.dumps({"error": f"No archive for {channel}. Run 'sync {channel}' first."}, ensure_ascii=False))
+        else:
+            console.print(f"[yellow]No archive for {channel}. Run 'python -m lib.slack sync {channel}' first.[/yellow]")
+        raise typer.Exit(1)
+
+    try:
+        client = SlackClient()
+        archive = SlackArchive(channel)
+        if not offline:
+            archive.sync(client, thread_days=0)
+        messages = archive.search(query, limit=limit)
+        names = client.resolve_user_names([msg.user for msg in messages]) if resolve_names else None
+
+        if json_output:
+            print(json.dumps({
+                "channel": channel,
+                "query": query,
+                "count": len(messages),
+                "messages": _messages_json(messages, names),
+            }, ensure_ascii=False, indent=2))
+        else:
+            if not messages:
+                console.print("[yellow]No messages found.[/yellow]")
+                return
+            _print_messages(channel, messages, f"search: {query}", names)
+    except SlackError as e:
+        if json_output:
+            print(json.dumps({"error": str(e)}, ensure_ascii=False))
+        else:
+            console.print(f"[red]✗ Failed to search: {e}[/red]")
+        raise typer.Exit(1)
+
+
+async def _list_channels_with_members(include_private: bool, exclude_archived: bool) -> tuple[list, dict]:
+    """List channels, then fetch every channel's member list concurrently."""
+    import asyncio
+
+    from .async_client import AsyncSlackClient
+
+    async with AsyncSlackClient() as client:
+        channel_list = await client.list_channels(include_private=include_private, exclude_archived=exclude_archived)
+        results = await asyncio.gather(
+            *(client.get_channel_members(ch.id) for ch in channel_list),
+            return_exceptions=True,
+        )
+    members = {ch.id: result for ch, result in zip(channel_list, results) if isinstance(result, list)}
+    return channel_list, members
+
+
 @app.command()
 def channels(
     include_private: bool = typer.Option(False, "--private", "-p", help="Include private channels"),
     show_archived: bool = typer.Option(False, "--archived", "-a", help="Include archived channels"),
+    with_members: bool = typer.Option(False, "--with-members", "-m", help="Fetch member IDs of every channel (concurrent)"),
     json_output: bool = typer.Option(False, "--json", "-j", help="Output as JSON"),
 ):
     """
@@ -266,20 +431,33 @@ def channels(
     from .errors import SlackError
 
     try:
-        client = SlackClient()
-        channel_list = client.list_channels(
-            include_private=include_private,
-            exclude_archived=not show_archived,
-        )
+        members: dict[str, list[str]] = {}
+        if with_members:
+            import asyncio
+
+            channel_list, members = asyncio.run(
+                _list_channels_with_members(include_private, exclude_archived=not show_archived)
+            )
+        else:
+            client = SlackClient()
+            channel_list = client.list_channels(
+                include_private=include_private,
+                exclude_archived=not show_archived,
+            )
 
         if json_output:
-            output = [{
-                "id": ch.id,
-                "name": ch.name,
-                "is_private": ch.is_private,
-                "is_archived": ch.is_archived,
-                "num_members": ch.num_members,
-            } for ch in channel_list]
+            output = []
+            for ch in channel_list:
+                item = {
+                    "id": ch.id,
+                    "name": ch.name,
+                    "is_private": ch.is_private,
+                    "is_archived": ch.is_archived,
+                    "num_members": ch.num_members,
+                }
+                if with_members:
+                    item["members"] = members.get(ch.id)
+                output.append(item)
             print(json.dumps({"count": len(channel_list), "channels": output}, ensure_ascii=False, indent=2))
         else:
             if not channel_list:
@@ -294,8 +472,11 @@ def channels(
 
             for ch in channel_list:
                 private_icon = "🔒" if ch.is_private else ""
-                members = str(ch.num_members) if ch.num_members else "-"
-                table.add_row(ch.id, f"#{ch.name}", private_icon, members)
+                if ch.id in members:
+                    count = str(len(members[ch.id]))
+                else:
+                    count = str(ch.num_members) if ch.num_members else "-"
+                table.add_row(ch.id, f"#{ch.name}", private_icon, count)
 
             console.print(table)
     except SlackError as e:
@@ -304,6 +485,9 @@ def channels(
         else:
             console.print(f"[red]✗ Failed to list channels: {e}[/red]")
         raise typer.Exit(1)
+    except ImportError as e:
+        console.print(f"[red]✗ {e}[/red]")
+        raise typer.Exit(1)
 
 
 @app.command()
@@ -349,6 +533,41 @@ def user(
         raise typer.Exit(1)
 
 
+@app.command()
+def users(
+    refresh: bool = typer.Option(False, "--refresh", "-r", help="Reload the directory with users.list even if cached"),
+    json_output: bool = typer.Option(False, "--json", "-j", help="Output as JSON"),
+):
+    """
+    Load the workspace user directory into the local cache.
+    """
+    import time
+
+    from .client import SlackClient
+    from .errors import SlackError
+
+    try:
+        directory = SlackClient().users
+        if refresh or time.time() - directory.loaded_at >= directory.ttl:
+            directory.refresh()
+
+        if json_output:
+            print(json.dumps({
+                "count": len(directory),
+                "loaded_at": directory.loaded_at,
+                "cache": str(directory.cache_path),
+            }, ensure_ascii=False, indent=2))
+        else:
+            console.print(f"[green]✓ {len(directory)} users cached[/green]")
+            console.print(f"  Cache: {directory.cache_path}")
+    except SlackError as e:
+        if json_output:
+            print(json.dumps({"error": str(e)}, ensure_ascii=False))
+        else:
+            console.print(f"[red]✗ Failed to load users: {e}[/red]")
+        raise typer.Exit(1)
+
+
 @app.command()
 def info(
     channel: str = typer.Argument(..., help="Channel ID (C...)"),
@@ -16,13 +16,17 @@ Usage:
 """
 
 import json
+import sqlite3
+import threading
 import time
 from pathlib import Path
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Callable, Optional
 from datetime import datetime
 
 from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
+from slack_sdk.http_retry.handler import RetryHandler
+from slack_sdk.http_retry.response import HttpResponse
 
 from .models import SlackToken, SlackTeam, SlackMessage, SlackChannel, SlackUser, SendResult
 from .errors import (
@@ -33,15 +37,65 @@ from .errors import (
     SlackTokenRevokedError,
 )
 
+if TYPE_CHECKING:
+    from .directory import UserDirectory
+
 
 # Token file path — __file__ 기반 상대 경로 (이식성)
 _BASE = Path(__file__).resolve().parent.parent.parent  # → C:/claude/
 TOKEN_PATH = _BASE / "json" / "slack_token.json"
 
 
+# Slack rate limit tiers: (requests per minute, burst capacity)
+TIER_LIMITS: dict[int, tuple[float, int]] = {
+    1: (1, 1),
+    2: (20, 3),
+    3: (50, 5),
+    4: (100, 10),
+}
+
+# Web API method → tier (unlisted methods use DEFAULT_TIER)
+METHOD_TIERS: dict[str, int] = {
+    "chat.postMessage": 2,
+    "chat.update": 3,
+    "chat.delete": 3,
+    "conversations.history": 3,
+    "conversations.replies": 3,
+    "conversations.list": 2,
+    "conversations.info": 3,
+    "conversations.members": 4,
+    "pins.list": 2,
+    "reactions.get": 3,
+    "users.info": 4,
+    "users.list": 2,
+    "auth.test": 4,
+    "files.upload": 2,
+    "files.getUploadURLExternal": 4,
+    "files.completeUploadExternal": 4,
+    "slackLists.create": 2,
+    "slackLists.items.create": 2,
+    "slackLists.items.list": 2,
+}
+DEFAULT_TIER = 3
+
+# Shared bucket state for every process on this host
+RATE_LIMIT_DB = _BASE / "json" / "slack_rate_limit.db"
+
+
 class RateLimiter:
     """
-    Per-method rate limiting for Slack API.
+    Cross-process token bucket rate limiting for Slack API.
+
+    One bucket per Web API method, sized by the method's Slack tier
+    (Slack applies limits per method per workspace). Bucket state lives in a
+    SQLite file so that every CLI invocation, cron job and hook on the host
+    draws from the same buckets.
+
+    A caller takes a token inside a single IMMEDIATE transaction. When the
+    bucket is empty the token count goes negative, which reserves the caller's
+    place in line, and the caller sleeps for the deficit outside the transaction.
+    A ``ratelimited`` response (Retry-After) pushes the bucket further into debt
+    so that every process backs off, not just the one that was rejected.
 
     Slack 2026 Rate Limits:
     - Tier 2 (~20 req/min): chat.postMessage, conversations.list
@@ -49,30 +103,168 @@ class RateLimiter:
     - Tier 4 (~100 req/min): users.info
     """
 
-    def __init__(self):
-        self.method_intervals = {
-            "chat.postMessage": 3.0,      # Tier 2
-            "chat.update": 3.0,           # Tier 2
-            "conversations.history": 2.0,  # Tier 3 (safe margin)
-            "conversations.replies": 2.0,  # Tier 3 (safe margin)
-            "conversations.list": 3.0,     # Tier 2
-            "users.info": 0.6,             # Tier 4
-            "auth.test": 1.0,              # Default
-            "files.upload": 3.0,           # Tier 2
-            "default": 1.0,
+    def __init__(self, db_path: Optional[Path] = None):
+        """
+        Initialize limiter.
+
+        Args:
+            db_path: Shared SQLite state file. If None, uses RATE_LIMIT_DB.
+                     Falls back to in-process state if the file cannot be opened.
+        """
+        self.db_path = Path(db_path) if db_path is not None else RATE_LIMIT_DB
+        self._lock = threading.Lock()
+        self._conn = self._connect()
+        self.stats: dict[str, dict[str, float]] = {}
+
+    def _connect(self) -> sqlite3.Connection:
+        try:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+        except (sqlite3.Error, OSError):
+            conn = sqlite3.connect(":memory:", isolation_level=None, check_same_thread=False)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS buckets ("
+            "method TEXT PRIMARY KEY, tokens REAL NOT NULL, updated REAL NOT NULL)"
+        )
+        return conn
+
+    @staticmethod
+    def limits(method: str) -> tuple[float, int]:
+        """(tokens per second, capacity) for a method."""
+        per_minute, burst = TIER_LIMITS[METHOD_TIERS.get(method, DEFAULT_TIER)]
+        return per_minute / 60.0, burst
+
+    def _update(self, method: str, change: Callable[[float], float]) -> float:
+        """Refill the bucket, apply change to its token count and return the new count."""
+        rate, capacity = self.limits(method)
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                now = time.time()
+                row = self._conn.execute(
+                    "SELECT tokens, updated FROM buckets WHERE method = ?", (method,)
+                ).fetchone()
+                tokens = float(capacity) if row is None else min(capacity, row[0] + max(now - row[1], 0) * rate)
+                tokens = change(tokens)
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO buckets (method, tokens, updated) VALUES (?, ?, ?)",
+                    (method, tokens, now),
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return tokens
+
+    def _record(self, method: str, key: str, value: float) -> None:
+        entry = self.stats.setdefault(method, {"calls": 0, "waited": 0.0, "ratelimited": 0})
+        entry[key] += value
+
+    def reserve(self, method: str) -> float:
+        """
+        Take a token without sleeping.
+
+        Returns:
+            Seconds the caller must wait before sending the request
+        """
+        rate, _ = self.limits(method)
+        tokens = self._update(method, lambda tokens: tokens - 1)
+        delay = -tokens / rate if tokens < 0 else 0.0
+        self._record(method, "calls", 1)
+        self._record(method, "waited", delay)
+        return delay
+
+    def wait_if_needed(self, method: str) -> float:
+        """
+        Wait if necessary to respect rate limits.
+
+        Returns:
+            Seconds spent waiting
+        """
+        delay = self.reserve(method)
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    def defer(self, method: str, retry_after: float) -> None:
+        """Push the shared bucket back by Retry-After seconds after a ratelimited response."""
+        rate, _ = self.limits(method)
+        # Drop banked tokens too, so nobody bursts right after the penalty
+        self._update(method, lambda tokens: min(tokens, 0) - retry_after * rate)
+        self._record(method, "ratelimited", 1)
+
+    @property
+    def total_wait(self) -> float:
+        return sum(entry["waited"] for entry in self.stats.values())
+
+    def report(self) -> dict:
+        """
+        Time spent waiting on rate limits by this process.
+
+        Returns:
+            {"calls", "waited", "ratelimited", "methods": {method: {...}}}
+        """
+        return {
+            "calls": int(sum(entry["calls"] for entry in self.stats.values())),
+            "waited": round(self.total_wait, 3),
+            "ratelimited": int(sum(entry["ratelimited"] for entry in self.stats.values())),
+            "methods": {
+                method: {"calls": int(e["calls"]), "waited": round(e["waited"], 3), "ratelimited": int(e["ratelimited"])}
+                for method, e in sorted(self.stats.items())
+            },
         }
-        self.last_call: dict[str, float] = {}
 
-    def wait_if_needed(self, method: str) -> None:
-        """Wait if necessary to respect rate limits."""
-        interval = self.method_intervals.get(method, self.method_intervals["default"])
-        last = self.last_call.get(method, 0)
-        elapsed = time.time() - last
 
-        if elapsed < interval:
-            time.sleep(interval - elapsed)
+_shared_limiter: Optional[RateLimiter] = None
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Process-wide RateLimiter used by clients created without an explicit limiter."""
+    global _shared_limiter
+    if _shared_limiter is None:
+        _shared_limiter = RateLimiter()
+    return _shared_limiter
+
+
+def _api_method(url: str) -> str:
+    """Web API method name from a request URL (https://slack.com/api/chat.postMessage)."""
+    return url.rsplit("/", 1)[-1].split("?", 1)[0]
+
 
-        self.last_call[method] = time.time()
+def _retry_after(response: HttpResponse) -> float:
+    for key, value in response.headers.items():
+        if key.lower() == "retry-after":
+            try:
+                return float(value[0] if isinstance(value, list) else value)
+            except (TypeError, ValueError, IndexError):
+                break
+    return 1.0
+
+
+class SlackRateLimitRetryHandler(RetryHandler):
+    """
+    Re-queue ratelimited (HTTP 429) requests through the shared buckets.
+
+    Instead of sleeping locally like the SDK's RateLimitErrorRetryHandler, the
+    Retry-After penalty is written to the shared bucket and the retry waits for
+    a new token like any other caller. When retries run out, the SDK raises
+    SlackApiError and the client surfaces it as SlackRateLimitError.
+    """
+
+    def __init__(self, limiter: RateLimiter, max_retry_count: int = 3):
+        super().__init__(max_retry_count=max_retry_count)
+        self.limiter = limiter
+
+    def _can_retry(self, *, state, request, response=None, error=None) -> bool:
+        return response is not None and response.status_code == 429
+
+    def prepare_for_next_attempt(self, *, state, request, response=None, error=None) -> None:
+        method = _api_method(request.url)
+        self.limiter.defer(method, _retry_after(response))
+        self.limiter.wait_if_needed(method)
+        state.next_attempt_requested = True
+        state.increment_current_attempt()
 
 
 def load_token() -> SlackToken:
@@ -112,6 +304,87 @@ def load_token() -> SlackToken:
         raise SlackAuthError(f"Invalid token file format: {e}")
 
 
+def parse_message(msg: dict, channel: str) -> SlackMessage:
+    """Convert a Web API message dict to SlackMessage."""
+    return SlackMessage(
+        ts=msg["ts"],
+        text=msg.get("text", ""),
+        channel=channel,
+        user=msg.get("user"),
+        thread_ts=msg.get("thread_ts"),
+        reply_count=msg.get("reply_count", 0),
+        latest_reply=msg.get("latest_reply"),
+        timestamp=datetime.fromtimestamp(float(msg["ts"])) if msg.get("ts") else None,
+        files=msg.get("files", []),
+    )
+
+
+def list_create_params(
+    name: str,
+    description: str = "",
+    todo_mode: bool = True,
+    schema: Optional[list[dict]] = None,
+) -> dict:
+    """Request body for slackLists.create."""
+    params = {
+        "name": name,
+        "todo_mode": todo_mode,
+    }
+
+    if description:
+        # description needs to be in Block Kit format
+        params["description_blocks"] = [
+            {
+                "type": "rich_text",
+                "elements": [{
+                    "type": "rich_text_section",
+                    "elements": [{
+                        "type": "text",
+                        "text": description,
+                    }]
+                }]
+            }
+        ]
+
+    if schema:
+        params["schema"] = schema
+
+    return params
+
+
+def list_initial_fields(fields: dict[str, Any]) -> list[dict]:
+    """Convert {column_id: value} to slackLists.items.create initial_fields format."""
+    initial_fields = []
+    for column_id, value in fields.items():
+        if isinstance(value, str):
+            # Text fields require rich_text as array (not wrapped in value)
+            initial_fields.append({
+                "column_id": column_id,
+                "rich_text": [{
+                    "type": "rich_text",
+                    "elements": [{
+                        "type": "rich_text_section",
+                        "elements": [{
+                            "type": "text",
+                            "text": value,
+                        }]
+                    }]
+                }]
+            })
+        elif isinstance(value, bool):
+            # Boolean fields (like todo_completed)
+            initial_fields.append({
+                "column_id": column_id,
+                "checkbox": value,
+            })
+        else:
+            initial_fields.append({
+                "column_id": column_id,
+                "value": value,
+            })
+    return initial_fields
+
+
 class SlackClient:
     """
     Slack Web API client with rate limiting.
@@ -121,20 +394,23 @@ class SlackClient:
         client = SlackClient(token="xoxb-...")  # Explicit token
     """
 
-    def __init__(self, token: Optional[str] = None):
+    def __init__(self, token: Optional[str] = None, rate_limiter: Optional[RateLimiter] = None):
         """
         Initialize client.
 
         Args:
             token: Bot token (xoxb-...). If None, loads from file.
+            rate_limiter: Limiter to use. If None, uses the process-wide shared limiter.
         """
         if token is None:
             token_obj = load_token()
             token = token_obj.access_token
 
         self._token = token
+        self._rate_limiter = rate_limiter or get_rate_limiter()
         self._client = WebClient(token=token)
-        self._rate_limiter = RateLimiter()
+        self._client.retry_handlers.append(SlackRateLimitRetryHandler(self._rate_limiter))
+        self._users = None
 
     def _handle_error(self, error: SlackApiError) -> None:
         """Convert Slack API errors to custom exceptions."""
@@ -345,18 +621,46 @@ class SlackClient:
 
             response = self._client.conversations_history(**params)
 
-            messages = []
-            for msg in response.data.get("messages", []):
-                messages.append(SlackMessage(
-                    ts=msg["ts"],
-                    text=msg.get("text", ""),
-                    channel=channel,
-                    user=msg.get("user"),
-                    thread_ts=msg.get("thread_ts"),
-                    reply_count=msg.get("reply_count", 0),
-                    timestamp=datetime.fromtimestamp(float(msg["ts"])) if msg.get("ts") else None,
-                    files=msg.get("files", []),
-                ))
+            messages = [parse_message(msg, channel) for msg in response.data.get("messages", [])]
+
+            next_cursor = response.data.get("response_metadata", {}).get("next_cursor") or None
+            return messages, next_cursor
+        except SlackApiError as e:
+            self._handle_error(e)
+            return [], None
+
+    def get_replies_with_cursor(
+        self,
+        channel: str,
+        thread_ts: str,
+        limit: int = 200,
+        oldest: Optional[str] = None,
+        cursor: Optional[str] = None,
+    ) -> tuple[list[SlackMessage], Optional[str]]:
+        """cursor 기반 스레드 답글 페이지네이션.
+
+        Args:
+            channel: Channel ID
+            thread_ts: Parent message timestamp
+            limit: Max messages per page (default 200)
+            oldest: Only messages after this Unix timestamp
+            cursor: Pagination cursor from previous response
+
+        Returns:
+            (messages, next_cursor) — the parent message comes first on the first page
+        """
+        self._rate_limiter.wait_if_needed("conversations.replies")
+
+        try:
+            params: dict = {"channel": channel, "ts": thread_ts, "limit": limit}
+            if oldest is not None:
+                params["oldest"] = oldest
+            if cursor is not None:
+                params["cursor"] = cursor
+
+            response = self._client.conversations_replies(**params)
+
+            messages = [parse_message(msg, channel) for msg in response.data.get("messages", [])]
 
             next_cursor = response.data.get("response_metadata", {}).get("next_cursor") or None
             return messages, next_cursor
@@ -417,9 +721,41 @@ class SlackClient:
         except SlackApiError as e:
             self._handle_error(e)
 
+    @staticmethod
+    def _parse_user(user_data: dict, user_id: str = "") -> SlackUser:
+        profile = user_data.get("profile", {})
+        return SlackUser(
+            id=user_data.get("id", user_id),
+            name=user_data.get("name", ""),
+            real_name=user_data.get("real_name") or profile.get("real_name"),
+            display_name=profile.get("display_name"),
+            email=profile.get("email"),
+            is_bot=user_data.get("is_bot", False),
+        )
+
+    @property
+    def users(self) -> "UserDirectory":
+        """Cached workspace user directory (loaded on first use)."""
+        if self._users is None:
+            from .directory import UserDirectory
+            self._users = UserDirectory(self)
+        return self._users
+
     def get_user(self, user_id: str) -> SlackUser:
         """
-        Get user information.
+        Get user information from the cached user directory.
+
+        Args:
+            user_id: User ID (U...)
+
+        Returns:
+            SlackUser object
+        """
+        return self.users.get(user_id)
+
+    def fetch_user(self, user_id: str) -> SlackUser:
+        """
+        Get user information directly from users.info (no cache).
 
         Args:
             user_id: User ID (U...)
@@ -431,21 +767,51 @@ class SlackClient:
 
         try:
             response = self._client.users_info(user=user_id)
+            return self._parse_user(response.data.get("user", {}), user_id)
+        except SlackApiError as e:
+            self._handle_error(e)
 
-            user_data = response.data.get("user", {})
-            profile = user_data.get("profile", {})
+    def list_users(self) -> list[SlackUser]:
+        """
+        List every user in the workspace (users.list, 200 per page).
 
-            return SlackUser(
-                id=user_data.get("id", user_id),
-                name=user_data.get("name", ""),
-                real_name=user_data.get("real_name") or profile.get("real_name"),
-                display_name=profile.get("display_name"),
-                email=profile.get("email"),
-                is_bot=user_data.get("is_bot", False),
-            )
+        Returns:
+            List of SlackUser objects (including deactivated users)
+        """
+        users = []
+        cursor = None
+
+        try:
+            while True:
+                self._rate_limiter.wait_if_needed("users.list")
+
+                params = {"limit": 200}
+                if cursor:
+                    params["cursor"] = cursor
+
+                response = self._client.users_list(**params)
+                users.extend(self._parse_user(member) for member in response.data.get("members", []))
+
+                cursor = response.data.get("response_metadata", {}).get("next_cursor")
+                if not cursor:
+                    break
+
+            return users
         except SlackApiError as e:
             self._handle_error(e)
 
+    def resolve_user_names(self, user_ids: list[str]) -> dict[str, str]:
+        """
+        Map user IDs to display names using the cached user directory.
+
+        Args:
+            user_ids: User IDs (duplicates and None are ignored)
+
+        Returns:
+            {user_id: display name}
+        """
+        return self.users.resolve_names(user_ids)
+
     def validate_token(self) -> bool:
         """
         Check if token is valid.
@@ -502,28 +868,7 @@ class SlackClient:
         self._rate_limiter.wait_if_needed("slackLists.create")
 
         try:
-            params = {
-                "name": name,
-                "todo_mode": todo_mode,
-            }
-
-            if description:
-                # description needs to be in Block Kit format
-                params["description_blocks"] = [
-                    {
-                        "type": "rich_text",
-                        "elements": [{
-                            "type": "rich_text_section",
-                            "elements": [{
-                                "type": "text",
-                                "text": description,
-                            }]
-                        }]
-                    }
-                ]
-
-            if schema:
-                params["schema"] = schema
+            params = list_create_params(name, description, todo_mode, schema)
 
             response = self._client.api_call(
                 "slackLists.create",
@@ -558,35 +903,7 @@ class SlackClient:
         self._rate_limiter.wait_if_needed("slackLists.items.create")
 
         try:
-            # Convert fields to initial_fields format
-            initial_fields = []
-            for column_id, value in fields.items():
-                if isinstance(value, str):
-                    # Text fields require rich_text as array (not wrapped in value)
-                    initial_fields.append({
-                        "column_id": column_id,
-                        "rich_text": [{
-                            "type": "rich_text",
-                            "elements": [{
-                                "type": "rich_text_section",
-                                "elements": [{
-                                    "type": "text",
-                                    "text": value,
-                                }]
-                            }]
-                        }]
-                    })
-                elif isinstance(value, bool):
-                    # Boolean fields (like todo_completed)
-                    initial_fields.append({
-                        "column_id": column_id,
-                        "checkbox": value,
-                    })
-                else:
-                    initial_fields.append({
-                        "column_id": column_id,
-                        "value": value,
-                    })
+            initial_fields = list_initial_fields(fields)
 
             response = self._client.api_call(
                 "slackLists.items.create",
@@ -750,12 +1067,13 @@ class SlackUserClient(SlackClient):
         result = client.create_list("My List", "Description")
     """
 
-    def __init__(self, token: Optional[str] = None):
+    def __init__(self, token: Optional[str] = None, rate_limiter: Optional[RateLimiter] = None):
         """
         Initialize client with user token.
 
         Args:
             token: User token (xoxp-...). If None, loads from file.
+            rate_limiter: Limiter to use. If None, uses the process-wide shared limiter.
         """
         if token is None:
             from .auth import get_user_token
@@ -767,4 +1085,4 @@ class SlackUserClient(SlackClient):
             token = user_token.access_token
 
         # Initialize parent with user token
-        super().__init__(token=token)
+        super().__init__(token=token, rate_limiter=rate_limiter)
@@ -0,0 +1,215 @@
+"""
+Slack User Directory Cache
+
+Bulk-loads the workspace with paginated users.list into a JSON cache on disk
+and serves user lookups and name resolution from memory, instead of one
+users.info call per user ID.
+
+Each entry carries its own fetch time. Missing or stale entries are refreshed
+individually with users.info, unless that would cost more calls than reloading
+the whole directory (users.list is Tier 2 at 200 users per page, users.info is
+Tier 4), in which case the directory is reloaded in bulk.
+
+Usage:
+    directory = UserDirectory(SlackClient())
+    user = directory.get("U123")
+    names = directory.resolve_names([m.user for m in messages])
+"""
+
+import json
+import math
+import os
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, Optional
+
+from .errors import SlackAPIError, SlackError
+from .models import SlackUser
+
+if TYPE_CHECKING:
+    from .client import SlackClient
+
+# Cache file path — __file__ 기반 상대 경로 (이식성)
+_BASE = Path(__file__).resolve().parent.parent.parent  # → C:/claude/
+USER_CACHE_PATH = _BASE / "json" / "slack_users.json"
+
+DEFAULT_TTL = 24 * 60 * 60  # seconds
+
+# users.list returns up to 200 users per page; users.info (Tier 4) is 5x cheaper
+# per call than users.list (Tier 2) under the rate limiter
+USERS_PER_PAGE = 200
+LIST_CALL_COST = 5
+
+
+def display_name(user: SlackUser) -> str:
+    """Name shown for a user: display name, then real name, then username."""
+    return user.display_name or user.real_name or user.name or user.id
+
+
+class UserDirectory:
+    """
+    In-memory workspace user directory backed by an on-disk cache.
+
+    Usage:
+        directory = UserDirectory(client, ttl=3600)
+        directory.get("U123").real_name
+    """
+
+    def __init__(
+        self,
+        client: Optional["SlackClient"],
+        cache_path: Optional[Path] = None,
+        ttl: float = DEFAULT_TTL,
+    ):
+        """
+        Initialize directory and load the disk cache if present.
+
+        Args:
+            client: SlackClient used to fetch users. None for a cache-only
+                    directory (AsyncSlackClient drives it through stale/update);
+                    its fetching methods then raise SlackError.
+            cache_path: JSON cache file. If None, uses USER_CACHE_PATH.
+            ttl: Seconds before a cached entry is considered stale
+        """
+        self.client = client
+        self.cache_path = Path(cache_path) if cache_path is not None else USER_CACHE_PATH
+        self.ttl = ttl
+        self.loaded_at: float = 0.0  # Last full users.list load
+        self._users: dict[str, SlackUser] = {}
+        self._fetched: dict[str, float] = {}
+        self._load()
+
+    def __len__(self) -> int:
+        return len(self._users)
+
+    def __contains__(self, user_id: str) -> bool:
+        return user_id in self._users
+
+    # --- disk cache ---
+
+    def _load(self) -> None:
+        if not self.cache_path.exists():
+            return
+        try:
+            data = json.loads(self.cache_path.read_text(encoding="utf-8"))
+            users = {uid: SlackUser(**entry["user"]) for uid, entry in data.get("users", {}).items()}
+            fetched = {uid: float(entry["fetched_at"]) for uid, entry in data.get("users", {}).items()}
+        except (json.JSONDecodeError, IOError, KeyError, TypeError, ValueError):
+            return  # Corrupt cache: start empty and reload
+        self._users, self._fetched = users, fetched
+        self.loaded_at = float(data.get("loaded_at", 0))
+
+    def save(self) -> None:
+        """Write the directory to disk (atomic replace)."""
+        data = {
+            "loaded_at": self.loaded_at,
+            "users": {
+                uid: {"user": user.model_dump(), "fetched_at": self._fetched.get(uid, 0.0)}
+                for uid, user in self._users.items()
+            },
+        }
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.cache_path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp_path, self.cache_path)
+
+    # --- refresh ---
+
+    def _is_stale(self, user_id: str, now: float) -> bool:
+        return now - self._fetched.get(user_id, 0.0) >= self.ttl
+
+    def stale(self, user_ids: Iterable[Optional[str]]) -> list[str]:
+        """IDs that are missing or older than the TTL (duplicates and None removed)."""
+        now = time.time()
+        return [uid for uid in dict.fromkeys(user_ids) if uid and self._is_stale(uid, now)]
+
+    def bulk_is_cheaper(self, missing: int) -> bool:
+        """Whether reloading with users.list costs fewer calls than users.info for each missing user."""
+        # Before the first load the workspace size is unknown: assume one page
+        pages = max(1, math.ceil(len(self._users) / USERS_PER_PAGE))
+        return missing > pages * LIST_CALL_COST
+
+    def update(self, users: Iterable[SlackUser], full: bool = False) -> None:
+        """
+        Store freshly fetched users and save the cache.
+
+        Args:
+            users: Users from users.list or users.info
+            full: True if users is the complete users.list result
+        """
+        now = time.time()
+        for user in users:
+            self._users[user.id] = user
+            self._fetched[user.id] = now
+        if full:
+            self.loaded_at = now
+        self.save()
+
+    def _fetcher(self) -> "SlackClient":
+        if self.client is None:
+            raise SlackError("UserDirectory has no client to fetch users; use stale/update/names/cached")
+        return self.client
+
+    def refresh(self) -> int:
+        """
+        Reload the whole directory with users.list.
+
+        Returns:
+            Number of users loaded
+        """
+        self.update(self._fetcher().list_users(), full=True)
+        return len(self._users)
+
+    def ensure(self, user_ids: Iterable[Optional[str]]) -> None:
+        """Make sure the given users are cached and fresh, with as few API calls as possible."""
+        stale = self.stale(user_ids)
+        if not stale:
+            return
+        if self.bulk_is_cheaper(len(stale)):
+            self.refresh()
+            # Users not in users.list (e.g. other workspaces in shared channels)
+            stale = [uid for uid in stale if uid not in self._users]
+        fetched = []
+        for user_id in stale:
+            try:
+                fetched.append(self._fetcher().fetch_user(user_id))
+            except SlackAPIError:
+                continue  # user_not_found etc.: leave unresolved
+        if fetched:
+            self.update(fetched)
+
+    # --- lookup ---
+
+    def cached(self, user_id: str) -> Optional[SlackUser]:
+        """Cached user without any API call (may be stale)."""
+        return self._users.get(user_id)
+
+    def get(self, user_id: str) -> SlackUser:
+        """
+        Get a user, fetching only if missing or stale.
+
+        Raises:
+            SlackAPIError: User does not exist
+        """
+        if self.stale([user_id]):
+            # A single user is always cheaper with users.info than users.list
+            self.update([self._fetcher().fetch_user(user_id)])
+        return self._users[user_id]
+
+    def names(self, user_ids: Iterable[Optional[str]]) -> dict[str, str]:
+        """Display names from the cache only (unknown IDs map to themselves)."""
+        return {
+            uid: display_name(self._users[uid]) if uid in self._users else uid
+            for uid in dict.fromkeys(user_ids) if uid
+        }
+
+    def resolve_names(self, user_ids: Iterable[Optional[str]]) -> dict[str, str]:
+        """
+        Map user IDs to display names (unknown IDs map to themselves).
+
+        Args:
+            user_ids: User IDs, e.g. message authors (duplicates and None are ignored)
+        """
+        user_ids = [uid for uid in dict.fromkeys(user_ids) if uid]
+        self.ensure(user_ids)
+        return self.names(user_ids)
@@ -61,6 +61,7 @@ class SlackMessage(BaseModel):
     user: Optional[str] = None
     thread_ts: Optional[str] = None
     reply_count: int = 0
+    latest_reply: Optional[str] = None  # ts of the newest reply (thread parents only)
     timestamp: Optional[datetime] = None  # Parsed timestamp
     files: list[dict] = Field(default_factory=list)  # File attachments
 
@@ -110,3 +111,15 @@ class SendResult(BaseModel):
         """Generate message permalink"""
         ts_no_dot = self.ts.replace(".", "")
         return f"https://slack.com/archives/{self.channel}/p{ts_no_dot}"
+
+
+class SyncResult(BaseModel):
+    """Result of syncing a channel into the local archive"""
+
+    channel: str
+    new_messages: int = 0  # Top-level messages fetched
+    new_replies: int = 0  # Thread replies fetched
+    threads_checked: int = 0  # Threads whose replies were fetched
+    high_water: Optional[str] = None  # Newest archived top-level ts
+    total: int = 0  # Messages in the archive after sync
+    elapsed: float = 0.0  # Seconds
@@ -0,0 +1,197 @@
+"""
+Tests for the local Slack channel archive
+"""
+
+import time
+from typing import Optional
+
+import pytest
+
+from lib.slack.archive import SlackArchive
+from lib.slack.models import SlackMessage
+
+
+class FakeSlack:
+    """Minimal in-memory stand-in for SlackClient's paginated history/replies"""
+
+    def __init__(self, page_size: int = 2):
+        self.page_size = page_size
+        self.messages: list[SlackMessage] = []
+        self.replies: dict[str, list[SlackMessage]] = {}
+        self.history_calls: list[Optional[str]] = []
+        self.reply_calls: list[tuple[str, Optional[str]]] = []
+
+    def post(self, ts: str, text: str, user: str = "U1") -> None:
+        self.messages.append(SlackMessage(ts=ts, text=text, channel="C1", user=user))
+
+    def reply(self, parent_ts: str, ts: str, text: str) -> None:
+        self.replies.setdefault(parent_ts, []).append(
+            SlackMessage(ts=ts, text=text, channel="C1", user="U2", thread_ts=parent_ts)
+        )
+        for i, msg in enumerate(self.messages):
+            if msg.ts == parent_ts:
+                self.messages[i] = msg.model_copy(update={
+                    "thread_ts": parent_ts,
+                    "reply_count": len(self.replies[parent_ts]),
+                    "latest_reply": ts,
+                })
+
+    def _page(self, items, cursor):
+        start = int(cursor or 0)
+        end = start + self.page_size
+        return items[start:end], (str(end) if end < len(items) else None)
+
+    def get_history_with_cursor(self, channel, limit=100, oldest=None, cursor=None):
+        if cursor is None:
+            self.history_calls.append(oldest)
+        items = sorted((m for m in self.messages if oldest is None or m.ts > oldest), key=lambda m: m.ts, reverse=True)
+        return self._page(items, cursor)
+
+    def get_replies_with_cursor(self, channel, thread_ts, limit=200, oldest=None, cursor=None):
+        if cursor is None:
+            self.reply_calls.append((thread_ts, oldest))
+        parent = next(m for m in self.messages if m.ts == thread_ts)
+        items = [parent] + [m for m in self.replies.get(thread_ts, []) if oldest is None or m.ts > oldest]
+        return self._page(items, cursor)
+
+
+@pytest.fixture
+def slack():
+    fake = FakeSlack()
+    fake.post("1700000001.000100", "배포 일정 공유드립니다")
+    fake.post("1700000002.000100", "release notes draft")
+    fake.post("1700000003.000100", "회의록 정리했습니다")
+    fake.reply("1700000002.000100", "1700000002.000200", "looks good, ship it")
+    return fake
+
+
+@pytest.fixture
+def archive(tmp_path):
+    archive = SlackArchive("C1", archive_dir=tmp_path)
+    yield archive
+    archive.close()
+
+
+class TestSync:
+    def test_initial_sync_stores_messages_and_replies(self, archive, slack):
+        result = archive.sync(slack)
+
+        assert result.new_messages == 3
+        assert result.new_replies == 1
+        assert result.high_water == "1700000003.000100"
+        assert len(archive) == 4
+        assert slack.history_calls == [None]
+
+    def test_second_sync_fetches_only_delta(self, archive, slack):
+        archive.sync(slack)
+        slack.post("1700000004.000100", "new message")
+
+        result = archive.sync(slack)
+
+        assert slack.history_calls == [None, "1700000003.000100"]
+        assert result.new_messages == 1
+        assert archive.high_water == "1700000004.000100"
+        assert len(archive) == 5
+
+    def test_new_reply_in_old_thread_is_picked_up(self, archive, slack):
+        slack.reply("1700000002.000100", f"{time.time():.6f}", "follow-up reply")
+        archive.sync(slack)
+        latest = slack.replies["1700000002.000100"][-1].ts
+        slack.reply("1700000002.000100", f"{float(latest) + 1:.6f}", "late reply")
+
+        result = archive.sync(slack)
+
+        assert result.new_messages == 0
+        assert result.new_replies == 1
+        assert slack.reply_calls[-1] == ("1700000002.000100", latest)
+        assert [m.text for m in archive.thread("1700000002.000100")][-1] == "late reply"
+
+    def test_first_reply_to_archived_message_is_picked_up(self, archive, slack):
+        recent = f"{time.time() - 3600:.6f}"
+        slack.post(recent, "recent question")
+        archive.sync(slack)
+        assert archive.search("answer") == []
+        slack.reply(recent, f"{float(recent) + 1:.6f}", "first answer")
+
+        result = archive.sync(slack)
+
+        assert result.new_messages == 0
+        assert result.new_replies == 1
+        assert result.threads_checked >= 1
+        assert archive.high_water == recent
+        assert [m.text for m in archive.search("answer")] == ["first answer"]
+        assert archive.history(limit=1)[0].reply_count == 1
+
+    def test_thread_days_zero_skips_old_threads(self, archive, slack):
+        archive.sync(slack)
+        calls = len(slack.reply_calls)
+
+        archive.sync(slack, thread_days=0)
+
+        assert len(slack.reply_calls) == calls
+
+    def test_high_water_unchanged_when_sync_fails(self, archive, slack):
+        archive.sync(slack)
+        slack.post("1700000004.000100", "new message")
+        slack.get_history_with_cursor = lambda *a, **k: (_ for _ in ()).throw(RuntimeError("boom"))
+
+        with pytest.raises(RuntimeError):
+            archive.sync(slack)
+
+        assert archive.high_water == "1700000003.000100"
+
+    def test_archive_persists_across_instances(self, tmp_path, slack):
+        first = SlackArchive("#general", archive_dir=tmp_path)
+        first.sync(slack)
+        first.close()
+
+        assert SlackArchive.exists("general", archive_dir=tmp_path)
+        second = SlackArchive("#general", archive_dir=tmp_path)
+        assert second.high_water == "1700000003.000100"
+        assert len(second) == 4
+        second.close()
+
+
+class TestRead:
+    def test_history_newest_first_without_replies(self, archive, slack):
+        archive.sync(slack)
+
+        messages = archive.history(limit=10)
+
+        assert [m.ts for m in messages] == ["1700000003.000100", "1700000002.000100", "1700000001.000100"]
+        assert messages[1].reply_count == 1
+
+    def test_history_limit_and_include_replies(self, archive, slack):
+        archive.sync(slack)
+
+        assert len(archive.history(limit=2)) == 2
+        assert len(archive.history(limit=10, include_replies=True)) == 4
+
+    def test_search_matches_replies(self, archive, slack):
+        archive.sync(slack)
+
+        assert [m.text for m in archive.search("ship")] == ["looks good, ship it"]
+
+    def test_search_korean_substring(self, archive, slack):
+        archive.sync(slack)
+
+        # Substring of a word with endings attached (trigram index)
+        assert [m.text for m in archive.search("정리했")] == ["회의록 정리했습니다"]
+        # Two-syllable word, shorter than a trigram (LIKE)
+        assert [m.text for m in archive.search("회의")] == ["회의록 정리했습니다"]
+        assert [m.text for m in archive.search("배포 일정")] == ["배포 일정 공유드립니다"]
+
+    def test_search_requires_all_terms(self, archive, slack):
+        archive.sync(slack)
+
+        assert [m.text for m in archive.search("release draft")] == ["release notes draft"]
+        assert archive.search("release ship") == []
+
+    def test_search_updates_with_edited_text(self, archive, slack):
+        archive.sync(slack)
+        edited = archive.history(limit=1)[0].model_copy(update={"text": "minutes uploaded"})
+
+        archive.store([edited])
+
+        assert archive.search("회의록") == []
+        assert [m.ts for m in archive.search("uploaded")] == [edited.ts]
@@ -0,0 +1,143 @@
+"""
+Tests for the asyncio Slack client (SDK AsyncWebClient is mocked)
+"""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from slack_sdk.errors import SlackApiError
+
+from lib.slack.async_client import AsyncSlackClient
+from lib.slack.client import RateLimiter
+from lib.slack.directory import UserDirectory
+from lib.slack.errors import SlackAPIError, SlackChannelNotFoundError, SlackError
+
+
+def async_response(data: dict, delay: float = 0.0):
+    """AsyncMock side effect returning a SlackResponse-like object after delay"""
+
+    async def call(*args, **kwargs):
+        if delay:
+            await asyncio.sleep(delay)
+        response = MagicMock()
+        response.data = data
+        return response
+
+    return call
+
+
+@pytest.fixture
+def mock_async_webclient():
+    with patch("lib.slack.async_client.AsyncWebClient") as mock_class:
+        mock_client = MagicMock()
+        mock_client.retry_handlers = []
+        mock_class.return_value = mock_client
+        yield mock_client
+
+
+@pytest.fixture
+def limiter(tmp_path):
+    return RateLimiter(tmp_path / "rate_limit.db")
+
+
+@pytest.fixture
+def client(mock_async_webclient, limiter, tmp_path):
+    client = AsyncSlackClient(token="xoxb-test", rate_limiter=limiter)
+    client._users = UserDirectory(None, cache_path=tmp_path / "users.json")
+    return client
+
+
+def test_requires_async_sdk_client(limiter):
+    with patch("lib.slack.async_client.AsyncWebClient", None):
+        with pytest.raises(ImportError, match="aiohttp"):
+            AsyncSlackClient(token="xoxb-test", rate_limiter=limiter)
+
+
+def test_different_methods_run_concurrently(client, mock_async_webclient):
+    mock_async_webclient.conversations_members = AsyncMock(side_effect=async_response({"members": ["U1"]}, 0.2))
+    mock_async_webclient.pins_list = AsyncMock(side_effect=async_response({"items": []}, 0.2))
+    mock_async_webclient.reactions_get = AsyncMock(side_effect=async_response({"message": {}}, 0.2))
+
+    async def run():
+        return await asyncio.gather(
+            client.get_channel_members("C1"),
+            client.get_pins("C1"),
+            client.get_reactions("C1", "1.0"),
+        )
+
+    start = time.perf_counter()
+    members, pins, reactions = asyncio.run(run())
+    elapsed = time.perf_counter() - start
+
+    assert (members, pins, reactions) == (["U1"], [], [])
+    assert elapsed < 0.5
+
+
+def test_same_method_is_paced_by_tier(client, mock_async_webclient, limiter):
+    mock_async_webclient.users_info = AsyncMock(side_effect=async_response({"user": {"id": "U1"}}))
+    rate, capacity = limiter.limits("users.info")
+    # Drain the burst so the gathered calls must queue
+    for _ in range(capacity):
+        limiter.reserve("users.info")
+
+    async def run():
+        return await asyncio.gather(*(client.fetch_user("U1") for _ in range(3)))
+
+    start = time.perf_counter()
+    asyncio.run(run())
+    elapsed = time.perf_counter() - start
+
+    assert elapsed >= 3 / rate * 0.9
+    assert limiter.report()["methods"]["users.info"]["calls"] == capacity + 3
+
+
+def test_resolve_user_names_fetches_stale_users_concurrently(client, mock_async_webclient):
+    async def users_info(user):
+        if user == "U404":
+            raise SlackApiError("not found", MagicMock(data={"ok": False, "error": "user_not_found"}))
+        response = MagicMock()
+        response.data = {"user": {"id": user, "profile": {"display_name": f"name-{user}"}}}
+        return response
+
+    mock_async_webclient.users_info = AsyncMock(side_effect=users_info)
+
+    names = asyncio.run(client.resolve_user_names(["U1", "U2", "U1", None, "U404"]))
+
+    assert names == {"U1": "name-U1", "U2": "name-U2", "U404": "U404"}
+    assert mock_async_webclient.users_info.await_count == 3
+    # Second call is served from the cache
+    asyncio.run(client.resolve_user_names(["U1", "U2"]))
+    assert mock_async_webclient.users_info.await_count == 3
+
+
+def test_directory_cannot_fetch_synchronously(client, mock_async_webclient):
+    mock_async_webclient.users_info = AsyncMock(side_effect=async_response({"user": {"id": "U1"}}))
+    mock_async_webclient.users_list = AsyncMock(side_effect=async_response({"members": []}))
+
+    assert not hasattr(client, "users")
+    directory = client._directory
+    for misuse in (lambda: directory.get("U1"), lambda: directory.resolve_names(["U1"]), directory.refresh):
+        with pytest.raises(SlackError):
+            misuse()
+
+    assert mock_async_webclient.users_info.call_count == 0
+    assert mock_async_webclient.users_list.call_count == 0
+    assert asyncio.run(client.get_user("U1")).id == "U1"
+    assert directory.get("U1").id == "U1"  # Fresh entries are served from the cache
+
+
+def test_errors_map_to_slack_errors(client, mock_async_webclient):
+    error = SlackApiError("error", MagicMock(data={"ok": False, "error": "channel_not_found"}))
+    mock_async_webclient.chat_postMessage = AsyncMock(side_effect=error)
+
+    with pytest.raises(SlackChannelNotFoundError):
+        asyncio.run(client.send_message("#missing", "hi"))
+
+
+def test_lists_api_checks_ok(client, mock_async_webclient):
+    mock_async_webclient.api_call = AsyncMock(side_effect=async_response({"ok": False, "error": "invalid_schema"}))
+
+    with pytest.raises(SlackAPIError):
+        asyncio.run(client.create_list("My List"))
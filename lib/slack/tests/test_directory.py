@@ -0,0 +1,126 @@
+"""
+Tests for the cached Slack user directory
+"""
+
+import json
+
+import pytest
+from slack_sdk.errors import SlackApiError
+
+from lib.slack.client import RateLimiter, SlackClient
+from lib.slack.directory import UserDirectory, display_name
+from lib.slack.errors import SlackAPIError
+
+
+def _member(n: int) -> dict:
+    return {
+        "id": f"U{n:04d}",
+        "name": f"user{n}",
+        "real_name": f"User {n}",
+        "profile": {"display_name": f"u{n}" if n % 2 else "", "email": f"user{n}@example.com"},
+    }
+
+
+@pytest.fixture
+def workspace(mock_webclient, mock_slack_response):
+    """users.list with 450 members over 3 pages"""
+    members = [_member(n) for n in range(450)]
+    pages = {None: (members[:200], "c1"), "c1": (members[200:400], "c2"), "c2": (members[400:], "")}
+
+    def users_list(limit=200, cursor=None):
+        page, next_cursor = pages[cursor]
+        return mock_slack_response({"members": page, "response_metadata": {"next_cursor": next_cursor}})
+
+    def users_info(user):
+        n = int(user[1:]) if user[1:].isdigit() else -1
+        if not 0 <= n < 1000:
+            response = mock_slack_response({"error": "user_not_found"}, ok=False)
+            raise SlackApiError("user_not_found", response)
+        return mock_slack_response({"user": _member(n)})
+
+    mock_webclient.users_list.side_effect = users_list
+    mock_webclient.users_info.side_effect = users_info
+    return mock_webclient
+
+
+@pytest.fixture
+def client(workspace, tmp_path):
+    client = SlackClient(token="xoxb-test", rate_limiter=RateLimiter(tmp_path / "rate.db"))
+    client._rate_limiter.wait_if_needed = lambda method: 0.0
+    client._users = UserDirectory(client, cache_path=tmp_path / "users.json")
+    return client
+
+
+class TestUserDirectory:
+    def test_many_authors_bulk_load_once(self, client, workspace):
+        authors = [f"U{n:04d}" for n in range(0, 400, 5)]  # 80 authors
+
+        names = client.resolve_user_names(authors + authors[:10] + [None])
+
+        assert workspace.users_list.call_count == 3
+        assert workspace.users_info.call_count == 0
+        assert len(names) == 80
+        assert names["U0005"] == "u5"
+        assert names["U0000"] == "User 0"
+
+    def test_few_missing_users_use_users_info(self, client, workspace):
+        names = client.resolve_user_names(["U0001", "U0002"])
+
+        assert workspace.users_list.call_count == 0
+        assert workspace.users_info.call_count == 2
+        assert names == {"U0001": "u1", "U0002": "User 2"}
+
+    def test_get_user_served_from_memory(self, client, workspace):
+        client.users.refresh()
+
+        user = client.get_user("U0123")
+        client.get_user("U0123")
+
+        assert user.email == "user123@example.com"
+        assert workspace.users_info.call_count == 0
+
+    def test_cache_persists_to_disk(self, client, workspace, tmp_path):
+        client.users.refresh()
+
+        reloaded = UserDirectory(client, cache_path=tmp_path / "users.json")
+
+        assert len(reloaded) == 450
+        assert reloaded.get("U0449").name == "user449"
+        assert workspace.users_list.call_count == 3
+
+    def test_only_stale_entries_refreshed(self, client, workspace, tmp_path):
+        client.users.refresh()
+        path = tmp_path / "users.json"
+        data = json.loads(path.read_text(encoding="utf-8"))
+        data["users"]["U0007"]["fetched_at"] = 0
+        path.write_text(json.dumps(data), encoding="utf-8")
+
+        reloaded = UserDirectory(client, cache_path=path)
+        reloaded.resolve_names(["U0007", "U0008"])
+
+        assert workspace.users_info.call_count == 1
+        workspace.users_info.assert_called_with(user="U0007")
+
+    def test_expired_directory_reloads_in_bulk(self, client, workspace):
+        client.users.refresh()
+        client.users.ttl = 0
+
+        client.users.resolve_names([f"U{n:04d}" for n in range(100)])
+
+        assert workspace.users_list.call_count == 6
+
+    def test_unknown_user(self, client, workspace):
+        assert client.resolve_user_names(["UNKNOWN"]) == {"UNKNOWN": "UNKNOWN"}
+        with pytest.raises(SlackAPIError):
+            client.get_user("UNKNOWN")
+
+    def test_corrupt_cache_starts_empty(self, client, tmp_path):
+        path = tmp_path / "broken.json"
+        path.write_text("{not json", encoding="utf-8")
+
+        assert len(UserDirectory(client, cache_path=path)) == 0
+
+    def test_display_name_fallback(self, client):
+        user = client.fetch_user("U0004")
+        assert display_name(user) == "User 4"
+        assert display_name(user.model_copy(update={"real_name": None})) == "user4"
@@ -0,0 +1,170 @@
+"""
+Tests for the cross-process Slack rate limiter
+"""
+
+import math
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+from slack_sdk.http_retry.request import HttpRequest
+from slack_sdk.http_retry.response import HttpResponse
+from slack_sdk.http_retry.state import RetryState
+
+from lib.slack.client import RateLimiter, SlackClient, SlackRateLimitRetryHandler
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return tmp_path / "rate_limit.db"
+
+
+@pytest.fixture
+def frozen_time():
+    """Freeze the limiter clock and record sleeps instead of sleeping"""
+    clock = {"now": 1_000_000.0}
+    sleeps = []
+
+    def fake_sleep(seconds):
+        sleeps.append(seconds)
+        clock["now"] += seconds
+
+    with patch("lib.slack.client.time.time", side_effect=lambda: clock["now"]), \
+            patch("lib.slack.client.time.sleep", side_effect=fake_sleep):
+        yield clock, sleeps
+
+
+def _reserve_many(db_path, method, count):
+    limiter = RateLimiter(db_path)
+    return [limiter.reserve(method) for _ in range(count)]
+
+
+class TestTokenBucket:
+    def test_burst_then_tier_rate(self, db_path, frozen_time):
+        _, sleeps = frozen_time
+        limiter = RateLimiter(db_path)
+        rate, capacity = limiter.limits("conversations.list")  # Tier 2
+
+        waits = [limiter.wait_if_needed("conversations.list") for _ in range(capacity + 2)]
+
+        assert waits[:capacity] == [0.0] * capacity
+        assert waits[capacity] == pytest.approx(1 / rate)
+        assert waits[capacity + 1] == pytest.approx(1 / rate)
+        assert sum(sleeps) == pytest.approx(2 / rate)
+
+    def test_refills_over_time(self, db_path, frozen_time):
+        clock, _ = frozen_time
+        limiter = RateLimiter(db_path)
+        rate, capacity = limiter.limits("users.info")
+        for _ in range(capacity):
+            limiter.reserve("users.info")
+
+        clock["now"] += 1 / rate
+        assert limiter.reserve("users.info") == pytest.approx(0.0, abs=1e-6)
+        assert limiter.reserve("users.info") == pytest.approx(1 / rate)
+
+    def test_methods_have_independent_buckets(self, db_path, frozen_time):
+        limiter = RateLimiter(db_path)
+        _, capacity = limiter.limits("chat.postMessage")
+        for _ in range(capacity):
+            limiter.reserve("chat.postMessage")
+
+        assert limiter.reserve("chat.postMessage") > 0
+        assert limiter.reserve("conversations.history") == 0.0
+
+    def test_state_shared_between_limiters(self, db_path, frozen_time):
+        first, second = RateLimiter(db_path), RateLimiter(db_path)
+        rate, capacity = first.limits("chat.postMessage")
+        for _ in range(capacity):
+            first.reserve("chat.postMessage")
+
+        # Second limiter queues behind the first one's reservations
+        assert second.reserve("chat.postMessage") == pytest.approx(1 / rate)
+        assert first.reserve("chat.postMessage") == pytest.approx(2 / rate)
+
+    def test_concurrent_connections_never_overdraw(self, db_path):
+        # Separate connections lock the same SQLite file the way separate processes do
+        limiter = RateLimiter(db_path)
+        rate, capacity = limiter.limits("conversations.list")
+        delays = []
+        start = time.time()
+        threads = [
+            threading.Thread(target=lambda: delays.extend(_reserve_many(db_path, "conversations.list", capacity)))
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=30)
+        refilled = math.ceil((time.time() - start) * rate)
+
+        # One bucket's worth of burst across all callers; the rest queue at the tier rate
+        assert len(delays) == 4 * capacity
+        assert sum(1 for d in delays if d == 0.0) <= capacity + refilled
+        assert max(delays) >= (3 * capacity - refilled) / rate
+
+    def test_unwritable_path_falls_back_to_memory(self, tmp_path, frozen_time):
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+        limiter = RateLimiter(blocker / "sub" / "rate_limit.db")
+
+        assert limiter.reserve("auth.test") == 0.0
+
+
+class TestRetryAfter:
+    def test_defer_blocks_all_limiters(self, db_path, frozen_time):
+        first, second = RateLimiter(db_path), RateLimiter(db_path)
+        first.reserve("conversations.history")
+
+        first.defer("conversations.history", 30)
+
+        rate, _ = second.limits("conversations.history")
+        assert second.reserve("conversations.history") == pytest.approx(30 + 1 / rate)
+
+    def test_retry_handler_requeues_through_bucket(self, db_path, frozen_time):
+        _, sleeps = frozen_time
+        limiter = RateLimiter(db_path)
+        handler = SlackRateLimitRetryHandler(limiter, max_retry_count=2)
+        state = RetryState()
+        request = HttpRequest(method="POST", url="https://slack.com/api/chat.postMessage", headers={})
+        response = HttpResponse(status_code=429, headers={"Retry-After": ["12"]})
+
+        assert handler.can_retry(state=state, request=request, response=response)
+        handler.prepare_for_next_attempt(state=state, request=request, response=response)
+
+        assert state.next_attempt_requested
+        assert state.current_attempt == 1
+        assert sleeps and sleeps[-1] >= 12
+        assert limiter.report()["methods"]["chat.postMessage"]["ratelimited"] == 1
+
+    def test_retry_handler_ignores_other_errors(self, db_path):
+        handler = SlackRateLimitRetryHandler(RateLimiter(db_path))
+        request = HttpRequest(method="POST", url="https://slack.com/api/chat.postMessage", headers={})
+
+        assert not handler.can_retry(
+            state=RetryState(), request=request, response=HttpResponse(status_code=500, headers={})
+        )
+
+
+class TestReport:
+    def test_report_totals(self, db_path, frozen_time):
+        limiter = RateLimiter(db_path)
+        _, capacity = limiter.limits("pins.list")
+        for _ in range(capacity + 1):
+            limiter.wait_if_needed("pins.list")
+
+        report = limiter.report()
+        assert report["calls"] == capacity + 1
+        assert report["waited"] > 0
+        assert report["methods"]["pins.list"]["calls"] == capacity + 1
+
+    def test_client_uses_limiter_and_installs_retry_handler(self, mock_webclient, db_path, frozen_time):
+        mock_webclient.retry_handlers = []
+        limiter = RateLimiter(db_path)
+        client = SlackClient(token="xoxb-test", rate_limiter=limiter)
+
+        client.send_message("C123", "hi")
+
+        assert any(isinstance(h, SlackRateLimitRetryHandler) for h in mock_webclient.retry_handlers)
+        assert limiter.report()["methods"]["chat.postMessage"]["calls"] == 1
@@ -6,22 +6,41 @@ Google Docs → 로컬 Markdown 캐시 동기화.
 
 import logging
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from .client import GoogleDocsClient, _get_project_root
-from .metadata_manager import MetadataManager
+from .metadata_manager import MetadataManager, PRDMetadata
 
 logger = logging.getLogger(__name__)
 
 
+def _revision_token(file: Optional[Dict[str, Any]]) -> str:
+    """Drive 파일 정보 → 변경 식별자
+
+    Google Docs 파일은 headRevisionId가 비어 있는 경우가 많아
+    version + modifiedTime을 함께 사용합니다.
+    """
+    if not file:
+        return ""
+    if file.get("headRevisionId"):
+        return file["headRevisionId"]
+    if file.get("version") or file.get("modifiedTime"):
+        return f"{file.get('version', '')}@{file.get('modifiedTime', '')}"
+    return ""
+
+
 class CacheManager:
     """로컬 캐시 관리자"""
 
     # 기본 캐시 디렉토리
     DEFAULT_CACHE_DIR = _get_project_root() / "tasks" / "prds"
 
+    # sync_all 동시 다운로드 수
+    DEFAULT_SYNC_WORKERS = 8
+
     # 캐시 파일 헤더 템플릿
     CACHE_HEADER_TEMPLATE = """<!--
   {prd_id} Local Cache (Read-Only)
@@ -64,6 +83,9 @@ class CacheManager:
         """
         단일 PRD 동기화 (Google Docs → 로컬 캐시)
 
+        내려받기 전에 revision을 조회해 함께 기록하므로, 이후 sync_all은
+        이 문서가 바뀌지 않았다면 다시 내려받지 않습니다.
+
         Args:
             prd_id: PRD ID
 
@@ -75,6 +97,36 @@ class CacheManager:
             logger.warning(f"PRD를 찾을 수 없음: {prd_id}")
             return False
 
+        file: Optional[Dict[str, Any]] = None
+        try:
+            file = self.client.get_file_revisions(
+                [prd.google_doc_id], [prd.google_folder_id or self.client.folder_id]
+            ).get(prd.google_doc_id)
+        except Exception as e:
+            logger.warning(f"revision 조회 실패: {prd_id} - {e}")
+
+        cache_path = self._download(prd)
+        if cache_path is None:
+            return False
+
+        # 메타데이터 업데이트 (조회 시점 revision 기록)
+        fields: Dict[str, Any] = {
+            "local_cache": cache_path.name,
+            "synced_revision": _revision_token(file),
+        }
+        parents = (file or {}).get("parents") or []
+        if parents and prd.google_folder_id not in parents:
+            fields["google_folder_id"] = parents[0]
+        self.metadata.update_prd(prd_id, **fields)
+        return True
+
+    def _download(self, prd: PRDMetadata) -> Optional[Path]:
+        """
+        문서를 가져와 캐시 파일로 저장 (메타데이터는 갱신하지 않음, 스레드 안전)
+
+        Returns:
+            캐시 파일 경로, 실패 시 None
+        """
         try:
             # Google Docs에서 내용 가져오기
             doc = self.client.get_document(prd.google_doc_id)
@@ -82,43 +134,101 @@ class CacheManager:
 
             # 캐시 파일 헤더 생성
             header = self.CACHE_HEADER_TEMPLATE.format(
-                prd_id=prd_id,
+                prd_id=prd.prd_id,
                 google_doc_url=prd.google_doc_url,
                 last_sync=datetime.utcnow().isoformat() + "Z",
             )
 
             # 캐시 파일 저장
             self._ensure_cache_dir()
-            cache_path = self._get_cache_path(prd_id)
+            cache_path = self._get_cache_path(prd.prd_id)
 
             with open(cache_path, "w", encoding="utf-8") as f:
                 f.write(header)
                 f.write(content)
 
-            # 메타데이터 업데이트
-            self.metadata.update_prd(prd_id, local_cache=cache_path.name)
-
-            logger.info(f"캐시 동기화 완료: {prd_id} → {cache_path}")
-            return True
+            logger.info(f"캐시 동기화 완료: {prd.prd_id} → {cache_path}")
+            return cache_path
 
         except Exception as e:
-            logger.error(f"캐시 동기화 실패: {prd_id} - {e}")
-            return False
+            logger.error(f"캐시 동기화 실패: {prd.prd_id} - {e}")
+            return None
 
-    def sync_all(self) -> Dict[str, bool]:
+    def sync_all(
+        self,
+        force: bool = False,
+        max_workers: int = DEFAULT_SYNC_WORKERS,
+    ) -> Dict[str, bool]:
         """
         모든 PRD 동기화
 
+        PRD 문서가 있는 폴더들을 대상으로 Drive files.list 1회로 전체 PRD의
+        revision 정보를 조회한 뒤, 마지막 동기화 이후 바뀐 문서만 병렬로 다시
+        내려받습니다. 문서의 폴더는 조회 결과의 parents로 기록해 두며, 폴더를
+        아직 모르는 PRD는 기본 폴더에서 찾고 없으면 files.get으로 조회합니다.
+
+        Args:
+            force: revision 비교 없이 전체 다시 내려받기
+            max_workers: 동시 다운로드 수
+
         Returns:
-            PRD ID별 동기화 결과 딕셔너리
+            PRD ID별 동기화 결과 딕셔너리 (변경 없어 건너뛴 PRD는 True)
         """
-        results = {}
-        for prd in self.metadata.list_prds():
-            results[prd.prd_id] = self.sync_prd(prd.prd_id)
+        prds = self.metadata.list_prds()
+
+        revisions: Dict[str, Dict[str, Any]] = {}
+        if not force and prds:
+            folder_ids = sorted(
+                {prd.google_folder_id or self.client.folder_id for prd in prds}
+            )
+            try:
+                revisions = self.client.get_file_revisions(
+                    [prd.google_doc_id for prd in prds], folder_ids
+                )
+            except Exception as e:
+                logger.warning(f"revision 조회 실패, 전체 동기화: {e}")
+
+        updates: Dict[str, Dict[str, Any]] = {}
+        results: Dict[str, bool] = {}
+        pending = []
+        for prd in prds:
+            parents = (revisions.get(prd.google_doc_id) or {}).get("parents") or []
+            if parents and prd.google_folder_id not in parents:
+                updates[prd.prd_id] = {"google_folder_id": parents[0]}
+
+            token = _revision_token(revisions.get(prd.google_doc_id))
+            if (
+                token
+                and token == prd.synced_revision
+                and self._get_cache_path(prd.prd_id).exists()
+            ):
+                results[prd.prd_id] = True
+            else:
+                pending.append((prd, token))
+
+        skipped = len(results)
+        if pending:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(pending))) as pool:
+                paths = list(pool.map(lambda item: self._download(item[0]), pending))
+
+            # 조회 시점 revision을 기록 (다운로드 중 바뀌었다면 다음 동기화에서 다시 받음)
+            for (prd, token), cache_path in zip(pending, paths):
+                results[prd.prd_id] = cache_path is not None
+                if cache_path is not None:
+                    updates.setdefault(prd.prd_id, {}).update(
+                        local_cache=cache_path.name,
+                        synced_revision=token,
+                    )
+
+        if updates:
+            self.metadata.update_prds(updates)
 
         success_count = sum(1 for v in results.values() if v)
         total_count = len(results)
-        logger.info(f"전체 동기화 완료: {success_count}/{total_count}")
+        logger.info(
+            f"전체 동기화 완료: {success_count}/{total_count} "
+            f"(변경 없음 {skipped}개, 다운로드 {len(pending)}개)"
+        )
 
         return results
 
@@ -7,6 +7,7 @@ OAuth 2.0 인증 기반 Google Docs/Drive API 클라이언트.
 import json
 import logging
 import os
+import threading
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -14,6 +15,8 @@ from google.oauth2.credentials import Credentials
 from google.auth.transport.requests import Request
 from googleapiclient.discovery import build, Resource
 
+from lib.google_docs.rate_governor import execute_request
+
 logger = logging.getLogger(__name__)
 
 
@@ -67,11 +70,16 @@ class GoogleDocsClient:
         self.folder_id = folder_id or self.DEFAULT_FOLDER_ID
 
         self._credentials: Optional[Credentials] = None
-        self._docs_service: Optional[Resource] = None
-        self._drive_service: Optional[Resource] = None
+        # googleapiclient 서비스(httplib2)는 스레드 간 공유 불가 → 스레드별 생성
+        self._local = threading.local()
+        self._credentials_lock = threading.Lock()
 
     def _load_credentials(self) -> Credentials:
         """OAuth 자격증명 로드 및 갱신"""
+        with self._credentials_lock:
+            return self._load_credentials_locked()
+
+    def _load_credentials_locked(self) -> Credentials:
         if self._credentials and self._credentials.valid:
             return self._credentials
 
@@ -120,19 +128,25 @@ class GoogleDocsClient:
 
     @property
     def docs_service(self) -> Resource:
-        """Google Docs API 서비스"""
-        if self._docs_service is None:
+        """Google Docs API 서비스 (현재 스레드 전용)"""
+        service = getattr(self._local, "docs_service", None)
+        if service is None:
             credentials = self._load_credentials()
-            self._docs_service = build("docs", "v1", credentials=credentials)
-        return self._docs_service
+            service = self._local.docs_service = build(
+                "docs", "v1", credentials=credentials
+            )
+        return service
 
     @property
     def drive_service(self) -> Resource:
-        """Google Drive API 서비스"""
-        if self._drive_service is None:
+        """Google Drive API 서비스 (현재 스레드 전용)"""
+        service = getattr(self._local, "drive_service", None)
+        if service is None:
             credentials = self._load_credentials()
-            self._drive_service = build("drive", "v3", credentials=credentials)
-        return self._drive_service
+            service = self._local.drive_service = build(
+                "drive", "v3", credentials=credentials
+            )
+        return service
 
     # ==================== Document Operations ====================
 
@@ -154,26 +168,28 @@ class GoogleDocsClient:
         folder_id = folder_id or self.folder_id
 
         # 1. 빈 문서 생성
-        doc = self.docs_service.documents().create(body={"title": title}).execute()
+        doc = execute_request(
+            self.docs_service.documents().create(body={"title": title})
+        )
         doc_id = doc["documentId"]
 
         # 2. 폴더로 이동
         if folder_id:
             # 현재 부모 조회
-            file_info = (
-                self.drive_service.files()
-                .get(fileId=doc_id, fields="parents")
-                .execute()
+            file_info = execute_request(
+                self.drive_service.files().get(fileId=doc_id, fields="parents")
             )
             current_parents = ",".join(file_info.get("parents", []))
 
             # 새 폴더로 이동
-            self.drive_service.files().update(
-                fileId=doc_id,
-                addParents=folder_id,
-                removeParents=current_parents,
-                fields="id, parents",
-            ).execute()
+            execute_request(
+                self.drive_service.files().update(
+                    fileId=doc_id,
+                    addParents=folder_id,
+                    removeParents=current_parents,
+                    fields="id, parents",
+                )
+            )
 
         logger.info(f"문서 생성됨: {title} (ID: {doc_id})")
 
@@ -193,7 +209,7 @@ class GoogleDocsClient:
         Returns:
             문서 전체 내용 (body, title 등)
         """
-        doc = self.docs_service.documents().get(documentId=document_id).execute()
+        doc = execute_request(self.docs_service.documents().get(documentId=document_id))
         return doc
 
     def get_document_text(self, document_id: str) -> str:
@@ -241,10 +257,10 @@ class GoogleDocsClient:
         Returns:
             업데이트 결과
         """
-        result = (
-            self.docs_service.documents()
-            .batchUpdate(documentId=document_id, body={"requests": requests})
-            .execute()
+        result = execute_request(
+            self.docs_service.documents().batchUpdate(
+                documentId=document_id, body={"requests": requests}
+            )
         )
         return result
 
@@ -316,7 +332,7 @@ class GoogleDocsClient:
         Args:
             document_id: Google Docs 문서 ID
         """
-        self.drive_service.files().delete(fileId=document_id).execute()
+        execute_request(self.drive_service.files().delete(fileId=document_id))
         logger.info(f"문서 삭제됨: {document_id}")
 
     # ==================== Folder Operations ====================
@@ -344,19 +360,75 @@ class GoogleDocsClient:
             "and trashed=false"
         )
 
-        results = (
-            self.drive_service.files()
-            .list(
+        results = execute_request(
+            self.drive_service.files().list(
                 q=query,
                 pageSize=page_size,
                 fields="files(id, name, modifiedTime, createdTime)",
                 orderBy="modifiedTime desc",
             )
-            .execute()
         )
 
         return results.get("files", [])
 
+    def get_file_revisions(
+        self,
+        file_ids: List[str],
+        folder_ids: Optional[List[str]] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        문서별 변경 식별 정보 일괄 조회
+
+        폴더 단위 files.list (페이지당 1000개) 1회로 조회하고, 목록에 없는
+        문서(다른 폴더로 옮겨진 문서 등)만 files.get으로 개별 조회합니다.
+
+        Args:
+            file_ids: 조회할 문서 ID 목록
+            folder_ids: 문서가 있는 폴더 ID 목록 (없으면 기본 폴더)
+
+        Returns:
+            문서 ID별 {id, headRevisionId, modifiedTime, version, parents}
+            (삭제되었거나 접근할 수 없는 문서는 제외)
+        """
+        wanted = set(file_ids)
+        folder_ids = folder_ids or [self.folder_id]
+        fields = "id, headRevisionId, modifiedTime, version, parents"
+
+        parents = " or ".join(f"'{folder_id}' in parents" for folder_id in folder_ids)
+        query = (
+            f"({parents}) "
+            "and mimeType='application/vnd.google-apps.document' "
+            "and trashed=false"
+        )
+
+        revisions: Dict[str, Dict[str, Any]] = {}
+        page_token = None
+        while True:
+            results = execute_request(
+                self.drive_service.files().list(
+                    q=query,
+                    pageSize=1000,
+                    fields=f"nextPageToken, files({fields})",
+                    pageToken=page_token,
+                )
+            )
+            for file in results.get("files", []):
+                if file["id"] in wanted:
+                    revisions[file["id"]] = file
+            page_token = results.get("nextPageToken")
+            if not page_token or len(revisions) == len(wanted):
+                break
+
+        for file_id in wanted - revisions.keys():
+            try:
+                revisions[file_id] = execute_request(
+                    self.drive_service.files().get(fileId=file_id, fields=fields)
+                )
+            except Exception as e:
+                logger.warning(f"문서 정보 조회 실패: {file_id} - {e}")
+
+        return revisions
+
     def copy_document(
         self,
         source_doc_id: str,
@@ -380,8 +452,8 @@ class GoogleDocsClient:
         if folder_id:
             body["parents"] = [folder_id]
 
-        copied_file = (
-            self.drive_service.files().copy(fileId=source_doc_id, body=body).execute()
+        copied_file = execute_request(
+            self.drive_service.files().copy(fileId=source_doc_id, body=body)
         )
 
         doc_id = copied_file["id"]
@@ -408,7 +480,7 @@ class GoogleDocsClient:
         """
         try:
             # 간단한 API 호출로 테스트
-            self.drive_service.about().get(fields="user").execute()
+            execute_request(self.drive_service.about().get(fields="user"))
             logger.info("Google API 연결 성공")
             return True
         except Exception as e:
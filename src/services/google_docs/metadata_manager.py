@@ -31,6 +31,8 @@ class PRDMetadata:
     local_cache: str = ""  # PRD-0001.cache.md
     checklist_path: str = ""  # docs/checklists/PRD-0001.md
     tags: List[str] = field(default_factory=list)
+    synced_revision: str = ""  # 마지막 캐시 동기화 시점의 Drive revision 식별자
+    google_folder_id: str = ""  # 문서가 있는 Drive 폴더 ID (revision 일괄 조회용)
 
     def __post_init__(self):
         if not self.created_at:
@@ -299,6 +301,34 @@ class MetadataManager:
         logger.info(f"PRD 업데이트됨: {prd_id}")
         return prd
 
+    def update_prds(self, updates: Dict[str, Dict[str, Any]]) -> int:
+        """
+        여러 PRD 일괄 업데이트 (레지스트리 저장 1회)
+
+        Args:
+            updates: PRD ID별 업데이트할 필드
+
+        Returns:
+            업데이트된 PRD 수
+        """
+        now = datetime.utcnow().isoformat() + "Z"
+        count = 0
+        for prd_id, fields in updates.items():
+            prd = self.get_prd(prd_id)
+            if not prd:
+                logger.warning(f"PRD를 찾을 수 없음: {prd_id}")
+                continue
+            for key, value in fields.items():
+                if hasattr(prd, key):
+                    setattr(prd, key, value)
+            prd.updated_at = now
+            count += 1
+
+        if count:
+            self.save()
+            logger.info(f"PRD {count}개 업데이트됨")
+        return count
+
     def delete_prd(self, prd_id: str) -> bool:
         """
         PRD 삭제
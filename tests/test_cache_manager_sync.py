@@ -0,0 +1,137 @@
+"""CacheManager.sync_all revision 비교 테스트"""
+
+import threading
+
+import pytest
+
+from src.services.google_docs.cache_manager import CacheManager
+from src.services.google_docs.metadata_manager import MetadataManager, PRDMetadata
+
+
+class FakeClient:
+    """get_file_revisions / get_document 호출 수 기록
+
+    문서는 기본 폴더와 "team" 폴더에 나뉘어 있고, 조회 대상 폴더 밖의 문서는
+    files.get 개별 조회(single_gets)로 셉니다.
+    """
+
+    folder_id = "default"
+
+    def __init__(self, doc_ids):
+        self.versions = {doc_id: 1 for doc_id in doc_ids}
+        self.folders = {doc_id: "team" if i % 3 == 0 else "default" for i, doc_id in enumerate(doc_ids)}
+        self.revision_calls = 0
+        self.folder_calls = []
+        self.single_gets = 0
+        self.downloads = []
+        self._lock = threading.Lock()
+
+    def get_file_revisions(self, file_ids, folder_ids=None):
+        self.revision_calls += 1
+        folder_ids = folder_ids or [self.folder_id]
+        self.folder_calls.append(sorted(folder_ids))
+        revisions = {}
+        for doc_id in file_ids:
+            if doc_id not in self.versions:
+                continue
+            if self.folders[doc_id] not in folder_ids:
+                self.single_gets += 1
+            revisions[doc_id] = {
+                "id": doc_id,
+                "version": str(self.versions[doc_id]),
+                "modifiedTime": "t",
+                "parents": [self.folders[doc_id]],
+            }
+        return revisions
+
+    def get_document(self, document_id):
+        with self._lock:
+            self.downloads.append(document_id)
+        text = f"{document_id} v{self.versions[document_id]}\n"
+        return {"body": {"content": [{"paragraph": {"elements": [{"textRun": {"content": text}}]}}]}}
+
+
+@pytest.fixture
+def manager(tmp_path):
+    metadata = MetadataManager(registry_path=tmp_path / ".prd-registry.json")
+    doc_ids = [f"doc{i}" for i in range(300)]
+    for i, doc_id in enumerate(doc_ids):
+        prd_id = f"PRD-{i:04d}"
+        metadata.registry.prds[prd_id] = PRDMetadata(
+            prd_id=prd_id,
+            google_doc_id=doc_id,
+            google_doc_url=f"https://docs.google.com/document/d/{doc_id}/edit",
+            title=f"PRD {i}",
+        )
+    metadata.save()
+    return CacheManager(cache_dir=tmp_path / "cache", client=FakeClient(doc_ids), metadata_manager=metadata)
+
+
+class TestSyncAll:
+
+    def test_unchanged_sync_uses_one_call(self, manager):
+        assert all(manager.sync_all().values())
+        assert len(manager.client.downloads) == 300
+
+        manager.client.downloads.clear()
+        manager.client.revision_calls = 0
+        results = manager.sync_all()
+
+        assert len(results) == 300 and all(results.values())
+        assert manager.client.revision_calls == 1
+        assert manager.client.downloads == []
+
+    def test_only_changed_documents_downloaded(self, manager):
+        manager.sync_all()
+        manager.client.downloads.clear()
+        manager.client.versions["doc7"] = 2
+        manager._get_cache_path("PRD-0011").unlink()
+
+        manager.sync_all()
+
+        assert sorted(manager.client.downloads) == ["doc11", "doc7"]
+        assert "doc7 v2" in manager.read_cache("PRD-0007")
+
+    def test_force(self, manager):
+        manager.sync_all()
+        manager.client.downloads.clear()
+
+        manager.sync_all(force=True)
+        assert len(manager.client.downloads) == 300
+
+    def test_revisions_listed_from_document_folders(self, manager):
+        manager.sync_all()
+        assert manager.client.folder_calls == [["default"]]
+        assert manager.client.single_gets == 100
+
+        manager.client.single_gets = 0
+        manager.client.downloads.clear()
+        manager.sync_all()
+
+        assert manager.client.folder_calls[-1] == ["default", "team"]
+        assert manager.client.single_gets == 0
+        assert manager.client.downloads == []
+        assert manager.metadata.get_prd("PRD-0003").google_folder_id == "team"
+
+    def test_moved_document_folder_updated(self, manager):
+        manager.sync_all()
+        manager.client.folders["doc1"] = "archive"
+
+        manager.sync_all()
+        manager.client.single_gets = 0
+        manager.sync_all()
+
+        assert manager.client.folder_calls[-1] == ["archive", "default", "team"]
+        assert manager.client.single_gets == 0
+        assert manager.metadata.get_prd("PRD-0001").google_folder_id == "archive"
+
+    def test_sync_prd_records_revision(self, manager):
+        manager.sync_all()
+        manager.client.versions["doc3"] = 2
+        assert manager.sync_prd("PRD-0003")
+        assert "doc3 v2" in manager.read_cache("PRD-0003")
+
+        manager.client.downloads.clear()
+        manager.sync_all()
+
+        assert manager.client.downloads == []
@@ -67,3 +67,13 @@ class TestGraphicDetector:
         result = detector.detect_with_type(image)
         assert len(result) >= 1
         assert all(e.layer == 1 for e in result)
+
+    def test_detect_array_input(self):
+        from lib.ocr import GraphicDetector
+        import cv2
+        detector = GraphicDetector(min_area=100)
+        img_cv = np.full((200, 200, 3), 255, dtype=np.uint8)
+        cv2.rectangle(img_cv, (50, 50), (150, 150), (0, 0, 0), -1)
+        expected = detector.detect(Image.fromarray(img_cv))
+        assert detector.detect(img_cv) == expected
+        assert detector.detect(cv2.cvtColor(img_cv, cv2.COLOR_RGB2GRAY)) == expected
@@ -54,3 +54,20 @@ class TestHybridPipeline:
         image = Image.new("RGB", (100, 100), color=(255, 255, 255))
         result = pipeline.analyze(image, mode="coords")
         assert result.annotated_image_path is None
+
+    def test_ocr_layer_receives_shared_array(self, tmp_path):
+        """경로 입력도 1회 디코딩한 배열을 Layer 1/2에 전달 (임시 파일 없음)"""
+        import numpy as np
+        from lib.ocr import HybridPipeline
+        image_path = str(tmp_path / "test.png")
+        Image.new("RGB", (100, 80), color=(255, 255, 255)).save(image_path)
+        pipeline = HybridPipeline()
+        with patch("lib.ocr.hybrid_pipeline.OCRExtractor") as mock_cls, \
+                patch.object(pipeline.graphic_detector, "detect_with_type", return_value=[]) as mock_detect, \
+                patch("lib.ocr.hybrid_pipeline.tempfile.gettempdir", return_value=str(tmp_path)):
+            mock_cls.return_value.extract_text.return_value.layout_info.blocks = []
+            pipeline.analyze(image_path, mode="coords")
+        pixels = mock_cls.call_args.args[0]
+        assert isinstance(pixels, np.ndarray) and pixels.shape == (80, 100, 3)
+        assert mock_detect.call_args.args[0] is pixels
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["test.png"]
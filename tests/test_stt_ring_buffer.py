@@ -0,0 +1,124 @@
+"""실시간 STT PCM 링 버퍼 테스트"""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("av")
+pytest.importorskip("aiohttp")
+
+from auto_meeting.poc.poc_realtime_stt import PCMRingBuffer  # noqa: E402
+
+
+def _samples(start: int, count: int) -> "np.ndarray":
+    """절대 위치를 값으로 갖는 샘플 (어느 위치가 보존됐는지 확인용)"""
+    return np.arange(start, start + count, dtype=np.float32)
+
+
+class TestPCMRingBuffer:
+
+    def test_view_across_wraparound_is_contiguous(self):
+        ring = PCMRingBuffer(10)
+        ring.append(_samples(0, 8))
+        ring.discard_until(6)
+        ring.append(_samples(8, 6))
+
+        window = ring.view(ring.start, ring.end)
+
+        assert window.tolist() == list(range(6, 14))
+        assert not window.flags.writeable
+
+    def test_overflow_drops_oldest(self):
+        ring = PCMRingBuffer(10)
+        ring.append(_samples(0, 8))
+        ring.append(_samples(8, 5))
+
+        assert (ring.start, ring.end, ring.dropped) == (3, 13, 3)
+        assert ring.view(0, 13).tolist() == list(range(3, 13))
+
+    def test_oversized_append_keeps_newest(self):
+        ring = PCMRingBuffer(10)
+        ring.append(_samples(0, 25))
+
+        assert ring.dropped == 15
+        assert ring.view(ring.start, ring.end).tolist() == list(range(15, 25))
+
+    def test_snapshot_is_view_with_enough_headroom(self):
+        ring = PCMRingBuffer(10)
+        ring.append(_samples(0, 4))
+
+        window = ring.snapshot(0, 4, headroom=6)
+        ring.append(_samples(4, 6))
+
+        assert np.shares_memory(window, ring._data)
+        assert window.tolist() == list(range(4))
+
+    def test_snapshot_copies_near_capacity(self):
+        ring = PCMRingBuffer(10)
+        ring.append(_samples(0, 8))
+
+        window = ring.snapshot(0, 8, headroom=5)
+        ring.append(_samples(8, 5))  # 용량 초과로 0..2 위치를 덮어씀
+
+        assert not np.shares_memory(window, ring._data)
+        assert window.tolist() == list(range(8))
+
+    def test_discard_until_clamps_to_end(self):
+        ring = PCMRingBuffer(10)
+        ring.append(_samples(0, 5))
+        ring.discard_until(20)
+
+        assert len(ring) == 0
+        assert ring.view(0, 5).size == 0
+
+
+class TestTakeWindow:
+
+    def test_window_survives_backlog_while_transcribing(self):
+        from auto_meeting.poc import poc_realtime_stt as stt
+
+        session = stt.AudioSession("test", ws=None)
+        capacity = session.pcm.capacity
+        session.pcm.append(_samples(0, capacity - stt.SAMPLE_RATE))
+
+        window, snapshot_end = session.take_window()
+        expected = window.copy()
+        session.pcm.append(_samples(snapshot_end, stt.MAX_BACKLOG_SECONDS * stt.SAMPLE_RATE))
+
+        assert session.drained.is_set()
+        assert np.array_equal(window, expected)
+
+
+def _webm_opus(seconds: int, freq: float = 440.0) -> bytes:
+    """녹음기가 3초마다 보내는 것과 같은 완결된 WebM/Opus 파일 1개"""
+    import io
+
+    import av
+
+    buf = io.BytesIO()
+    with av.open(buf, "w", format="webm") as container:
+        stream = container.add_stream("libopus", rate=48000)
+        stream.layout = "mono"
+        t = np.arange(seconds * 48000, dtype=np.float32) / 48000
+        samples = (0.3 * np.sin(2 * np.pi * freq * t)).astype(np.float32)
+        for start in range(0, samples.size, 960):
+            frame = av.AudioFrame.from_ndarray(samples[None, start:start + 960], format="flt", layout="mono")
+            frame.sample_rate = 48000
+            frame.pts = start
+            for packet in stream.encode(frame):
+                container.mux(packet)
+        for packet in stream.encode(None):
+            container.mux(packet)
+    return buf.getvalue()
+
+
+class TestStreamingOpusDecoder:
+
+    def test_consecutive_webm_chunks_on_one_decoder(self):
+        from auto_meeting.poc import poc_realtime_stt as stt
+
+        decoder = stt.StreamingOpusDecoder()
+        decoded = [decoder.decode(_webm_opus(3, freq)) for freq in (440.0, 660.0, 880.0)]
+
+        assert all(audio is not None for audio in decoded)
+        # 16kHz 리샘플러 지연만큼의 오차 허용
+        assert all(abs(audio.size - 3 * stt.SAMPLE_RATE) < stt.SAMPLE_RATE // 10 for audio in decoded)